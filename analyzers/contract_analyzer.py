@@ -13,6 +13,10 @@ from web3 import Web3
 from web3.contract import Contract
 
 from models.token import ContractAnalysis, RiskLevel, TradingOpportunity
+from analyzers.trade_simulator import TradeSimulator, SimulationResult, SimulationStatus
+from config.chains import multichain_settings, ChainType
+from utils.async_cache import analysis_cache
+from utils.replay_io import create_http_session
 from utils.logger import logger_manager
 
 class ContractAnalyzer:
@@ -26,6 +30,17 @@ class ContractAnalyzer:
         self.w3 = w3
         self.logger = logger_manager.get_logger("ContractAnalyzer")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.cache = analysis_cache
+        
+        # Buy/sell simulation through the Ethereum router
+        ethereum_config = multichain_settings.get_chain_config(ChainType.ETHEREUM)
+        self.trade_simulator = TradeSimulator(
+            w3, ethereum_config.dex_router, ethereum_config.wrapped_native
+        )
+        
+        # Sell tax above which a token is treated as a honeypot
+        self.honeypot_sell_tax = 0.5
+        self.high_tax_threshold = 0.1
         
         # Common honeypot patterns and risk indicators
         self.honeypot_signatures = [
@@ -61,14 +76,15 @@ class ContractAnalyzer:
         
     async def initialize(self):
         """Initialize HTTP session for external API calls."""
-        timeout = aiohttp.ClientTimeout(total=30)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        self.session = create_http_session(30)
+        self.cache.load()
         
     async def cleanup(self):
         """Cleanup resources."""
         if self.session:
             await self.session.close()
             self.session = None
+        self.cache.save()
             
     async def analyze_contract(self, opportunity: TradingOpportunity) -> ContractAnalysis:
         """
@@ -108,7 +124,9 @@ class ContractAnalyzer:
             await self._analyze_contract_functions(token_address, analysis)
             
             # 6. Trading simulation
-            await self._simulate_trading(token_address, analysis)
+            simulation = await self._simulate_trading(token_address, analysis)
+            if simulation and simulation.code_hash:
+                opportunity.metadata['code_hash'] = simulation.code_hash
             
             # 7. External API checks
             await self._check_external_sources(token_address, analysis)
@@ -122,7 +140,7 @@ class ContractAnalyzer:
             # await self._analyze_contract_age_and_activity(token_address, analysis)
             # 8. Enhanced security analysis (methods not implemented yet)
             # TODO: Implement these advanced methods later:
-            await self._detect_honeypot_advanced(token_address, analysis)
+            await self._detect_honeypot_advanced(token_address, analysis, simulation)
             await self._analyze_liquidity_locks_comprehensive(opportunity, analysis)
             await self._analyze_token_distribution(token_address, analysis)
             await self._check_contract_upgradability(token_address, analysis)
@@ -143,20 +161,28 @@ class ContractAnalyzer:
     
     # Add these methods to the ContractAnalyzer class in analyzers/contract_analyzer.py:
 
-    async def _detect_honeypot_advanced(self, token_address: str, analysis: ContractAnalysis) -> None:
-        """Advanced honeypot detection using multiple techniques."""
+    async def _detect_honeypot_advanced(
+        self,
+        token_address: str,
+        analysis: ContractAnalysis,
+        result: Optional[SimulationResult]
+    ) -> None:
+        """Advanced honeypot detection from the buy/sell simulation result."""
         try:
-            # This is a placeholder for advanced honeypot detection
-            # In a full implementation, this would include:
-            # - Advanced bytecode analysis
-            # - Dynamic analysis using simulation
-            # - Pattern matching against known honeypot techniques
-            # - Cross-referencing with honeypot databases
+            self.logger.debug("Advanced honeypot detection for %s", token_address)
             
-            self.logger.debug(f"Advanced honeypot detection for {token_address}")
+            if not result:
+                analysis.analysis_notes.append("Advanced honeypot detection: No simulation data")
+                return
             
-            # For now, just add a note that advanced analysis was attempted
-            analysis.analysis_notes.append("Advanced honeypot detection: No additional patterns found")
+            if result.is_honeypot:
+                analysis.is_honeypot = True
+                analysis.analysis_notes.append(f"Honeypot detected by simulation: {result.error or 'sell blocked'}")
+            elif result.sell_tax is not None and result.sell_tax >= self.honeypot_sell_tax:
+                analysis.is_honeypot = True
+                analysis.analysis_notes.append(f"Honeypot detected: sell tax {result.sell_tax:.0%}")
+            else:
+                analysis.analysis_notes.append("Advanced honeypot detection: No additional patterns found")
             
         except Exception as e:
             self.logger.error(f"Advanced honeypot detection failed: {e}")
@@ -172,7 +198,7 @@ class ContractAnalyzer:
             # - Percentage of liquidity locked
             # - Lock contract verification
             
-            self.logger.debug(f"Comprehensive liquidity analysis for {opportunity.token.symbol}")
+            self.logger.debug("Comprehensive liquidity analysis for %s", opportunity.token.symbol)
             
             # Basic check - assume not locked unless proven otherwise
             analysis.liquidity_locked = False
@@ -192,7 +218,7 @@ class ContractAnalyzer:
             # - Whale wallet detection
             # - Developer/team wallet identification
             
-            self.logger.debug(f"Token distribution analysis for {token_address}")
+            self.logger.debug("Token distribution analysis for %s", token_address)
             
             analysis.analysis_notes.append("Token distribution analysis: Basic check completed")
             
@@ -209,7 +235,7 @@ class ContractAnalyzer:
             # - Admin functions that can modify contract behavior
             # - Upgrade mechanisms
             
-            self.logger.debug(f"Contract upgradability check for {token_address}")
+            self.logger.debug("Contract upgradability check for %s", token_address)
             
             analysis.analysis_notes.append("Upgradability check: No obvious upgrade patterns detected")
             
@@ -227,7 +253,7 @@ class ContractAnalyzer:
             # - Interaction patterns
             # - Age-based risk assessment
             
-            self.logger.debug(f"Contract age and activity analysis for {token_address}")
+            self.logger.debug("Contract age and activity analysis for %s", token_address)
             
             analysis.analysis_notes.append("Contract age analysis: Recently deployed")
             
@@ -277,16 +303,16 @@ class ContractAnalyzer:
             # Method 1: Check with honeypot detection API
             if self.session:
                 try:
-                    url = f"https://api.honeypot.is/v2/IsHoneypot"
-                    params = {"address": token_address}
-                    
-                    async with self.session.get(url, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if data.get('isHoneypot'):
-                                analysis.is_honeypot = True
-                                analysis.analysis_notes.append("Honeypot detected by external API")
-                                return
+                    data = await self.cache.get_or_fetch(
+                        'honeypot_api', token_address,
+                        lambda: self._fetch_json(
+                            "https://api.honeypot.is/v2/IsHoneypot", {"address": token_address}
+                        )
+                    )
+                    if data and data.get('isHoneypot'):
+                        analysis.is_honeypot = True
+                        analysis.analysis_notes.append("Honeypot detected by external API")
+                        return
                         
                 except Exception as api_error:
                     self.logger.debug(f"Honeypot API check failed: {api_error}")
@@ -440,23 +466,39 @@ class ContractAnalyzer:
         except Exception as e:
             analysis.analysis_notes.append(f"Function analysis failed: {str(e)}")
             
-    async def _simulate_trading(self, token_address: str, analysis: ContractAnalysis):
+    async def _simulate_trading(self, token_address: str, analysis: ContractAnalysis) -> Optional[SimulationResult]:
         """Simulate buy/sell transactions to detect trading restrictions."""
+        result = None
         try:
-            # This is a simplified simulation
-            # Real implementation would use tools like Tenderly or fork mainnet
-            
-            analysis.analysis_notes.append("Trading simulation: SKIPPED (requires advanced setup)")
+            result = await self.trade_simulator.simulate(token_address)
+            
+            analysis.buy_tax = result.buy_tax
+            analysis.sell_tax = result.sell_tax
+            
+            if result.status == SimulationStatus.OK:
+                analysis.analysis_notes.append(
+                    f"Trading simulation: buy tax {result.buy_tax or 0:.1%}, sell tax {result.sell_tax or 0:.1%}"
+                )
+            elif result.status == SimulationStatus.BUY_ONLY:
+                analysis.analysis_notes.append("Trading simulation: buy succeeded, sell not verifiable on this node")
+            elif result.status == SimulationStatus.BUY_REVERTED:
+                analysis.analysis_notes.append(f"Trading simulation: buy reverted ({result.error})")
+                analysis.risk_score += 0.3
+            elif result.status == SimulationStatus.HONEYPOT:
+                analysis.analysis_notes.append(f"Trading simulation: sell blocked ({result.error})")
+            else:
+                analysis.analysis_notes.append(f"Trading simulation: FAILED ({result.error})")
             
-            # Placeholder for trading simulation logic
-            # Would test:
-            # 1. Can we buy the token?
-            # 2. Can we sell the token immediately after buying?
-            # 3. Are there hidden fees or restrictions?
-            # 4. Does the token balance reflect correctly?
+            # Hidden fees
+            max_tax = max(result.buy_tax or 0.0, result.sell_tax or 0.0)
+            if max_tax > self.high_tax_threshold:
+                analysis.analysis_notes.append(f"High trading tax detected: {max_tax:.0%}")
+                analysis.risk_score += self.risk_weights['high_tax'] / 100
             
         except Exception as e:
             analysis.analysis_notes.append(f"Trading simulation failed: {str(e)}")
+        
+        return result
             
     async def _check_external_sources(self, token_address: str, analysis: ContractAnalysis):
         """Check external sources for additional risk information."""
@@ -468,6 +510,7 @@ class ContractAnalyzer:
             sources_to_check = [
                 {
                     'name': 'Token Sniffer',
+                    'cache_source': 'token_sniffer',
                     'url': f'https://tokensniffer.com/api/v1/tokens/{token_address}',
                 },
                 # Could add more sources like:
@@ -478,15 +521,19 @@ class ContractAnalyzer:
             
             for source in sources_to_check:
                 try:
-                    async with self.session.get(source['url']) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            # Parse response based on source
-                            if source['name'] == 'Token Sniffer':
-                                score = data.get('score', 0)
-                                if score < 50:
-                                    analysis.analysis_notes.append(f"Low score on {source['name']}: {score}")
-                                    analysis.risk_score += 0.2
+                    data = await self.cache.get_or_fetch(
+                        source['cache_source'], token_address,
+                        lambda url=source['url']: self._fetch_json(url)
+                    )
+                    if not data:
+                        continue
+                        
+                    # Parse response based on source
+                    if source['name'] == 'Token Sniffer':
+                        score = data.get('score', 0)
+                        if score < 50:
+                            analysis.analysis_notes.append(f"Low score on {source['name']}: {score}")
+                            analysis.risk_score += 0.2
                                     
                 except Exception:
                     continue
@@ -494,6 +541,24 @@ class ContractAnalyzer:
         except Exception as e:
             analysis.analysis_notes.append(f"External source check failed: {str(e)}")
             
+    async def _fetch_json(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Fetch a JSON document, returning None for non-200 responses.
+        
+        Args:
+            url: URL to fetch
+            params: Optional query parameters
+            
+        Returns:
+            Parsed JSON or None
+        """
+        if not self.session:
+            return None
+        async with self.session.get(url, params=params) as response:
+            if response.status != 200:
+                return None
+            return await response.json()
+            
     async def _analyze_solana_token(self, opportunity: TradingOpportunity, analysis: ContractAnalysis) -> ContractAnalysis:
         """Analyze Solana token (simplified)."""
         try:
@@ -0,0 +1,234 @@
+# analyzers/pre_filter.py
+"""
+Fast pre-filter for new opportunities.
+Rejects launches on cheap, already-known signals before the expensive
+contract/social analysis runs.
+"""
+
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Set, Any
+
+from models.token import TradingOpportunity
+from config.chains import multichain_settings
+from config.settings import settings
+from utils.logger import logger_manager
+
+
+@dataclass
+class PreFilterResult:
+    """Outcome of the pre-filter for one opportunity."""
+    passed: bool
+    reason: Optional[str] = None
+
+
+class StageStats:
+    """Pass/reject counters with reject reasons for one pipeline stage."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.evaluated = 0
+        self.passed = 0
+        self.rejected = 0
+        self.reasons: Counter = Counter()
+
+    def record(self, passed: bool, reason: Optional[str] = None) -> None:
+        """
+        Record one stage outcome.
+
+        Args:
+            passed: Whether the opportunity passed the stage
+            reason: Reject reason (ignored when passed)
+        """
+        self.evaluated += 1
+        if passed:
+            self.passed += 1
+        else:
+            self.rejected += 1
+            self.reasons[reason or "unspecified"] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary."""
+        return {
+            'evaluated': self.evaluated,
+            'passed': self.passed,
+            'rejected': self.rejected,
+            'reject_rate': self.rejected / self.evaluated if self.evaluated else 0.0,
+            'reasons': dict(self.reasons.most_common())
+        }
+
+
+class OpportunityPreFilter:
+    """
+    Constant-time checks on signals known at detection time.
+    Only survivors are sent to the contract analyzer, social analyzer and scorer.
+    """
+
+    def __init__(self, risk_manager=None, check_capacity: bool = True, max_seen_tokens: int = 50000) -> None:
+        """
+        Initialize the pre-filter.
+
+        Args:
+            risk_manager: Optional RiskManager used for chain/portfolio capacity checks
+            check_capacity: Whether to reject when trading capacity is exhausted
+            max_seen_tokens: Number of recently seen tokens kept for duplicate detection
+        """
+        self.logger = logger_manager.get_logger("OpportunityPreFilter")
+        self.risk_manager = risk_manager
+        self.check_capacity = check_capacity
+        self.max_seen_tokens = max_seen_tokens
+
+        self.blacklisted_tokens: Set[str] = {address.lower() for address in settings.blacklisted_tokens}
+        self.blacklisted_deployers: Set[str] = {address.lower() for address in settings.blacklisted_deployers}
+        self.scam_code_hashes: Set[str] = set()
+        self.seen_tokens: "OrderedDict[str, None]" = OrderedDict()
+
+        self.min_liquidity_by_chain: Dict[str, float] = {
+            chain_type.name: config.min_liquidity_usd
+            for chain_type, config in multichain_settings.chains.items()
+        }
+        self.default_min_liquidity = settings.min_liquidity_usd
+
+        self.stats = StageStats()
+
+    @staticmethod
+    def _chain_family(chain: str) -> str:
+        """Collapse source-specific labels (SOLANA-PUMP, SOLANA-JUPITER) to their chain."""
+        return 'SOLANA' if chain.startswith('SOLANA') else chain
+
+    @staticmethod
+    def _get_deployer(opportunity: TradingOpportunity) -> Optional[str]:
+        """Get the deployer/creator address if a monitor provided it."""
+        deployer = opportunity.metadata.get('deployer') or opportunity.metadata.get('creator')
+        return deployer.lower() if deployer else None
+
+    def needs_code_hash(self, opportunity: TradingOpportunity) -> bool:
+        """
+        Whether the scam code-hash check needs a code hash the opportunity does not carry yet.
+
+        Args:
+            opportunity: Newly detected opportunity
+
+        Returns:
+            True for EVM tokens without a code hash while scams have been recorded
+        """
+        chain = opportunity.metadata.get('chain', 'ETHEREUM').upper()
+        return bool(
+            self.scam_code_hashes and
+            self._chain_family(chain) != 'SOLANA' and
+            not opportunity.metadata.get('code_hash')
+        )
+
+    def evaluate(self, opportunity: TradingOpportunity, code_hash_pending: bool = False) -> PreFilterResult:
+        """
+        Run the cheap checks in order of cost and record the outcome.
+
+        Args:
+            opportunity: Newly detected opportunity
+            code_hash_pending: The code hash is fetched for survivors and checked with
+                check_code_hash(), which then records the outcome; only rejections are recorded here
+
+        Returns:
+            PreFilterResult with the first failing reason, if any
+        """
+        try:
+            reason = self._first_rejection(opportunity)
+        except Exception as e:
+            # Never drop an opportunity because the fast path itself failed
+            self.logger.error(f"Pre-filter failed for {opportunity.token.symbol}: {e}")
+            reason = None
+
+        if reason is not None or not code_hash_pending:
+            self.stats.record(reason is None, reason)
+        return PreFilterResult(passed=reason is None, reason=reason)
+
+    def check_code_hash(self, opportunity: TradingOpportunity) -> PreFilterResult:
+        """
+        Check a survivor of evaluate(code_hash_pending=True) against recorded scam code hashes.
+
+        Args:
+            opportunity: Opportunity with its code hash in metadata (if it could be fetched)
+
+        Returns:
+            PreFilterResult, rejected if the code matches a recorded scam
+        """
+        code_hash = opportunity.metadata.get('code_hash')
+        reason = "known scam code hash" if code_hash and code_hash in self.scam_code_hashes else None
+        self.stats.record(reason is None, reason)
+        return PreFilterResult(passed=reason is None, reason=reason)
+
+    def _first_rejection(self, opportunity: TradingOpportunity) -> Optional[str]:
+        """
+        Return the first reject reason for an opportunity, or None if it passes.
+
+        Args:
+            opportunity: Opportunity to check
+
+        Returns:
+            Reject reason or None
+        """
+        chain = opportunity.metadata.get('chain', 'ETHEREUM').upper()
+        token_address = opportunity.token.address.lower()
+
+        # Duplicate token (also catches the same Solana token from Birdeye and Jupiter)
+        seen_key = f"{self._chain_family(chain)}:{token_address}"
+        if seen_key in self.seen_tokens:
+            return "duplicate token"
+        self.seen_tokens[seen_key] = None
+        if len(self.seen_tokens) > self.max_seen_tokens:
+            self.seen_tokens.popitem(last=False)
+
+        if token_address in self.blacklisted_tokens:
+            return "blacklisted token"
+
+        deployer = self._get_deployer(opportunity)
+        if deployer and deployer in self.blacklisted_deployers:
+            return "blacklisted deployer"
+
+        # Only a code hash the monitor already provided; fetched hashes go through check_code_hash()
+        code_hash = opportunity.metadata.get('code_hash')
+        if code_hash and code_hash in self.scam_code_hashes:
+            return "known scam code hash"
+
+        # Liquidity is only checked when the monitor already knows it
+        liquidity_usd = opportunity.liquidity.liquidity_usd if opportunity.liquidity else 0
+        min_liquidity = self.min_liquidity_by_chain.get(chain, self.default_min_liquidity)
+        if 0 < liquidity_usd < min_liquidity:
+            return "liquidity below minimum"
+
+        if self.check_capacity and self.risk_manager:
+            capacity_reason = self.risk_manager.check_capacity(chain)
+            if capacity_reason:
+                return capacity_reason
+
+        return None
+
+    def record_scam(self, opportunity: TradingOpportunity, code_hash: Optional[str] = None) -> None:
+        """
+        Remember the code hash and deployer of a token found to be a scam.
+
+        Args:
+            opportunity: Opportunity whose analysis flagged a scam
+            code_hash: Contract code hash, if known
+        """
+        code_hash = code_hash or opportunity.metadata.get('code_hash')
+        if code_hash:
+            self.scam_code_hashes.add(code_hash)
+
+        deployer = self._get_deployer(opportunity)
+        if deployer:
+            self.blacklisted_deployers.add(deployer)
+
+        self.logger.info(
+            f"Scam recorded: {opportunity.token.symbol} "
+            f"(code hash: {code_hash or 'unknown'}, deployer: {deployer or 'unknown'})"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pre-filter statistics."""
+        return {
+            **self.stats.to_dict(),
+            'seen_tokens': len(self.seen_tokens),
+            'scam_code_hashes': len(self.scam_code_hashes),
+            'blacklisted_deployers': len(self.blacklisted_deployers)
+        }
@@ -6,11 +6,15 @@ Analyzes Twitter, Telegram, and other social signals.
 
 import asyncio
 import aiohttp
+import logging
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Callable, Awaitable
 from datetime import datetime, timedelta
 
 from models.token import SocialMetrics, TradingOpportunity
+from config.settings import settings
+from utils.async_cache import analysis_cache
+from utils.replay_io import create_http_session
 from utils.logger import logger_manager
 
 class SocialAnalyzer:
@@ -19,10 +23,24 @@ class SocialAnalyzer:
     Provides insights into community strength and potential viral growth.
     """
     
-    def __init__(self):
-        """Initialize the social analyzer."""
+    def __init__(self, deadline_seconds: float = 0.75, late_result_timeout: float = 15.0):
+        """
+        Initialize the social analyzer.
+        
+        Args:
+            deadline_seconds: Time budget for social sources before scoring
+            late_result_timeout: How long late sources may run for refinement
+        """
         self.logger = logger_manager.get_logger("SocialAnalyzer")
         self.session: Optional[aiohttp.ClientSession] = None
+        self.deadline_seconds = deadline_seconds
+        self.late_result_timeout = late_result_timeout
+        
+        # Called with (opportunity, refined_metrics) once late sources finish
+        self.refinement_callbacks: List[Callable[[TradingOpportunity, SocialMetrics], Awaitable[None]]] = []
+        self.refinement_tasks: set = set()
+        self.cache = analysis_cache
+        self.twitter_bearer_token = settings.api.twitter_bearer_token
         
         # Social media patterns and keywords
         self.positive_keywords = [
@@ -42,19 +60,37 @@ class SocialAnalyzer:
         
     async def initialize(self):
         """Initialize HTTP session for API calls."""
-        timeout = aiohttp.ClientTimeout(total=20)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        self.session = create_http_session(20)
+        self.cache.load()
         
     async def cleanup(self):
         """Cleanup resources."""
+        for task in list(self.refinement_tasks):
+            task.cancel()
         if self.session:
             await self.session.close()
             self.session = None
+        self.cache.save()
+            
+    def add_refinement_callback(
+        self,
+        callback: Callable[[TradingOpportunity, SocialMetrics], Awaitable[None]]
+    ) -> None:
+        """
+        Register a coroutine called with refined metrics when late sources complete.
+        
+        Args:
+            callback: Async callback receiving the opportunity and refined metrics
+        """
+        self.refinement_callbacks.append(callback)
             
     async def analyze_social_metrics(self, opportunity: TradingOpportunity) -> SocialMetrics:
         """
         Analyze social media sentiment and activity for a token.
         
+        All sources run concurrently; whatever finishes within the deadline is
+        scored, and late sources trigger an asynchronous refinement.
+        
         Args:
             opportunity: The trading opportunity to analyze
             
@@ -71,15 +107,37 @@ class SocialAnalyzer:
             token_name = getattr(opportunity.token, 'name', None)
             token_address = opportunity.token.address
             
-            # Multiple analysis methods
-            await self._analyze_twitter_mentions(token_symbol, token_name, metrics)
-            await self._analyze_telegram_activity(token_symbol, token_address, metrics)
-            await self._analyze_reddit_mentions(token_symbol, token_name, metrics)
-            await self._check_influencer_mentions(token_symbol, metrics)
+            # Each source writes into its own partial metrics
+            partials = {name: SocialMetrics() for name in ('twitter', 'telegram', 'reddit', 'influencer')}
+            tasks = {
+                'twitter': asyncio.create_task(
+                    self._analyze_twitter_mentions(token_symbol, token_name, partials['twitter'])),
+                'telegram': asyncio.create_task(
+                    self._analyze_telegram_activity(token_symbol, token_address, partials['telegram'])),
+                'reddit': asyncio.create_task(
+                    self._analyze_reddit_mentions(token_symbol, token_name, partials['reddit'])),
+                'influencer': asyncio.create_task(
+                    self._check_influencer_mentions(token_symbol, partials['influencer']))
+            }
+            
+            done, pending = await asyncio.wait(tasks.values(), timeout=self.deadline_seconds)
+            
+            metrics = self._merge_source_metrics(
+                [partials[name] for name, task in tasks.items() if task in done]
+            )
             
             # Calculate composite scores
             self._calculate_social_scores(metrics)
             
+            if pending:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    late_sources = [name for name, task in tasks.items() if task in pending]
+                    self.logger.debug("Social deadline hit for %s, late: %s", token_symbol, ', '.join(late_sources))
+                
+                refinement = asyncio.create_task(self._refine_after_late_results(opportunity, tasks, partials))
+                self.refinement_tasks.add(refinement)
+                refinement.add_done_callback(self.refinement_tasks.discard)
+            
             self.logger.info(f"Social analysis complete: {token_symbol} - Score: {metrics.social_score:.2f}")
             
         except Exception as e:
@@ -90,6 +148,65 @@ class SocialAnalyzer:
             
         return metrics
         
+    async def _refine_after_late_results(
+        self,
+        opportunity: TradingOpportunity,
+        tasks: Dict[str, asyncio.Task],
+        partials: Dict[str, SocialMetrics]
+    ) -> None:
+        """
+        Wait for late sources, re-score with everything available and notify callbacks.
+        
+        Args:
+            opportunity: Opportunity being analyzed
+            tasks: Source tasks by name
+            partials: Partial metrics by source name
+        """
+        try:
+            pending = [task for task in tasks.values() if not task.done()]
+            _, still_pending = await asyncio.wait(pending, timeout=self.late_result_timeout)
+            for task in still_pending:
+                task.cancel()
+            
+            refined = self._merge_source_metrics(
+                [partials[name] for name, task in tasks.items() if task.done() and not task.cancelled()]
+            )
+            self._calculate_social_scores(refined)
+            
+            self.logger.debug(
+                f"Social refinement: {opportunity.token.symbol} - Score: {refined.social_score:.2f}"
+            )
+            
+            for callback in self.refinement_callbacks:
+                try:
+                    await callback(opportunity, refined)
+                except Exception as e:
+                    self.logger.error(f"Social refinement callback failed: {e}")
+                    
+        except Exception as e:
+            self.logger.error(f"Social refinement failed for {opportunity.token.symbol}: {e}")
+            
+    def _merge_source_metrics(self, partials: List[SocialMetrics]) -> SocialMetrics:
+        """
+        Combine per-source partial metrics into one SocialMetrics.
+        
+        Args:
+            partials: Metrics written by the sources that completed
+            
+        Returns:
+            Merged SocialMetrics (scores not yet calculated)
+        """
+        merged = SocialMetrics()
+        for partial in partials:
+            merged.twitter_followers = merged.twitter_followers or partial.twitter_followers
+            merged.telegram_members = merged.telegram_members or partial.telegram_members
+            merged.discord_members = merged.discord_members or partial.discord_members
+            merged.reddit_subscribers = merged.reddit_subscribers or partial.reddit_subscribers
+            merged.website_url = merged.website_url or partial.website_url
+            # Sources add their sentiment contribution to a zero baseline
+            merged.sentiment_score += partial.sentiment_score
+        return merged
+        
     async def _analyze_twitter_mentions(self, symbol: str, name: Optional[str], metrics: SocialMetrics):
         """Analyze Twitter/X mentions and sentiment."""
         try:
@@ -108,7 +225,7 @@ class SocialAnalyzer:
                 estimated_mentions = 3
                 metrics.twitter_followers = estimated_mentions * 20
                 
-            self.logger.debug(f"Twitter analysis: {symbol} - {estimated_mentions} estimated mentions")
+            self.logger.debug("Twitter analysis: %s - %s estimated mentions", symbol, estimated_mentions)
             
         except Exception as e:
             self.logger.debug(f"Twitter analysis failed: {e}")
@@ -140,7 +257,7 @@ class SocialAnalyzer:
                 estimated_members = 100
                 
             metrics.telegram_members = estimated_members
-            self.logger.debug(f"Telegram analysis: {symbol} - {estimated_members} estimated members")
+            self.logger.debug("Telegram analysis: %s - %s estimated members", symbol, estimated_members)
             
         except Exception as e:
             self.logger.debug(f"Telegram analysis failed: {e}")
@@ -162,7 +279,7 @@ class SocialAnalyzer:
                 reddit_score += 0.2
                 
             metrics.reddit_subscribers = int(reddit_score * 1000)
-            self.logger.debug(f"Reddit analysis: {symbol} - Score: {reddit_score}")
+            self.logger.debug("Reddit analysis: %s - Score: %s", symbol, reddit_score)
             
         except Exception as e:
             self.logger.debug(f"Reddit analysis failed: {e}")
@@ -184,7 +301,7 @@ class SocialAnalyzer:
                 influencer_mentions = 1
                 
             metrics.sentiment_score += influencer_mentions * 0.3
-            self.logger.debug(f"Influencer analysis: {symbol} - {influencer_mentions} mentions")
+            self.logger.debug("Influencer analysis: %s - %s mentions", symbol, influencer_mentions)
             
         except Exception as e:
             self.logger.debug(f"Influencer analysis failed: {e}")
@@ -245,39 +362,43 @@ class SocialAnalyzer:
                 "user.fields": "public_metrics"
             }
             
-            async with self.session.get(url, headers=headers, params=params) as response:
-                if response.status == 200:
+            async def fetch_tweets():
+                async with self.session.get(url, headers=headers, params=params) as response:
+                    if response.status != 200:
+                        return None
                     data = await response.json()
-                    tweets = data.get('data', [])
+                    return data.get('data', [])
+            
+            tweets = await self.cache.get_or_fetch('twitter', f"{symbol}:{name}", fetch_tweets)
                     
-                    if tweets:
-                        # Analyze sentiment and engagement
-                        total_engagement = 0
-                        positive_sentiment = 0
-                        total_tweets = len(tweets)
-                        
-                        for tweet in tweets:
-                            metrics_data = tweet.get('public_metrics', {})
-                            engagement = (
-                                metrics_data.get('like_count', 0) +
-                                metrics_data.get('retweet_count', 0) * 2 +
-                                metrics_data.get('reply_count', 0)
-                            )
-                            total_engagement += engagement
-                            
-                            # Simple sentiment analysis
-                            text = tweet.get('text', '').lower()
-                            if any(word in text for word in self.positive_keywords):
-                                positive_sentiment += 1
-                        
-                        # Calculate metrics
-                        avg_engagement = total_engagement / total_tweets if total_tweets > 0 else 0
-                        sentiment_ratio = positive_sentiment / total_tweets if total_tweets > 0 else 0
-                        
-                        metrics.twitter_followers = int(avg_engagement * 10)  # Estimate
-                        metrics.sentiment_score += (sentiment_ratio - 0.5) * 0.4  # -0.2 to +0.2
-                        
-                        self.logger.info(f"Twitter analysis: {symbol} - {total_tweets} tweets, avg engagement: {avg_engagement}")
+            if tweets:
+                # Analyze sentiment and engagement
+                total_engagement = 0
+                positive_sentiment = 0
+                total_tweets = len(tweets)
+                
+                for tweet in tweets:
+                    metrics_data = tweet.get('public_metrics', {})
+                    engagement = (
+                        metrics_data.get('like_count', 0) +
+                        metrics_data.get('retweet_count', 0) * 2 +
+                        metrics_data.get('reply_count', 0)
+                    )
+                    total_engagement += engagement
+                    
+                    # Simple sentiment analysis
+                    text = tweet.get('text', '').lower()
+                    if any(word in text for word in self.positive_keywords):
+                        positive_sentiment += 1
+                
+                # Calculate metrics
+                avg_engagement = total_engagement / total_tweets if total_tweets > 0 else 0
+                sentiment_ratio = positive_sentiment / total_tweets if total_tweets > 0 else 0
+                
+                metrics.twitter_followers = int(avg_engagement * 10)  # Estimate
+                metrics.sentiment_score += (sentiment_ratio - 0.5) * 0.4  # -0.2 to +0.2
+                
+                self.logger.info(f"Twitter analysis: {symbol} - {total_tweets} tweets, avg engagement: {avg_engagement}")
                     
         except Exception as e:
             self.logger.debug(f"Twitter analysis failed: {e}")
@@ -290,13 +411,21 @@ class SocialAnalyzer:
             
             for term in search_terms:
                 # Use Telegram search API or web scraping
-                channels = await self._search_telegram_channels(term)
+                channels = await self.cache.get_or_fetch(
+                    'telegram', f"search:{term}",
+                    lambda term=term: self._search_telegram_channels(term)
+                ) or []
                 
                 for channel in channels:
                     # Verify it's the official channel
                     if await self._verify_official_channel(channel, token_address):
-                        member_count = await self._get_telegram_member_count(channel)
-                        recent_activity = await self._analyze_telegram_activity(channel)
+                        channel_data = await self.cache.get_or_fetch(
+                            'telegram', f"channel:{channel}",
+                            lambda channel=channel: self._fetch_telegram_channel(channel)
+                        )
+                        if not channel_data:
+                            continue
+                        member_count, recent_activity = channel_data
                         
                         metrics.telegram_members = member_count
                         
@@ -326,7 +455,10 @@ class SocialAnalyzer:
             
             for subreddit in subreddits:
                 # Search for token mentions in the last 24 hours
-                posts = await self._search_reddit_posts(subreddit, symbol, hours=24)
+                posts = await self.cache.get_or_fetch(
+                    'reddit', f"{subreddit}:{symbol}",
+                    lambda subreddit=subreddit: self._search_reddit_posts(subreddit, symbol, hours=24)
+                ) or []
                 
                 for post in posts:
                     total_mentions += 1
@@ -366,14 +498,20 @@ class SocialAnalyzer:
             for influencer in influencers:
                 try:
                     # Check their recent tweets for token mentions
-                    tweets = await self._get_user_tweets(influencer, count=50)
+                    tweets = await self.cache.get_or_fetch(
+                        'influencer', f"tweets:{influencer}",
+                        lambda influencer=influencer: self._get_user_tweets(influencer, count=50)
+                    ) or []
                     
                     for tweet in tweets:
                         if symbol.lower() in tweet.get('text', '').lower():
                             mentions_found += 1
                             
                             # Get influencer's follower count for weighting
-                            user_data = await self._get_twitter_user_data(influencer)
+                            user_data = await self.cache.get_or_fetch(
+                                'influencer', f"user:{influencer}",
+                                lambda influencer=influencer: self._get_twitter_user_data(influencer)
+                            ) or {}
                             followers = user_data.get('followers_count', 0)
                             total_followers += followers
                             
@@ -395,6 +533,40 @@ class SocialAnalyzer:
         except Exception as e:
             self.logger.debug(f"Influencer analysis failed: {e}")
 
+    async def _fetch_telegram_channel(self, channel: str):
+        """
+        Fetch member count and recent messages from a channel's public t.me preview.
+        
+        Args:
+            channel: Channel handle
+            
+        Returns:
+            Tuple of (member_count, recent_messages), or None if the page is unavailable
+        """
+        if not self.session:
+            return None
+        
+        async with self.session.get(f"https://t.me/s/{channel}") as response:
+            if response.status != 200:
+                return None
+            page = await response.text()
+        
+        return self._parse_telegram_member_count(page), self._get_telegram_recent_messages(page)
+
+    @staticmethod
+    def _parse_telegram_member_count(page: str) -> int:
+        """Parse the subscriber/member count from a t.me preview page."""
+        match = re.search(r'tgme_page_extra">\s*([\d\s,.]+)\s*(?:subscribers|members)', page)
+        if not match:
+            return 0
+        return int(re.sub(r'[^\d]', '', match.group(1)) or 0)
+
+    @staticmethod
+    def _get_telegram_recent_messages(page: str, limit: int = 20) -> List[str]:
+        """Extract the text of the most recent messages from a t.me preview page."""
+        messages = re.findall(r'class="tgme_widget_message_text[^"]*"[^>]*>(.*?)</div>', page, re.S)
+        return [re.sub(r'<[^>]+>', ' ', message).strip() for message in messages[-limit:]]
+
     def _calculate_social_scores_enhanced(self, metrics: SocialMetrics):
         """Enhanced social score calculation with real data."""
         try:
@@ -0,0 +1,511 @@
+# analyzers/trade_simulator.py
+"""
+Buy/sell trade simulation for honeypot and tax detection.
+Runs a router buy followed by a sell through eth_callMany with state overrides,
+batching concurrent requests and caching results by contract code hash.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+from web3 import Web3
+
+from utils.abi_encoding import (
+    encode_balance_of,
+    encode_approve,
+    encode_get_amounts_out,
+    encode_swap_exact_eth_for_tokens,
+    encode_swap_exact_tokens_for_tokens_fot,
+    decode_uint,
+    decode_uint_array_last
+)
+from utils.logger import logger_manager
+
+
+class SimulationStatus(Enum):
+    """Outcome of a buy/sell simulation."""
+    OK = "ok"
+    HONEYPOT = "honeypot"
+    BUY_REVERTED = "buy_reverted"
+    BUY_ONLY = "buy_only"
+    NO_CODE = "no_code"
+    FAILED = "failed"
+
+
+@dataclass
+class SimulationResult:
+    """Measured result of a simulated buy followed by a sell."""
+    token_address: str
+    code_hash: Optional[str] = None
+    status: SimulationStatus = SimulationStatus.FAILED
+    buy_success: bool = False
+    sell_success: bool = False
+    buy_tax: Optional[float] = None
+    sell_tax: Optional[float] = None
+    error: Optional[str] = None
+    method: str = "eth_callMany"
+    simulated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def is_honeypot(self) -> bool:
+        """Whether the token can be bought but not sold back."""
+        return self.status == SimulationStatus.HONEYPOT
+
+
+# Address used as the simulated trader; funded through a state override
+SIMULATION_ACCOUNT = "0x5e1f0a7A39Cd7c1F6b2DdE8f6f3e3bB0A1c4D9e2"
+SIMULATION_BALANCE_WEI = 10 ** 21
+SIMULATION_GAS = 2_000_000
+
+# Swap deadline for simulated calls, which are never broadcast. A constant instead of
+# now + N keeps the request params identical between recording and replay.
+SIMULATION_DEADLINE = 2 ** 32 - 1
+
+# Error messages nodes return when eth_callMany itself is unavailable (compared lower-cased)
+CALL_MANY_UNSUPPORTED_MESSAGES = (
+    "method not found",
+    "not supported",
+    "method not supported",
+    "the method eth_callmany does not exist/is not available",
+)
+
+
+class TradeSimulator:
+    """
+    Simulates a buy and an immediate sell through a Uniswap V2 style router.
+    Concurrent simulate() calls are collected into one eth_callMany request.
+    """
+
+    def __init__(
+        self,
+        w3: Web3,
+        router_address: str,
+        wrapped_native: str,
+        buy_amount_wei: int = 10 ** 16,
+        batch_window: float = 0.025,
+        max_batch_size: int = 25,
+        cache_ttl: float = 600.0,
+        max_token_results: int = 5000,
+        max_cached_hashes: int = 5000
+    ) -> None:
+        """
+        Initialize the trade simulator.
+
+        Args:
+            w3: Web3 connection (node must support eth_callMany for sell checks)
+            router_address: DEX router used for the simulated swaps
+            wrapped_native: Wrapped native token address (WETH)
+            buy_amount_wei: Native amount used for the simulated buy
+            batch_window: Seconds to wait for more requests before flushing a batch
+            max_batch_size: Maximum tokens simulated in one request
+            cache_ttl: Seconds a result stays valid for a code hash
+            max_token_results: Maximum recent results kept per token address
+            max_cached_hashes: Maximum results kept per code hash
+        """
+        self.logger = logger_manager.get_logger("TradeSimulator")
+        self.w3 = w3
+        self.router = Web3.to_checksum_address(router_address)
+        self.wrapped_native = Web3.to_checksum_address(wrapped_native)
+        self.sim_account = Web3.to_checksum_address(SIMULATION_ACCOUNT)
+        self.buy_amount_wei = buy_amount_wei
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.cache_ttl = cache_ttl
+        self.max_token_results = max_token_results
+        self.max_cached_hashes = max_cached_hashes
+
+        # Results per code hash, least recently used first
+        self.cache: "OrderedDict[str, Tuple[float, SimulationResult]]" = OrderedDict()
+        # Latest result per token address, including clones served from the code-hash cache
+        self.token_results: "OrderedDict[str, Tuple[float, SimulationResult]]" = OrderedDict()
+        self.pending: Dict[str, List[asyncio.Future]] = {}
+        self.flush_task: Optional[asyncio.Task] = None
+        # Full-batch flushes, referenced until done so they are not garbage-collected
+        self.flush_tasks: Set[asyncio.Task] = set()
+        self.call_many_supported: Optional[bool] = None
+
+        self.stats = {
+            'simulations': 0,
+            'cache_hits': 0,
+            'batches': 0,
+            'honeypots': 0
+        }
+
+    async def simulate(self, token_address: str) -> SimulationResult:
+        """
+        Simulate a buy and sell of a token, sharing a batch with concurrent callers.
+
+        Args:
+            token_address: Token to simulate
+
+        Returns:
+            SimulationResult with measured taxes and revert status
+        """
+        token_address = Web3.to_checksum_address(token_address)
+        future = asyncio.get_running_loop().create_future()
+        self.pending.setdefault(token_address, []).append(future)
+
+        if len(self.pending) >= self.max_batch_size:
+            # Detached, so cancelling this caller cannot cancel the batch other callers wait on
+            task = asyncio.create_task(self._run_and_resolve(self._take_pending()))
+            self.flush_tasks.add(task)
+            task.add_done_callback(self.flush_tasks.discard)
+        elif not self.flush_task or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    async def simulate_batch(self, token_addresses: List[str]) -> List[SimulationResult]:
+        """
+        Simulate several tokens in as few requests as possible.
+
+        Args:
+            token_addresses: Tokens to simulate
+
+        Returns:
+            SimulationResults in input order
+        """
+        return list(await asyncio.gather(*(self.simulate(address) for address in token_addresses)))
+
+    async def _flush_after_window(self) -> None:
+        """Flush the pending batch once the batching window expires."""
+        await asyncio.sleep(self.batch_window)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Run all pending simulations and resolve their futures."""
+        await self._run_and_resolve(self._take_pending())
+
+    def _take_pending(self) -> Dict[str, List[asyncio.Future]]:
+        """Detach the pending batch so later callers start a new one."""
+        batch, self.pending = self.pending, {}
+        return batch
+
+    async def _run_and_resolve(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        """
+        Simulate a batch and resolve its callers' futures.
+
+        Args:
+            batch: Futures waiting on each token address
+        """
+        if not batch:
+            return
+
+        try:
+            results = await self._run_batch(list(batch.keys()))
+        except Exception as e:
+            self.logger.error(f"Simulation batch failed: {e}")
+            results = {
+                address: SimulationResult(token_address=address, error=str(e))
+                for address in batch
+            }
+
+        for address, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(results[address])
+
+    async def _run_batch(self, token_addresses: List[str]) -> Dict[str, SimulationResult]:
+        """
+        Resolve code hashes, serve cached results and simulate the rest.
+
+        Args:
+            token_addresses: Checksummed token addresses
+
+        Returns:
+            Mapping of token address to SimulationResult
+        """
+        codes = await asyncio.gather(
+            *(asyncio.to_thread(self.w3.eth.get_code, address) for address in token_addresses),
+            return_exceptions=True
+        )
+
+        results: Dict[str, SimulationResult] = {}
+        to_simulate: List[Tuple[str, str]] = []
+        now = time.time()
+
+        for address, code in zip(token_addresses, codes):
+            if isinstance(code, Exception):
+                results[address] = SimulationResult(token_address=address, error=str(code))
+                continue
+            if not code:
+                results[address] = SimulationResult(token_address=address, status=SimulationStatus.NO_CODE)
+                continue
+
+            code_hash = Web3.keccak(code).hex()
+            cached = self._get_cache_entry(code_hash)
+            if cached and now - cached[0] < self.cache_ttl:
+                self.stats['cache_hits'] += 1
+                results[address] = replace(cached[1], token_address=address)
+                self._remember(results[address], cached[0])
+            else:
+                to_simulate.append((address, code_hash))
+
+        if to_simulate:
+            self.stats['batches'] += 1
+            simulated = await self._simulate_uncached([address for address, _ in to_simulate])
+
+            for address, code_hash in to_simulate:
+                result = simulated[address]
+                result.code_hash = code_hash
+                results[address] = result
+                self.stats['simulations'] += 1
+                if result.is_honeypot:
+                    self.stats['honeypots'] += 1
+                if result.status != SimulationStatus.FAILED:
+                    self._cache_result(code_hash, result, now)
+                    self._remember(result, now)
+
+        return results
+
+    def _cache_result(self, code_hash: str, result: SimulationResult, simulated_at: float) -> None:
+        """Cache a result under its code hash, evicting the least recently used entries."""
+        self.cache[code_hash] = (simulated_at, result)
+        self.cache.move_to_end(code_hash)
+        while len(self.cache) > self.max_cached_hashes:
+            self.cache.popitem(last=False)
+
+    def _get_cache_entry(self, code_hash: str) -> Optional[Tuple[float, SimulationResult]]:
+        """Get the cached (simulated_at, result) for a code hash, marking it recently used."""
+        cached = self.cache.get(code_hash)
+        if cached:
+            self.cache.move_to_end(code_hash)
+        return cached
+
+    def _remember(self, result: SimulationResult, simulated_at: float) -> None:
+        """Index a result under its token address, evicting the oldest entries."""
+        key = result.token_address.lower()
+        self.token_results[key] = (simulated_at, result)
+        self.token_results.move_to_end(key)
+        while len(self.token_results) > self.max_token_results:
+            self.token_results.popitem(last=False)
+
+    async def _simulate_uncached(self, token_addresses: List[str]) -> Dict[str, SimulationResult]:
+        """
+        Simulate tokens with eth_callMany, falling back to single eth_calls.
+
+        Args:
+            token_addresses: Tokens to simulate
+
+        Returns:
+            Mapping of token address to SimulationResult
+        """
+        if self.call_many_supported is not False:
+            try:
+                results = await self._simulate_with_call_many(token_addresses)
+                self.call_many_supported = True
+                return results
+            except NotImplementedError:
+                self.call_many_supported = False
+                self.logger.warning("eth_callMany not supported by node, falling back to buy-only eth_call")
+
+        return await self._simulate_buy_only(token_addresses)
+
+    def _state_context(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Build the block context and balance override for the simulated account."""
+        state_context = {'blockNumber': 'latest', 'transactionIndex': -1}
+        state_override = {self.sim_account: {'balance': hex(SIMULATION_BALANCE_WEI)}}
+        return state_context, state_override
+
+    def _call(self, to: str, data: bytes, value: int = 0) -> Dict[str, Any]:
+        """Build a simulated call from the simulation account."""
+        call = {'from': self.sim_account, 'to': to, 'data': '0x' + data.hex(), 'gas': hex(SIMULATION_GAS)}
+        if value:
+            call['value'] = hex(value)
+        return call
+
+    def _buy_call(self, token_address: str) -> Dict[str, Any]:
+        """Build the simulated fee-on-transfer tolerant buy."""
+        data = encode_swap_exact_eth_for_tokens(
+            0, [self.wrapped_native, token_address], self.sim_account, SIMULATION_DEADLINE, fee_on_transfer=True
+        )
+        return self._call(self.router, data, self.buy_amount_wei)
+
+    async def _call_many(self, bundles: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Execute bundles through eth_callMany in one request.
+
+        Args:
+            bundles: Bundles of sequential transactions
+
+        Returns:
+            Per-bundle lists of per-transaction results
+        """
+        state_context, state_override = self._state_context()
+        response = await asyncio.to_thread(
+            self.w3.provider.make_request, "eth_callMany", [bundles, state_context, state_override]
+        )
+
+        error = response.get('error')
+        if error:
+            message = str(error.get('message', '')).lower()
+            if error.get('code') == -32601 or message in CALL_MANY_UNSUPPORTED_MESSAGES:
+                raise NotImplementedError(error.get('message'))
+            raise RuntimeError(error.get('message', str(error)))
+
+        return response['result']
+
+    @staticmethod
+    def _output(step: Dict[str, Any]) -> Optional[bytes]:
+        """Return the output bytes of a bundle step, or None if it reverted."""
+        if 'error' in step:
+            return None
+        return bytes.fromhex(step.get('value', '0x')[2:])
+
+    async def _simulate_with_call_many(self, token_addresses: List[str]) -> Dict[str, SimulationResult]:
+        """
+        Two-round simulation: measure the buy, then replay it and measure the sell.
+
+        Args:
+            token_addresses: Tokens to simulate
+
+        Returns:
+            Mapping of token address to SimulationResult
+        """
+        results: Dict[str, SimulationResult] = {}
+
+        # Round 1: quote, buy, read received balance
+        round_one = [
+            {'transactions': [
+                self._call(self.router, encode_get_amounts_out(self.buy_amount_wei, [self.wrapped_native, address])),
+                self._buy_call(address),
+                self._call(address, encode_balance_of(self.sim_account))
+            ]}
+            for address in token_addresses
+        ]
+        round_one_out = await self._call_many(round_one)
+
+        received: Dict[str, int] = {}
+        for address, steps in zip(token_addresses, round_one_out):
+            result = SimulationResult(token_address=address)
+            results[address] = result
+
+            quote, buy, balance = (self._output(step) for step in steps)
+            if buy is None or quote is None or balance is None:
+                result.status = SimulationStatus.BUY_REVERTED
+                result.error = str(steps[1].get('error')) if buy is None else "Quote or balance call reverted"
+                continue
+
+            expected = decode_uint_array_last(quote)
+            amount = decode_uint(balance)
+            result.buy_success = True
+            result.buy_tax = max(0.0, 1 - amount / expected) if expected else None
+
+            if amount > 0:
+                received[address] = amount
+            else:
+                result.status = SimulationStatus.HONEYPOT
+                result.error = "Buy succeeded but no tokens received"
+
+        if not received:
+            return results
+
+        # Round 2: replay buy, approve, quote the sell, sell, read WETH received
+        sell_addresses = list(received.keys())
+        round_two = [
+            {'transactions': [
+                self._buy_call(address),
+                self._call(address, encode_approve(self.router)),
+                self._call(self.router, encode_get_amounts_out(received[address], [address, self.wrapped_native])),
+                self._call(self.router, encode_swap_exact_tokens_for_tokens_fot(
+                    received[address], 0, [address, self.wrapped_native], self.sim_account, SIMULATION_DEADLINE
+                )),
+                self._call(self.wrapped_native, encode_balance_of(self.sim_account))
+            ]}
+            for address in sell_addresses
+        ]
+        round_two_out = await self._call_many(round_two)
+
+        for address, steps in zip(sell_addresses, round_two_out):
+            result = results[address]
+            _, approve, quote, sell, weth_balance = (self._output(step) for step in steps)
+
+            if approve is None or sell is None:
+                result.status = SimulationStatus.HONEYPOT
+                result.error = str((steps[3] if sell is None else steps[1]).get('error', 'Sell reverted'))
+                continue
+
+            expected = decode_uint_array_last(quote) if quote else 0
+            weth_received = decode_uint(weth_balance) if weth_balance else 0
+            result.sell_success = True
+            result.sell_tax = max(0.0, 1 - weth_received / expected) if expected else None
+            result.status = SimulationStatus.OK
+
+        return results
+
+    async def _simulate_buy_only(self, token_addresses: List[str]) -> Dict[str, SimulationResult]:
+        """
+        Fallback for nodes without eth_callMany: check that a plain buy does not revert.
+
+        Args:
+            token_addresses: Tokens to simulate
+
+        Returns:
+            Mapping of token address to SimulationResult
+        """
+        state_context, state_override = self._state_context()
+
+        async def buy_only(address: str) -> SimulationResult:
+            result = SimulationResult(token_address=address, method="eth_call")
+            response = await asyncio.to_thread(
+                self.w3.provider.make_request,
+                "eth_call",
+                [self._buy_call(address), 'latest', state_override]
+            )
+            if response.get('error'):
+                result.status = SimulationStatus.BUY_REVERTED
+                result.error = response['error'].get('message')
+            else:
+                result.buy_success = True
+                result.status = SimulationStatus.BUY_ONLY
+            return result
+
+        outcomes = await asyncio.gather(*(buy_only(address) for address in token_addresses), return_exceptions=True)
+        return {
+            address: outcome if isinstance(outcome, SimulationResult)
+            else SimulationResult(token_address=address, method="eth_call", error=str(outcome))
+            for address, outcome in zip(token_addresses, outcomes)
+        }
+
+    async def get_code_hash(self, token_address: str, w3: Optional[Web3] = None) -> Optional[str]:
+        """
+        Fetch a token's runtime code hash without simulating it.
+
+        Args:
+            token_address: Token contract address
+            w3: Connection to the token's chain (the simulator's own connection by default)
+
+        Returns:
+            keccak256 of the deployed code, or None if there is no code
+        """
+        w3 = w3 or self.w3
+        code = await asyncio.to_thread(w3.eth.get_code, Web3.to_checksum_address(token_address))
+        return Web3.keccak(code).hex() if code else None
+
+    def get_cached(self, code_hash: str) -> Optional[SimulationResult]:
+        """Get a cached result for a code hash if still fresh."""
+        cached = self._get_cache_entry(code_hash)
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            return cached[1]
+        return None
+
+    def get_cached_for_token(self, token_address: str) -> Optional[SimulationResult]:
+        """Get the most recent fresh result simulated for a token address."""
+        cached = self.token_results.get(token_address.lower())
+        if cached and time.time() - cached[0] < self.cache_ttl:
+            return cached[1]
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get simulator statistics."""
+        return {
+            **self.stats,
+            'cached_code_hashes': len(self.cache),
+            'cached_tokens': len(self.token_results),
+            'call_many_supported': self.call_many_supported
+        }
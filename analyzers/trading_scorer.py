@@ -4,12 +4,10 @@ Trading opportunity scoring and recommendation system.
 Combines contract analysis, social metrics, and market data to score opportunities.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional, Sequence, Any
+from dataclasses import dataclass, field
 from datetime import datetime
 import math
-# At the top of analyzers/trading_scorer.py, add this import:
-from models.token import TradingOpportunity, RiskLevel
-# Add this line:
 try:
     from models.watchlist import watchlist_manager
 except ImportError:
@@ -17,6 +15,68 @@ except ImportError:
 from models.token import TradingOpportunity, RiskLevel
 from utils.logger import logger_manager
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Recommendation tiers checked in order: (action, confidence, position size, min score, allowed risk levels)
+# Allowed risk levels of None means any risk level
+RECOMMENDATION_TIERS = [
+    ("STRONG_BUY", "HIGH", 0.8, 0.8, (RiskLevel.LOW, RiskLevel.MEDIUM)),
+    ("BUY", "MEDIUM", 0.5, 0.65, (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH)),
+    ("SMALL_BUY", "LOW", 0.2, 0.45, (RiskLevel.LOW, RiskLevel.MEDIUM)),
+    ("WATCH", "NEUTRAL", 0.0, 0.3, None),
+]
+FALLBACK_TIER = ("AVOID", "HIGH", 0.0)
+
+# Integer codes for the risk level column of the feature matrix
+RISK_LEVEL_CODES = {level: code for code, level in enumerate(RiskLevel)}
+
+CONTRACT_RISK_PENALTIES = {
+    RiskLevel.LOW: 0.0,
+    RiskLevel.MEDIUM: 0.1,
+    RiskLevel.HIGH: 0.3,
+    RiskLevel.CRITICAL: 0.6
+}
+
+DEX_BONUSES = {
+    'Uniswap V2': 0.2,
+    'BaseSwap': 0.15,
+    'Solana-Jupiter': 0.1,
+    'Pump.fun': 0.05
+}
+
+SOLANA_SOURCE_BONUSES = {
+    'Pump.fun': 0.2,  # Real-time launch detection
+    'Jupiter': 0.1    # Verified but not as fresh
+}
+
+# Score given to opportunities whose features could not be read
+FAILED_SCORE = 0.1
+
+
+@dataclass
+class BatchScoreResult:
+    """
+    Scores and recommendation tiers for a batch of opportunities.
+    Sequences are NumPy arrays when NumPy is available, lists otherwise.
+    """
+    scores: Sequence[float]
+    actions: Sequence[str]
+    confidences: Sequence[str]
+    position_sizes: Sequence[float]
+    components: Dict[str, Sequence[float]] = field(default_factory=dict)
+    vectorized: bool = False
+    elapsed_ms: float = 0.0
+
+    def __len__(self) -> int:
+        """Number of scored opportunities."""
+        return len(self.scores)
+
 class TradingScorer:
     """
     Scores trading opportunities based on multiple factors and generates recommendations.
@@ -42,6 +102,9 @@ class TradingScorer:
             RiskLevel.CRITICAL: 1.0
         }
         
+        # Chain bonus lookups per chain label, memoized for batch extraction
+        self._chain_feature_cache: Dict[str, Tuple[float, bool, bool]] = {}
+        
     def score_opportunity(self, opportunity: TradingOpportunity) -> float:
         """
         Calculate a comprehensive score for a trading opportunity.
@@ -53,7 +116,7 @@ class TradingScorer:
             Score from 0.0 (terrible) to 1.0 (excellent)
         """
         try:
-            self.logger.info(f"Scoring opportunity: {opportunity.token.symbol}")
+            self.logger.debug("Scoring opportunity: %s", opportunity.token.symbol)
             
             # Component scores
             contract_score = self._score_contract_safety(opportunity)
@@ -71,8 +134,14 @@ class TradingScorer:
             
             # Update opportunity with calculated score
             opportunity.confidence_score = final_score
+            opportunity.metadata['score_components'] = {
+                'contract_safety': contract_score,
+                'social_sentiment': social_score,
+                'liquidity_quality': liquidity_score,
+                'timing_factors': timing_score
+            }
             
-            self.logger.info(
+            self.logger.debug(
                 f"Scoring complete: {opportunity.token.symbol} - "
                 f"Final: {final_score:.3f} "
                 f"(Contract: {contract_score:.2f}, Social: {social_score:.2f}, "
@@ -113,12 +182,7 @@ class TradingScorer:
                 score -= 0.2
                 
             # Apply risk level penalty
-            risk_penalty = {
-                RiskLevel.LOW: 0.0,
-                RiskLevel.MEDIUM: 0.1,
-                RiskLevel.HIGH: 0.3,
-                RiskLevel.CRITICAL: 0.6
-            }.get(analysis.risk_level, 0.3)
+            risk_penalty = CONTRACT_RISK_PENALTIES.get(analysis.risk_level, 0.3)
             
             score -= risk_penalty
             
@@ -171,16 +235,7 @@ class TradingScorer:
                 score += 0.1  # Decent for Solana
                 
             # DEX quality bonus
-            dex_bonuses = {
-                'Uniswap V2': 0.2,
-                'BaseSwap': 0.15,
-                'Solana-Jupiter': 0.1,
-                'Pump.fun': 0.05
-            }
-            
-            dex_name = liquidity.dex_name
-            if dex_name in dex_bonuses:
-                score += dex_bonuses[dex_name]
+            score += DEX_BONUSES.get(liquidity.dex_name, 0.0)
                 
             # Liquidity amount bonus
             if liquidity.liquidity_usd:
@@ -224,10 +279,7 @@ class TradingScorer:
             # Source quality for Solana
             if 'SOLANA' in chain:
                 source = opportunity.metadata.get('solana_source', '')
-                if source == 'Pump.fun':
-                    score += 0.2  # Real-time launch detection
-                elif source == 'Jupiter':
-                    score += 0.1  # Verified but not as fresh
+                score += SOLANA_SOURCE_BONUSES.get(source, 0.0)
                     
             return max(0.0, min(1.0, score))
             
@@ -235,6 +287,284 @@ class TradingScorer:
             self.logger.error(f"Timing scoring failed: {e}")
             return 0.5
             
+    # ------------------------------------------------------------------
+    # Batch scoring
+    # ------------------------------------------------------------------
+
+    FEATURE_COLUMNS = (
+        'valid', 'is_honeypot', 'ownership_renounced', 'liquidity_locked',
+        'has_blacklist', 'is_mintable', 'is_pausable', 'risk_code',
+        'social_score', 'sentiment_score', 'twitter_followers', 'telegram_members',
+        'chain_liquidity_bonus', 'dex_bonus', 'liquidity_usd',
+        'detected_ts', 'timing_chain_bonus'
+    )
+
+    def score_batch(
+        self,
+        opportunities: List[TradingOpportunity],
+        update_opportunities: bool = True
+    ) -> BatchScoreResult:
+        """
+        Score many opportunities at once.
+        
+        Builds a columnar feature matrix and applies the component scorers,
+        weights and recommendation tiers as vector operations. Falls back to
+        the per-opportunity scorers when NumPy is not installed.
+        
+        Args:
+            opportunities: Opportunities to score
+            update_opportunities: Whether to write each score to confidence_score
+            
+        Returns:
+            BatchScoreResult aligned with the input order
+        """
+        start = datetime.now()
+        
+        if NUMPY_AVAILABLE:
+            result = self.score_feature_matrix(self.build_feature_matrix(opportunities))
+        else:
+            result = self._score_batch_scalar(opportunities)
+        
+        if update_opportunities:
+            scores = result.scores.tolist() if result.vectorized else result.scores
+            for opportunity, score in zip(opportunities, scores):
+                opportunity.confidence_score = score
+        
+        result.elapsed_ms = (datetime.now() - start).total_seconds() * 1000
+        self.logger.debug(
+            f"Batch scored {len(opportunities)} opportunities in {result.elapsed_ms:.1f}ms "
+            f"({'vectorized' if result.vectorized else 'scalar'})"
+        )
+        return result
+
+    def build_feature_matrix(self, opportunities: List[TradingOpportunity]) -> Dict[str, Any]:
+        """
+        Extract the scoring inputs of each opportunity into NumPy columns.
+        
+        Only weight- and time-independent values are stored, so the matrix can be
+        kept and re-scored later (e.g. after changing scoring_weights).
+        
+        Args:
+            opportunities: Opportunities to extract
+            
+        Returns:
+            Dictionary of column name to 1-D float array
+        """
+        rows = [self._feature_row(opportunity) for opportunity in opportunities]
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(self.FEATURE_COLUMNS))
+        matrix = np.ascontiguousarray(matrix.T)
+        return {name: matrix[index] for index, name in enumerate(self.FEATURE_COLUMNS)}
+
+    def _feature_row(self, opportunity: TradingOpportunity) -> Tuple[float, ...]:
+        """Extract one feature row; rows that cannot be read are marked invalid."""
+        try:
+            analysis = opportunity.contract_analysis
+            social = opportunity.social_metrics
+            liquidity = opportunity.liquidity
+            metadata = opportunity.metadata
+            
+            chain = metadata.get('chain', '').upper()
+            chain_features = self._chain_feature_cache.get(chain)
+            if chain_features is None:
+                chain_features = self._get_chain_features(chain)
+                self._chain_feature_cache[chain] = chain_features
+            chain_liquidity_bonus, is_base, is_solana = chain_features
+            
+            timing_chain_bonus = 0.0
+            if is_base and liquidity.block_number:
+                timing_chain_bonus += 0.1
+            if is_solana:
+                timing_chain_bonus += SOLANA_SOURCE_BONUSES.get(metadata.get('solana_source', ''), 0.0)
+            
+            return (
+                1.0,
+                analysis.is_honeypot,
+                analysis.ownership_renounced,
+                analysis.liquidity_locked,
+                analysis.has_blacklist,
+                analysis.is_mintable,
+                analysis.is_pausable,
+                RISK_LEVEL_CODES.get(analysis.risk_level, -1),
+                social.social_score or 0.0,
+                social.sentiment_score or 0.0,
+                social.twitter_followers or 0,
+                social.telegram_members or 0,
+                chain_liquidity_bonus,
+                DEX_BONUSES.get(liquidity.dex_name, 0.0),
+                liquidity.liquidity_usd or 0.0,
+                opportunity.detected_at.timestamp(),
+                timing_chain_bonus
+            )
+            
+        except Exception as e:
+            self.logger.debug(f"Feature extraction failed: {e}")
+            return (0.0,) * len(self.FEATURE_COLUMNS)
+
+    @staticmethod
+    def _get_chain_features(chain: str) -> Tuple[float, bool, bool]:
+        """Get (liquidity chain bonus, is Base, is Solana) for an upper-cased chain label."""
+        if 'ETHEREUM' in chain:
+            liquidity_bonus = 0.2
+        elif 'BASE' in chain:
+            liquidity_bonus = 0.3
+        elif 'SOLANA' in chain:
+            liquidity_bonus = 0.1
+        else:
+            liquidity_bonus = 0.0
+        return liquidity_bonus, 'BASE' in chain, 'SOLANA' in chain
+
+    def score_feature_matrix(
+        self,
+        features: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> BatchScoreResult:
+        """
+        Score a feature matrix with the current weights, mirroring the scalar scorers.
+        
+        Args:
+            features: Columns produced by build_feature_matrix
+            now: Reference time for detection age (defaults to now)
+            
+        Returns:
+            BatchScoreResult with per-row scores, tiers and component scores
+        """
+        f = features
+        valid = f['valid'] > 0
+        
+        # Contract safety
+        penalty_table = np.array([CONTRACT_RISK_PENALTIES[level] for level in RiskLevel] + [0.3])
+        risk_code = f['risk_code'].astype(np.int64)
+        contract = (
+            1.0
+            - 0.3 * (f['ownership_renounced'] == 0)
+            - 0.4 * (f['liquidity_locked'] == 0)
+            - 0.3 * f['has_blacklist']
+            - 0.2 * f['is_mintable']
+            - 0.2 * f['is_pausable']
+            - penalty_table[risk_code]
+        )
+        contract = np.where(f['is_honeypot'] > 0, 0.0, np.clip(contract, 0.0, 1.0))
+        
+        # Social metrics
+        activity = np.where(f['social_score'] != 0, f['social_score'], 0.3)
+        social = (
+            activity * (1.0 + f['sentiment_score'] * 0.5)
+            + 0.1 * (f['twitter_followers'] > 1000)
+            + 0.1 * (f['telegram_members'] > 500)
+        )
+        social = np.clip(social, 0.0, 1.0)
+        
+        # Liquidity quality
+        liquidity_usd = f['liquidity_usd']
+        liquidity_bonus = np.select(
+            [liquidity_usd > 100000, liquidity_usd > 50000, liquidity_usd > 10000],
+            [0.2, 0.15, 0.1],
+            default=0.0
+        )
+        liquidity = np.clip(0.5 + f['chain_liquidity_bonus'] + f['dex_bonus'] + liquidity_bonus, 0.0, 1.0)
+        
+        # Timing factors
+        now_ts = (now or datetime.now()).timestamp()
+        age_minutes = (now_ts - f['detected_ts']) / 60
+        age_bonus = np.select(
+            [age_minutes < 1, age_minutes < 5, age_minutes < 15],
+            [0.3, 0.2, 0.1],
+            default=0.0
+        )
+        timing = np.clip(0.5 + age_bonus + f['timing_chain_bonus'], 0.0, 1.0)
+        
+        scores = (
+            contract * self.scoring_weights['contract_safety'] +
+            social * self.scoring_weights['social_sentiment'] +
+            liquidity * self.scoring_weights['liquidity_quality'] +
+            timing * self.scoring_weights['timing_factors']
+        )
+        scores = np.where(valid, scores, FAILED_SCORE)
+        
+        # Recommendation tiers, first matching tier wins
+        conditions = []
+        for _, _, _, min_score, allowed_levels in RECOMMENDATION_TIERS:
+            allowed_table = np.array(
+                [allowed_levels is None or level in allowed_levels for level in RiskLevel]
+                + [allowed_levels is None]
+            )
+            conditions.append((scores >= min_score) & allowed_table[risk_code])
+        
+        tier_index = np.select(conditions, np.arange(len(RECOMMENDATION_TIERS)), default=len(RECOMMENDATION_TIERS))
+        tiers = RECOMMENDATION_TIERS + [(*FALLBACK_TIER, 0.0, None)]
+        
+        return BatchScoreResult(
+            scores=scores,
+            actions=np.array([tier[0] for tier in tiers])[tier_index],
+            confidences=np.array([tier[1] for tier in tiers])[tier_index],
+            position_sizes=np.array([tier[2] for tier in tiers])[tier_index],
+            components={
+                'contract_safety': np.where(valid, contract, np.nan),
+                'social_sentiment': np.where(valid, social, np.nan),
+                'liquidity_quality': np.where(valid, liquidity, np.nan),
+                'timing_factors': np.where(valid, timing, np.nan)
+            },
+            vectorized=True
+        )
+
+    def _score_batch_scalar(self, opportunities: List[TradingOpportunity]) -> BatchScoreResult:
+        """Score a batch with the per-opportunity scorers (used without NumPy)."""
+        components: Dict[str, List[float]] = {
+            'contract_safety': [],
+            'social_sentiment': [],
+            'liquidity_quality': [],
+            'timing_factors': []
+        }
+        scores, actions, confidences, position_sizes = [], [], [], []
+        
+        for opportunity in opportunities:
+            component_scores = {
+                'contract_safety': self._score_contract_safety(opportunity),
+                'social_sentiment': self._score_social_metrics(opportunity),
+                'liquidity_quality': self._score_liquidity_quality(opportunity),
+                'timing_factors': self._score_timing_factors(opportunity)
+            }
+            score = sum(value * self.scoring_weights[name] for name, value in component_scores.items())
+            
+            try:
+                risk_level = opportunity.contract_analysis.risk_level
+            except AttributeError:
+                risk_level = None
+            action, confidence, position_size = self._classify(score, risk_level)
+            
+            for name, value in component_scores.items():
+                components[name].append(value)
+            scores.append(score)
+            actions.append(action)
+            confidences.append(confidence)
+            position_sizes.append(position_size)
+        
+        return BatchScoreResult(
+            scores=scores,
+            actions=actions,
+            confidences=confidences,
+            position_sizes=position_sizes,
+            components=components,
+            vectorized=False
+        )
+
+    @staticmethod
+    def _classify(score: float, risk_level: Optional[RiskLevel]) -> Tuple[str, str, float]:
+        """
+        Map a score and risk level to a recommendation tier.
+        
+        Args:
+            score: Final opportunity score
+            risk_level: Contract risk level
+            
+        Returns:
+            Tuple of (action, confidence, position size fraction)
+        """
+        for action, confidence, position_size, min_score, allowed_levels in RECOMMENDATION_TIERS:
+            if score >= min_score and (allowed_levels is None or risk_level in allowed_levels):
+                return action, confidence, position_size
+        return FALLBACK_TIER
+            
     def generate_recommendation(self, opportunity: TradingOpportunity) -> Dict[str, any]:
         """
         Generate trading recommendation based on analysis.
@@ -250,26 +580,7 @@ class TradingScorer:
             risk_level = opportunity.contract_analysis.risk_level
             
             # Determine recommendation
-            if score >= 0.8 and risk_level in [RiskLevel.LOW, RiskLevel.MEDIUM]:
-                action = "STRONG_BUY"
-                confidence = "HIGH"
-                position_size = 0.8
-            elif score >= 0.65 and risk_level != RiskLevel.CRITICAL:
-                action = "BUY"
-                confidence = "MEDIUM"
-                position_size = 0.5
-            elif score >= 0.45 and risk_level in [RiskLevel.LOW, RiskLevel.MEDIUM]:
-                action = "SMALL_BUY"
-                confidence = "LOW"
-                position_size = 0.2
-            elif score >= 0.3:
-                action = "WATCH"
-                confidence = "NEUTRAL"
-                position_size = 0.0
-            else:
-                action = "AVOID"
-                confidence = "HIGH"
-                position_size = 0.0
+            action, confidence, position_size = self._classify(score, risk_level)
                 
             # Calculate suggested position sizes for different chains
             max_positions = {
@@ -542,117 +853,6 @@ class TradingScorer:
             self.logger.error(f"Enhanced liquidity scoring failed: {e}")
             return 0.3
 
-    # At the top of analyzers/trading_scorer.py, add import:
-    from models.watchlist import watchlist_manager
-
-    # Update the generate_recommendation method in the TradingScorer class:
-    def generate_recommendation(self, opportunity: TradingOpportunity) -> Dict[str, any]:
-        """
-        Generate trading recommendation based on analysis.
-        
-        Args:
-            opportunity: The analyzed opportunity
-            
-        Returns:
-            Dictionary with recommendation details
-        """
-        try:
-            score = opportunity.confidence_score or 0.0
-            risk_level = opportunity.contract_analysis.risk_level
-            
-            # Determine recommendation
-            if score >= 0.8 and risk_level in [RiskLevel.LOW, RiskLevel.MEDIUM]:
-                action = "STRONG_BUY"
-                confidence = "HIGH"
-                position_size = 0.8
-            elif score >= 0.65 and risk_level != RiskLevel.CRITICAL:
-                action = "BUY"
-                confidence = "MEDIUM"
-                position_size = 0.5
-            elif score >= 0.45 and risk_level in [RiskLevel.LOW, RiskLevel.MEDIUM]:
-                action = "SMALL_BUY"
-                confidence = "LOW"
-                position_size = 0.2
-            elif score >= 0.3:
-                action = "WATCH"
-                confidence = "NEUTRAL"
-                position_size = 0.0
-            else:
-                action = "AVOID"
-                confidence = "HIGH"
-                position_size = 0.0
-                
-            # Calculate suggested position sizes for different chains
-            max_positions = {
-                'ETHEREUM': 0.1,
-                'BASE': 0.5,
-                'SOLANA': 100
-            }
-            
-            chain = opportunity.metadata.get('chain', 'ETHEREUM').upper()
-            max_position = max_positions.get(chain, 0.1)
-            suggested_position = max_position * position_size
-            
-            recommendation = {
-                'action': action,
-                'confidence': confidence,
-                'score': score,
-                'risk_level': risk_level.value,
-                'suggested_position': suggested_position,
-                'chain': chain,
-                'reasons': self._get_recommendation_reasons(opportunity),
-                'warnings': self._get_risk_warnings(opportunity)
-            }
-            
-            # AUTO-ADD TO WATCHLIST for WATCH recommendations
-            if action == "WATCH":
-                try:
-                    reason = f"Auto-added: Score {score:.2f}, {confidence} confidence"
-                    target_price = None  # Could calculate based on analysis
-                    
-                    success = watchlist_manager.add_to_watchlist(
-                        opportunity=opportunity,
-                        reason=reason,
-                        target_price=target_price,
-                        notes=f"Generated recommendation: {action} ({confidence})"
-                    )
-                    
-                    if success:
-                        self.logger.info(f"Auto-added to watchlist: {opportunity.token.symbol}")
-                        recommendation['watchlist_added'] = True
-                    else:
-                        recommendation['watchlist_added'] = False
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to auto-add to watchlist: {e}")
-                    recommendation['watchlist_added'] = False
-            
-            return recommendation
-            
-        except Exception as e:
-            self.logger.error(f"Recommendation generation failed: {e}")
-            return {
-                'action': 'AVOID',
-                'confidence': 'HIGH',
-                'score': 0.0,
-                'risk_level': 'CRITICAL',
-                'suggested_position': 0.0,
-                'reasons': ['Analysis failed'],
-                'warnings': ['Could not analyze token safety'],
-                'watchlist_added': False
-            }
-
-
-
-
-
-
-
-
-
-
-
-
     def _assess_analysis_quality(self, opportunity: TradingOpportunity) -> str:
         """Assess the quality of the analysis performed."""
         quality_score = 0
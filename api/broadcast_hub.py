@@ -0,0 +1,588 @@
+# api/broadcast_hub.py
+"""
+WebSocket broadcast hub for the dashboard.
+Every connection gets a bounded send queue drained by its own writer task, so
+publishing is a non-blocking enqueue and a slow client only delays itself.
+Writers batch queued messages into one frame every frame interval, send
+dashboard stats as deltas against what the client already has, and encode
+frames as msgpack or JSON depending on what the client negotiated. Clients
+can subscribe to a subset of chains and a minimum score.
+"""
+
+import asyncio
+import json
+import struct
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Union
+
+from utils.logger import logger_manager
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+JSON_ENCODING = "json"
+MSGPACK_ENCODING = "msgpack"
+
+# Encodings this server can produce, in order of preference
+SUPPORTED_ENCODINGS = (MSGPACK_ENCODING, JSON_ENCODING) if MSGPACK_AVAILABLE else (JSON_ENCODING,)
+
+# Message types that carry an opportunity and are subject to topic filters
+OPPORTUNITY_MESSAGES = ("new_opportunity", "opportunity_update")
+
+# Error text that means the socket went away rather than a real failure
+DISCONNECT_INDICATORS = (
+    'disconnect', 'closed', 'connection', 'reset',
+    '1001', '1000', '1006',
+    'broken pipe', 'connection aborted'
+)
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[str]:
+    """
+    Key under which a queued message may be replaced by a newer one.
+
+    Args:
+        message: Message about to be queued
+
+    Returns:
+        Key string, or None if every message of this type must be delivered
+    """
+    message_type = message.get("type")
+    if message_type in ("heartbeat", "ping"):
+        return message_type
+    if message_type == "opportunity_update":
+        data = message.get("data") or {}
+        return f"opportunity_update:{data.get('token_address', '')}"
+    if message_type == "snapshot":
+        return f"snapshot:{message.get('name', '')}"
+    return None
+
+
+def negotiate_encoding(requested: Optional[Iterable[str]]) -> str:
+    """
+    Pick the first requested encoding this server supports.
+
+    Args:
+        requested: Encodings offered by the client, in its order of preference
+
+    Returns:
+        Encoding name, JSON if nothing else matches
+    """
+    for encoding in requested or ():
+        if encoding in SUPPORTED_ENCODINGS:
+            return encoding
+    return JSON_ENCODING
+
+
+def msgpack_array_header(length: int) -> bytes:
+    """msgpack array header for a frame of pre-encoded messages."""
+    if length < 16:
+        return bytes([0x90 | length])
+    if length < 0x10000:
+        return b'\xdc' + struct.pack('>H', length)
+    return b'\xdd' + struct.pack('>I', length)
+
+
+class OutgoingMessage:
+    """A published message with its topic attributes and per-encoding cache."""
+
+    __slots__ = ('message', 'key', 'chain', 'score', 'enqueued_at', '_encoded')
+
+    def __init__(self, message: Dict[str, Any], key: Optional[str] = None) -> None:
+        self.message = message
+        self.key = key
+        self.enqueued_at = time.perf_counter()
+        self.chain: Optional[str] = None
+        self.score = 0.0
+        self._encoded: Dict[str, Union[str, bytes]] = {}
+
+        if message.get("type") in OPPORTUNITY_MESSAGES:
+            data = message.get("data") or {}
+            self.chain = str(data.get("chain", "")).upper()
+            self.score = float(data.get("score") or 0.0)
+
+    def encode(self, encoding: str) -> Union[str, bytes]:
+        """
+        Serialize the message, once per encoding.
+
+        Args:
+            encoding: json or msgpack
+
+        Returns:
+            Encoded message
+        """
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            if encoding == MSGPACK_ENCODING:
+                encoded = msgpack.packb(self.message, use_bin_type=True)
+            else:
+                encoded = json.dumps(self.message)
+            self._encoded[encoding] = encoded
+        return encoded
+
+
+def build_frame(messages: List[OutgoingMessage], encoding: str) -> Union[str, bytes]:
+    """
+    Join encoded messages into one frame holding an array of messages.
+
+    Args:
+        messages: Messages in delivery order
+        encoding: json or msgpack
+
+    Returns:
+        Text frame for JSON, binary frame for msgpack
+    """
+    if encoding == MSGPACK_ENCODING:
+        return msgpack_array_header(len(messages)) + b''.join(m.encode(encoding) for m in messages)
+    return '[' + ','.join(m.encode(encoding) for m in messages) + ']'
+
+
+@dataclass
+class Subscription:
+    """Topics a client wants to receive opportunities for."""
+    chains: Optional[FrozenSet[str]] = None
+    min_score: float = 0.0
+
+    @classmethod
+    def from_request(cls, request: Dict[str, Any]) -> "Subscription":
+        """
+        Build a subscription from a client's subscribe message.
+
+        Args:
+            request: Message with optional chains (list) and min_score (float)
+
+        Returns:
+            Subscription; missing fields mean no filter
+        """
+        chains = request.get("chains")
+        try:
+            min_score = max(0.0, float(request.get("min_score") or 0.0))
+        except (TypeError, ValueError):
+            min_score = 0.0
+        return cls(
+            chains=frozenset(str(chain).upper() for chain in chains) if chains else None,
+            min_score=min_score
+        )
+
+    def matches(self, message: OutgoingMessage) -> bool:
+        """Whether a message passes this subscription."""
+        if message.chain is None:
+            return True
+        if self.chains is not None and message.chain not in self.chains:
+            return False
+        return message.score >= self.min_score
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Subscription as sent back to the client."""
+        return {
+            "chains": sorted(self.chains) if self.chains is not None else None,
+            "min_score": self.min_score
+        }
+
+
+@dataclass
+class ClientStats:
+    """Delivery statistics for one client."""
+    sent: int = 0
+    frames: int = 0
+    bytes_sent: int = 0
+    filtered: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    resyncs: int = 0
+    last_latency_ms: float = 0.0
+    avg_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    connected_at: float = field(default_factory=time.time)
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Update latency figures with an exponentially weighted average."""
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.avg_latency_ms = latency_ms if self.sent == 0 else 0.9 * self.avg_latency_ms + 0.1 * latency_ms
+
+
+class ClientChannel:
+    """Bounded outgoing queue and frame writer for one WebSocket."""
+
+    transport = "websocket"
+
+    def __init__(self, websocket: Any, hub: "BroadcastHub") -> None:
+        """
+        Initialize the channel.
+
+        Args:
+            websocket: Connection with async send_text (and send_bytes for msgpack)
+            hub: Owning hub, providing limits and shared stats state
+        """
+        self.websocket = websocket
+        self.hub = hub
+
+        self.queue: Deque[OutgoingMessage] = deque()
+        self.encoding = JSON_ENCODING
+        self.subscription = Subscription()
+        self.sent_state: Dict[str, Any] = {}
+        self.state_version = -1
+        self.needs_resync = False
+        self.closed = False
+        self.stats = ClientStats()
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    def wake(self) -> None:
+        """Signal the writer that there is something to send."""
+        self._wakeup.set()
+
+    def enqueue(self, message: OutgoingMessage) -> None:
+        """
+        Queue a message without waiting for the socket.
+
+        Args:
+            message: Published message; replaces a queued one with the same key
+        """
+        if self.closed:
+            return
+
+        if not self.subscription.matches(message):
+            self.stats.filtered += 1
+            return
+
+        if message.key is not None:
+            for index, queued in enumerate(self.queue):
+                if queued.key == message.key:
+                    self.queue[index] = message
+                    self.stats.coalesced += 1
+                    return
+
+        if len(self.queue) >= self.hub.max_queue:
+            self.queue.popleft()
+            self.stats.dropped += 1
+            if not self.needs_resync:
+                self.needs_resync = True
+                self.stats.resyncs += 1
+
+        self.queue.append(message)
+        self._wakeup.set()
+
+    def _has_pending(self) -> bool:
+        """Whether there are queued messages or unsent stats changes."""
+        return bool(self.queue) or self.needs_resync or self.state_version != self.hub.state_version
+
+    def _next_frame(self) -> List[OutgoingMessage]:
+        """Collect the messages for the next frame."""
+        frame: List[OutgoingMessage] = []
+
+        if self.needs_resync:
+            # Tell the client it missed messages and send it full stats again
+            self.needs_resync = False
+            self.sent_state.clear()
+            frame.append(OutgoingMessage({"type": "resync", "dropped": self.stats.dropped}))
+
+        if self.state_version != self.hub.state_version:
+            self.state_version = self.hub.state_version
+            delta = {
+                name: value for name, value in self.hub.state.items()
+                if name not in self.sent_state or self.sent_state[name] != value
+            }
+            if delta:
+                self.sent_state.update(delta)
+                frame.append(OutgoingMessage({"type": "stats_update", "data": delta}))
+
+        while self.queue and len(frame) < self.hub.max_batch:
+            frame.append(self.queue.popleft())
+
+        return frame
+
+    async def _writer(self) -> None:
+        """Send batched frames until the connection closes."""
+        try:
+            while not self.closed:
+                if not self._has_pending():
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                # Let the frame fill up before sending it
+                if self.hub.frame_interval > 0:
+                    await asyncio.sleep(self.hub.frame_interval)
+
+                messages = self._next_frame()
+                if not messages:
+                    continue
+
+                frame = self._encode_frame(messages)
+                await self._send(frame)
+
+                now = time.perf_counter()
+                self.stats.frames += 1
+                self.stats.bytes_sent += len(frame)
+                for message in messages:
+                    self.stats.record_latency((now - message.enqueued_at) * 1000)
+                    self.stats.sent += 1
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            error_str = str(e).lower()
+            if isinstance(e, asyncio.TimeoutError):
+                self.hub.logger.debug(f"Dropping client: send took longer than {self.hub.send_timeout}s")
+            elif any(indicator in error_str for indicator in DISCONNECT_INDICATORS):
+                self.hub.logger.debug(f"Client disconnected during send: {e}")
+            else:
+                self.hub.logger.warning(f"Error sending to client: {e}")
+        finally:
+            self.closed = True
+            self.queue.clear()
+            self.hub.unregister(self.websocket)
+
+    def _encode_frame(self, messages: List[OutgoingMessage]) -> Union[str, bytes]:
+        """Encode a batch of messages for this connection."""
+        return build_frame(messages, self.encoding)
+
+    async def _send(self, frame: Union[str, bytes]) -> None:
+        """Send one frame, bounded by the send timeout."""
+        if isinstance(frame, bytes):
+            send = self.websocket.send_bytes(frame)
+        else:
+            send = self.websocket.send_text(frame)
+        await asyncio.wait_for(send, timeout=self.hub.send_timeout)
+
+    def close(self) -> None:
+        """Stop the writer task."""
+        self.closed = True
+        if self._task and not self._task.done() and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get delivery statistics for this client."""
+        return {
+            'transport': self.transport,
+            'encoding': self.encoding,
+            'subscription': self.subscription.to_dict(),
+            'queued': len(self.queue),
+            'sent': self.stats.sent,
+            'frames': self.stats.frames,
+            'bytes_sent': self.stats.bytes_sent,
+            'filtered': self.stats.filtered,
+            'coalesced': self.stats.coalesced,
+            'dropped': self.stats.dropped,
+            'resyncs': self.stats.resyncs,
+            'last_latency_ms': round(self.stats.last_latency_ms, 3),
+            'avg_latency_ms': round(self.stats.avg_latency_ms, 3),
+            'max_latency_ms': round(self.stats.max_latency_ms, 3),
+            'connected_seconds': round(time.time() - self.stats.connected_at, 1)
+        }
+
+
+class BroadcastHub:
+    """
+    Fan-out of dashboard messages to WebSocket clients.
+    publish() serializes once per encoding in use and enqueues per client;
+    it never awaits a socket.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 256,
+        send_timeout: float = 5.0,
+        frame_interval: float = 0.1,
+        max_batch: int = 200
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            max_queue: Per-client queue bound
+            send_timeout: Seconds a single send may take before the client is dropped
+            frame_interval: Seconds a writer waits to batch messages into one frame
+            max_batch: Maximum messages per frame
+        """
+        self.logger = logger_manager.get_logger("BroadcastHub")
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.frame_interval = frame_interval
+        self.max_batch = max_batch
+
+        self.channels: Dict[int, ClientChannel] = {}
+        self.published = 0
+
+        # Latest dashboard stats; clients receive only the fields that changed
+        self.state: Dict[str, Any] = {}
+        self.state_version = 0
+        self.state_listeners: List[Callable[['BroadcastHub'], None]] = []
+
+    def add_state_listener(self, callback: Callable[['BroadcastHub'], None]) -> None:
+        """
+        Register a callback invoked whenever the stats state changes.
+
+        Args:
+            callback: Function receiving this hub
+        """
+        self.state_listeners.append(callback)
+
+    @property
+    def clients(self) -> List[Any]:
+        """Currently registered WebSocket connections."""
+        return [channel.websocket for channel in self.channels.values()]
+
+    def register(self, websocket: Any, channel_class: Optional[type] = None) -> ClientChannel:
+        """
+        Add a connection and start its writer task.
+
+        Args:
+            websocket: Accepted WebSocket connection (or another sink with send_text)
+            channel_class: ClientChannel subclass for non-WebSocket transports
+
+        Returns:
+            The connection's channel
+        """
+        channel = self.channels.get(id(websocket))
+        if channel is None:
+            channel = (channel_class or ClientChannel)(websocket, self)
+            self.channels[id(websocket)] = channel
+            channel.start()
+            self.update_state({"connected_clients": len(self.channels)})
+        return channel
+
+    def unregister(self, websocket: Any) -> None:
+        """
+        Remove a connection and stop its writer task.
+
+        Args:
+            websocket: Connection to remove
+        """
+        channel = self.channels.pop(id(websocket), None)
+        if channel:
+            channel.close()
+            self.update_state({"connected_clients": len(self.channels)})
+
+    def subscribe(self, websocket: Any, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply a client's subscribe message: topics and frame encoding.
+
+        Args:
+            websocket: Client connection
+            request: Message with optional chains, min_score and encodings
+
+        Returns:
+            Confirmation message describing what was applied
+        """
+        channel = self.channels.get(id(websocket))
+        if channel is None:
+            return {"type": "error", "message": "Not connected"}
+
+        channel.subscription = Subscription.from_request(request)
+        if "encodings" in request:
+            encoding = negotiate_encoding(request.get("encodings"))
+            if encoding == MSGPACK_ENCODING and not hasattr(websocket, 'send_bytes'):
+                encoding = JSON_ENCODING
+            channel.encoding = encoding
+
+        return {
+            "type": "subscribed",
+            "message": "Successfully subscribed to updates",
+            "encoding": channel.encoding,
+            **channel.subscription.to_dict()
+        }
+
+    def send_to(self, websocket: Any, message: Dict[str, Any]) -> None:
+        """
+        Queue a message for a single connection.
+
+        Args:
+            websocket: Target connection
+            message: Message to send
+        """
+        channel = self.channels.get(id(websocket))
+        if channel:
+            outgoing = OutgoingMessage(message, coalesce_key(message))
+            outgoing.encode(channel.encoding)
+            channel.enqueue(outgoing)
+
+    def publish(self, message: Dict[str, Any]) -> int:
+        """
+        Queue a message for every connection.
+
+        Args:
+            message: Message to broadcast
+
+        Returns:
+            Number of clients the message was queued for
+
+        Raises:
+            TypeError: If the message cannot be serialized
+        """
+        if not self.channels:
+            return 0
+
+        outgoing = OutgoingMessage(message, coalesce_key(message))
+        # Serialize up front so bad payloads fail here rather than in a writer task
+        for encoding in {channel.encoding for channel in self.channels.values()}:
+            outgoing.encode(encoding)
+
+        for channel in list(self.channels.values()):
+            channel.enqueue(outgoing)
+
+        self.published += 1
+        return len(self.channels)
+
+    def update_state(self, fields: Dict[str, Any]) -> None:
+        """
+        Merge dashboard stats; changed fields go out with each client's next frame.
+
+        Args:
+            fields: Stat names and values
+        """
+        changed = False
+        for name, value in fields.items():
+            if name not in self.state or self.state[name] != value:
+                self.state[name] = value
+                changed = True
+
+        if changed:
+            self.state_version += 1
+            for channel in self.channels.values():
+                channel.wake()
+            for listener in self.state_listeners:
+                try:
+                    listener(self)
+                except Exception as e:
+                    self.logger.error(f"State listener failed: {e}")
+
+    def close_all(self) -> None:
+        """Stop every writer task."""
+        for websocket in self.clients:
+            self.unregister(websocket)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hub and per-client delivery statistics."""
+        client_stats = [channel.get_stats() for channel in self.channels.values()]
+        return {
+            'clients': len(client_stats),
+            'published': self.published,
+            'frame_interval_ms': self.frame_interval * 1000,
+            'encodings': sorted({s['encoding'] for s in client_stats}),
+            'transports': {
+                transport: sum(1 for s in client_stats if s['transport'] == transport)
+                for transport in sorted({s['transport'] for s in client_stats})
+            },
+            'queued': sum(s['queued'] for s in client_stats),
+            'frames': sum(s['frames'] for s in client_stats),
+            'bytes_sent': sum(s['bytes_sent'] for s in client_stats),
+            'dropped': sum(s['dropped'] for s in client_stats),
+            'max_latency_ms': max((s['max_latency_ms'] for s in client_stats), default=0.0),
+            'per_client': client_stats
+        }
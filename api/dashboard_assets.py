@@ -0,0 +1,261 @@
+# api/dashboard_assets.py
+"""
+Prebuilt dashboard assets.
+The dashboard page is rendered once, its inline stylesheet and script are
+split into content-hashed files, and every file is compressed ahead of time
+with gzip (and brotli when installed). Requests are then answered from
+memory with ETag revalidation, immutable caching for hashed assets and the
+best encoding the browser accepts.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+from utils.logger import logger_manager
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+
+DEFAULT_TEMPLATE_PATH = "web/templates/dashboard.html"
+ASSET_PREFIX = "/assets/"
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Smaller bodies are not worth compressing
+MIN_COMPRESS_BYTES = 512
+
+
+@dataclass
+class Asset:
+    """One prebuilt file with its precompressed variants."""
+    name: str
+    content_type: str
+    body: bytes
+    etag: str
+    cache_control: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, name: str, content_type: str, body: bytes, cache_control: str) -> "Asset":
+        """
+        Hash and precompress a file.
+
+        Args:
+            name: Asset name
+            content_type: Content-Type header value
+            body: Uncompressed content
+            cache_control: Cache-Control header value
+
+        Returns:
+            Asset with gzip/brotli variants where they are smaller
+        """
+        asset = cls(
+            name=name,
+            content_type=content_type,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:20]}"',
+            cache_control=cache_control
+        )
+        if len(body) >= MIN_COMPRESS_BYTES:
+            compressed = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(compressed) < len(body):
+                asset.encoded['gzip'] = compressed
+            if BROTLI_AVAILABLE:
+                compressed = brotli.compress(body, quality=11)
+                if len(compressed) < len(body):
+                    asset.encoded['br'] = compressed
+        return asset
+
+
+@dataclass
+class AssetResponse:
+    """Framework-independent response for an asset request."""
+    status: int
+    body: bytes
+    headers: Dict[str, str]
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value
+
+    Returns:
+        Mapping of encoding to quality value
+    """
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        pieces = part.strip().split(';')
+        encoding = pieces[0].strip().lower()
+        if not encoding:
+            continue
+        quality = 1.0
+        for parameter in pieces[1:]:
+            name, _, value = parameter.strip().partition('=')
+            if name == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[encoding] = quality
+    return accepted
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return any(tag.removeprefix('W/') == etag for tag in candidates)
+
+
+def split_inline_assets(html: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Pull the page's main inline stylesheet and script out of the HTML.
+
+    Args:
+        html: Rendered page
+
+    Returns:
+        Tuple of (html with placeholders, css or None, js or None)
+    """
+    css = js = None
+
+    style = re.search(r'<style>(.*?)</style>', html, re.DOTALL)
+    if style:
+        css = style.group(1)
+        html = html[:style.start()] + '<!--DASHBOARD_CSS-->' + html[style.end():]
+
+    script = re.search(r'<script>(.*?)</script>', html, re.DOTALL)
+    if script:
+        js = script.group(1)
+        html = html[:script.start()] + '<!--DASHBOARD_JS-->' + html[script.end():]
+
+    return html, css, js
+
+
+class DashboardAssets:
+    """In-memory store of the built dashboard page and its assets."""
+
+    def __init__(
+        self,
+        template_path: str = DEFAULT_TEMPLATE_PATH,
+        fallback_renderer: Optional[Callable[[], str]] = None
+    ) -> None:
+        """
+        Initialize the asset store.
+
+        Args:
+            template_path: HTML template served when it exists
+            fallback_renderer: Function rendering the built-in page otherwise
+        """
+        self.logger = logger_manager.get_logger("DashboardAssets")
+        self.template_path = template_path
+        self.fallback_renderer = fallback_renderer
+        self.assets: Dict[str, Asset] = {}
+        self.index: Optional[Asset] = None
+
+    def _render_source(self) -> str:
+        """Read the template, or render the built-in page."""
+        if os.path.exists(self.template_path):
+            try:
+                with open(self.template_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            except Exception as e:
+                self.logger.error(f"Error reading template: {e}")
+
+        if self.fallback_renderer is None:
+            raise RuntimeError(f"No dashboard template at {self.template_path}")
+        return self.fallback_renderer()
+
+    def build(self) -> None:
+        """Render the page, split and hash its assets and precompress everything."""
+        html, css, js = split_inline_assets(self._render_source())
+        assets: Dict[str, Asset] = {}
+
+        for placeholder, source, extension, content_type, tag in (
+            ('<!--DASHBOARD_CSS-->', css, 'css', 'text/css; charset=utf-8',
+             '<link rel="stylesheet" href="{url}">'),
+            ('<!--DASHBOARD_JS-->', js, 'js', 'application/javascript; charset=utf-8',
+             '<script src="{url}"></script>')
+        ):
+            if source is None:
+                continue
+            body = source.encode('utf-8')
+            name = f"dashboard.{hashlib.sha256(body).hexdigest()[:12]}.{extension}"
+            assets[name] = Asset.build(name, content_type, body, IMMUTABLE_CACHE)
+            html = html.replace(placeholder, tag.format(url=ASSET_PREFIX + name))
+
+        self.index = Asset.build('index.html', 'text/html; charset=utf-8', html.encode('utf-8'), REVALIDATE_CACHE)
+        self.assets = assets
+
+        sizes = ', '.join(
+            f"{asset.name} {len(asset.body)}B"
+            + ''.join(f"/{encoding} {len(body)}B" for encoding, body in asset.encoded.items())
+            for asset in [self.index, *assets.values()]
+        )
+        self.logger.info(f"Dashboard assets built: {sizes}")
+
+    def _ensure_built(self) -> None:
+        if self.index is None:
+            self.build()
+
+    def asset_names(self) -> Dict[str, str]:
+        """Hashed asset URLs by type."""
+        self._ensure_built()
+        return {name.rsplit('.', 1)[-1]: ASSET_PREFIX + name for name in self.assets}
+
+    def respond(
+        self,
+        name: Optional[str],
+        accept_encoding: Optional[str] = None,
+        if_none_match: Optional[str] = None
+    ) -> AssetResponse:
+        """
+        Answer a request for the page (name None) or a hashed asset.
+
+        Args:
+            name: Asset file name, or None for the page itself
+            accept_encoding: Request Accept-Encoding header
+            if_none_match: Request If-None-Match header
+
+        Returns:
+            200 with the best encoding, 304 if the client copy is current, or 404
+        """
+        self._ensure_built()
+        asset = self.index if name is None else self.assets.get(name)
+        if asset is None:
+            return AssetResponse(404, b'Not found', {'Content-Type': 'text/plain; charset=utf-8'})
+
+        headers = {
+            'ETag': asset.etag,
+            'Cache-Control': asset.cache_control,
+            'Vary': 'Accept-Encoding'
+        }
+        if etag_matches(if_none_match, asset.etag):
+            return AssetResponse(304, b'', headers)
+
+        body = asset.body
+        accepted = accepted_encodings(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in asset.encoded and accepted.get(encoding, 0.0) > 0:
+                body = asset.encoded[encoding]
+                headers['Content-Encoding'] = encoding
+                break
+
+        headers['Content-Type'] = asset.content_type
+        return AssetResponse(200, body, headers)
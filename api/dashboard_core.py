@@ -12,6 +12,10 @@ from fastapi import WebSocket, WebSocketDisconnect
 
 from models.token import TradingOpportunity, TokenInfo, LiquidityInfo, ContractAnalysis, SocialMetrics
 from models.watchlist import watchlist_manager
+from api.broadcast_hub import BroadcastHub, ClientChannel, OutgoingMessage, Subscription
+from api.event_stream import EventStream
+from api.opportunity_store import OpportunityStore
+from api.read_model import ReadModel
 from api.dashboard_models import WatchlistAddRequest
 from utils.logger import logger_manager
 
@@ -22,14 +26,29 @@ class DashboardServer:
     for real-time communication with the trading system.
     """
     
-    def __init__(self) -> None:
-        """Initialize the dashboard server."""
+    def __init__(self, opportunity_capacity: int = 100_000) -> None:
+        """
+        Initialize the dashboard server.
+        
+        Args:
+            opportunity_capacity: Opportunities retained for the dashboard API
+        """
         self.logger = logger_manager.get_logger("DashboardServer")
         self.trading_executor = None
-        self.position_manager = None
+        self._position_manager = None
         self.risk_manager = None
-        self.connected_clients: List[WebSocket] = []
-        self.opportunities_queue: List[TradingOpportunity] = []
+        self.broadcast_hub = BroadcastHub()
+        self.opportunity_store = OpportunityStore(opportunity_capacity)
+        
+        # Set when the trading core runs in another process (see api.dashboard_ipc)
+        self.command_client = None
+        self.remote_views: Dict[str, Any] = {}
+        
+        # Stats, positions and trades are rebuilt once per change, not per request
+        self.read_model = ReadModel()
+        self.read_model.register("stats", self._build_stats_snapshot)
+        self.read_model.register("positions", self._build_positions_snapshot)
+        self.read_model.register("trades", self._build_trades_snapshot)
         
         # Statistics
         self.stats = {
@@ -39,6 +58,121 @@ class DashboardServer:
             "analysis_rate": 0,
             "uptime_start": datetime.now()
         }
+        self.broadcast_hub.update_state({
+            name: value for name, value in self.stats.items() if name != "uptime_start"
+        })
+        self.broadcast_hub.add_state_listener(lambda hub: self.read_model.invalidate("stats"))
+        
+    @property
+    def connected_clients(self) -> List[WebSocket]:
+        """Currently connected WebSocket clients."""
+        return self.broadcast_hub.clients
+        
+    @property
+    def position_manager(self) -> Any:
+        """Position manager whose changes drive the stats/positions/trades snapshots."""
+        return self._position_manager
+        
+    @position_manager.setter
+    def position_manager(self, position_manager: Any) -> None:
+        self._position_manager = position_manager
+        if position_manager is not None and hasattr(position_manager, "add_listener"):
+            position_manager.add_listener(self._on_portfolio_change)
+        self._on_portfolio_change(position_manager)
+        
+    def _on_portfolio_change(self, position_manager: Any) -> None:
+        """Position manager listener: positions or P&L changed."""
+        self.read_model.invalidate()
+        
+    def apply_remote_view(self, name: str, payload: Any) -> None:
+        """
+        Use a view published by a trading process instead of a local position manager.
+        
+        Args:
+            name: portfolio, positions or trades
+            payload: View payload
+        """
+        self.remote_views[name] = payload
+        self.read_model.invalidate()
+        
+    def _build_portfolio_view(self) -> Dict[str, Any]:
+        """Portfolio summary of the local position manager."""
+        if not self.position_manager:
+            return {}
+        try:
+            return self.position_manager.get_portfolio_summary()
+        except Exception as portfolio_error:
+            self.logger.debug(f"Portfolio error: {portfolio_error}")
+            return {"status": "unavailable"}
+        
+    def _build_stats_snapshot(self) -> Dict[str, Any]:
+        """Payload of /api/stats."""
+        uptime = datetime.now() - self.stats["uptime_start"]
+        portfolio = self.remote_views.get("portfolio") or self._build_portfolio_view()
+                
+        state = self.broadcast_hub.state
+        return {
+            "total_opportunities": state.get("total_opportunities", self.stats["total_opportunities"]),
+            "high_confidence": state.get("high_confidence", self.stats["high_confidence"]),
+            "active_chains": state.get("active_chains", self.stats["active_chains"]),
+            "analysis_rate": state.get("analysis_rate", self.stats["analysis_rate"]),
+            "uptime_start": self.stats["uptime_start"].isoformat(),
+            "uptime_hours": uptime.total_seconds() / 3600,
+            "portfolio": portfolio,
+            "connected_clients": len(self.connected_clients)
+        }
+        
+    def _build_positions_snapshot(self) -> Dict[str, Any]:
+        """Payload of /api/positions."""
+        if "positions" in self.remote_views:
+            return self.remote_views["positions"]
+            
+        positions = []
+        
+        if self.position_manager and hasattr(self.position_manager, 'active_positions'):
+            for position_id, position in list(self.position_manager.active_positions.items()):
+                try:
+                    positions.append({
+                        "token_symbol": getattr(position, 'token_symbol', 'UNKNOWN'),
+                        "amount": float(getattr(position, 'entry_amount', 0)),
+                        "entry_price": float(getattr(position, 'entry_price', 0)),
+                        "current_price": float(getattr(position, 'current_price', 0)),
+                        "pnl": float(getattr(position, 'unrealized_pnl', 0)),
+                        "pnl_percentage": getattr(position, 'unrealized_pnl_percentage', 0.0)
+                    })
+                except Exception as pos_error:
+                    self.logger.error(f"Error processing position {position_id}: {pos_error}")
+                    continue
+                    
+        return {"positions": positions, "status": "success"}
+        
+    def _build_trades_snapshot(self) -> Dict[str, Any]:
+        """Payload of /api/trades (last 20 closed positions)."""
+        if "trades" in self.remote_views:
+            return self.remote_views["trades"]
+            
+        trades = []
+        
+        if self.position_manager and hasattr(self.position_manager, 'closed_positions'):
+            for exit in self.position_manager.closed_positions[-20:]:
+                try:
+                    trades.append({
+                        "id": getattr(exit, 'position_id', 'unknown'),
+                        "token_symbol": getattr(exit, 'position_id', 'UNKNOWN').split('_')[0],
+                        "trade_type": "close",
+                        "amount": float(getattr(exit, 'exit_amount', 0)),
+                        "status": "completed",
+                        "created_at": getattr(exit, 'exit_time', datetime.now()).isoformat(),
+                        "executed_at": getattr(exit, 'exit_time', datetime.now()).isoformat(),
+                        "tx_hash": getattr(exit, 'exit_tx_hash', None),
+                        "chain": "unknown",
+                        "pnl": float(getattr(exit, 'realized_pnl', 0))
+                    })
+                except Exception as trade_error:
+                    self.logger.error(f"Error processing individual trade: {trade_error}")
+                    continue
+                    
+        return {"trades": trades, "status": "success"}
         
     async def initialize(self) -> None:
         """
@@ -59,77 +193,39 @@ class DashboardServer:
     async def broadcast_message(self, message: Dict[str, Any]) -> None:
         """
         Broadcast message to all connected WebSocket clients.
+        Messages are queued per client and sent in batched frames by the
+        client's writer task, so this returns without waiting on any socket.
+        Stats updates are merged into the hub's state and sent as deltas.
         
         Args:
             message: Message to broadcast
         """
-        if not self.connected_clients:
+        if message.get("type") == "stats_update":
+            self.broadcast_hub.update_state(message.get("data") or {})
+            return
+            
+        if not self.broadcast_hub.channels:
             return
             
-        disconnected_clients = []
-        
         try:
             # Debug logging for new opportunities
             if message.get("type") == "new_opportunity":
                 data = message.get("data", {})
                 self.logger.debug(f"Broadcasting opportunity: {data.get('token_symbol')} - Liquidity: {data.get('liquidity_usd')} (type: {type(data.get('liquidity_usd'))})")
                 
-            message_str = json.dumps(message)
+            self.broadcast_hub.publish(message)
         except Exception as json_error:
             self.logger.error(f"Error serializing message: {json_error}")
             self.logger.error(f"Message content: {message}")
-            return
-        
-        for client in self.connected_clients.copy():
-            try:
-                # Check if client is still connected using multiple methods
-                client_disconnected = False
-                
-                # Method 1: Check client_state if available
-                if hasattr(client, 'client_state'):
-                    try:
-                        # WebSocket states: 0=CONNECTING, 1=OPEN, 2=CLOSING, 3=CLOSED
-                        if client.client_state.value in [2, 3]:  # CLOSING or CLOSED
-                            client_disconnected = True
-                    except Exception:
-                        # If we can't check state, assume client might be disconnected
-                        client_disconnected = True
-                
-                # Method 2: Try to send the message
-                if not client_disconnected:
-                    try:
-                        await client.send_text(message_str)
-                    except Exception as send_error:
-                        error_str = str(send_error).lower()
-                        
-                        # Check for specific disconnect indicators
-                        disconnect_indicators = [
-                            'disconnect', 'closed', 'connection', 'reset',
-                            '1001', '1000', '1006',  # WebSocket close codes
-                            'broken pipe', 'connection aborted'
-                        ]
-                        
-                        if any(indicator in error_str for indicator in disconnect_indicators):
-                            self.logger.debug(f"Client disconnected during broadcast: {send_error}")
-                        else:
-                            self.logger.warning(f"Error sending to client: {send_error}")
-                        
-                        client_disconnected = True
-                
-                if client_disconnected:
-                    disconnected_clients.append(client)
-                    
-            except Exception as e:
-                self.logger.warning(f"Error processing client during broadcast: {e}")
-                disconnected_clients.append(client)
+
+    def get_broadcast_stats(self) -> Dict[str, Any]:
+        """
+        Get WebSocket delivery statistics.
         
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            if client in self.connected_clients:
-                self.connected_clients.remove(client)
-                
-        if disconnected_clients:
-            self.logger.debug(f"Removed {len(disconnected_clients)} disconnected clients during broadcast")
+        Returns:
+            Hub totals and per-client queue depth, drops and send latency
+        """
+        return self.broadcast_hub.get_stats()
 
     async def add_opportunity(self, opportunity: TradingOpportunity) -> None:
         """
@@ -139,112 +235,8 @@ class DashboardServer:
             opportunity: The trading opportunity to add
         """
         try:
-            # Add to queue (keep last 100)
-            self.opportunities_queue.append(opportunity)
-            if len(self.opportunities_queue) > 100:
-                self.opportunities_queue.pop(0)
-                
-            # Update stats
-            self.stats["total_opportunities"] += 1
-            
-            recommendation = opportunity.metadata.get("recommendation", {})
-            if recommendation.get("confidence") == "HIGH":
-                self.stats["high_confidence"] += 1
-                
-            # Create safe opportunity data for broadcast with proper value extraction
-            try:
-                # Safely extract liquidity USD value
-                liquidity_usd = 0.0
-                if hasattr(opportunity.liquidity, 'liquidity_usd') and opportunity.liquidity.liquidity_usd:
-                    liquidity_usd = float(opportunity.liquidity.liquidity_usd)
-                
-                # Safely extract DEX name
-                dex_name = "Unknown DEX"
-                if hasattr(opportunity.liquidity, 'dex_name') and opportunity.liquidity.dex_name:
-                    dex_name = str(opportunity.liquidity.dex_name)
-                
-                # Safely extract pair address
-                pair_address = ""
-                if hasattr(opportunity.liquidity, 'pair_address') and opportunity.liquidity.pair_address:
-                    pair_address = str(opportunity.liquidity.pair_address)
-                
-                # Safely extract block number
-                block_number = None
-                if hasattr(opportunity.liquidity, 'block_number') and opportunity.liquidity.block_number:
-                    block_number = int(opportunity.liquidity.block_number)
-                
-                # Safely extract token information
-                token_symbol = "UNKNOWN"
-                if hasattr(opportunity.token, 'symbol') and opportunity.token.symbol:
-                    token_symbol = str(opportunity.token.symbol)
-                
-                token_address = ""
-                if hasattr(opportunity.token, 'address') and opportunity.token.address:
-                    token_address = str(opportunity.token.address)
-                
-                token_name = None
-                if hasattr(opportunity.token, 'name') and opportunity.token.name:
-                    token_name = str(opportunity.token.name)
-                
-                # Safely extract analysis data
-                risk_level = "unknown"
-                if hasattr(opportunity.contract_analysis, 'risk_level') and opportunity.contract_analysis.risk_level:
-                    risk_level = str(opportunity.contract_analysis.risk_level.value)
-                
-                opp_data = {
-                    "token_symbol": token_symbol,
-                    "token_address": token_address,
-                    "token_name": token_name,
-                    "chain": opportunity.metadata.get("chain", "ethereum"),
-                    "risk_level": risk_level,
-                    "recommendation": recommendation.get("action", "UNKNOWN"),
-                    "confidence": recommendation.get("confidence", "UNKNOWN"),
-                    "score": float(recommendation.get("score", 0.0)),
-                    "liquidity_usd": liquidity_usd,
-                    "dex_name": dex_name,
-                    "pair_address": pair_address,
-                    "block_number": block_number,
-                    "detected_at": opportunity.detected_at.isoformat(),
-                    "reasons": recommendation.get("reasons", []),
-                    "warnings": recommendation.get("warnings", [])
-                }
-                
-                # Add additional metadata if available
-                if "market_cap_usd" in opportunity.metadata:
-                    opp_data["market_cap_usd"] = float(opportunity.metadata["market_cap_usd"])
-                
-                if "volume_24h_usd" in opportunity.metadata:
-                    opp_data["volume_24h_usd"] = float(opportunity.metadata["volume_24h_usd"])
-                
-                if "solana_source" in opportunity.metadata:
-                    opp_data["solana_source"] = str(opportunity.metadata["solana_source"])
-                
-            except Exception as data_error:
-                self.logger.error(f"Error creating opportunity data: {data_error}")
-                # Fallback to minimal data
-                opp_data = {
-                    "token_symbol": getattr(opportunity.token, 'symbol', 'UNKNOWN') or 'UNKNOWN',
-                    "token_address": getattr(opportunity.token, 'address', '') or '',
-                    "chain": opportunity.metadata.get("chain", "ethereum"),
-                    "risk_level": "unknown",
-                    "recommendation": "UNKNOWN",
-                    "confidence": "UNKNOWN", 
-                    "score": 0.0,
-                    "liquidity_usd": 0.0,
-                    "dex_name": "Unknown DEX",
-                    "pair_address": "",
-                    "detected_at": opportunity.detected_at.isoformat(),
-                    "reasons": [],
-                    "warnings": []
-                }
-                
-            # Broadcast to connected clients
-            await self.broadcast_message({
-                "type": "new_opportunity",
-                "data": opp_data
-            })
-            
-            self.logger.debug(f"Added opportunity: {token_symbol} (${liquidity_usd:,.2f} liquidity)")
+            opp_data = self._serialize_opportunity(opportunity)
+            await self.publish_opportunity(opp_data, opportunity.detected_at.timestamp())
             
         except Exception as e:
             self.logger.error(f"Error adding opportunity: {e}")
@@ -254,6 +246,199 @@ class DashboardServer:
             except Exception:
                 self.logger.debug("Could not log opportunity structure")
 
+    def _store_opportunity(
+        self,
+        opp_data: Dict[str, Any],
+        detected_at: float,
+        record_id: Optional[int] = None
+    ) -> Optional[int]:
+        """Store a compact record; its id lets clients page with since_id."""
+        return self.opportunity_store.add(opp_data, detected_at, record_id)
+
+    async def publish_opportunity(
+        self,
+        opp_data: Dict[str, Any],
+        detected_at: float,
+        count: bool = True,
+        record_id: Optional[int] = None
+    ) -> None:
+        """
+        Store, count and broadcast a serialized opportunity.
+        
+        Args:
+            opp_data: Client-facing opportunity data
+            detected_at: Detection time as a Unix timestamp
+            count: Update the opportunity counters (False when they come from a trading process)
+            record_id: Id the trading process assigned, when this is a dashboard process
+        """
+        record_id = self._store_opportunity(opp_data, detected_at, record_id)
+        if record_id is not None:
+            opp_data["id"] = record_id
+            
+        # Update stats
+        if count:
+            self.stats["total_opportunities"] += 1
+            if opp_data.get("confidence") == "HIGH":
+                self.stats["high_confidence"] += 1
+                
+            self.broadcast_hub.update_state({
+                "total_opportunities": self.stats["total_opportunities"],
+                "high_confidence": self.stats["high_confidence"]
+            })
+            
+        # Broadcast to connected clients
+        await self.broadcast_message({
+            "type": "new_opportunity",
+            "data": opp_data
+        })
+        
+        self.logger.debug(
+            f"Added opportunity: {opp_data.get('token_symbol')} (${opp_data.get('liquidity_usd') or 0:,.2f} liquidity)"
+        )
+
+    def _serialize_opportunity(self, opportunity: TradingOpportunity) -> Dict[str, Any]:
+        """
+        Build the client-facing data for an opportunity with safe value extraction.
+        
+        Args:
+            opportunity: The trading opportunity to serialize
+            
+        Returns:
+            Dictionary ready to be broadcast
+        """
+        recommendation = opportunity.metadata.get("recommendation", {})
+        
+        try:
+            # Safely extract liquidity USD value
+            liquidity_usd = 0.0
+            if hasattr(opportunity.liquidity, 'liquidity_usd') and opportunity.liquidity.liquidity_usd:
+                liquidity_usd = float(opportunity.liquidity.liquidity_usd)
+            
+            # Safely extract DEX name
+            dex_name = "Unknown DEX"
+            if hasattr(opportunity.liquidity, 'dex_name') and opportunity.liquidity.dex_name:
+                dex_name = str(opportunity.liquidity.dex_name)
+            
+            # Safely extract pair address
+            pair_address = ""
+            if hasattr(opportunity.liquidity, 'pair_address') and opportunity.liquidity.pair_address:
+                pair_address = str(opportunity.liquidity.pair_address)
+            
+            # Safely extract block number
+            block_number = None
+            if hasattr(opportunity.liquidity, 'block_number') and opportunity.liquidity.block_number:
+                block_number = int(opportunity.liquidity.block_number)
+            
+            # Safely extract token information
+            token_symbol = "UNKNOWN"
+            if hasattr(opportunity.token, 'symbol') and opportunity.token.symbol:
+                token_symbol = str(opportunity.token.symbol)
+            
+            token_address = ""
+            if hasattr(opportunity.token, 'address') and opportunity.token.address:
+                token_address = str(opportunity.token.address)
+            
+            token_name = None
+            if hasattr(opportunity.token, 'name') and opportunity.token.name:
+                token_name = str(opportunity.token.name)
+            
+            # Safely extract analysis data
+            risk_level = "unknown"
+            if hasattr(opportunity.contract_analysis, 'risk_level') and opportunity.contract_analysis.risk_level:
+                risk_level = str(opportunity.contract_analysis.risk_level.value)
+            
+            opp_data = {
+                "token_symbol": token_symbol,
+                "token_address": token_address,
+                "token_name": token_name,
+                "chain": opportunity.metadata.get("chain", "ethereum"),
+                "risk_level": risk_level,
+                "recommendation": recommendation.get("action", "UNKNOWN"),
+                "confidence": recommendation.get("confidence", "UNKNOWN"),
+                "score": float(recommendation.get("score", 0.0)),
+                "liquidity_usd": liquidity_usd,
+                "dex_name": dex_name,
+                "pair_address": pair_address,
+                "block_number": block_number,
+                "detected_at": opportunity.detected_at.isoformat(),
+                "reasons": recommendation.get("reasons", []),
+                "warnings": recommendation.get("warnings", [])
+            }
+            
+            # Add additional metadata if available
+            if "market_cap_usd" in opportunity.metadata:
+                opp_data["market_cap_usd"] = float(opportunity.metadata["market_cap_usd"])
+            
+            if "volume_24h_usd" in opportunity.metadata:
+                opp_data["volume_24h_usd"] = float(opportunity.metadata["volume_24h_usd"])
+            
+            if "solana_source" in opportunity.metadata:
+                opp_data["solana_source"] = str(opportunity.metadata["solana_source"])
+            
+        except Exception as data_error:
+            self.logger.error(f"Error creating opportunity data: {data_error}")
+            # Fallback to minimal data
+            opp_data = {
+                "token_symbol": getattr(opportunity.token, 'symbol', 'UNKNOWN') or 'UNKNOWN',
+                "token_address": getattr(opportunity.token, 'address', '') or '',
+                "chain": opportunity.metadata.get("chain", "ethereum"),
+                "risk_level": "unknown",
+                "recommendation": "UNKNOWN",
+                "confidence": "UNKNOWN", 
+                "score": 0.0,
+                "liquidity_usd": 0.0,
+                "dex_name": "Unknown DEX",
+                "pair_address": "",
+                "detected_at": opportunity.detected_at.isoformat(),
+                "reasons": [],
+                "warnings": []
+            }
+            
+        return opp_data
+
+    async def update_opportunity(self, opportunity: TradingOpportunity) -> None:
+        """
+        Broadcast a refined version of an opportunity that was already added.
+        
+        Args:
+            opportunity: The re-scored trading opportunity
+        """
+        try:
+            await self.publish_opportunity_update(self._serialize_opportunity(opportunity))
+        except Exception as e:
+            self.logger.error(f"Error updating opportunity: {e}")
+
+    async def publish_opportunity_update(self, opp_data: Dict[str, Any]) -> None:
+        """
+        Update the stored record of a serialized opportunity and broadcast it.
+        
+        Args:
+            opp_data: Client-facing opportunity data
+        """
+        record_id = self.opportunity_store.update(opp_data)
+        if record_id is not None:
+            opp_data["id"] = record_id
+            
+        await self.broadcast_message({
+            "type": "opportunity_update",
+            "data": opp_data
+        })
+
+    async def publish_price_alerts(self, alerts: List[Any]) -> None:
+        """
+        Broadcast a batch of fired watchlist price alerts.
+        
+        Args:
+            alerts: PriceAlert objects from the alert engine
+        """
+        try:
+            await self.broadcast_message({
+                "type": "price_alerts",
+                "data": {"alerts": [alert.to_dict() for alert in alerts]}
+            })
+        except Exception as e:
+            self.logger.error(f"Error broadcasting price alerts: {e}")
+
     async def update_analysis_rate(self, rate: int) -> None:
         """
         Update the analysis rate statistic.
@@ -264,15 +449,8 @@ class DashboardServer:
         try:
             self.stats["analysis_rate"] = rate
             
-            # Broadcast updated stats
-            await self.broadcast_message({
-                "type": "stats_update",
-                "data": {
-                    "analysis_rate": rate,
-                    "total_opportunities": self.stats["total_opportunities"],
-                    "high_confidence": self.stats["high_confidence"]
-                }
-            })
+            # Clients receive the change with their next frame
+            self.broadcast_hub.update_state({"analysis_rate": rate})
         except Exception as e:
             self.logger.error(f"Error updating analysis rate: {e}")
 
@@ -286,6 +464,10 @@ class DashboardServer:
         Returns:
             True if added successfully, False if already exists
         """
+        if self.command_client is not None:
+            result = await self.command_client.request("watchlist_add", request.dict())
+            return bool(result)
+            
         try:
             # Create opportunity object for watchlist
             token_address = request.token_address
@@ -355,6 +537,100 @@ class DashboardServer:
             self.logger.error(f"Error adding to watchlist: {e}")
             raise
 
+    async def remove_token_from_watchlist(self, token_address: str, chain: str) -> bool:
+        """
+        Remove a token from the watchlist and tell connected clients.
+        
+        Args:
+            token_address: Token contract address
+            chain: Blockchain name
+            
+        Returns:
+            True if removed, False if it was not in the watchlist
+        """
+        if self.command_client is not None:
+            result = await self.command_client.request(
+                "watchlist_remove", {"token_address": token_address, "chain": chain}
+            )
+            return bool(result)
+            
+        success = watchlist_manager.remove_from_watchlist(token_address, chain)
+        
+        if success:
+            # Broadcast to connected clients
+            await self.broadcast_message({
+                "type": "watchlist_updated",
+                "data": {
+                    "action": "removed",
+                    "token_address": token_address,
+                    "chain": chain
+                }
+            })
+            
+        return success
+
+    async def execute_manual_trade(
+        self,
+        token_address: str,
+        amount: float,
+        chain: str,
+        token_symbol: str
+    ) -> Dict[str, Any]:
+        """
+        Execute a manual trade and broadcast the result.
+        
+        Args:
+            token_address: Token contract address
+            amount: Trade amount
+            chain: Blockchain name
+            token_symbol: Token symbol, for display
+            
+        Returns:
+            Dictionary with success flag, message and trade id
+        """
+        if self.command_client is not None:
+            return await self.command_client.request("manual_trade", {
+                "token_address": token_address,
+                "amount": amount,
+                "chain": chain,
+                "token_symbol": token_symbol
+            })
+            
+        self.logger.info(f"Manual trade request: {token_symbol}")
+        
+        if not self.trading_executor:
+            return {"success": False, "message": "Trading executor not available"}
+            
+        # Execute the trade
+        result = await self.trading_executor.manual_trade(
+            token_address=token_address,
+            amount=amount,
+            chain=chain
+        )
+        
+        if not result:
+            return {
+                "success": False,
+                "message": "Trade execution failed"
+            }
+            
+        # Broadcast trade execution to connected clients
+        await self.broadcast_message({
+            "type": "trade_executed",
+            "data": {
+                "token_symbol": token_symbol,
+                "amount": amount,
+                "status": result.status.value if hasattr(result, 'status') else 'unknown',
+                "tx_hash": getattr(result, 'tx_hash', None)
+            }
+        })
+        
+        return {
+            "success": True,
+            "trade_id": getattr(result, 'id', 'unknown'),
+            "message": f"Trade executed for {token_symbol}"
+        }
+
     async def handle_websocket_connection(self, websocket: WebSocket) -> None:
         """
         Handle a new WebSocket connection with comprehensive error handling.
@@ -363,50 +639,38 @@ class DashboardServer:
             websocket: The WebSocket connection to handle
         """
         await websocket.accept()
-        self.connected_clients.append(websocket)
+        channel = self.broadcast_hub.register(websocket)
         self.logger.info(f"WebSocket client connected. Total: {len(self.connected_clients)}")
         
         try:
             # Send initial connection confirmation
-            await websocket.send_text(json.dumps({
+            self.broadcast_hub.send_to(websocket, {
                 "type": "connected",
                 "message": "WebSocket connection established"
-            }))
+            })
             
-            while True:
+            while not channel.closed:
                 try:
                     # Use receive_json with timeout to handle disconnects gracefully
                     message = await asyncio.wait_for(websocket.receive_json(), timeout=30.0)
                     
                     # Handle different message types
                     if message.get("type") == "ping":
-                        await websocket.send_text(json.dumps({"type": "pong"}))
+                        self.broadcast_hub.send_to(websocket, {"type": "pong"})
                     elif message.get("type") == "subscribe":
-                        await websocket.send_text(json.dumps({
-                            "type": "subscribed",
-                            "message": "Successfully subscribed to updates"
-                        }))
+                        # Optional chains/min_score topics and encodings preference
+                        self.broadcast_hub.send_to(websocket, self.broadcast_hub.subscribe(websocket, message))
                         
                 except asyncio.TimeoutError:
-                    # Send ping to keep connection alive
-                    try:
-                        await websocket.send_text(json.dumps({"type": "ping"}))
-                    except Exception:
-                        # If we can't send ping, connection is dead
-                        self.logger.debug("WebSocket ping failed - connection closed")
-                        break
+                    # Send ping to keep connection alive; the writer task drops the client if it fails
+                    self.broadcast_hub.send_to(websocket, {"type": "ping"})
                         
                 except json.JSONDecodeError as json_error:
                     self.logger.warning(f"Invalid JSON from WebSocket client: {json_error}")
-                    try:
-                        await websocket.send_text(json.dumps({
-                            "type": "error",
-                            "message": "Invalid JSON format"
-                        }))
-                    except Exception:
-                        # If we can't send error message, connection is dead
-                        self.logger.debug("WebSocket error response failed - connection closed")
-                        break
+                    self.broadcast_hub.send_to(websocket, {
+                        "type": "error",
+                        "message": "Invalid JSON format"
+                    })
                         
                 except Exception as message_error:
                     # Handle specific WebSocket close codes
@@ -453,10 +717,74 @@ class DashboardServer:
                 self.logger.warning(f"Unexpected WebSocket error: {e}")
         finally:
             # Always clean up the client connection
-            if websocket in self.connected_clients:
-                self.connected_clients.remove(websocket)
+            self.broadcast_hub.unregister(websocket)
             self.logger.debug(f"WebSocket cleanup complete. Remaining clients: {len(self.connected_clients)}")
     
+    def open_event_stream(
+        self,
+        chains: Optional[List[str]] = None,
+        min_score: float = 0.0,
+        last_event_id: Optional[int] = None
+    ) -> EventStream:
+        """
+        Attach a Server-Sent Events consumer to the broadcast hub.
+        
+        Args:
+            chains: Only opportunities on these chains
+            min_score: Only opportunities scoring at least this
+            last_event_id: Last opportunity id the consumer saw, to replay what it missed
+            
+        Returns:
+            Stream whose iter_events() is the response body
+        """
+        stream = EventStream(self.broadcast_hub)
+        channel = stream.open()
+        channel.subscription = Subscription.from_request({"chains": chains, "min_score": min_score})
+        
+        if last_event_id is not None:
+            self._replay_opportunities(channel, last_event_id)
+            
+        self.logger.debug(f"Event stream opened. Total clients: {len(self.connected_clients)}")
+        return stream
+        
+    def _replay_opportunities(self, channel: ClientChannel, last_event_id: int) -> None:
+        """
+        Queue opportunities newer than last_event_id ahead of live messages.
+        Sends a resync event instead when the gap is no longer in the store or
+        is larger than the channel's queue.
+        
+        Args:
+            channel: Channel of the resuming consumer
+            last_event_id: Last opportunity id the consumer saw
+        """
+        store = self.opportunity_store
+        if last_event_id >= store.latest_id:
+            if last_event_id > store.latest_id:
+                # Ids from before a restart
+                channel.enqueue(OutgoingMessage({"type": "resync", "latest_id": store.latest_id}))
+            return
+            
+        if last_event_id + 1 < store.oldest_id:
+            channel.enqueue(OutgoingMessage({"type": "resync", "oldest_id": store.oldest_id}))
+            
+        cursor = last_event_id
+        remaining = self.broadcast_hub.max_queue
+        while remaining > 0:
+            page = store.query(
+                min_score=channel.subscription.min_score or None,
+                since_id=cursor,
+                limit=min(remaining, 500)
+            )
+            for item in page["items"]:
+                channel.enqueue(OutgoingMessage({"type": "new_opportunity", "data": item}))
+            if not page["items"]:
+                return
+            cursor = page["next_cursor"]
+            remaining -= len(page["items"])
+            
+        if cursor < store.latest_id:
+            channel.enqueue(OutgoingMessage({"type": "resync", "oldest_id": cursor + 1}))
+    
     async def _periodic_cleanup_task(self) -> None:
         """Periodic task to clean up dead WebSocket connections."""
         while True:
@@ -475,45 +803,25 @@ class DashboardServer:
                 
             dead_clients = []
             
-            for client in self.connected_clients.copy():
-                try:
-                    # Check multiple indicators of disconnected state
-                    is_dead = False
-                    
-                    # Check client_state if available
-                    if hasattr(client, 'client_state'):
-                        try:
-                            # WebSocket states: 0=CONNECTING, 1=OPEN, 2=CLOSING, 3=CLOSED
-                            if client.client_state.value in [2, 3]:  # CLOSING or CLOSED
-                                is_dead = True
-                        except Exception:
-                            # If we can't read the state, consider it potentially dead
-                            is_dead = True
-                    
-                    # Additional check: try to send a ping
-                    if not is_dead:
-                        try:
-                            # Send a very small message to test connection
-                            await asyncio.wait_for(
-                                client.send_text(json.dumps({"type": "heartbeat"})), 
-                                timeout=1.0
-                            )
-                        except Exception:
-                            # If ping fails, connection is dead
-                            is_dead = True
-                    
-                    if is_dead:
+            for client in self.connected_clients:
+                # Check client_state if available
+                if hasattr(client, 'client_state'):
+                    try:
+                        # WebSocket states: 0=CONNECTING, 1=OPEN, 2=CLOSING, 3=CLOSED
+                        if client.client_state.value in [2, 3]:  # CLOSING or CLOSED
+                            dead_clients.append(client)
+                            continue
+                    except Exception:
+                        # If we can't read the state, consider it dead
                         dead_clients.append(client)
-                        
-                except Exception as check_error:
-                    # If we can't check the client, assume it's dead
-                    self.logger.debug(f"Error checking client state: {check_error}")
-                    dead_clients.append(client)
+                        continue
+                
+                # Queue a heartbeat; the writer task drops the client if the send fails
+                self.broadcast_hub.send_to(client, {"type": "heartbeat"})
             
             # Remove dead clients
             for client in dead_clients:
-                if client in self.connected_clients:
-                    self.connected_clients.remove(client)
+                self.broadcast_hub.unregister(client)
             
             if dead_clients:
                 self.logger.debug(f"Cleaned up {len(dead_clients)} dead connections")
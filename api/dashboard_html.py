@@ -467,6 +467,8 @@ def get_enhanced_dashboard_html() -> str:
         let reconnectAttempts = 0;
         const maxReconnectAttempts = 5;
         let opportunities = [];
+        let lastOpportunityId = 0;
+        let runtimeConfig = {{ ws_path: '/ws' }};
         let watchlist = [];
         
         /**
@@ -519,6 +521,99 @@ def get_enhanced_dashboard_html() -> str:
             }}
         }}
         
+        /**
+         * Decode a msgpack frame from the server
+         * @param {{ArrayBuffer}} buffer - Binary WebSocket message
+         * @returns {{any}} Decoded value
+         */
+        function decodeMsgpack(buffer) {{
+            const view = new DataView(buffer);
+            const bytes = new Uint8Array(buffer);
+            const textDecoder = new TextDecoder();
+            let offset = 0;
+            
+            function readString(length) {{
+                const value = textDecoder.decode(bytes.subarray(offset, offset + length));
+                offset += length;
+                return value;
+            }}
+            function readArray(length) {{
+                const value = new Array(length);
+                for (let i = 0; i < length; i++) value[i] = read();
+                return value;
+            }}
+            function readMap(length) {{
+                const value = {{}};
+                for (let i = 0; i < length; i++) {{
+                    const key = read();
+                    value[key] = read();
+                }}
+                return value;
+            }}
+            function readBinary(length) {{
+                const value = bytes.slice(offset, offset + length);
+                offset += length;
+                return value;
+            }}
+            function read() {{
+                const type = bytes[offset++];
+                if (type < 0x80) return type;
+                if (type < 0x90) return readMap(type & 0x0f);
+                if (type < 0xa0) return readArray(type & 0x0f);
+                if (type < 0xc0) return readString(type & 0x1f);
+                if (type >= 0xe0) return type - 0x100;
+                let value;
+                switch (type) {{
+                    case 0xc0: return null;
+                    case 0xc2: return false;
+                    case 0xc3: return true;
+                    case 0xc4: value = bytes[offset]; offset += 1; return readBinary(value);
+                    case 0xc5: value = view.getUint16(offset); offset += 2; return readBinary(value);
+                    case 0xc6: value = view.getUint32(offset); offset += 4; return readBinary(value);
+                    case 0xca: value = view.getFloat32(offset); offset += 4; return value;
+                    case 0xcb: value = view.getFloat64(offset); offset += 8; return value;
+                    case 0xcc: value = view.getUint8(offset); offset += 1; return value;
+                    case 0xcd: value = view.getUint16(offset); offset += 2; return value;
+                    case 0xce: value = view.getUint32(offset); offset += 4; return value;
+                    case 0xcf: value = Number(view.getBigUint64(offset)); offset += 8; return value;
+                    case 0xd0: value = view.getInt8(offset); offset += 1; return value;
+                    case 0xd1: value = view.getInt16(offset); offset += 2; return value;
+                    case 0xd2: value = view.getInt32(offset); offset += 4; return value;
+                    case 0xd3: value = Number(view.getBigInt64(offset)); offset += 8; return value;
+                    case 0xd9: value = bytes[offset]; offset += 1; return readString(value);
+                    case 0xda: value = view.getUint16(offset); offset += 2; return readString(value);
+                    case 0xdb: value = view.getUint32(offset); offset += 4; return readString(value);
+                    case 0xdc: value = view.getUint16(offset); offset += 2; return readArray(value);
+                    case 0xdd: value = view.getUint32(offset); offset += 4; return readArray(value);
+                    case 0xde: value = view.getUint16(offset); offset += 2; return readMap(value);
+                    case 0xdf: value = view.getUint32(offset); offset += 4; return readMap(value);
+                    default: throw new Error('Unsupported msgpack type 0x' + type.toString(16));
+                }}
+            }}
+            
+            return read();
+        }}
+        
+        /**
+         * Build the subscribe message from the page URL
+         * (?chains=ETHEREUM,BASE&min_score=0.6 limits what the server sends)
+         * @returns {{object}} Subscribe message
+         */
+        function buildSubscription() {{
+            const params = new URLSearchParams(window.location.search);
+            const message = {{
+                type: 'subscribe',
+                encodings: ['msgpack', 'json']
+            }};
+            if (params.get('chains')) {{
+                message.chains = params.get('chains').split(',').map(chain => chain.trim().toUpperCase());
+            }}
+            if (params.get('min_score')) {{
+                message.min_score = parseFloat(params.get('min_score'));
+            }}
+            return message;
+        }}
+        
         /**
          * Add new opportunity to the dashboard list
          * @param {{object}} opportunity - Opportunity data object
@@ -725,6 +820,29 @@ def get_enhanced_dashboard_html() -> str:
             }}
         }}
         
+        /**
+         * Load runtime settings (WebSocket path, encodings) from the server
+         */
+        async function loadRuntimeConfig() {{
+            try {{
+                const response = await fetch('/api/config');
+                if (response.ok) {{
+                    runtimeConfig = await response.json();
+                }}
+            }} catch (error) {{
+                console.warn('Using default runtime config:', error);
+            }}
+        }}
+        
+        /**
+         * WebSocket URL on the host that served this page
+         * @returns {{string}} ws:// or wss:// URL
+         */
+        function dashboardWebSocketUrl() {{
+            const scheme = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+            return `${{scheme}}//${{window.location.host}}${{runtimeConfig.ws_path || '/ws'}}`;
+        }}
+        
         /**
          * Establish WebSocket connection with retry logic
          */
@@ -736,18 +854,27 @@ def get_enhanced_dashboard_html() -> str:
                 }}
                 
                 console.log('Connecting to WebSocket...');
-                ws = new WebSocket('ws://localhost:8000/ws');
+                ws = new WebSocket(dashboardWebSocketUrl());
+                ws.binaryType = 'arraybuffer';
                 
                 ws.onopen = function() {{
                     console.log('WebSocket connected successfully');
                     updateConnectionStatus(true);
                     reconnectAttempts = 0;
+                    ws.send(JSON.stringify(buildSubscription()));
                 }};
                 
                 ws.onmessage = function(event) {{
                     try {{
-                        const data = JSON.parse(event.data);
-                        handleWebSocketMessage(data);
+                        // Frames are arrays of messages, msgpack-encoded once negotiated
+                        const data = event.data instanceof ArrayBuffer
+                            ? decodeMsgpack(event.data)
+                            : JSON.parse(event.data);
+                        if (Array.isArray(data)) {{
+                            data.forEach(handleWebSocketMessage);
+                        }} else {{
+                            handleWebSocketMessage(data);
+                        }}
                     }} catch (error) {{
                         console.error('Error parsing WebSocket message:', error);
                         console.error('Raw message:', event.data);
@@ -794,12 +921,22 @@ def get_enhanced_dashboard_html() -> str:
                 switch (data.type) {{
                     case 'new_opportunity':
                         if (data.data) {{
+                            lastOpportunityId = Math.max(lastOpportunityId, data.data.id || 0);
                             addOpportunityToList(data.data);
                         }} else {{
                             console.warn('Received new_opportunity message without data');
                         }}
                         break;
                         
+                    case 'opportunity_update':
+                        if (data.data) {{
+                            const index = opportunities.findIndex(opp => opp.token_address === data.data.token_address);
+                            if (index >= 0) {{
+                                opportunities[index] = data.data;
+                            }}
+                        }}
+                        break;
+                        
                     case 'stats_update':
                         if (data.data) {{
                             updateStats(data.data);
@@ -810,11 +947,28 @@ def get_enhanced_dashboard_html() -> str:
                         refreshWatchlist();
                         break;
                         
+                    case 'price_alerts':
+                        data.data.alerts.forEach(alert => {{
+                            const type = alert.kind === 'stop_loss' || alert.kind === 'liquidity_drop' ? 'error' : 'info';
+                            showNotification(`${{alert.token_symbol}}: ${{alert.kind.replace('_', ' ')}} (${{alert.value}})`, type);
+                        }});
+                        break;
+                        
+                    case 'resync':
+                        // The server dropped messages because this tab fell behind
+                        console.warn('Dashboard fell behind, resyncing. Dropped:', data.dropped);
+                        resyncOpportunities();
+                        fetchStats();
+                        break;
+                        
                     case 'connected':
-                    case 'subscribed':
                         console.log('WebSocket connection confirmed');
                         break;
                         
+                    case 'subscribed':
+                        console.log('WebSocket subscribed. Encoding:', data.encoding, 'Chains:', data.chains, 'Min score:', data.min_score);
+                        break;
+                        
                     case 'heartbeat':
                     case 'ping':
                         // Ignore heartbeat messages
@@ -876,6 +1030,31 @@ def get_enhanced_dashboard_html() -> str:
             }}
         }}
         
+        /**
+         * Reload opportunities missed while the WebSocket was behind
+         */
+        async function resyncOpportunities() {{
+            try {{
+                // Ask only for what arrived after the last opportunity this tab saw
+                const url = lastOpportunityId
+                    ? `/api/opportunities?since_id=${{lastOpportunityId}}&limit=200`
+                    : '/api/opportunities';
+                const response = await fetch(url);
+                if (!response.ok) {{
+                    throw new Error(`HTTP ${{response.status}}: ${{response.statusText}}`);
+                }}
+                
+                const latest = await response.json();
+                const known = new Set(opportunities.map(opp => opp.token_address));
+                latest.filter(opp => !known.has(opp.token_address)).forEach(opp => {{
+                    lastOpportunityId = Math.max(lastOpportunityId, opp.id || 0);
+                    addOpportunityToList(opp);
+                }});
+            }} catch (error) {{
+                console.error('Error resyncing opportunities:', error);
+            }}
+        }}
+        
         /**
          * Fetch statistics from API
          */
@@ -992,15 +1171,12 @@ def get_enhanced_dashboard_html() -> str:
         try {{
             console.log('Dashboard v2.1.{cache_bust} initializing...');
             
-            // Start WebSocket connection
-            connectWebSocket();
+            // Start WebSocket connection once the runtime config is known
+            loadRuntimeConfig().then(connectWebSocket);
             
-            // Fetch initial stats
+            // Fetch initial stats; later changes arrive as stats_update deltas
             fetchStats();
             
-            // Set up periodic stats refresh
-            setInterval(fetchStats, 10000); // Every 10 seconds
-            
             // Show debug panel after 5 seconds if no opportunities
             setTimeout(() => {{
                 if (opportunities.length === 0) {{
@@ -0,0 +1,553 @@
+# api/dashboard_ipc.py
+"""
+Out-of-process dashboard link.
+The trading process runs a DashboardPublisher in place of the dashboard
+server. It keeps the DashboardServer interface the trading system calls, but
+instead of serving HTTP it exposes its broadcast hub on a Unix socket:
+opportunities, stats deltas and portfolio views go out as length-prefixed
+msgpack (or JSON) frames, batched and bounded per connection like any other
+hub client. One or more dashboard processes run the FastAPI app with a
+DashboardSubscriber that applies the feed locally and sends trade and
+watchlist commands back over the same socket. HTTP parsing, JSON encoding
+and WebSocket fan-out then happen outside the trading event loop.
+Opportunity ids are assigned by the publisher, and a dashboard process gets a
+backfill of recent opportunities when it connects, so every process serves
+the same ids to SSE clients resuming with Last-Event-ID.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Union
+
+from api.broadcast_hub import (
+    JSON_ENCODING,
+    MSGPACK_AVAILABLE,
+    MSGPACK_ENCODING,
+    ClientChannel,
+    msgpack
+)
+from api.dashboard_core import DashboardServer
+from api.dashboard_models import WatchlistAddRequest
+from api.opportunity_store import OpportunityStore
+from models.watchlist import watchlist_manager
+from utils.logger import logger_manager
+
+
+DEFAULT_SOCKET_PATH = "data/dashboard.sock"
+
+# Environment variable that puts the dashboard app in subscriber mode
+IPC_PATH_ENV = "DASHBOARD_IPC_PATH"
+
+# Frame header: body length, codec
+FRAME_HEADER = struct.Struct('>IB')
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+# Stats owned by each dashboard process rather than the trading process
+LOCAL_STATS = ("connected_clients",)
+
+
+def pack_frame(payload: Union[str, bytes]) -> bytes:
+    """
+    Prefix an encoded payload with its frame header.
+
+    Args:
+        payload: JSON text or msgpack bytes
+
+    Returns:
+        Frame ready to write to the socket
+    """
+    if isinstance(payload, str):
+        body = payload.encode('utf-8')
+        codec = CODEC_JSON
+    else:
+        body = payload
+        codec = CODEC_MSGPACK
+    return FRAME_HEADER.pack(len(body), codec) + body
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Encode a single message as a frame."""
+    if MSGPACK_AVAILABLE:
+        return pack_frame(msgpack.packb(message, use_bin_type=True, default=str))
+    return pack_frame(json.dumps(message, default=str))
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Any:
+    """
+    Read and decode one frame.
+
+    Args:
+        reader: Socket reader
+
+    Returns:
+        Decoded message or list of messages
+
+    Raises:
+        asyncio.IncompleteReadError: If the peer closed the connection
+        ValueError: If the frame is oversized or cannot be decoded here
+    """
+    length, codec = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"Frame of {length} bytes exceeds limit")
+    body = await reader.readexactly(length)
+
+    if codec == CODEC_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("Received msgpack frame but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body)
+
+
+def _timestamp(value: Any) -> float:
+    """Unix timestamp from an ISO string, falling back to now."""
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except (TypeError, ValueError):
+        return datetime.now().timestamp()
+
+
+class IPCConnection:
+    """Socket writer with the send interface hub channels expect."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+
+    async def send_text(self, text: str) -> None:
+        self.writer.write(pack_frame(text))
+        await self.writer.drain()
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.writer.write(pack_frame(data))
+        await self.writer.drain()
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+class IPCChannel(ClientChannel):
+    """Hub channel for a dashboard process; frames are msgpack when available."""
+
+    transport = "ipc"
+
+    def __init__(self, websocket: Any, hub: Any) -> None:
+        super().__init__(websocket, hub)
+        self.encoding = MSGPACK_ENCODING if MSGPACK_AVAILABLE else JSON_ENCODING
+
+
+class DashboardPublisher(DashboardServer):
+    """
+    Trading-process side of the link.
+    Accepts dashboard processes on a Unix socket and feeds them through the
+    broadcast hub; the trading loop only ever enqueues.
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        snapshot_interval: float = 0.5,
+        max_queue: int = 10_000,
+        backfill_size: int = 1024
+    ) -> None:
+        """
+        Initialize the publisher.
+
+        Args:
+            socket_path: Unix socket dashboard processes connect to
+            snapshot_interval: Minimum seconds between portfolio view rebuilds
+            max_queue: Per-connection queue bound before a dashboard must resync
+            backfill_size: Recent opportunities sent to a dashboard process when it connects
+        """
+        # Ids are assigned here so every dashboard process agrees on them; the
+        # dashboard processes keep the large ring buffer, this one only feeds backfills
+        super().__init__(opportunity_capacity=backfill_size)
+        self.logger = logger_manager.get_logger("DashboardPublisher")
+        self.stream_id = uuid.uuid4().hex
+        self.socket_path = socket_path
+        self.snapshot_interval = snapshot_interval
+        self.broadcast_hub.max_queue = max_queue
+
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.views: Dict[str, Any] = {}
+        self.views_dirty = True
+        self.commands_handled = 0
+        self.command_errors = 0
+        self._snapshot_task: Optional[asyncio.Task] = None
+        # Commands in flight, referenced until done so they are not garbage-collected
+        self.command_tasks: Set[asyncio.Task] = set()
+
+    async def initialize(self) -> None:
+        """
+        Start listening for dashboard processes.
+
+        Raises:
+            Exception: If the socket cannot be created
+        """
+        try:
+            directory = os.path.dirname(self.socket_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+            self.server = await asyncio.start_unix_server(self._handle_connection, path=self.socket_path)
+            self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+            self.logger.info(f"Dashboard publisher listening on {self.socket_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to start dashboard publisher: {e}")
+            raise
+
+    async def close(self) -> None:
+        """Stop listening and disconnect dashboard processes."""
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+        for task in list(self.command_tasks):
+            task.cancel()
+        if self.server:
+            self.server.close()
+        for connection in self.broadcast_hub.clients:
+            connection.close()
+        self.broadcast_hub.close_all()
+        if self.server:
+            await self.server.wait_closed()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def _on_portfolio_change(self, position_manager: Any) -> None:
+        """Defer view rebuilds to the snapshot loop so trading is never slowed by them."""
+        self.views_dirty = True
+
+    async def _snapshot_loop(self) -> None:
+        """Rebuild and publish portfolio views at most once per interval."""
+        while True:
+            try:
+                await asyncio.sleep(self.snapshot_interval)
+                if self.views_dirty:
+                    self.views_dirty = False
+                    self._publish_views()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error publishing portfolio views: {e}")
+
+    def _publish_views(self) -> None:
+        """Publish views whose content changed."""
+        views = {
+            "portfolio": self._build_portfolio_view(),
+            "positions": self._build_positions_snapshot(),
+            "trades": self._build_trades_snapshot()
+        }
+        for name, payload in views.items():
+            if self.views.get(name) != payload:
+                self.views[name] = payload
+                self.broadcast_hub.publish({"type": "snapshot", "name": name, "data": payload})
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Feed one dashboard process and run the commands it sends."""
+        connection = IPCConnection(writer)
+        channel = self.broadcast_hub.register(connection, channel_class=IPCChannel)
+        # Queued before any live opportunity, so the dashboard's ids have no gap
+        self.broadcast_hub.send_to(connection, {
+            "type": "backfill",
+            "stream": self.stream_id,
+            "data": list(self.opportunity_store.iter_records())
+        })
+        for name, payload in self.views.items():
+            self.broadcast_hub.send_to(connection, {"type": "snapshot", "name": name, "data": payload})
+        self.logger.info(f"Dashboard process connected. Total: {len(self.connected_clients)}")
+
+        try:
+            while not channel.closed:
+                frame = await read_frame(reader)
+                for message in frame if isinstance(frame, list) else [frame]:
+                    if isinstance(message, dict) and message.get("type") == "command":
+                        task = asyncio.create_task(self._run_command(connection, message))
+                        self.command_tasks.add(task)
+                        task.add_done_callback(self.command_tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            self.logger.warning(f"Dashboard connection error: {e}")
+        finally:
+            self.broadcast_hub.unregister(connection)
+            connection.close()
+            self.logger.info(f"Dashboard process disconnected. Remaining: {len(self.connected_clients)}")
+
+    async def _run_command(self, connection: IPCConnection, message: Dict[str, Any]) -> None:
+        """
+        Execute a command from a dashboard process and queue the reply.
+
+        Args:
+            connection: Connection the command arrived on
+            message: Command with id, name and args
+        """
+        name = message.get("name")
+        args = message.get("args") or {}
+        reply: Dict[str, Any] = {"type": "reply", "id": message.get("id")}
+
+        try:
+            if name == "manual_trade":
+                reply["result"] = await self.execute_manual_trade(**args)
+            elif name == "watchlist_add":
+                reply["result"] = await self.add_token_to_watchlist(WatchlistAddRequest(**args))
+            elif name == "watchlist_remove":
+                reply["result"] = await self.remove_token_from_watchlist(**args)
+            else:
+                raise ValueError(f"Unknown command: {name}")
+            self.commands_handled += 1
+        except Exception as e:
+            self.command_errors += 1
+            self.logger.error(f"Dashboard command {name} failed: {e}")
+            reply["error"] = str(e)
+
+        self.broadcast_hub.send_to(connection, reply)
+
+    def get_link_stats(self) -> Dict[str, Any]:
+        """Connected dashboard processes and command counters."""
+        return {
+            "socket_path": self.socket_path,
+            "dashboards": len(self.connected_clients),
+            "commands_handled": self.commands_handled,
+            "command_errors": self.command_errors,
+            "delivery": self.broadcast_hub.get_stats()
+        }
+
+
+class DashboardSubscriber:
+    """
+    Dashboard-process side of the link.
+    Applies the trading process's feed to the local DashboardServer and
+    forwards commands; reconnects when the trading process restarts.
+    """
+
+    def __init__(
+        self,
+        dashboard: DashboardServer,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        request_timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize the subscriber.
+
+        Args:
+            dashboard: Local dashboard server serving HTTP and WebSocket clients
+            socket_path: Trading process socket
+            request_timeout: Seconds to wait for a command reply
+        """
+        self.logger = logger_manager.get_logger("DashboardSubscriber")
+        self.dashboard = dashboard
+        self.socket_path = socket_path
+        self.request_timeout = request_timeout
+
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.stream_id: Optional[str] = None
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.next_request_id = 0
+        self.is_running = False
+        self.connections = 0
+        self.frames_received = 0
+        self.messages_applied = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the trading process is currently connected."""
+        return self.writer is not None
+
+    def start(self) -> None:
+        """Connect in the background and route the dashboard's commands through this link."""
+        self.is_running = True
+        self.dashboard.command_client = self
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Disconnect and stop reconnecting."""
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        """Connect, consume frames, and reconnect with backoff."""
+        delay = 0.5
+        while self.is_running:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            except (OSError, ConnectionError) as e:
+                self.logger.debug(f"Trading process not reachable at {self.socket_path}: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10.0)
+                continue
+
+            delay = 0.5
+            self.writer = writer
+            self.connections += 1
+            self.logger.info(f"Connected to trading process at {self.socket_path}")
+            if self.connections > 1:
+                # Opportunities published while disconnected were missed
+                await self.dashboard.broadcast_message({"type": "resync"})
+
+            try:
+                while True:
+                    frame = await read_frame(reader)
+                    self.frames_received += 1
+                    for message in frame if isinstance(frame, list) else [frame]:
+                        await self._apply(message)
+            except asyncio.CancelledError:
+                raise
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.logger.warning("Trading process disconnected")
+            except Exception as e:
+                self.logger.error(f"Error reading from trading process: {e}")
+            finally:
+                self.writer = None
+                writer.close()
+                for future in self.pending.values():
+                    if not future.done():
+                        future.set_exception(ConnectionError("Trading process disconnected"))
+                self.pending.clear()
+
+            await asyncio.sleep(delay)
+
+    async def _apply(self, message: Dict[str, Any]) -> None:
+        """
+        Apply one message from the trading process.
+
+        Args:
+            message: Hub message
+        """
+        message_type = message.get("type")
+        data = message.get("data")
+
+        try:
+            if message_type == "new_opportunity":
+                await self.dashboard.publish_opportunity(
+                    data, _timestamp(data.get("detected_at")), count=False, record_id=data.get("id")
+                )
+            elif message_type == "backfill":
+                self._apply_backfill(message.get("stream"), data or [])
+            elif message_type == "opportunity_update":
+                await self.dashboard.publish_opportunity_update(data)
+            elif message_type == "stats_update":
+                fields = {name: value for name, value in data.items() if name not in LOCAL_STATS}
+                self.dashboard.stats.update(fields)
+                self.dashboard.broadcast_hub.update_state(fields)
+            elif message_type == "snapshot":
+                self.dashboard.apply_remote_view(message.get("name"), data)
+            elif message_type == "reply":
+                future = self.pending.pop(message.get("id"), None)
+                if future is not None and not future.done():
+                    if message.get("error"):
+                        future.set_exception(RuntimeError(message["error"]))
+                    else:
+                        future.set_result(message.get("result"))
+            elif message_type == "watchlist_updated":
+                watchlist_manager.reload()
+                await self.dashboard.broadcast_message(message)
+            elif message_type in ("heartbeat", "ping", "pong"):
+                return
+            else:
+                # resync, trade_executed and anything else goes to clients as-is
+                await self.dashboard.broadcast_message(message)
+            self.messages_applied += 1
+
+        except Exception as e:
+            self.logger.error(f"Error applying {message_type} from trading process: {e}")
+
+    def _apply_backfill(self, stream_id: Optional[str], records: List[Dict[str, Any]]) -> None:
+        """
+        Store the recent opportunities the trading process sends on connect.
+
+        Args:
+            stream_id: Identifies the trading process run that numbered the records
+            records: Stored opportunity records, oldest first
+        """
+        if self.stream_id is not None and stream_id != self.stream_id:
+            # A restarted trading process numbers from 1 again
+            self.dashboard.opportunity_store = OpportunityStore(self.dashboard.opportunity_store.capacity)
+            self.logger.info("Trading process restarted; opportunity history reset")
+        self.stream_id = stream_id
+
+        store = self.dashboard.opportunity_store
+        for record in records:
+            store.add(record, _timestamp(record.get("detected_at")), record_id=record.get("id"))
+        self.logger.info(f"Backfilled {len(records)} opportunities (latest id {store.latest_id})")
+
+    async def request(self, name: str, args: Dict[str, Any]) -> Any:
+        """
+        Run a command in the trading process.
+
+        Args:
+            name: manual_trade, watchlist_add or watchlist_remove
+            args: Command arguments
+
+        Returns:
+            The command's result
+
+        Raises:
+            ConnectionError: If the trading process is not connected
+            RuntimeError: If the command failed there
+            asyncio.TimeoutError: If no reply arrived in time
+        """
+        if self.writer is None:
+            raise ConnectionError("Trading process not connected")
+
+        self.next_request_id += 1
+        request_id = self.next_request_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+
+        try:
+            self.writer.write(encode_message({"type": "command", "id": request_id, "name": name, "args": args}))
+            await self.writer.drain()
+            return await asyncio.wait_for(future, timeout=self.request_timeout)
+        finally:
+            self.pending.pop(request_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Link state and counters."""
+        return {
+            "socket_path": self.socket_path,
+            "connected": self.connected,
+            "connections": self.connections,
+            "frames_received": self.frames_received,
+            "messages_applied": self.messages_applied,
+            "pending_commands": len(self.pending)
+        }
+
+
+async def launch_dashboard_process(
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1
+) -> asyncio.subprocess.Process:
+    """
+    Start the dashboard app in its own process, subscribed to socket_path.
+
+    Args:
+        socket_path: Publisher socket
+        host: HTTP bind address
+        port: HTTP port
+        workers: uvicorn worker processes
+
+    Returns:
+        The child process
+    """
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "api.dashboard_process",
+        "--ipc-path", socket_path,
+        "--host", host,
+        "--port", str(port),
+        "--workers", str(workers)
+    )
@@ -0,0 +1,42 @@
+# api/dashboard_process.py
+"""
+Entry point for running the dashboard in its own process.
+The app subscribes to a trading process's DashboardPublisher socket instead
+of sharing its event loop; several uvicorn workers may serve it at once.
+
+Usage:
+    python -m api.dashboard_process --ipc-path data/dashboard.sock --workers 2
+"""
+
+import argparse
+import os
+
+from api.dashboard_ipc import DEFAULT_SOCKET_PATH, IPC_PATH_ENV
+
+
+def main() -> None:
+    """Parse arguments and run uvicorn with the dashboard app in subscriber mode."""
+    parser = argparse.ArgumentParser(description='DEX Sniping dashboard process')
+    parser.add_argument('--ipc-path', default=DEFAULT_SOCKET_PATH,
+                        help='Trading process socket to subscribe to')
+    parser.add_argument('--host', default='127.0.0.1', help='HTTP bind address')
+    parser.add_argument('--port', type=int, default=8000, help='HTTP port')
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn worker processes')
+    args = parser.parse_args()
+
+    # Inherited by every worker; the app's startup hook connects when it is set
+    os.environ[IPC_PATH_ENV] = os.path.abspath(args.ipc_path)
+
+    import uvicorn
+    uvicorn.run(
+        "api.dashboard_server:app",
+        host=args.host,
+        port=args.port,
+        workers=max(1, args.workers),
+        log_level="warning",
+        access_log=False
+    )
+
+
+if __name__ == "__main__":
+    main()
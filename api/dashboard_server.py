@@ -5,16 +5,21 @@ Main entry point for the web dashboard with route definitions.
 """
 
 import asyncio
+import hashlib
 import json
 import os
 from typing import List, Optional
 from datetime import datetime
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from api.broadcast_hub import SUPPORTED_ENCODINGS
+from api.dashboard_assets import DashboardAssets, etag_matches
 from api.dashboard_core import DashboardServer, dashboard_server
+from api.dashboard_ipc import IPC_PATH_ENV, DashboardSubscriber
+from api.event_stream import parse_last_event_id
 from api.dashboard_models import (
     TradeRequest, 
     OpportunityResponse, 
@@ -33,6 +38,12 @@ app = FastAPI(
     redoc_url="/api/redoc"
 )
 
+# Page and hashed assets, built once and served from memory
+dashboard_assets = DashboardAssets(fallback_renderer=get_enhanced_dashboard_html)
+
+# Link to the trading process when running as a separate dashboard process
+dashboard_subscriber: Optional[DashboardSubscriber] = None
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -46,34 +57,43 @@ app.add_middleware(
 @app.on_event("startup")
 async def startup_event() -> None:
     """Initialize services on startup."""
+    global dashboard_subscriber
     try:
         await dashboard_server.initialize()
+        dashboard_assets.build()
+        
+        ipc_path = os.environ.get(IPC_PATH_ENV)
+        if ipc_path:
+            dashboard_subscriber = DashboardSubscriber(dashboard_server, ipc_path)
+            dashboard_subscriber.start()
     except Exception as e:
         logger_manager.get_logger("FastAPI").error(f"Startup failed: {e}")
         raise
 
 
+def _asset_response(request: Request, name: Optional[str]) -> Response:
+    """Serve a prebuilt asset with the request's encoding and cache headers."""
+    result = dashboard_assets.respond(
+        name,
+        accept_encoding=request.headers.get("accept-encoding"),
+        if_none_match=request.headers.get("if-none-match")
+    )
+    return Response(content=result.body, status_code=result.status, headers=result.headers)
+
+
 @app.get("/", response_class=HTMLResponse)
-async def get_dashboard() -> HTMLResponse:
+async def get_dashboard(request: Request) -> Response:
     """
     Serve the main dashboard page.
     
+    Args:
+        request: Incoming request (for Accept-Encoding and If-None-Match)
+        
     Returns:
-        HTMLResponse with the dashboard content
+        Prebuilt page, revalidated by ETag
     """
     try:
-        # Check if custom template exists
-        template_path = "web/templates/dashboard.html"
-        if os.path.exists(template_path):
-            try:
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    return HTMLResponse(content=content)
-            except Exception as file_error:
-                dashboard_server.logger.error(f"Error reading template: {file_error}")
-        
-        # Return enhanced basic dashboard with watchlist
-        return HTMLResponse(content=get_enhanced_dashboard_html())
+        return _asset_response(request, None)
         
     except Exception as e:
         dashboard_server.logger.error(f"Dashboard page error: {e}")
@@ -83,95 +103,187 @@ async def get_dashboard() -> HTMLResponse:
         )
 
 
-@app.get("/api/stats")
-async def get_stats() -> dict:
+@app.get("/assets/{name}")
+async def get_dashboard_asset(name: str, request: Request) -> Response:
     """
-    Get current system statistics.
+    Serve a content-hashed dashboard asset.
     
+    Args:
+        name: Hashed asset file name
+        request: Incoming request (for Accept-Encoding and If-None-Match)
+        
     Returns:
-        Dictionary containing system statistics
+        Asset cached as immutable, or 404
     """
-    try:
-        uptime = datetime.now() - dashboard_server.stats["uptime_start"]
-        portfolio = {}
+    return _asset_response(request, name)
+
+
+@app.get("/api/config")
+async def get_dashboard_config(request: Request) -> Response:
+    """
+    Runtime values for the dashboard page, so nothing is hardcoded in its assets.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
         
-        if dashboard_server.position_manager:
-            try:
-                portfolio = dashboard_server.position_manager.get_portfolio_summary()
-            except Exception as portfolio_error:
-                dashboard_server.logger.debug(f"Portfolio error: {portfolio_error}")
-                portfolio = {"status": "unavailable"}
+    Returns:
+        WebSocket path, supported frame encodings and asset URLs
+    """
+    config = {
+        "version": app.version,
+        "ws_path": "/ws",
+        "api_base": "/api",
+        "encodings": list(SUPPORTED_ENCODINGS),
+        "frame_interval_ms": int(dashboard_server.broadcast_hub.frame_interval * 1000),
+        "assets": dashboard_assets.asset_names()
+    }
+    body = json.dumps(config, sort_keys=True).encode("utf-8")
+    headers = {
+        "ETag": f'"{hashlib.sha256(body).hexdigest()[:20]}"',
+        "Cache-Control": "no-cache"
+    }
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _snapshot_response(request: Request, name: str, version: Optional[int], wait: float) -> Response:
+    """
+    Serve a read-model snapshot, revalidated by ETag and optionally long-polled.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        name: Snapshot name
+        version: Version the client already holds, as an alternative to If-None-Match
+        wait: Seconds to wait for a newer version when the client's copy is current
         
-        return {
-            "total_opportunities": dashboard_server.stats["total_opportunities"],
-            "high_confidence": dashboard_server.stats["high_confidence"], 
-            "active_chains": dashboard_server.stats["active_chains"],
-            "analysis_rate": dashboard_server.stats["analysis_rate"],
-            "uptime_hours": uptime.total_seconds() / 3600,
-            "portfolio": portfolio,
-            "connected_clients": len(dashboard_server.connected_clients)
-        }
+    Returns:
+        Snapshot bytes, or 304 if the client's copy is still current
+    """
+    read_model = dashboard_server.read_model
+    snapshot = read_model.get(name)
+    if snapshot is None:
+        return JSONResponse({"status": "error", "error": f"{name} unavailable"}, status_code=503)
         
-    except Exception as e:
-        dashboard_server.logger.error(f"Error getting stats: {e}")
-        return {
-            "error": str(e),
-            "connected_clients": len(dashboard_server.connected_clients),
-            "status": "error"
-        }
+    def is_current(current) -> bool:
+        return current.version == version or etag_matches(request.headers.get("if-none-match"), current.etag)
+        
+    if wait > 0 and is_current(snapshot):
+        snapshot = await read_model.wait_for_change(name, snapshot.etag, wait)
+        
+    if is_current(snapshot):
+        read_model.not_modified += 1
+        return Response(status_code=304, headers=snapshot.headers())
+    return Response(content=snapshot.body, media_type="application/json", headers=snapshot.headers())
 
 
-@app.get("/api/opportunities", response_model=List[OpportunityResponse])
-async def get_opportunities() -> List[OpportunityResponse]:
+@app.get("/api/stats")
+async def get_stats(request: Request, version: Optional[int] = None, wait: float = 0.0) -> Response:
     """
-    Get current trading opportunities from the queue.
+    Get current system statistics.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        version: Snapshot version the client already holds
+        wait: Long-poll up to this many seconds for a newer version
     
     Returns:
-        List of OpportunityResponse objects with recent opportunities
+        Latest stats snapshot
+    """
+    return await _snapshot_response(request, "stats", version, wait)
+
+
+def _query_opportunities(
+    limit: int,
+    chain: Optional[str],
+    min_score: Optional[float],
+    token_address: Optional[str],
+    since_id: Optional[int],
+    before_id: Optional[int],
+    since: Optional[float]
+) -> dict:
+    """Run a filtered opportunity store query with the API's limit bounds."""
+    return dashboard_server.opportunity_store.query(
+        chain=chain,
+        token_address=token_address,
+        min_score=min_score,
+        since_id=since_id,
+        before_id=before_id,
+        since_time=since,
+        limit=max(1, min(limit, 1000))
+    )
+
+
+@app.get("/api/opportunities")
+async def get_opportunities(
+    limit: int = 20,
+    chain: Optional[str] = None,
+    min_score: Optional[float] = None,
+    token_address: Optional[str] = None,
+    since_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    since: Optional[float] = None
+) -> JSONResponse:
+    """
+    Get recent trading opportunities, optionally filtered.
+    
+    Args:
+        limit: Maximum opportunities returned (up to 1000)
+        chain: Only this chain
+        min_score: Only opportunities scoring at least this
+        token_address: Only this token
+        since_id: Only opportunities newer than this id, oldest first
+        before_id: Only opportunities older than this id
+        since: Only opportunities detected after this Unix timestamp
         
-    Raises:
-        HTTPException: If there's an error retrieving opportunities
+    Returns:
+        List of opportunity records (OpportunityResponse fields plus id and detected_at)
     """
     try:
-        opportunities = []
-        
-        # Get last 20 opportunities from queue
-        recent_opportunities = list(dashboard_server.opportunities_queue)[-20:]
-        
-        for opp in recent_opportunities:
-            try:
-                # Calculate age in minutes
-                age_minutes = int((datetime.now() - opp.detected_at).total_seconds() / 60)
-                
-                # Extract recommendation safely
-                recommendation = opp.metadata.get("recommendation", {})
-                
-                # Create response object with validation
-                opportunity_response = OpportunityResponse(
-                    token_symbol=opp.token.symbol or "UNKNOWN",
-                    token_address=opp.token.address,
-                    chain=opp.metadata.get("chain", "ethereum").lower(),
-                    risk_level=opp.contract_analysis.risk_level.value if opp.contract_analysis else "unknown",
-                    recommendation=recommendation.get("action", "UNKNOWN"),
-                    confidence=recommendation.get("confidence", "UNKNOWN"),
-                    score=float(recommendation.get("score", 0.0)),
-                    liquidity_usd=float(opp.liquidity.liquidity_usd) if opp.liquidity else 0.0,
-                    age_minutes=age_minutes
-                )
-                
-                opportunities.append(opportunity_response)
-                
-            except Exception as e:
-                dashboard_server.logger.warning(f"Skipping malformed opportunity: {e}")
-                continue
-        
-        dashboard_server.logger.debug(f"Returning {len(opportunities)} opportunities")
-        return opportunities
+        page = _query_opportunities(limit, chain, min_score, token_address, since_id, before_id, since)
+        return JSONResponse(content=page["items"])
         
     except Exception as e:
         dashboard_server.logger.error(f"Error getting opportunities: {e}")
         # Return empty list instead of error to keep dashboard functional
-        return []
+        return JSONResponse(content=[])
+
+
+@app.get("/api/opportunities/page")
+async def get_opportunities_page(
+    limit: int = 50,
+    chain: Optional[str] = None,
+    min_score: Optional[float] = None,
+    token_address: Optional[str] = None,
+    since_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    since: Optional[float] = None
+) -> JSONResponse:
+    """
+    Cursor-paginated opportunity query.
+    Pass next_cursor back as before_id to page further back, or as since_id
+    when following new opportunities.
+    
+    Args:
+        limit: Maximum opportunities returned (up to 1000)
+        chain: Only this chain
+        min_score: Only opportunities scoring at least this
+        token_address: Only this token
+        since_id: Only opportunities newer than this id, oldest first
+        before_id: Only opportunities older than this id
+        since: Only opportunities detected after this Unix timestamp
+        
+    Returns:
+        Dictionary with items, next_cursor, latest_id and oldest_id
+    """
+    try:
+        page = _query_opportunities(limit, chain, min_score, token_address, since_id, before_id, since)
+        return JSONResponse(content=page)
+        
+    except Exception as e:
+        dashboard_server.logger.error(f"Error paging opportunities: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 
 # Watchlist API endpoints
 @app.get("/api/watchlist")
@@ -245,19 +357,9 @@ async def remove_from_watchlist(token_address: str, chain: str) -> dict:
         Dictionary with success status and message
     """
     try:
-        success = watchlist_manager.remove_from_watchlist(token_address, chain)
+        success = await dashboard_server.remove_token_from_watchlist(token_address, chain)
         
         if success:
-            # Broadcast to connected clients
-            await dashboard_server.broadcast_message({
-                "type": "watchlist_updated",
-                "data": {
-                    "action": "removed",
-                    "token_address": token_address,
-                    "chain": chain
-                }
-            })
-            
             return {"success": True, "message": "Removed from watchlist"}
         else:
             return {"success": False, "message": "Token not found in watchlist"}
@@ -295,85 +397,67 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     await dashboard_server.handle_websocket_connection(websocket)
 
 
+@app.get("/api/stream")
+async def stream_events(
+    request: Request,
+    chains: Optional[str] = None,
+    min_score: float = 0.0,
+    last_event_id: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Server-Sent Events feed of the dashboard broadcasts, for read-only consumers.
+    
+    Args:
+        request: Incoming request (for the Last-Event-ID header)
+        chains: Comma-separated chains to receive opportunities for
+        min_score: Only opportunities scoring at least this
+        last_event_id: Resume point when the Last-Event-ID header cannot be set
+        
+    Returns:
+        text/event-stream response; opportunity events carry their id
+    """
+    stream = dashboard_server.open_event_stream(
+        chains=[chain.strip() for chain in chains.split(",") if chain.strip()] if chains else None,
+        min_score=min_score,
+        last_event_id=parse_last_event_id(request.headers.get("last-event-id") or last_event_id)
+    )
+    return StreamingResponse(
+        stream.iter_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/api/trades")
-async def get_trade_history() -> dict:
+async def get_trade_history(request: Request, version: Optional[int] = None, wait: float = 0.0) -> Response:
     """
     Get recent trade history.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        version: Snapshot version the client already holds
+        wait: Long-poll up to this many seconds for a newer version
+    
     Returns:
-        Dictionary containing trade history
+        Latest trades snapshot
     """
-    try:
-        trades = []
-        
-        # Try to get trades from position manager
-        if (dashboard_server.position_manager and 
-            hasattr(dashboard_server.position_manager, 'closed_positions')):
-            
-            try:
-                for exit in dashboard_server.position_manager.closed_positions[-20:]:  # Last 20
-                    try:
-                        trades.append({
-                            "id": getattr(exit, 'position_id', 'unknown'),
-                            "token_symbol": getattr(exit, 'position_id', 'UNKNOWN').split('_')[0],
-                            "trade_type": "close",
-                            "amount": float(getattr(exit, 'exit_amount', 0)),
-                            "status": "completed",
-                            "created_at": getattr(exit, 'exit_time', datetime.now()).isoformat(),
-                            "executed_at": getattr(exit, 'exit_time', datetime.now()).isoformat(),
-                            "tx_hash": getattr(exit, 'exit_tx_hash', None),
-                            "chain": "unknown",
-                            "pnl": float(getattr(exit, 'realized_pnl', 0))
-                        })
-                    except Exception as trade_error:
-                        dashboard_server.logger.error(f"Error processing individual trade: {trade_error}")
-                        continue
-            except Exception as position_error:
-                dashboard_server.logger.error(f"Error accessing position manager data: {position_error}")
-        
-        return {"trades": trades, "status": "success"}
-        
-    except Exception as e:
-        dashboard_server.logger.error(f"Error getting trade history: {e}")
-        return {"trades": [], "error": str(e), "status": "error"}
+    return await _snapshot_response(request, "trades", version, wait)
 
 
 @app.get("/api/positions")
-async def get_positions() -> dict:
+async def get_positions(request: Request, version: Optional[int] = None, wait: float = 0.0) -> Response:
     """
     Get current trading positions.
     
+    Args:
+        request: Incoming request (for If-None-Match)
+        version: Snapshot version the client already holds
+        wait: Long-poll up to this many seconds for a newer version
+    
     Returns:
-        Dictionary containing current positions
+        Latest positions snapshot
     """
-    try:
-        positions = []
-        
-        if (dashboard_server.position_manager and 
-            hasattr(dashboard_server.position_manager, 'active_positions')):
-            
-            try:
-                for position_id, position in dashboard_server.position_manager.active_positions.items():
-                    try:
-                        positions.append({
-                            "token_symbol": getattr(position, 'token_symbol', 'UNKNOWN'),
-                            "amount": float(getattr(position, 'entry_amount', 0)),
-                            "entry_price": float(getattr(position, 'entry_price', 0)),
-                            "current_price": float(getattr(position, 'current_price', 0)),
-                            "pnl": float(getattr(position, 'unrealized_pnl', 0)),
-                            "pnl_percentage": getattr(position, 'unrealized_pnl_percentage', 0.0)
-                        })
-                    except Exception as pos_error:
-                        dashboard_server.logger.error(f"Error processing position {position_id}: {pos_error}")
-                        continue
-            except Exception as positions_error:
-                dashboard_server.logger.error(f"Error accessing active positions: {positions_error}")
-        
-        return {"positions": positions, "status": "success"}
-        
-    except Exception as e:
-        dashboard_server.logger.error(f"Error getting positions: {e}")
-        return {"positions": [], "error": str(e), "status": "error"}
+    return await _snapshot_response(request, "positions", version, wait)
 
 
 @app.post("/api/trade")
@@ -388,41 +472,13 @@ async def execute_trade(trade_request: TradeRequest) -> dict:
         Dictionary containing trade execution result
     """
     try:
-        dashboard_server.logger.info(f"Manual trade request: {trade_request.token_symbol}")
-        
-        if not dashboard_server.trading_executor:
-            return {"success": False, "message": "Trading executor not available"}
-        
-        # Execute the trade
-        result = await dashboard_server.trading_executor.manual_trade(
+        return await dashboard_server.execute_manual_trade(
             token_address=trade_request.token_address,
             amount=trade_request.amount,
-            chain=trade_request.chain
+            chain=trade_request.chain,
+            token_symbol=trade_request.token_symbol
         )
         
-        if result:
-            # Broadcast trade execution to connected clients
-            await dashboard_server.broadcast_message({
-                "type": "trade_executed",
-                "data": {
-                    "token_symbol": trade_request.token_symbol,
-                    "amount": trade_request.amount,
-                    "status": result.status.value if hasattr(result, 'status') else 'unknown',
-                    "tx_hash": getattr(result, 'tx_hash', None)
-                }
-            })
-            
-            return {
-                "success": True,
-                "trade_id": getattr(result, 'id', 'unknown'),
-                "message": f"Trade executed for {trade_request.token_symbol}"
-            }
-        else:
-            return {
-                "success": False,
-                "message": "Trade execution failed"
-            }
-            
     except Exception as e:
         dashboard_server.logger.error(f"Error executing trade: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -443,9 +499,15 @@ async def get_system_status() -> dict:
             "status": "running",
             "uptime_seconds": uptime.total_seconds(),
             "connected_clients": len(dashboard_server.connected_clients),
-            "trading_executor_initialized": dashboard_server.trading_executor is not None,
+            "trading_executor_initialized": (
+                dashboard_server.trading_executor is not None or dashboard_server.command_client is not None
+            ),
             "position_manager_initialized": dashboard_server.position_manager is not None,
-            "opportunities_in_queue": len(dashboard_server.opportunities_queue),
+            "opportunities_in_queue": len(dashboard_server.opportunity_store),
+            "opportunity_store": dashboard_server.opportunity_store.get_stats(),
+            "websocket_delivery": dashboard_server.get_broadcast_stats(),
+            "read_model": dashboard_server.read_model.get_stats(),
+            "trading_link": dashboard_subscriber.get_stats() if dashboard_subscriber else None,
             "watchlist_items": len(watchlist_manager.get_watchlist()),
             "chains": {
                 "ethereum": {"status": "active"},
@@ -471,18 +533,7 @@ async def export_data() -> dict:
         export_data = {
             "timestamp": datetime.now().isoformat(),
             "stats": dashboard_server.stats,
-            "opportunities": [
-                {
-                    "token_symbol": opp.token.symbol,
-                    "token_address": opp.token.address,
-                    "chain": opp.metadata.get("chain"),
-                    "risk_level": opp.contract_analysis.risk_level.value,
-                    "recommendation": opp.metadata.get("recommendation", {}),
-                    "detected_at": opp.detected_at.isoformat(),
-                    "liquidity_usd": opp.liquidity.liquidity_usd
-                }
-                for opp in dashboard_server.opportunities_queue
-            ],
+            "opportunities": list(dashboard_server.opportunity_store.iter_records()),
             "watchlist": [item.to_dict() for item in watchlist_manager.get_watchlist()],
             "trade_history": [],  # Will be populated if trading system is available
             "positions": []  # Will be populated if position manager is available
@@ -0,0 +1,133 @@
+# api/event_stream.py
+"""
+Server-Sent Events transport for the broadcast hub.
+Read-only consumers attach over plain HTTP instead of a WebSocket. Each
+stream is an ordinary hub channel, so it shares publishing, topic filters,
+stats deltas and backpressure with WebSocket clients, but frames are written
+as SSE events. Opportunity events carry their store id, which lets clients
+resume with Last-Event-ID. There is no ping/pong: an idle stream only gets a
+comment line every keepalive interval to keep proxies from closing it.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional
+
+from api.broadcast_hub import JSON_ENCODING, BroadcastHub, ClientChannel, OutgoingMessage
+
+# Client reconnect delay advertised in the stream
+RETRY_MS = 3000
+
+# Seconds of silence before a keepalive comment is written
+KEEPALIVE_SECONDS = 15.0
+
+# Hub messages that only serve WebSocket liveness checks
+LIVENESS_MESSAGES = ("heartbeat", "ping", "pong")
+
+
+def format_event(message: OutgoingMessage) -> str:
+    """
+    Format one message as an SSE event.
+
+    Args:
+        message: Published message (its JSON encoding is shared with WebSocket clients)
+
+    Returns:
+        Event text including the terminating blank line
+    """
+    lines = []
+    data = message.message.get("data")
+    if isinstance(data, dict) and data.get("id") is not None and message.chain is not None:
+        lines.append(f"id: {data['id']}")
+    lines.append(f"event: {message.message.get('type', 'message')}")
+    lines.append(f"data: {message.encode(JSON_ENCODING)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class EventStreamChannel(ClientChannel):
+    """Hub channel that writes batches as SSE events."""
+
+    transport = "sse"
+
+    def enqueue(self, message: OutgoingMessage) -> None:
+        """Queue a message, skipping WebSocket liveness messages."""
+        if message.message.get("type") in LIVENESS_MESSAGES:
+            return
+        super().enqueue(message)
+
+    def _encode_frame(self, messages: List[OutgoingMessage]) -> str:
+        """Encode a batch as consecutive SSE events."""
+        return "".join(format_event(message) for message in messages)
+
+
+class EventStream:
+    """
+    One SSE connection: the sink its hub channel writes into and the body
+    iterator handed to the HTTP response.
+    """
+
+    def __init__(self, hub: BroadcastHub, max_pending: int = 16) -> None:
+        """
+        Initialize the stream.
+
+        Args:
+            hub: Broadcast hub to register with
+            max_pending: Written batches buffered before the channel's writer waits
+        """
+        self.hub = hub
+        self.pending: asyncio.Queue = asyncio.Queue(max_pending)
+        self.channel: Optional[ClientChannel] = None
+
+    def open(self) -> ClientChannel:
+        """
+        Register with the hub.
+
+        Returns:
+            The stream's hub channel
+        """
+        self.channel = self.hub.register(self, channel_class=EventStreamChannel)
+        return self.channel
+
+    async def send_text(self, text: str) -> None:
+        """Called by the channel writer; waits while the HTTP response is behind."""
+        await self.pending.put(text)
+
+    async def iter_events(self, keepalive: float = KEEPALIVE_SECONDS) -> AsyncIterator[str]:
+        """
+        Response body: queued events until the client disconnects or the channel closes.
+
+        Args:
+            keepalive: Seconds of silence before writing a comment line
+
+        Yields:
+            SSE text chunks
+        """
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while self.channel is not None and not (self.channel.closed and self.pending.empty()):
+                try:
+                    yield await asyncio.wait_for(self.pending.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Unregister from the hub."""
+        self.hub.unregister(self)
+
+
+def parse_last_event_id(value: Any) -> Optional[int]:
+    """
+    Parse a Last-Event-ID header or query value.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        Opportunity id, or None if missing or not an id this server issued
+    """
+    try:
+        event_id = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return event_id if event_id >= 0 else None
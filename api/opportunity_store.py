@@ -0,0 +1,484 @@
+# api/opportunity_store.py
+"""
+Fixed-capacity opportunity store for the dashboard API.
+Opportunities are kept as compact fixed-width records in a ring buffer of
+typed arrays, with indexes by chain, token address, score bucket and
+detection time; about 120 bytes per retained record in total. Queries page with an id cursor and only
+walk the smallest matching index, so they stay fast as the buffer fills.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from utils.logger import logger_manager
+
+
+ADDRESS_BYTES = 44  # Base58 Solana addresses are up to 44 characters, EVM addresses 42
+SYMBOL_BYTES = 12
+SCORE_BUCKETS = 10
+MAX_BLOCK = 2 ** 32 - 1
+
+
+class StringTable:
+    """Maps a small set of repeated strings (chains, risk levels) to byte codes."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        """Get or assign the code for a value."""
+        code = self.codes.get(value)
+        if code is None:
+            if len(self.values) >= 255:
+                # Out of codes; lump the rest together rather than fail
+                return self.code("other")
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def lookup(self, value: str) -> Optional[int]:
+        """Code for a value, or None if it was never stored."""
+        return self.codes.get(value)
+
+
+class TokenIndex:
+    """
+    Open-addressing hash table from token address to newest record id.
+    Slots hold record ids only; addresses are compared against the record
+    columns, so the table costs 8 bytes per slot instead of a dict entry and
+    a string per token. Ids that have left the buffer act as tombstones and
+    are cleared by rebuild().
+    """
+
+    def __init__(self, store: "OpportunityStore", slots: int) -> None:
+        self.store = store
+        self.mask = (1 << max(4, (slots - 1).bit_length())) - 1
+        self.table = array('q', bytes(8 * (self.mask + 1)))
+        self.inserted_since_rebuild = 0
+
+    def _probe(self, address: str) -> Iterator[int]:
+        position = hash(address) & self.mask
+        while True:
+            yield position
+            position = (position + 1) & self.mask
+
+    def get(self, address: str) -> Optional[int]:
+        """Newest retained record id for an address."""
+        for position in self._probe(address):
+            record_id = self.table[position]
+            if record_id == 0:
+                return None
+            if self.store._contains(record_id) and self.store._address_at(self.store._slot(record_id)) == address:
+                return record_id
+
+    def put(self, address: str, record_id: int) -> None:
+        """Point an address at a record, replacing its previous record."""
+        reusable = None
+        for position in self._probe(address):
+            existing = self.table[position]
+            if existing == 0:
+                break
+            if not self.store._contains(existing):
+                if reusable is None:
+                    reusable = position
+            elif self.store._address_at(self.store._slot(existing)) == address:
+                self.table[position] = record_id
+                return
+
+        self.table[position if reusable is None else reusable] = record_id
+        self.inserted_since_rebuild += 1
+
+    def rebuild(self) -> None:
+        """Re-insert retained records to clear tombstones."""
+        self.table = array('q', bytes(8 * (self.mask + 1)))
+        for record_id in range(self.store.oldest_id, self.store.next_id):
+            address = self.store._address_at(self.store._slot(record_id))
+            if address:
+                self.put(address, record_id)
+        self.inserted_since_rebuild = 0
+
+    def __len__(self) -> int:
+        return sum(1 for record_id in self.table if record_id and self.store._contains(record_id))
+
+
+def score_bucket(score: float) -> int:
+    """Score bucket (0-9) for a 0.0-1.0 score."""
+    return min(SCORE_BUCKETS - 1, max(0, int(score * SCORE_BUCKETS)))
+
+
+def _encode_text(value: str, width: int) -> bytes:
+    """UTF-8 encode and truncate/pad a string to a fixed width."""
+    encoded = (value or '').encode('utf-8')[:width]
+    return encoded.ljust(width, b'\0')
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode a fixed-width text field."""
+    return raw.rstrip(b'\0').decode('utf-8', errors='ignore')
+
+
+class OpportunityStore:
+    """
+    Ring buffer of opportunity records.
+    Records get increasing ids; once the buffer is full each new record
+    overwrites the oldest. Indexes hold ids in ascending order and are
+    trimmed lazily as ids fall out of the buffer.
+    """
+
+    def __init__(self, capacity: int = 100_000) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            capacity: Number of records retained
+        """
+        self.logger = logger_manager.get_logger("OpportunityStore")
+        self.capacity = max(1, capacity)
+        self.next_id = 1
+
+        # Columns, one slot per record
+        self.detected_at = array('d', bytes(8 * self.capacity))
+        self.score = array('f', bytes(4 * self.capacity))
+        self.liquidity_usd = array('f', bytes(4 * self.capacity))
+        self.block_number = array('I', bytes(4 * self.capacity))
+        self.chain = array('B', bytes(self.capacity))
+        self.risk_level = array('B', bytes(self.capacity))
+        self.action = array('B', bytes(self.capacity))
+        self.confidence = array('B', bytes(self.capacity))
+        self.address = bytearray(ADDRESS_BYTES * self.capacity)
+        self.symbol = bytearray(SYMBOL_BYTES * self.capacity)
+
+        self.chains = StringTable()
+        self.risk_levels = StringTable()
+        self.actions = StringTable()
+        self.confidences = StringTable()
+
+        # Indexes
+        self.chain_index: Dict[int, array] = {}
+        self.score_index: List[array] = [array('q') for _ in range(SCORE_BUCKETS)]
+        # Rebuilt every capacity/2 inserts, so live entries plus tombstones stay under ~60% of the table
+        self.token_index = TokenIndex(self, 2 * self.capacity)
+        self._added_since_trim = 0
+
+    @property
+    def latest_id(self) -> int:
+        """Id of the newest record (0 if empty)."""
+        return self.next_id - 1
+
+    @property
+    def oldest_id(self) -> int:
+        """Id of the oldest retained record."""
+        return max(1, self.next_id - self.capacity)
+
+    def __len__(self) -> int:
+        return self.next_id - self.oldest_id
+
+    def _slot(self, record_id: int) -> int:
+        return (record_id - 1) % self.capacity
+
+    def _contains(self, record_id: int) -> bool:
+        return self.oldest_id <= record_id < self.next_id
+
+    def _score_at(self, slot: int) -> float:
+        # Scores are stored as float32; round so 0.7 compares equal to 0.7
+        return round(float(self.score[slot]), 4)
+
+    def _address_at(self, slot: int) -> str:
+        return _decode_text(bytes(self.address[slot * ADDRESS_BYTES:(slot + 1) * ADDRESS_BYTES]))
+
+    def add(self, data: Dict[str, Any], detected_at: float, record_id: Optional[int] = None) -> int:
+        """
+        Append an opportunity, overwriting the oldest record when full.
+
+        Args:
+            data: Serialized opportunity (as broadcast to dashboard clients)
+            detected_at: Detection time as a Unix timestamp
+            record_id: Id assigned by the trading process, so every dashboard process uses the same ids
+
+        Returns:
+            Id of the new record
+        """
+        if record_id is not None:
+            if record_id < self.next_id:
+                return record_id  # Already stored, e.g. by a backfill overlapping the live feed
+            self._skip_to(record_id, detected_at)
+
+        record_id = self.next_id
+        slot = self._slot(record_id)
+
+        address = str(data.get("token_address") or '')
+        chain_code = self.chains.code(str(data.get("chain") or 'unknown').lower())
+        score = float(data.get("score") or 0.0)
+
+        self.detected_at[slot] = detected_at
+        self.score[slot] = score
+        self.liquidity_usd[slot] = float(data.get("liquidity_usd") or 0.0)
+        self.block_number[slot] = min(MAX_BLOCK, max(0, int(data.get("block_number") or 0)))
+        self.chain[slot] = chain_code
+        self.risk_level[slot] = self.risk_levels.code(str(data.get("risk_level") or 'unknown'))
+        self.action[slot] = self.actions.code(str(data.get("recommendation") or 'UNKNOWN'))
+        self.confidence[slot] = self.confidences.code(str(data.get("confidence") or 'UNKNOWN'))
+        self.address[slot * ADDRESS_BYTES:(slot + 1) * ADDRESS_BYTES] = _encode_text(address, ADDRESS_BYTES)
+        self.symbol[slot * SYMBOL_BYTES:(slot + 1) * SYMBOL_BYTES] = _encode_text(
+            str(data.get("token_symbol") or 'UNKNOWN'), SYMBOL_BYTES
+        )
+
+        self.chain_index.setdefault(chain_code, array('q')).append(record_id)
+        self.score_index[score_bucket(score)].append(record_id)
+        self.next_id += 1
+        if address:
+            self.token_index.put(address, record_id)
+            if self.token_index.inserted_since_rebuild >= max(1, self.capacity // 2):
+                self.token_index.rebuild()
+
+        self._added_since_trim += 1
+        if self._added_since_trim >= max(1, self.capacity // 4):
+            self._trim_indexes()
+
+        return record_id
+
+    def _skip_to(self, record_id: int, detected_at: float) -> None:
+        """Leave empty records for ids that never arrived, so the next record gets record_id."""
+        for missing_id in range(max(self.next_id, record_id - self.capacity), record_id):
+            slot = self._slot(missing_id)
+            self.detected_at[slot] = detected_at
+            self.score[slot] = 0.0
+            self.address[slot * ADDRESS_BYTES:(slot + 1) * ADDRESS_BYTES] = bytes(ADDRESS_BYTES)
+            self.symbol[slot * SYMBOL_BYTES:(slot + 1) * SYMBOL_BYTES] = bytes(SYMBOL_BYTES)
+        self.next_id = record_id
+
+    def _is_empty(self, slot: int) -> bool:
+        return self.address[slot * ADDRESS_BYTES] == 0
+
+    def update(self, data: Dict[str, Any]) -> Optional[int]:
+        """
+        Update the newest record of a token after re-scoring.
+
+        Args:
+            data: Serialized opportunity with token_address and new recommendation fields
+
+        Returns:
+            Id of the updated record, or None if the token is not in the store
+        """
+        record_id = self.token_index.get(str(data.get("token_address") or ''))
+        if record_id is None or not self._contains(record_id):
+            return None
+
+        slot = self._slot(record_id)
+        if "score" in data:
+            score = float(data.get("score") or 0.0)
+            if score_bucket(score) != score_bucket(self._score_at(slot)):
+                # The old bucket keeps a stale entry; queries re-check the score
+                insort(self.score_index[score_bucket(score)], record_id)
+            self.score[slot] = score
+        if "recommendation" in data:
+            self.action[slot] = self.actions.code(str(data["recommendation"]))
+        if "confidence" in data:
+            self.confidence[slot] = self.confidences.code(str(data["confidence"]))
+        if "risk_level" in data:
+            self.risk_level[slot] = self.risk_levels.code(str(data["risk_level"]))
+
+        return record_id
+
+    def _trim_indexes(self) -> None:
+        """Drop index entries for records that have left the buffer."""
+        oldest = self.oldest_id
+        for ids in list(self.chain_index.values()) + self.score_index:
+            cut = bisect_left(ids, oldest)
+            if cut:
+                del ids[:cut]
+        self._added_since_trim = 0
+
+    def _first_id_at(self, timestamp: float) -> int:
+        """First retained id detected at or after a timestamp (records are in detection order)."""
+        lo, hi = self.oldest_id, self.next_id
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.detected_at[self._slot(mid)] < timestamp:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def _walk(ids: array, lo_id: int, hi_id: int, ascending: bool) -> Iterator[int]:
+        """Ids of a sorted index within [lo_id, hi_id]."""
+        start = bisect_left(ids, lo_id)
+        end = bisect_right(ids, hi_id)
+        positions = range(start, end) if ascending else range(end - 1, start - 1, -1)
+        for position in positions:
+            yield ids[position]
+
+    def _candidates(
+        self,
+        chain_code: Optional[int],
+        min_bucket: int,
+        lo_id: int,
+        hi_id: int,
+        ascending: bool
+    ) -> Iterator[int]:
+        """Candidate ids from the most selective index; callers re-check every filter."""
+        chain_ids = self.chain_index.get(chain_code) if chain_code is not None else None
+        bucket_ids = self.score_index[min_bucket:] if min_bucket > 0 else None
+
+        if chain_ids is not None and (
+            bucket_ids is None or len(chain_ids) <= sum(len(ids) for ids in bucket_ids)
+        ):
+            yield from self._walk(chain_ids, lo_id, hi_id, ascending)
+            return
+
+        if bucket_ids is not None:
+            walks = [self._walk(ids, lo_id, hi_id, ascending) for ids in bucket_ids]
+            merged = heapq.merge(*walks) if ascending else heapq.merge(*walks, reverse=True)
+            previous = None
+            for record_id in merged:
+                # A re-scored record can sit in two buckets
+                if record_id != previous:
+                    yield record_id
+                previous = record_id
+            return
+
+        yield from (range(lo_id, hi_id + 1) if ascending else range(hi_id, lo_id - 1, -1))
+
+    def record(self, record_id: int, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Expand a record into the API representation.
+
+        Args:
+            record_id: Record id
+            now: Reference time for age_minutes (defaults to the current time)
+
+        Returns:
+            Record dictionary, or None if the id is no longer retained
+        """
+        if not self._contains(record_id):
+            return None
+
+        slot = self._slot(record_id)
+        detected_at = self.detected_at[slot]
+        now = now if now is not None else datetime.now().timestamp()
+        block_number = self.block_number[slot]
+        return {
+            "id": record_id,
+            "token_symbol": _decode_text(bytes(self.symbol[slot * SYMBOL_BYTES:(slot + 1) * SYMBOL_BYTES])),
+            "token_address": self._address_at(slot),
+            "chain": self.chains.values[self.chain[slot]],
+            "risk_level": self.risk_levels.values[self.risk_level[slot]],
+            "recommendation": self.actions.values[self.action[slot]],
+            "confidence": self.confidences.values[self.confidence[slot]],
+            "score": self._score_at(slot),
+            "liquidity_usd": round(float(self.liquidity_usd[slot]), 2),
+            "block_number": block_number or None,
+            "detected_at": datetime.fromtimestamp(detected_at).isoformat(),
+            "age_minutes": max(0, int((now - detected_at) / 60))
+        }
+
+    def query(
+        self,
+        chain: Optional[str] = None,
+        token_address: Optional[str] = None,
+        min_score: Optional[float] = None,
+        since_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        since_time: Optional[float] = None,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Filtered, cursor-paginated query.
+        With since_id, returns records newer than the cursor, oldest first
+        (for following the stream). Otherwise returns records older than
+        before_id (or the newest), newest first (for paging back).
+
+        Args:
+            chain: Chain name (case-insensitive)
+            token_address: Exact token address
+            min_score: Minimum score
+            since_id: Return records with id greater than this
+            before_id: Return records with id less than this
+            since_time: Only records detected at or after this Unix timestamp
+            limit: Maximum records returned
+
+        Returns:
+            Dictionary with items, next_cursor, latest_id and oldest_id
+        """
+        limit = max(1, limit)
+        ascending = since_id is not None
+        result = {"items": [], "next_cursor": None, "latest_id": self.latest_id, "oldest_id": self.oldest_id}
+
+        lo_id = self.oldest_id
+        hi_id = self.latest_id
+        if since_id is not None:
+            lo_id = max(lo_id, since_id + 1)
+        if before_id is not None:
+            hi_id = min(hi_id, before_id - 1)
+        if since_time is not None:
+            lo_id = max(lo_id, self._first_id_at(since_time))
+        if lo_id > hi_id:
+            result["next_cursor"] = since_id if ascending else None
+            return result
+
+        chain_code = None
+        if chain:
+            chain_code = self.chains.lookup(chain.lower())
+            if chain_code is None:
+                result["next_cursor"] = since_id if ascending else None
+                return result
+
+        if token_address:
+            record_id = self.token_index.get(token_address)
+            candidates = iter([record_id] if record_id is not None and lo_id <= record_id <= hi_id else [])
+        else:
+            candidates = self._candidates(
+                chain_code, score_bucket(min_score) if min_score else 0, lo_id, hi_id, ascending
+            )
+
+        now = datetime.now().timestamp()
+        items = result["items"]
+        for record_id in candidates:
+            slot = self._slot(record_id)
+            if self._is_empty(slot):
+                continue
+            if chain_code is not None and self.chain[slot] != chain_code:
+                continue
+            if min_score is not None and self._score_at(slot) < min_score:
+                continue
+            items.append(self.record(record_id, now))
+            if len(items) >= limit:
+                break
+
+        if ascending:
+            result["next_cursor"] = items[-1]["id"] if items else since_id
+        elif len(items) >= limit:
+            result["next_cursor"] = items[-1]["id"]
+        return result
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate every retained record, oldest first."""
+        now = datetime.now().timestamp()
+        for record_id in range(self.oldest_id, self.next_id):
+            if not self._is_empty(self._slot(record_id)):
+                yield self.record(record_id, now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and memory statistics."""
+        columns = (
+            self.detected_at, self.score, self.liquidity_usd, self.block_number,
+            self.chain, self.risk_level, self.action, self.confidence
+        )
+        record_bytes = sum(column.itemsize * len(column) for column in columns)
+        record_bytes += len(self.address) + len(self.symbol)
+        index_bytes = sum(ids.itemsize * len(ids) for ids in list(self.chain_index.values()) + self.score_index)
+        return {
+            'records': len(self),
+            'capacity': self.capacity,
+            'latest_id': self.latest_id,
+            'oldest_id': self.oldest_id,
+            'record_bytes': record_bytes,
+            'index_bytes': index_bytes + self.token_index.table.itemsize * len(self.token_index.table),
+            'chains': {name: len(self.chain_index.get(code, ())) for name, code in self.chains.codes.items()}
+        }
@@ -0,0 +1,184 @@
+# api/read_model.py
+"""
+Snapshot read model for the dashboard API.
+The trading core marks views (stats, positions, trades) as changed; each view
+is rebuilt and serialized once per change and every request is answered from
+the cached bytes. Snapshots carry a version and ETag so clients can revalidate
+with If-None-Match or long-poll for the next version.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set
+
+from utils.logger import logger_manager
+
+
+# Upper bound for a single long-poll request
+MAX_WAIT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable, pre-serialized view published by the read model."""
+    name: str
+    version: int
+    body: bytes
+    etag: str
+    published_at: float
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers identifying this snapshot."""
+        return {
+            "ETag": self.etag,
+            "Cache-Control": "no-cache",
+            "X-Snapshot-Version": str(self.version)
+        }
+
+
+class ReadModel:
+    """Versioned snapshots rebuilt on change instead of on every request."""
+
+    def __init__(self) -> None:
+        """Initialize the read model."""
+        self.logger = logger_manager.get_logger("ReadModel")
+
+        # ETags include a per-process epoch so a restart never matches a stale copy
+        self.epoch = uuid.uuid4().hex[:8]
+
+        self.builders: Dict[str, Callable[[], Any]] = {}
+        self.snapshots: Dict[str, Snapshot] = {}
+        self.dirty: Set[str] = set()
+        self.changed: Dict[str, asyncio.Event] = {}
+
+        self.builds = 0
+        self.reads = 0
+        self.not_modified = 0
+
+    def register(self, name: str, builder: Callable[[], Any]) -> None:
+        """
+        Register a view.
+
+        Args:
+            name: View name
+            builder: Function returning the JSON-serializable payload
+        """
+        self.builders[name] = builder
+        self.dirty.add(name)
+
+    def invalidate(self, *names: str) -> None:
+        """
+        Mark views as changed and wake their long-poll waiters.
+
+        Args:
+            names: Views to mark; all registered views when empty
+        """
+        for name in names or tuple(self.builders):
+            if name not in self.builders:
+                continue
+            self.dirty.add(name)
+            event = self.changed.pop(name, None)
+            if event is not None:
+                event.set()
+
+    def publish(self, name: str, payload: Any) -> Snapshot:
+        """
+        Serialize a payload and make it the current snapshot.
+        The version only advances when the serialized bytes differ.
+
+        Args:
+            name: View name
+            payload: JSON-serializable payload
+
+        Returns:
+            Current snapshot of the view
+        """
+        body = json.dumps(payload, default=str, separators=(',', ':')).encode('utf-8')
+        current = self.snapshots.get(name)
+        if current is not None and current.body == body:
+            return current
+
+        version = current.version + 1 if current else 1
+        snapshot = Snapshot(
+            name=name,
+            version=version,
+            body=body,
+            etag=f'"{name}-{self.epoch}-{version}"',
+            published_at=time.time()
+        )
+        self.snapshots[name] = snapshot
+        return snapshot
+
+    def get(self, name: str) -> Optional[Snapshot]:
+        """
+        Latest snapshot of a view, rebuilding it first if it was invalidated.
+
+        Args:
+            name: View name
+
+        Returns:
+            Snapshot, or None for an unknown view
+        """
+        if name in self.dirty:
+            self.dirty.discard(name)
+            try:
+                self.publish(name, self.builders[name]())
+                self.builds += 1
+            except Exception as e:
+                self.logger.error(f"Error building {name} snapshot: {e}")
+
+        self.reads += 1
+        return self.snapshots.get(name)
+
+    async def wait_for_change(self, name: str, etag: Optional[str], timeout: float) -> Optional[Snapshot]:
+        """
+        Long-poll until the view's ETag differs from the client's copy.
+
+        Args:
+            name: View name
+            etag: ETag the client already holds
+            timeout: Seconds to wait at most
+
+        Returns:
+            Latest snapshot, which still matches etag if nothing changed in time
+        """
+        deadline = time.monotonic() + min(max(timeout, 0.0), MAX_WAIT_SECONDS)
+        snapshot = self.get(name)
+
+        while snapshot is not None and snapshot.etag == etag:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            event = self.changed.setdefault(name, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            snapshot = self.get(name)
+
+        return snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get read model statistics.
+
+        Returns:
+            Build/read counters and current version of each view
+        """
+        return {
+            "builds": self.builds,
+            "reads": self.reads,
+            "not_modified": self.not_modified,
+            "waiting_views": len(self.changed),
+            "views": {
+                name: {
+                    "version": snapshot.version,
+                    "bytes": len(snapshot.body),
+                    "dirty": name in self.dirty
+                }
+                for name, snapshot in self.snapshots.items()
+            }
+        }
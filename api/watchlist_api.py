@@ -1,7 +1,7 @@
 # api/watchlist_api.py
 """
 Watchlist API endpoints for DEX sniping dashboard.
-Handles server-side watchlist storage and management.
+Handles server-side watchlist management on top of the shared watchlist store.
 """
 
 from typing import List, Dict, Any, Optional
@@ -13,6 +13,10 @@ import os
 import asyncio
 from pathlib import Path
 
+from models.watchlist import WatchlistStatus
+from models.watchlist_store import WatchlistStore, watchlist_key, watchlist_store
+from utils.logger import logger_manager
+
 # Pydantic models for API
 class WatchlistToken(BaseModel):
     """Model for a token in the watchlist."""
@@ -53,60 +57,117 @@ class AddTokenRequest(BaseModel):
 # Create router
 router = APIRouter(prefix="/api/watchlist", tags=["watchlist"])
 
+def _token_to_record(token_data: Dict) -> Dict[str, Any]:
+    """
+    Convert an API token to a watchlist store record.
+    
+    Args:
+        token_data (Dict): Token information in the API shape
+        
+    Returns:
+        Dict[str, Any]: Record in the WatchlistItem layout
+    """
+    now = datetime.now().isoformat()
+    return {
+        'token_address': token_data.get('token_address', ''),
+        'token_symbol': token_data.get('token_symbol', 'UNKNOWN'),
+        'token_name': token_data.get('token_name'),
+        'chain': token_data.get('chain', 'unknown'),
+        'added_at': token_data.get('added_at', now),
+        'reason': "Dashboard watchlist",
+        'score': token_data.get('score', 0.0),
+        'risk_level': token_data.get('risk_level', 'unknown'),
+        'price_when_added': None,
+        'target_price': None,
+        'stop_loss': None,
+        'status': WatchlistStatus.WATCHING.value,
+        'notes': "",
+        'metadata': {
+            'action': token_data.get('recommendation', 'UNKNOWN'),
+            'confidence': token_data.get('confidence', 'UNKNOWN'),
+            'liquidity_usd': token_data.get('liquidity_usd', 0.0),
+            'dex_name': token_data.get('dex_name', 'Unknown'),
+            'pair_address': token_data.get('pair_address') or None,
+            'reasons': token_data.get('reasons', []),
+            'warnings': token_data.get('warnings', [])
+        },
+        'last_updated': now
+    }
+
+def _record_to_token(record: Dict[str, Any]) -> Dict:
+    """
+    Convert a watchlist store record to the API token shape.
+    
+    Args:
+        record (Dict[str, Any]): Record in the WatchlistItem layout
+        
+    Returns:
+        Dict: Token information in the API shape
+    """
+    metadata = record.get('metadata') or {}
+    return {
+        'token_symbol': record.get('token_symbol') or 'UNKNOWN',
+        'token_address': record.get('token_address', ''),
+        'chain': record.get('chain', 'unknown'),
+        'risk_level': record.get('risk_level') or 'unknown',
+        'recommendation': metadata.get('action') or 'UNKNOWN',
+        'confidence': metadata.get('confidence') or 'UNKNOWN',
+        'score': record.get('score') or 0.0,
+        'liquidity_usd': metadata.get('liquidity_usd') or 0.0,
+        'added_at': record.get('added_at'),
+        'dex_name': metadata.get('dex_name') or 'Unknown',
+        'reasons': metadata.get('reasons', []),
+        'warnings': metadata.get('warnings', [])
+    }
+
 class WatchlistManager:
     """
     Server-side watchlist management.
-    Handles persistent storage and operations for user watchlists.
+    Tokens live in the shared watchlist store, so this API and the dashboard
+    see the same per-user watchlist and no call rewrites a file.
     """
     
-    def __init__(self, storage_dir: str = "data"):
+    def __init__(self, storage_dir: str = "data", store: Optional[WatchlistStore] = None):
         """
         Initialize the watchlist manager.
         
         Args:
-            storage_dir (str): Directory to store watchlist files
+            storage_dir (str): Directory holding legacy watchlist_<user>.json files
+            store (Optional[WatchlistStore]): Watchlist store (the global store by default)
         """
         self.storage_dir = Path(storage_dir)
-        self.storage_dir.mkdir(exist_ok=True)
+        self.store = store or watchlist_store
         self.max_items = 100
-        self.watchlists: Dict[str, List[Dict]] = {}  # In-memory cache
+        self.logger = logger_manager.get_logger("WatchlistAPI")
         
     def _get_user_file(self, user_id: str = "default") -> Path:
         """
-        Get the file path for a user's watchlist.
+        Get the legacy file path for a user's watchlist.
         
         Args:
             user_id (str): User identifier
             
         Returns:
-            Path: Path to user's watchlist file
+            Path: Path to user's legacy watchlist file
         """
         return self.storage_dir / f"watchlist_{user_id}.json"
     
-    async def load_watchlist(self, user_id: str = "default") -> List[Dict]:
+    def _import_legacy_file(self, user_id: str) -> None:
         """
-        Load watchlist from storage.
+        Import a user's pre-store watchlist file once.
         
         Args:
             user_id (str): User identifier
-            
-        Returns:
-            List[Dict]: User's watchlist tokens
-            
-        Raises:
-            Exception: If loading fails
         """
+        user_file = self._get_user_file(user_id)
+        marker = f"imported:{user_file}"
+        if self.store.get_meta(marker) or not user_file.exists():
+            return
+        
         try:
-            user_file = self._get_user_file(user_id)
-            
-            if not user_file.exists():
-                self.watchlists[user_id] = []
-                return []
-            
             with open(user_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                
-            # Validate data structure
+            
             if isinstance(data, dict) and 'tokens' in data:
                 tokens = data['tokens']
             elif isinstance(data, list):
@@ -114,45 +175,50 @@ class WatchlistManager:
             else:
                 tokens = []
             
-            # Cache in memory
-            self.watchlists[user_id] = tokens
-            return tokens
+            # Files are newest first; the store keeps insertion order oldest first
+            for token in reversed(tokens):
+                address = token.get('token_address', '')
+                if address and self.store.find_key(user_id, address) is None:
+                    self.store.put(user_id, watchlist_key(token.get('chain', 'unknown'), address),
+                                   _token_to_record(token))
+            
+            self.store.set_meta(marker, datetime.now().isoformat())
+            self.store.compact()
+            self.logger.info(f"Imported legacy watchlist file {user_file} for {user_id}")
+            
+        except Exception as e:
+            self.logger.error(f"Error importing watchlist for {user_id}: {e}")
+    
+    async def load_watchlist(self, user_id: str = "default") -> List[Dict]:
+        """
+        Load watchlist from the store.
+        
+        Args:
+            user_id (str): User identifier
+            
+        Returns:
+            List[Dict]: User's watchlist tokens, newest first
+        """
+        try:
+            self._import_legacy_file(user_id)
+            return [_record_to_token(record) for record in reversed(self.store.items(user_id))]
             
         except Exception as e:
             print(f"Error loading watchlist for {user_id}: {e}")
-            self.watchlists[user_id] = []
             return []
     
     async def save_watchlist(self, user_id: str = "default") -> bool:
         """
-        Save watchlist to storage.
+        Flush pending watchlist writes to disk.
         
         Args:
             user_id (str): User identifier
             
         Returns:
             bool: Success status
-            
-        Raises:
-            Exception: If saving fails
         """
         try:
-            user_file = self._get_user_file(user_id)
-            tokens = self.watchlists.get(user_id, [])
-            
-            data = {
-                "user_id": user_id,
-                "updated_at": datetime.now().isoformat(),
-                "count": len(tokens),
-                "tokens": tokens
-            }
-            
-            # Write atomically
-            temp_file = user_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            temp_file.replace(user_file)
+            self.store.sync()
             return True
             
         except Exception as e:
@@ -171,36 +237,24 @@ class WatchlistManager:
             tuple[bool, str]: Success status and message
         """
         try:
-            # Load current watchlist
-            await self.load_watchlist(user_id)
-            tokens = self.watchlists.get(user_id, [])
+            self._import_legacy_file(user_id)
             
             # Check if already exists
             token_address = token_data.get('token_address', '')
-            exists = any(token.get('token_address') == token_address for token in tokens)
-            
-            if exists:
+            if self.store.find_key(user_id, token_address) is not None:
                 return False, f"Token {token_data.get('token_symbol', 'unknown')} already in watchlist"
             
             # Add timestamp
             token_data['added_at'] = datetime.now().isoformat()
             
-            # Add to beginning of list
-            tokens.insert(0, token_data)
+            key = watchlist_key(token_data.get('chain', 'unknown'), token_address)
+            self.store.put(user_id, key, _token_to_record(token_data))
             
-            # Limit size
-            if len(tokens) > self.max_items:
-                tokens = tokens[:self.max_items]
-                
-            self.watchlists[user_id] = tokens
-            
-            # Save to storage
-            success = await self.save_watchlist(user_id)
+            # Limit size by dropping the oldest tokens
+            while self.store.count(user_id) > self.max_items:
+                self.store.delete(user_id, self.store.oldest_key(user_id))
             
-            if success:
-                return True, f"Added {token_data.get('token_symbol', 'token')} to watchlist"
-            else:
-                return False, "Failed to save watchlist"
+            return True, f"Added {token_data.get('token_symbol', 'token')} to watchlist"
                 
         except Exception as e:
             return False, f"Error adding token: {str(e)}"
@@ -217,26 +271,13 @@ class WatchlistManager:
             tuple[bool, str]: Success status and message
         """
         try:
-            # Load current watchlist
-            await self.load_watchlist(user_id)
-            tokens = self.watchlists.get(user_id, [])
+            self._import_legacy_file(user_id)
             
-            # Find and remove token
-            original_count = len(tokens)
-            tokens = [token for token in tokens if token.get('token_address') != token_address]
-            
-            if len(tokens) == original_count:
+            key = self.store.find_key(user_id, token_address)
+            if key is None or self.store.delete(user_id, key) is None:
                 return False, "Token not found in watchlist"
             
-            self.watchlists[user_id] = tokens
-            
-            # Save to storage
-            success = await self.save_watchlist(user_id)
-            
-            if success:
-                return True, "Token removed from watchlist"
-            else:
-                return False, "Failed to save watchlist"
+            return True, "Token removed from watchlist"
                 
         except Exception as e:
             return False, f"Error removing token: {str(e)}"
@@ -252,13 +293,9 @@ class WatchlistManager:
             tuple[bool, str]: Success status and message
         """
         try:
-            self.watchlists[user_id] = []
-            success = await self.save_watchlist(user_id)
-            
-            if success:
-                return True, "Watchlist cleared"
-            else:
-                return False, "Failed to clear watchlist"
+            self._import_legacy_file(user_id)
+            self.store.clear(user_id)
+            return True, "Watchlist cleared"
                 
         except Exception as e:
             return False, f"Error clearing watchlist: {str(e)}"
@@ -274,8 +311,7 @@ class WatchlistManager:
             List[Dict]: Current watchlist tokens
         """
         try:
-            await self.load_watchlist(user_id)
-            return self.watchlists.get(user_id, [])
+            return await self.load_watchlist(user_id)
         except Exception as e:
             print(f"Error getting watchlist: {e}")
             return []
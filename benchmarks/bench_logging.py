@@ -0,0 +1,115 @@
+# benchmarks/bench_logging.py
+"""
+Benchmark for logging overhead per opportunity.
+Replays the records one opportunity produces in the production pipeline
+(analysis banners, scorer/analyzer debug lines, the opportunity summary and
+the trade decision) and measures the time spent on the calling thread, i.e.
+on the event loop, with direct handlers and in queue mode, at DEBUG and INFO.
+Console output goes to the null device; files go to a temporary directory.
+
+Usage:
+    python benchmarks/bench_logging.py [--opportunities 5000] [--queue-size 10000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logger import LoggerManager
+
+
+def log_opportunity(i: int) -> None:
+    """
+    Emit the log records of one opportunity passing through the pipeline.
+
+    Args:
+        i: Opportunity number
+    """
+    pipeline = logging.getLogger("ProductionTradingSystem")
+    scorer = logging.getLogger("TradingScorer")
+    contract = logging.getLogger("ContractAnalyzer")
+    social = logging.getLogger("SocialAnalyzer")
+
+    symbol = f"T{i}"
+    address = f"0x{i:040x}"
+
+    pipeline.info(f"🔍 ANALYZING: {symbol} on BASE")
+    contract.debug("Advanced honeypot detection for %s", address)
+    contract.debug("Comprehensive liquidity analysis for %s", symbol)
+    contract.debug("Token distribution analysis for %s", address)
+    contract.debug("Contract upgradability check for %s", address)
+    contract.debug("Contract age and activity analysis for %s", address)
+    social.debug("Twitter analysis: %s - %s estimated mentions", symbol, i % 500)
+    social.debug("Telegram analysis: %s - %s estimated members", symbol, i % 300)
+    social.debug("Reddit analysis: %s - Score: %s", symbol, 0.4)
+    social.debug("Influencer analysis: %s - %s mentions", symbol, i % 7)
+    scorer.debug("Scoring opportunity: %s", symbol)
+
+    lines = ["=" * 100, f"PRODUCTION OPPORTUNITY: {symbol} on BASE", f"Address: {address}"]
+    lines.extend(f"Detail line {n}: {i * n}" for n in range(9))
+    lines.append("=" * 100)
+    pipeline.info("\n".join(lines))
+
+    pipeline.info(f"📋 NO TRADE: {symbol} - Risk assessment rejected")
+    pipeline.debug("Pipeline completed in %.2fs", 0.01)
+
+
+def run(log_dir: str, opportunities: int, queue_mode: bool, level: str, queue_size: int) -> None:
+    """
+    Time one configuration and print the result.
+
+    Args:
+        log_dir: Directory for the log files
+        opportunities: Opportunities to log
+        queue_mode: Use the queue handler and listener thread
+        level: Root log level
+        queue_size: Queue capacity in queue mode
+    """
+    manager = LoggerManager(log_dir=log_dir, queue_mode=False, level=level)
+    manager.handlers[0].setStream(open(os.devnull, 'w', encoding='utf-8'))
+    if queue_mode:
+        manager.enable_queue_mode(queue_size)
+
+    start = time.perf_counter()
+    for i in range(opportunities):
+        log_opportunity(i)
+    caller_time = time.perf_counter() - start
+
+    stats = manager.get_stats()
+    manager.disable_queue_mode()
+    total_time = time.perf_counter() - start
+    for handler in manager.handlers:
+        handler.close()
+
+    label = f"{'queue' if queue_mode else 'direct':6} {level:5}"
+    line = (
+        f"{label}  caller {caller_time / opportunities * 1e6:8.1f} us/opp"
+        f"  until written {total_time / opportunities * 1e6:8.1f} us/opp"
+    )
+    if queue_mode:
+        dropped = sum(stats['dropped'].values())
+        line += f"  max depth {stats['max_depth']:,}  dropped {dropped:,}"
+    print(line)
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description="Logging overhead per opportunity")
+    parser.add_argument('--opportunities', type=int, default=5000, help='Opportunities to log')
+    parser.add_argument('--queue-size', type=int, default=10000, help='Queue capacity in queue mode')
+    args = parser.parse_args()
+
+    print(f"Logging {args.opportunities:,} opportunities (14 records each at DEBUG, 3 at INFO)...")
+    with tempfile.TemporaryDirectory() as log_dir:
+        for level in ("DEBUG", "INFO"):
+            for queue_mode in (False, True):
+                run(log_dir, args.opportunities, queue_mode, level, args.queue_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+# benchmarks/bench_pipeline.py
+"""
+End-to-end benchmark of ProductionTradingSystem against local fake services.
+Starts benchmarks/fake_services.py in a subprocess, points every monitor,
+analyzer and execution client at it, runs the real pipeline for a fixed time
+and writes detection latency percentiles, throughput, memory growth,
+event-loop lag and dashboard fan-out latency to a JSON results file.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--duration 60] [--pairs-per-second 5]
+        [--dashboard-clients 50] [--baseline benchmarks/results/previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aiohttp
+
+from benchmarks.fake_services import LoadProfile, serve
+from config.chains import multichain_settings, ChainType
+from config.settings import settings
+from main_production import ProductionTradingSystem
+from models.token import TradingOpportunity
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Result metrics compared against a baseline; True means higher is better
+REGRESSION_METRICS = {
+    ('throughput', 'opportunities_per_second'): True,
+    ('detection_latency_ms', 'p50'): False,
+    ('detection_latency_ms', 'p99'): False,
+    ('pipeline_latency_ms', 'p99'): False,
+    ('event_loop_lag_ms', 'p99'): False,
+    ('memory', 'growth_mb_per_minute'): False,
+    ('dashboard_fanout_ms', 'p99'): False
+}
+
+
+def percentiles(values: List[float]) -> Dict[str, Any]:
+    """
+    Summarize samples with nearest-rank percentiles.
+
+    Args:
+        values: Samples
+
+    Returns:
+        Count, mean and p50/p90/p99/max
+    """
+    if not values:
+        return {'count': 0}
+
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+    return {
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered),
+        'p50': rank(50),
+        'p90': rank(90),
+        'p99': rank(99),
+        'max': ordered[-1]
+    }
+
+
+def read_rss_mb() -> float:
+    """Resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        import resource
+        # ru_maxrss is a peak, in KB on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def linear_slope(points: List[tuple]) -> float:
+    """Least-squares slope of (x, y) points."""
+    if len(points) < 2:
+        return 0.0
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+
+
+class FakeDashboardClient:
+    """WebSocket stand-in that records when each message arrives."""
+
+    def __init__(self, send_delay: float = 0.0) -> None:
+        self.send_delay = send_delay
+        self.received = 0
+        self.bytes_received = 0
+
+    async def send_text(self, message: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.received += 1
+        self.bytes_received += len(message)
+
+    async def send_bytes(self, message: bytes) -> None:
+        await self.send_text(message)
+
+
+class LocalRedirectSession:
+    """Wraps an aiohttp session so requests to external hosts hit the fake services instead."""
+
+    def __init__(self, session: Any, base_url: str) -> None:
+        self._session = session
+        self._base_url = base_url.rstrip('/')
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def _rewrite(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{self._base_url}/external{parts.path}"
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._session.get(self._rewrite(url), **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._session.post(self._rewrite(url), **kwargs)
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+class BenchmarkTradingSystem(ProductionTradingSystem):
+    """ProductionTradingSystem instrumented for the benchmark."""
+
+    def __init__(self, profile: LoadProfile, base_url: str, poll_interval: float, dashboard_clients: int) -> None:
+        super().__init__(auto_trading_enabled=False, disable_dashboard=dashboard_clients <= 0)
+        self.profile = profile
+        self.base_url = base_url
+        self.poll_interval = poll_interval
+        self.dashboard_clients = dashboard_clients
+
+        self.measure_from = float('inf')
+        self.detection_latencies: Dict[str, List[float]] = {}
+        self.pipeline_latencies: List[float] = []
+        self.fanout_latencies: List[float] = []
+        self.backlog_opportunities = 0
+        self.completed = 0
+        self.completion_times: List[float] = []
+
+    async def _initialize_analyzers(self) -> None:
+        await super()._initialize_analyzers()
+        # Honeypot/TokenSniffer/social APIs are answered by the fake services' 404 route
+        for analyzer in (self.contract_analyzer, self.social_analyzer):
+            if analyzer and analyzer.session:
+                analyzer.session = LocalRedirectSession(analyzer.session, self.base_url)
+
+    async def _initialize_web_dashboard(self) -> None:
+        """Attach an in-process dashboard with fake WebSocket clients instead of starting uvicorn."""
+        try:
+            from api.dashboard_core import DashboardServer
+        except ImportError as e:
+            self.logger.warning(f"Dashboard fan-out not measured ({e})")
+            return
+
+        dashboard = DashboardServer()
+        for _ in range(self.dashboard_clients):
+            dashboard.broadcast_hub.register(FakeDashboardClient())
+        add_opportunity = dashboard.add_opportunity
+
+        async def timed_add_opportunity(opportunity: TradingOpportunity) -> None:
+            start = time.perf_counter()
+            await add_opportunity(opportunity)
+            self.fanout_latencies.append((time.perf_counter() - start) * 1000)
+
+        dashboard.add_opportunity = timed_add_opportunity
+        self.dashboard_server = dashboard
+        self.components_initialized['web_dashboard'] = True
+
+    def _start_monitor(self, monitor) -> None:
+        """Point a monitor at the fake services before it connects."""
+        monitor.check_interval = self.poll_interval
+        if hasattr(monitor, 'token_list_url'):
+            monitor.jupiter_api = f"{self.base_url}/jupiter/v6"
+            monitor.birdeye_api = f"{self.base_url}/birdeye/defi"
+            monitor.token_list_url = f"{self.base_url}/jupiter/strict"
+            monitor.solana_rpc = f"{self.base_url}/rpc/solana"
+        super()._start_monitor(monitor)
+
+    async def _run_production_loop(self) -> None:
+        self.measure_from = time.time()
+        await super()._run_production_loop()
+
+    def _created_at(self, opportunity: TradingOpportunity, chain: str) -> Optional[float]:
+        """Creation time of a launch according to the load profile."""
+        if chain in ('ETHEREUM', 'BASE'):
+            block = getattr(opportunity.liquidity, 'block_number', None)
+            return self.profile.block_timestamp(chain.lower(), block) if block is not None else None
+
+        match = re.match(r'^[A-Z]+?(\d+)$', opportunity.token.symbol or '')
+        if not match:
+            return None
+        index = int(match.group(1))
+        if chain == 'SOLANA-PUMP':
+            return self.profile.launch_time(self.profile.pump_per_second, index)
+        if opportunity.token.symbol.startswith('BB'):
+            return self.profile.launch_time(self.profile.birdeye_per_minute / 60, index)
+        return self.profile.launch_time(self.profile.jupiter_per_minute / 60, index)
+
+    async def _process_opportunity_full_pipeline(self, opportunity: TradingOpportunity, chain: str) -> None:
+        detected = time.time()
+        created = self._created_at(opportunity, chain)
+
+        start = time.perf_counter()
+        await super()._process_opportunity_full_pipeline(opportunity, chain)
+        self.pipeline_latencies.append((time.perf_counter() - start) * 1000)
+        self.completed += 1
+        self.completion_times.append(time.time())
+
+        if created is None:
+            return
+        if created < self.measure_from:
+            # Launches from before the loop started measure startup time, not detection
+            self.backlog_opportunities += 1
+            return
+        self.detection_latencies.setdefault(chain, []).append((detected - created) * 1000)
+
+
+def configure_endpoints(base_url: str) -> None:
+    """Point every RPC and HTTP endpoint in the settings at the fake services."""
+    settings.networks.ethereum_rpc_url = f"{base_url}/rpc/ethereum"
+    multichain_settings.chains[ChainType.ETHEREUM].rpc_url = f"{base_url}/rpc/ethereum"
+    multichain_settings.chains[ChainType.BASE].rpc_url = f"{base_url}/rpc/base"
+    multichain_settings.solana.rpc_url = f"{base_url}/rpc/solana"
+    multichain_settings.solana.pump_fun_api = f"{base_url}/pump"
+
+
+async def wait_for_services(base_url: str, timeout: float = 15.0) -> None:
+    """Wait until the fake services answer."""
+    deadline = time.time() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.time() < deadline:
+            try:
+                async with session.get(f"{base_url}/stats") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError(f"Fake services did not start at {base_url}")
+
+
+async def fetch_service_stats(base_url: str) -> Dict[str, Any]:
+    """Request counters from the fake services."""
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{base_url}/stats") as response:
+                return (await response.json()).get('requests', {})
+    except Exception:
+        return {}
+
+
+async def sample_event_loop_lag(samples: List[float], interval: float = 0.05) -> None:
+    """Record how late the event loop wakes a sleeping task."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, (time.perf_counter() - start - interval) * 1000))
+
+
+async def sample_memory(samples: List[tuple], start: float, interval: float = 1.0) -> None:
+    """Record RSS over time."""
+    while True:
+        samples.append((time.perf_counter() - start, read_rss_mb()))
+        await asyncio.sleep(interval)
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the pipeline against the fake services and collect metrics.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Results dictionary
+    """
+    base_url = f"http://127.0.0.1:{args.port}"
+    profile = LoadProfile(
+        block_time={'ethereum': args.eth_block_time, 'base': args.base_block_time},
+        pairs_per_second={'ethereum': args.pairs_per_second, 'base': args.pairs_per_second},
+        pump_per_second=args.pump_per_second,
+        jupiter_per_minute=args.jupiter_per_minute,
+        birdeye_per_minute=args.jupiter_per_minute,
+        rpc_latency_ms=args.rpc_latency_ms
+    )
+
+    services = multiprocessing.get_context('spawn').Process(
+        target=serve, args=('127.0.0.1', args.port, profile), daemon=True
+    )
+    services.start()
+
+    try:
+        await wait_for_services(base_url)
+        configure_endpoints(base_url)
+
+        system = BenchmarkTradingSystem(profile, base_url, args.poll_interval, args.dashboard_clients)
+        lag_samples: List[float] = []
+        memory_samples: List[tuple] = []
+        wall_start = time.perf_counter()
+
+        samplers = [
+            asyncio.create_task(sample_event_loop_lag(lag_samples)),
+            asyncio.create_task(sample_memory(memory_samples, wall_start))
+        ]
+        system_task = asyncio.create_task(system.start())
+
+        # Run for the requested duration once the loop is live
+        while system.measure_from == float('inf') and not system_task.done():
+            await asyncio.sleep(0.1)
+        if system_task.done():
+            raise RuntimeError("Trading system stopped during startup; see the log above")
+        await asyncio.sleep(args.duration)
+
+        measured_until = time.time()
+        system.stop()
+        system_task.cancel()
+        try:
+            await asyncio.wait_for(system_task, timeout=30)
+        except (asyncio.CancelledError, asyncio.TimeoutError, Exception):
+            pass
+
+        for task in samplers:
+            task.cancel()
+
+        dashboard_delivery = {}
+        if system.dashboard_server and hasattr(system.dashboard_server, 'get_broadcast_stats'):
+            dashboard_delivery = system.dashboard_server.get_broadcast_stats()
+            dashboard_delivery.pop('per_client', None)
+
+        service_requests = await fetch_service_stats(base_url)
+
+    finally:
+        services.terminate()
+        services.join(timeout=5)
+
+    measured_seconds = max(1e-9, measured_until - system.measure_from) if system.measure_from != float('inf') else 0.0
+    completed_in_window = sum(1 for t in system.completion_times if system.measure_from <= t <= measured_until)
+
+    all_detection = [value for values in system.detection_latencies.values() for value in values]
+    steady_memory = [(x, y) for x, y in memory_samples if x >= memory_samples[0][0] + 5] if memory_samples else []
+    rss_values = [y for _, y in memory_samples]
+
+    return {
+        'benchmark': 'pipeline',
+        'timestamp': datetime.now().isoformat(),
+        'git_commit': git_commit(),
+        'config': {
+            'duration_seconds': args.duration,
+            'pairs_per_second_per_evm_chain': args.pairs_per_second,
+            'eth_block_time': args.eth_block_time,
+            'base_block_time': args.base_block_time,
+            'pump_per_second': args.pump_per_second,
+            'jupiter_per_minute': args.jupiter_per_minute,
+            'poll_interval': args.poll_interval,
+            'rpc_latency_ms': args.rpc_latency_ms,
+            'dashboard_clients': args.dashboard_clients
+        },
+        'results': {
+            'throughput': {
+                'opportunities_completed': completed_in_window,
+                'opportunities_per_second': completed_in_window / measured_seconds if measured_seconds else 0.0,
+                'detected_by_chain': dict(system.system_stats['chains']),
+                'backlog_opportunities': system.backlog_opportunities
+            },
+            'detection_latency_ms': {
+                **percentiles(all_detection),
+                'by_chain': {chain: percentiles(values) for chain, values in system.detection_latencies.items()}
+            },
+            'pipeline_latency_ms': percentiles(system.pipeline_latencies),
+            'event_loop_lag_ms': percentiles(lag_samples),
+            'memory': {
+                'start_mb': rss_values[0] if rss_values else 0.0,
+                'end_mb': rss_values[-1] if rss_values else 0.0,
+                'peak_mb': max(rss_values) if rss_values else 0.0,
+                'growth_mb_per_minute': linear_slope(steady_memory) * 60,
+                'samples': [[round(x, 2), round(y, 2)] for x, y in memory_samples]
+            },
+            'dashboard_fanout_ms': {
+                **percentiles(system.fanout_latencies),
+                'clients': args.dashboard_clients
+            },
+            'dashboard_delivery': dashboard_delivery,
+            'pre_filter': system.pre_filter.get_stats() if system.pre_filter else {},
+            'fake_service_requests': service_requests
+        }
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current git commit of the repository, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(RESULTS_DIR), capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    List metrics that regressed by more than the tolerance.
+
+    Args:
+        results: Current results
+        baseline: Results from a previous run
+        tolerance: Allowed relative change (0.2 = 20%)
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for (section, name), higher_is_better in REGRESSION_METRICS.items():
+        current = results['results'].get(section, {}).get(name)
+        previous = baseline.get('results', {}).get(section, {}).get(name)
+        if current is None or previous is None or previous == 0:
+            continue
+
+        change = (current - previous) / abs(previous)
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        if regressed:
+            regressions.append(f"{section}.{name}: {previous:.3f} -> {current:.3f} ({change:+.0%})")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, print a summary and save the JSON results."""
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmark against fake services")
+    parser.add_argument('--duration', type=float, default=60.0, help='Measured seconds')
+    parser.add_argument('--port', type=int, default=18545, help='Port for the fake services')
+    parser.add_argument('--pairs-per-second', type=float, default=2.0, help='PairCreated rate per EVM chain')
+    parser.add_argument('--eth-block-time', type=float, default=2.0)
+    parser.add_argument('--base-block-time', type=float, default=1.0)
+    parser.add_argument('--pump-per-second', type=float, default=2.0)
+    parser.add_argument('--jupiter-per-minute', type=float, default=30.0)
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='Monitor check interval')
+    parser.add_argument('--rpc-latency-ms', type=float, default=0.0, help='Added latency per RPC request')
+    parser.add_argument('--dashboard-clients', type=int, default=50, help='Fake WebSocket clients (0 disables)')
+    parser.add_argument('--output', help='Results file (default: benchmarks/results/pipeline_<timestamp>.json)')
+    parser.add_argument('--baseline', help='Previous results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative regression')
+    args = parser.parse_args()
+
+    results = asyncio.run(run_benchmark(args))
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2, default=str)
+
+    summary = results['results']
+    detection = summary['detection_latency_ms']
+    print(f"Opportunities/s:      {summary['throughput']['opportunities_per_second']:.2f} "
+          f"({summary['throughput']['opportunities_completed']} completed)")
+    if detection.get('count'):
+        print(f"Detection latency:    p50 {detection['p50']:.0f} ms, p99 {detection['p99']:.0f} ms")
+    pipeline = summary['pipeline_latency_ms']
+    if pipeline.get('count'):
+        print(f"Pipeline latency:     p50 {pipeline['p50']:.1f} ms, p99 {pipeline['p99']:.1f} ms")
+    lag = summary['event_loop_lag_ms']
+    if lag.get('count'):
+        print(f"Event loop lag:       p50 {lag['p50']:.1f} ms, p99 {lag['p99']:.1f} ms, max {lag['max']:.1f} ms")
+    print(f"Memory:               {summary['memory']['start_mb']:.0f} -> {summary['memory']['end_mb']:.0f} MB "
+          f"({summary['memory']['growth_mb_per_minute']:+.2f} MB/min)")
+    fanout = summary['dashboard_fanout_ms']
+    if fanout.get('count'):
+        print(f"Dashboard fan-out:    p50 {fanout['p50']:.2f} ms, p99 {fanout['p99']:.2f} ms "
+              f"to {fanout['clients']} clients")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print("REGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
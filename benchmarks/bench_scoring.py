@@ -0,0 +1,136 @@
+# benchmarks/bench_scoring.py
+"""
+Benchmark for TradingScorer batch scoring.
+Compares per-opportunity scoring with score_batch on synthetic opportunities
+and checks that both paths produce the same scores and tiers.
+
+Usage:
+    python benchmarks/bench_scoring.py [--rows 100000] [--seed 42]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analyzers.trading_scorer import TradingScorer, NUMPY_AVAILABLE
+from models.token import (
+    TradingOpportunity, TokenInfo, LiquidityInfo, ContractAnalysis, SocialMetrics, RiskLevel
+)
+
+
+CHAINS = [
+    ('ETHEREUM', 'Uniswap V2', None),
+    ('BASE', 'BaseSwap', None),
+    ('SOLANA-PUMP', 'Pump.fun', 'Pump.fun'),
+    ('SOLANA-JUPITER', 'Solana-Jupiter', 'Jupiter')
+]
+
+
+def make_opportunities(count: int, seed: int) -> List[TradingOpportunity]:
+    """
+    Build synthetic opportunities covering every scoring branch.
+
+    Args:
+        count: Number of opportunities
+        seed: Random seed
+
+    Returns:
+        List of opportunities
+    """
+    rng = random.Random(seed)
+    now = datetime.now()
+    opportunities = []
+
+    for i in range(count):
+        chain, dex_name, solana_source = rng.choice(CHAINS)
+        address = f"0x{i:040x}"
+
+        metadata = {'chain': chain}
+        if solana_source:
+            metadata['solana_source'] = solana_source
+
+        opportunities.append(TradingOpportunity(
+            token=TokenInfo(address=address, symbol=f"T{i}"),
+            liquidity=LiquidityInfo(
+                pair_address=address,
+                dex_name=dex_name,
+                token0=address,
+                token1=address,
+                reserve0=0.0,
+                reserve1=0.0,
+                liquidity_usd=rng.choice([0.0, 5000.0, 20000.0, 75000.0, 250000.0]),
+                created_at=now,
+                block_number=rng.choice([0, 1000000])
+            ),
+            contract_analysis=ContractAnalysis(
+                is_honeypot=rng.random() < 0.05,
+                is_mintable=rng.random() < 0.3,
+                is_pausable=rng.random() < 0.2,
+                has_blacklist=rng.random() < 0.2,
+                ownership_renounced=rng.random() < 0.6,
+                liquidity_locked=rng.random() < 0.6,
+                risk_level=rng.choice(list(RiskLevel))
+            ),
+            social_metrics=SocialMetrics(
+                twitter_followers=rng.choice([None, 0, 500, 5000]),
+                telegram_members=rng.choice([None, 0, 200, 2000]),
+                social_score=rng.choice([0.0, rng.random()]),
+                sentiment_score=rng.uniform(-1.0, 1.0)
+            ),
+            detected_at=now - timedelta(minutes=rng.choice([0.5, 3, 10, 30])),
+            metadata=metadata
+        ))
+
+    return opportunities
+
+
+def main() -> None:
+    """Run the benchmark and print timings."""
+    parser = argparse.ArgumentParser(description="TradingScorer batch scoring benchmark")
+    parser.add_argument('--rows', type=int, default=100000, help='Number of opportunities')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed')
+    args = parser.parse_args()
+
+    scorer = TradingScorer()
+
+    print(f"Building {args.rows:,} synthetic opportunities...")
+    opportunities = make_opportunities(args.rows, args.seed)
+
+    start = time.perf_counter()
+    scalar_scores = []
+    scalar_actions = []
+    for opportunity in opportunities:
+        score = scorer.score_opportunity(opportunity)
+        scalar_scores.append(score)
+        scalar_actions.append(scorer._classify(score, opportunity.contract_analysis.risk_level)[0])
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = scorer.score_batch(opportunities, update_opportunities=False)
+    batch_time = time.perf_counter() - start
+
+    print(f"Vectorized: {'yes' if result.vectorized else 'no (NumPy not installed)'}")
+    print(f"Scalar loop:  {scalar_time * 1000:10.1f} ms  ({args.rows / scalar_time:,.0f} rows/s)")
+    print(f"score_batch:  {batch_time * 1000:10.1f} ms  ({args.rows / batch_time:,.0f} rows/s)")
+
+    if NUMPY_AVAILABLE:
+        features = scorer.build_feature_matrix(opportunities)
+        start = time.perf_counter()
+        scorer.score_feature_matrix(features)
+        rescore_time = time.perf_counter() - start
+        print(f"Re-score matrix: {rescore_time * 1000:7.1f} ms  (features already extracted)")
+
+    batch_scores = list(result.scores)
+    max_diff = max((abs(a - b) for a, b in zip(scalar_scores, batch_scores)), default=0.0)
+    action_mismatches = sum(1 for a, b in zip(scalar_actions, result.actions) if a != b)
+    print(f"Max score difference: {max_diff:.2e}, tier mismatches: {action_mismatches}")
+
+
+if __name__ == "__main__":
+    main()
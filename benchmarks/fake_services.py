@@ -0,0 +1,455 @@
+# benchmarks/fake_services.py
+"""
+Local stand-ins for the external services the monitors poll.
+Serves an EVM JSON-RPC endpoint per chain that mints PairCreated and Sync logs
+at a configurable rate, plus pump.fun, Jupiter and Birdeye HTTP endpoints.
+Launches are generated deterministically from the start time, so the driver
+can compute when every token was created without asking the server.
+
+Usage:
+    python benchmarks/fake_services.py [--port 8545] [--pairs-per-second 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from utils.abi_encoding import encode_uint, encode_address
+
+
+# keccak256("PairCreated(address,address,address,uint256)")
+PAIR_CREATED_TOPIC = "0x0d3648bd0f6ba80134a33ba9275ac585d9d315f0ad8355cddefde31afa28d0e9"
+# keccak256("Sync(uint112,uint112)")
+SYNC_TOPIC = "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1"
+
+CHAIN_IDS = {'ethereum': 1, 'base': 8453}
+CHAIN_PREFIXES = {'ethereum': 0x11, 'base': 0x22}
+WRAPPED_NATIVE = {
+    'ethereum': "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+    'base': "0x4200000000000000000000000000000000000006"
+}
+
+# Minimal runtime code returned by eth_getCode for every fake token
+FAKE_TOKEN_CODE = "0x6080604052348015600f57600080fd5b50600436106032576000" + "00" * 64
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+MINT_SOURCES = {'pump': 1, 'jupiter': 2, 'birdeye': 3, 'creator': 4}
+# SolanaMonitor builds a TokenInfo, which only accepts 0x-style addresses
+PUMP_MINT_PREFIX = 0x33
+
+
+@dataclass
+class LoadProfile:
+    """Launch rates and chain timing for the fake services."""
+    start_time: float = field(default_factory=time.time)
+    # Block mined at start_time; monitors look back from the head, so it must not start near 0
+    first_block: int = 20_000_000
+    block_time: Dict[str, float] = field(default_factory=lambda: {'ethereum': 2.0, 'base': 1.0})
+    pairs_per_second: Dict[str, float] = field(default_factory=lambda: {'ethereum': 2.0, 'base': 2.0})
+    syncs_per_pair_block: int = 3
+    sync_window_blocks: int = 20
+    pump_per_second: float = 2.0
+    jupiter_per_minute: float = 30.0
+    birdeye_per_minute: float = 30.0
+    rpc_latency_ms: float = 0.0
+
+    def head_block(self, chain: str, now: Optional[float] = None) -> int:
+        """Latest mined block on a chain."""
+        elapsed = (now or time.time()) - self.start_time
+        return self.first_block + max(0, int(elapsed / self.block_time[chain]))
+
+    def block_timestamp(self, chain: str, block: int) -> float:
+        """Wall-clock time a block was mined."""
+        return self.start_time + (block - self.first_block) * self.block_time[chain]
+
+    def pairs_in_block(self, chain: str, block: int) -> range:
+        """Global pair indices created in a block; blocks before first_block have none."""
+        height = block - self.first_block
+        if height < 0:
+            return range(0)
+        per_block = self.pairs_per_second[chain] * self.block_time[chain]
+        return range(int(height * per_block), int((height + 1) * per_block))
+
+    def launches_until(self, rate_per_second: float, now: Optional[float] = None) -> int:
+        """Number of launches of a constant-rate source up to now."""
+        return max(0, int(((now or time.time()) - self.start_time) * rate_per_second))
+
+    def launch_time(self, rate_per_second: float, index: int) -> float:
+        """Wall-clock creation time of the index-th launch of a constant-rate source."""
+        return self.start_time + index / rate_per_second
+
+
+def token_address(chain: str, index: int) -> str:
+    """Deterministic token address for a pair index."""
+    return f"0x{CHAIN_PREFIXES[chain]:02x}{index:038x}"
+
+
+def pair_address(chain: str, index: int) -> str:
+    """Deterministic pair address for a pair index."""
+    return f"0x{CHAIN_PREFIXES[chain] + 1:02x}{index:038x}"
+
+
+def pair_index(address: str) -> Optional[int]:
+    """Recover the pair index from a fake token or pair address."""
+    try:
+        return int(address[4:], 16)
+    except (ValueError, TypeError):
+        return None
+
+
+def solana_mint(source: str, index: int) -> str:
+    """Deterministic base58-looking mint address."""
+    value = MINT_SOURCES[source] << 64 | index
+    chars = []
+    while value:
+        value, remainder = divmod(value, 58)
+        chars.append(BASE58_ALPHABET[remainder])
+    return (''.join(reversed(chars)) + "pump" + "1" * 32)[:44]
+
+
+def pump_mint(index: int) -> str:
+    """Deterministic pump.fun mint in the address format the pump.fun pipeline accepts."""
+    return f"0x{PUMP_MINT_PREFIX:02x}{index:038x}"
+
+
+def _encode_string(value: str) -> str:
+    """ABI-encode a single string return value."""
+    raw = value.encode()
+    padded = raw + b"\x00" * (-len(raw) % 32)
+    return '0x' + (encode_uint(32) + encode_uint(len(raw)) + padded).hex()
+
+
+class FakeServices:
+    """aiohttp application serving the fake chains and HTTP APIs."""
+
+    def __init__(self, profile: LoadProfile) -> None:
+        """
+        Initialize the services.
+
+        Args:
+            profile: Load profile shared with the driver
+        """
+        self.profile = profile
+        self.request_counts: Dict[str, int] = {}
+
+    def create_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application()
+        app.router.add_post('/rpc/{chain}', self.handle_rpc)
+        app.router.add_get('/pump/coins', self.handle_pump_coins)
+        app.router.add_get('/jupiter/strict', self.handle_jupiter_list)
+        app.router.add_get('/jupiter/v6/quote', self.handle_jupiter_quote)
+        app.router.add_get('/birdeye/defi/tokenlist', self.handle_birdeye)
+        app.router.add_get('/stats', self.handle_stats)
+        app.router.add_route('*', '/{tail:.*}', self.handle_unknown)
+        return app
+
+    def _count(self, name: str) -> None:
+        self.request_counts[name] = self.request_counts.get(name, 0) + 1
+
+    # JSON-RPC
+
+    async def handle_rpc(self, request: web.Request) -> web.Response:
+        """Serve a JSON-RPC request or batch for one chain."""
+        chain = request.match_info['chain']
+        body = await request.json()
+
+        if self.profile.rpc_latency_ms:
+            await asyncio.sleep(self.profile.rpc_latency_ms / 1000)
+
+        if isinstance(body, list):
+            return web.json_response([self._rpc_response(chain, item) for item in body])
+        return web.json_response(self._rpc_response(chain, body))
+
+    def _rpc_response(self, chain: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response for a single JSON-RPC call."""
+        method = request.get('method', '')
+        params = request.get('params') or []
+        self._count(f"rpc:{chain}:{method}")
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+
+        if chain not in CHAIN_IDS:
+            response['error'] = {'code': -32601, 'message': f"unsupported chain {chain}"}
+            return response
+
+        try:
+            result = self._rpc_result(chain, method, params)
+        except NotImplementedError:
+            response['error'] = {'code': -32601, 'message': f"the method {method} does not exist"}
+            return response
+        except Exception as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+            return response
+
+        response['result'] = result
+        return response
+
+    def _rpc_result(self, chain: str, method: str, params: List[Any]) -> Any:
+        """Dispatch a JSON-RPC method."""
+        head = self.profile.head_block(chain)
+
+        if method == 'web3_clientVersion':
+            return 'dex-sniper-fake-rpc/1.0'
+        if method == 'eth_chainId':
+            return hex(CHAIN_IDS[chain])
+        if method == 'net_version':
+            return str(CHAIN_IDS[chain])
+        if method == 'eth_blockNumber':
+            return hex(head)
+        if method == 'eth_getLogs':
+            return self._get_logs(chain, params[0] if params else {}, head)
+        if method == 'eth_call':
+            return self._eth_call(chain, params[0] if params else {})
+        if method == 'eth_getCode':
+            return FAKE_TOKEN_CODE
+        if method == 'eth_getBalance':
+            return hex(0)
+        if method in ('eth_gasPrice', 'eth_maxPriorityFeePerGas'):
+            return hex(2_000_000_000 if method == 'eth_maxPriorityFeePerGas' else 20_000_000_000)
+        if method == 'eth_estimateGas':
+            return hex(180_000)
+        if method == 'eth_feeHistory':
+            return self._fee_history(params, head)
+        if method == 'eth_getBlockByNumber':
+            return self._block(chain, params, head)
+        raise NotImplementedError(method)
+
+    @staticmethod
+    def _block_param(value: Any, head: int) -> int:
+        """Parse a block number or tag."""
+        if value in (None, 'latest', 'pending', 'safe', 'finalized'):
+            return head
+        if value == 'earliest':
+            return 0
+        return int(value, 16) if isinstance(value, str) else int(value)
+
+    def _get_logs(self, chain: str, log_filter: Dict[str, Any], head: int) -> List[Dict[str, Any]]:
+        """Return PairCreated and/or Sync logs matching a filter."""
+        from_block = max(self.profile.first_block, self._block_param(log_filter.get('fromBlock'), head))
+        to_block = min(self._block_param(log_filter.get('toBlock'), head), head)
+        topics = log_filter.get('topics') or []
+        topic0 = topics[0] if topics else None
+        if isinstance(topic0, list):
+            topic0 = topic0[0] if topic0 else None
+        topic0 = topic0.lower() if isinstance(topic0, str) else None
+        if topic0 and not topic0.startswith('0x'):
+            topic0 = '0x' + topic0
+        address = log_filter.get('address') or "0x" + "00" * 20
+
+        logs = []
+        for block in range(from_block, to_block + 1):
+            if topic0 in (None, PAIR_CREATED_TOPIC):
+                for index in self.profile.pairs_in_block(chain, block):
+                    logs.append(self._pair_created_log(chain, block, index, address))
+            if topic0 in (None, SYNC_TOPIC):
+                logs.extend(self._sync_logs(chain, block))
+        return logs
+
+    def _pair_created_log(self, chain: str, block: int, index: int, factory: Any) -> Dict[str, Any]:
+        """Build one PairCreated log."""
+        token = token_address(chain, index)
+        return {
+            'address': factory if isinstance(factory, str) else factory[0],
+            'topics': [
+                PAIR_CREATED_TOPIC,
+                '0x' + encode_address(token).hex(),
+                '0x' + encode_address(WRAPPED_NATIVE[chain]).hex()
+            ],
+            'data': '0x' + (encode_address(pair_address(chain, index)) + encode_uint(index + 1)).hex(),
+            'blockNumber': hex(block),
+            'blockHash': '0x' + f"{block:064x}",
+            'transactionHash': '0x' + f"{CHAIN_PREFIXES[chain]:02x}{index:062x}",
+            'transactionIndex': hex(0),
+            'logIndex': hex(index % 1000),
+            'removed': False
+        }
+
+    def _sync_logs(self, chain: str, block: int) -> List[Dict[str, Any]]:
+        """Build Sync logs for pairs created in the recent window."""
+        logs = []
+        first_block = max(self.profile.first_block, block - self.profile.sync_window_blocks)
+        pairs = self.profile.pairs_in_block(chain, first_block)
+        recent = range(pairs.start, self.profile.pairs_in_block(chain, block).stop)
+        if not len(recent):
+            return logs
+
+        for n in range(self.profile.syncs_per_pair_block * len(self.profile.pairs_in_block(chain, block))):
+            index = recent[(block * 7919 + n * 104729) % len(recent)]
+            drift = 1.0 + ((block * 31 + n) % 21 - 10) / 100
+            reserve_token = int(1e27 / drift)
+            reserve_quote = int(1e19 * drift)
+            logs.append({
+                'address': pair_address(chain, index),
+                'topics': [SYNC_TOPIC],
+                'data': '0x' + (encode_uint(reserve_token) + encode_uint(reserve_quote)).hex(),
+                'blockNumber': hex(block),
+                'blockHash': '0x' + f"{block:064x}",
+                'transactionHash': '0x' + f"{block:032x}{n:032x}",
+                'transactionIndex': hex(n),
+                'logIndex': hex(n),
+                'removed': False
+            })
+        return logs
+
+    def _eth_call(self, chain: str, call: Dict[str, Any]) -> str:
+        """Answer ERC20 metadata calls for fake tokens."""
+        data = (call.get('data') or call.get('input') or '0x').lower()
+        selector = data[2:10]
+        index = pair_index(call.get('to') or '') or 0
+
+        if selector == '06fdde03':  # name()
+            return _encode_string(f"Bench Token {index}")
+        if selector == '95d89b41':  # symbol()
+            return _encode_string(f"BT{index}")
+        if selector == '313ce567':  # decimals()
+            return '0x' + encode_uint(18).hex()
+        if selector == '18160ddd':  # totalSupply()
+            return '0x' + encode_uint(10 ** 27).hex()
+        if selector == '8da5cb5b':  # owner()
+            return '0x' + encode_address("0x" + "00" * 20).hex()
+        if selector == '70a08231':  # balanceOf(address)
+            return '0x' + encode_uint(0).hex()
+        raise ValueError("execution reverted")
+
+    @staticmethod
+    def _fee_history(params: List[Any], head: int) -> Dict[str, Any]:
+        """Flat fee history for the gas oracle."""
+        block_count = int(params[0], 16) if isinstance(params[0], str) else int(params[0])
+        block_count = max(1, min(block_count, 1024))
+        percentiles = params[2] if len(params) > 2 else []
+        return {
+            'oldestBlock': hex(max(0, head - block_count + 1)),
+            'baseFeePerGas': [hex(15_000_000_000)] * (block_count + 1),
+            'gasUsedRatio': [0.5] * block_count,
+            'reward': [[hex(1_500_000_000)] * len(percentiles)] * block_count
+        }
+
+    def _block(self, chain: str, params: List[Any], head: int) -> Dict[str, Any]:
+        """Minimal block header."""
+        number = self._block_param(params[0] if params else 'latest', head)
+        return {
+            'number': hex(number),
+            'hash': '0x' + f"{number:064x}",
+            'parentHash': '0x' + f"{max(0, number - 1):064x}",
+            'timestamp': hex(int(self.profile.block_timestamp(chain, number))),
+            'baseFeePerGas': hex(15_000_000_000),
+            'gasLimit': hex(30_000_000),
+            'gasUsed': hex(15_000_000),
+            'transactions': []
+        }
+
+    # HTTP APIs
+
+    async def handle_pump_coins(self, request: web.Request) -> web.Response:
+        """Newest pump.fun coins, newest first."""
+        self._count('pump:coins')
+        limit = int(request.query.get('limit', 20))
+        rate = self.profile.pump_per_second
+        total = self.profile.launches_until(rate)
+        coins = []
+        for index in range(total - 1, max(-1, total - 1 - limit), -1):
+            coins.append({
+                'mint': pump_mint(index),
+                'name': f"Pump Bench {index}",
+                'symbol': f"PB{index}",
+                'description': "benchmark token",
+                'created_timestamp': int(self.profile.launch_time(rate, index) * 1000),
+                'usd_market_cap': 5000 + index % 50000,
+                'reply_count': index % 40,
+                'creator': solana_mint('creator', index % 500)
+            })
+        return web.json_response({'coins': coins})
+
+    async def handle_jupiter_list(self, request: web.Request) -> web.Response:
+        """Jupiter strict token list, oldest first."""
+        self._count('jupiter:strict')
+        rate = self.profile.jupiter_per_minute / 60
+        total = self.profile.launches_until(rate)
+        tokens = [
+            {
+                'address': solana_mint('jupiter', index),
+                'name': f"Jupiter Bench {index}",
+                'symbol': f"JB{index}",
+                'decimals': 6
+            }
+            for index in range(max(0, total - 50), total)
+        ]
+        return web.json_response(tokens)
+
+    async def handle_jupiter_quote(self, request: web.Request) -> web.Response:
+        """Static quote used by the monitor's connection test."""
+        self._count('jupiter:quote')
+        return web.json_response({'inAmount': request.query.get('amount', '0'), 'outAmount': '150000000'})
+
+    async def handle_birdeye(self, request: web.Request) -> web.Response:
+        """Birdeye token list of active tokens."""
+        self._count('birdeye:tokenlist')
+        rate = self.profile.birdeye_per_minute / 60
+        total = self.profile.launches_until(rate)
+        limit = int(request.query.get('limit', 50))
+        tokens = [
+            {
+                'address': solana_mint('birdeye', index),
+                'name': f"Birdeye Bench {index}",
+                'symbol': f"BB{index}",
+                'decimals': 6,
+                'mc': 250000 + index,
+                'v24hUSD': 50000 + index,
+                'price': 0.001
+            }
+            for index in range(total - 1, max(-1, total - 1 - limit), -1)
+        ]
+        return web.json_response({'data': {'tokens': tokens}})
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Load profile and request counters."""
+        return web.json_response({'profile': asdict(self.profile), 'requests': self.request_counts})
+
+    async def handle_unknown(self, request: web.Request) -> web.Response:
+        """Fast 404 for external APIs the benchmark does not emulate."""
+        self._count('unknown')
+        return web.json_response({'error': 'not emulated'}, status=404)
+
+
+def serve(host: str, port: int, profile: LoadProfile) -> None:
+    """
+    Run the fake services until interrupted (used as a subprocess target).
+
+    Args:
+        host: Bind address
+        port: Bind port
+        profile: Load profile
+    """
+    web.run_app(FakeServices(profile).create_app(), host=host, port=port, print=None, access_log=None)
+
+
+def main() -> None:
+    """Run the fake services standalone."""
+    parser = argparse.ArgumentParser(description="Fake EVM JSON-RPC, pump.fun and Jupiter services")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8545)
+    parser.add_argument('--pairs-per-second', type=float, default=2.0, help='PairCreated rate per EVM chain')
+    parser.add_argument('--pump-per-second', type=float, default=2.0)
+    parser.add_argument('--rpc-latency-ms', type=float, default=0.0)
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        pairs_per_second={'ethereum': args.pairs_per_second, 'base': args.pairs_per_second},
+        pump_per_second=args.pump_per_second,
+        rpc_latency_ms=args.rpc_latency_ms
+    )
+    print(f"Fake services on http://{args.host}:{args.port} ({json.dumps(asdict(profile))})")
+    serve(args.host, args.port, profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -108,6 +108,7 @@ class Settings:
         
         # Risk management
         self.blacklisted_tokens: List[str] = []
+        self.blacklisted_deployers: List[str] = []
         self.whitelisted_deployers: List[str] = []
         
         # Free API endpoints (new)
@@ -157,6 +158,9 @@ class Settings:
         self.api.reddit_client_id = os.getenv('REDDIT_CLIENT_ID')
         self.api.reddit_client_secret = os.getenv('REDDIT_CLIENT_SECRET')
         self.api.honeypot_api_key = os.getenv('HONEYPOT_API_KEY')
+        
+        # Trading wallet (public address only; used as swap recipient and sender)
+        self.wallet_address: Optional[str] = os.getenv('WALLET_ADDRESS')
     
     def get_rpc_url(self, chain: str = 'ethereum') -> str:
         """Get the primary RPC URL for a chain."""
@@ -7,6 +7,7 @@ Coordinates monitoring across Ethereum, Base, and Solana with intelligent analys
 import asyncio
 import sys
 import os
+import time
 from typing import List, Dict
 from datetime import datetime
 from web3 import Web3
@@ -15,6 +16,7 @@ from web3 import Web3
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from utils.logger import logger_manager
+from utils.decision_log import decision_log, DECISION_ANALYZED, DEFAULT_LOG_DIR
 from monitors.new_token_monitor import NewTokenMonitor
 from monitors.base_chain_monitor import BaseChainMonitor
 from monitors.solana_monitor import SolanaMonitor
@@ -81,6 +83,7 @@ class MultiChainDexSnipingSystem:
             
             # Display configuration
             self._log_system_info()
+            decision_log.start(DEFAULT_LOG_DIR)
             
             # Phase 2: Initialize analysis components
             await self._initialize_analyzers()
@@ -242,7 +245,12 @@ class MultiChainDexSnipingSystem:
         """Phase 2: Analyze opportunity and log with intelligence."""
         try:
             # Run comprehensive analysis
+            analysis_start = time.perf_counter()
             await self._analyze_opportunity(opportunity)
+            decision_log.record_opportunity(
+                opportunity, chain, DECISION_ANALYZED,
+                latencies={'analysis': (time.perf_counter() - analysis_start) * 1000}
+            )
             
             # Log with analysis results
             await self._log_analyzed_opportunity(opportunity, chain, gas_token)
@@ -556,6 +564,8 @@ class MultiChainDexSnipingSystem:
                 await self.contract_analyzer.cleanup()
             if self.social_analyzer:
                 await self.social_analyzer.cleanup()
+            
+            decision_log.stop()
                 
             if self.start_time:
                 runtime = datetime.now() - self.start_time
@@ -6,33 +6,65 @@ Integrates all Phase 3 components for automated DEX sniping with risk management
 import asyncio
 import sys
 import os
-from typing import List, Dict, Optional
+import logging
+import time
+import importlib
+from typing import TYPE_CHECKING, List, Dict, Optional, Set
 from datetime import datetime
 from decimal import Decimal
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Imported first: startup timings are measured from here
+from utils.startup import StartupOrchestrator
 from utils.logger import logger_manager
 from models.token import TradingOpportunity, RiskLevel
 
-# Phase 1 & 2 Components
-from monitors.new_token_monitor import NewTokenMonitor
-from monitors.base_chain_monitor import BaseChainMonitor
-from monitors.solana_monitor import SolanaMonitor
-from monitors.jupiter_solana_monitor import JupiterSolanaMonitor
-from analyzers.contract_analyzer import ContractAnalyzer
-from analyzers.social_analyzer import SocialAnalyzer
-from analyzers.trading_scorer import TradingScorer
+# Phase 1 & 2 Components (monitors and analyzers are imported during startup)
+from analyzers.pre_filter import OpportunityPreFilter, StageStats
 
 # Phase 3 Components
 from trading.risk_manager import RiskManager, PortfolioLimits, RiskAssessment
-from trading.position_manager import PositionManager, Position, PositionStatus
-from trading.execution_engine import ExecutionEngine, ExecutionResult
+from trading.price_alerts import PriceAlertEngine, PriceTick, AlertAutoBuyer, ReservePoller
 
 # Configuration and API
 from config.chains import multichain_settings, ChainType
 from config.settings import settings
+from utils.async_cache import analysis_cache
+from utils.event_recorder import event_recorder, EventReplayer, RecordedEvent
+from utils.decision_log import (
+    decision_log,
+    DECISION_FILTERED,
+    DECISION_NO_TRADE,
+    DECISION_TRADE,
+    DECISION_TRADE_FAILED,
+    DEFAULT_LOG_DIR as DEFAULT_DECISION_LOG_DIR
+)
+from utils.replay_io import create_web3, enable_replay
+
+if TYPE_CHECKING:
+    from analyzers.contract_analyzer import ContractAnalyzer
+    from analyzers.social_analyzer import SocialAnalyzer
+    from analyzers.trading_scorer import TradingScorer
+    from trading.position_manager import PositionManager, Position
+    from trading.execution_engine import ExecutionEngine
+    from web3 import Web3
+
+# Modules that pull in web3 or NumPy (over two seconds combined); imported on a
+# worker thread during startup so HTTP monitors can start scanning meanwhile
+DEFERRED_IMPORTS = (
+    'monitors.new_token_monitor',
+    'monitors.base_chain_monitor',
+    'analyzers.contract_analyzer',
+    'analyzers.social_analyzer',
+    'analyzers.trading_scorer',
+    'trading.position_manager',
+    'trading.execution_engine'
+)
+
+# Longest wait for the in-process dashboard server to report that it is listening
+DASHBOARD_STARTUP_TIMEOUT = 10.0
 
 
 class ProductionTradingSystem:
@@ -41,20 +73,49 @@ class ProductionTradingSystem:
     Integrates monitoring, analysis, risk management, and execution.
     """
 
-    def __init__(self, auto_trading_enabled: bool = False, disable_dashboard: bool = False) -> None:
+    def __init__(
+        self,
+        auto_trading_enabled: bool = False,
+        disable_dashboard: bool = False,
+        record_path: Optional[str] = None,
+        replay_path: Optional[str] = None,
+        replay_speed: float = 0.0,
+        replay_concurrency: int = 1,
+        dashboard_process: bool = False,
+        dashboard_workers: int = 1,
+        decision_log_dir: Optional[str] = None
+    ) -> None:
         """
         Initialize the production trading system.
         
         Args:
             auto_trading_enabled: Whether to enable automated trading execution
             disable_dashboard: Whether to disable web dashboard
+            record_path: Event file to record all raw pipeline inputs into
+            replay_path: Event file to replay instead of polling live sources
+            replay_speed: Replay rate (1.0 = real time, 0 = as fast as possible)
+            replay_concurrency: Recorded inputs processed at once during replay
+            dashboard_process: Serve the dashboard from a separate process fed over a Unix socket
+            dashboard_workers: uvicorn workers for the separate dashboard process
+            decision_log_dir: Directory for the structured decision log (None disables it)
         """
         self.logger = logger_manager.get_logger("ProductionTradingSystem")
         self.auto_trading_enabled = auto_trading_enabled
         self.disable_dashboard = disable_dashboard
+        self.dashboard_process = dashboard_process
+        self.dashboard_workers = dashboard_workers
+        self.record_path = record_path
+        self.decision_log_dir = decision_log_dir
+        self.event_replayer: Optional[EventReplayer] = (
+            EventReplayer(replay_path, speed=replay_speed, concurrency=replay_concurrency)
+            if replay_path else None
+        )
         self.is_running = False
         self.start_time: Optional[datetime] = None
         
+        # Concurrent startup with readiness events and a timing breakdown
+        self.startup = StartupOrchestrator()
+        
         # Component initialization flags
         self.components_initialized = {
             'monitors': False,
@@ -65,20 +126,31 @@ class ProductionTradingSystem:
         
         # Monitoring components
         self.monitors: List = []
+        self.monitor_tasks: List[asyncio.Task] = []
+        
+        # Fire-and-forget tasks, referenced until done so they are not garbage-collected
+        self.background_tasks: Set[asyncio.Task] = set()
         
         # Analysis components
         self.contract_analyzer: Optional[ContractAnalyzer] = None
         self.social_analyzer: Optional[SocialAnalyzer] = None
         self.trading_scorer: Optional[TradingScorer] = None
+        self.pre_filter: Optional[OpportunityPreFilter] = None
+        
+        # Web3 connections for the pre-filter's code-hash lookups on non-Ethereum chains
+        self.chain_connections: Dict[str, Optional['Web3']] = {}
         
         # Trading components
         self.risk_manager: Optional[RiskManager] = None
         self.position_manager: Optional[PositionManager] = None
         self.execution_engine: Optional[ExecutionEngine] = None
+        self.price_alert_engine: Optional[PriceAlertEngine] = None
+        self.reserve_poller: Optional[ReservePoller] = None
         
         # Web dashboard
         self.dashboard_server = None
         self.web_server_task: Optional[asyncio.Task] = None
+        self.dashboard_child: Optional[asyncio.subprocess.Process] = None
         
         # Performance tracking
         self.system_stats = {
@@ -95,6 +167,12 @@ class ProductionTradingSystem:
                 'SOLANA-JUPITER': {'opportunities': 0, 'positions': 0}
             }
         }
+        
+        # Pass/reject counters for the stages after the pre-filter
+        self.stage_stats = {
+            'risk': StageStats(),
+            'decision': StageStats()
+        }
 
     async def start(self) -> None:
         """Start the complete production trading system."""
@@ -109,6 +187,10 @@ class ProductionTradingSystem:
             self.system_stats['uptime_start'] = self.start_time
             self.is_running = True
             
+            self._configure_record_replay()
+            if self.decision_log_dir:
+                decision_log.start(self.decision_log_dir)
+            
             # Initialize all system components
             await self._initialize_all_components()
             
@@ -121,25 +203,52 @@ class ProductionTradingSystem:
         finally:
             await self._cleanup_all_components()
 
+    def _configure_record_replay(self) -> None:
+        """Start recording or switch all clients to recorded responses before anything connects."""
+        if not self.record_path and not self.event_replayer:
+            return
+        
+        # Persisted lookups would skip the requests a replay needs to see
+        analysis_cache.persist_path = None
+        analysis_cache.entries.clear()
+        
+        if self.event_replayer:
+            self.event_replayer.load()
+            enable_replay(self.event_replayer.store)
+            speed = f"{self.event_replayer.speed:g}x" if self.event_replayer.speed > 0 else "as fast as possible"
+            self.logger.info(f"▶️  REPLAY MODE: {self.event_replayer.path} ({speed})")
+        elif self.record_path:
+            event_recorder.start(self.record_path)
+            self.logger.info(f"⏺️  RECORDING inputs to {self.record_path}")
+
     async def _initialize_all_components(self) -> None:
-        """Initialize all system components in proper order."""
+        """Initialize all system components concurrently, in dependency order."""
         try:
             self.logger.info("INITIALIZING PRODUCTION COMPONENTS...")
             
-            # Phase 1: Initialize analysis components
-            await self._initialize_analyzers()
+            startup = self.startup
+            startup.add_step('imports', self._load_deferred_imports)
             
-            # Phase 2: Initialize trading system
-            await self._initialize_trading_system()
+            # HTTP monitors need none of the deferred modules, so they start scanning first;
+            # detections wait in the pipeline until analyzers and trading are ready
+            startup.add_step('monitors', self._initialize_http_monitors, required=False)
+            startup.add_step('evm_monitors', self._initialize_evm_monitors, after=('imports',), required=False)
+            startup.add_step('trading', self._initialize_trading_system, after=('imports',))
+            startup.add_step('analyzers', self._initialize_analyzers, after=('imports',))
             
-            # Phase 3: Initialize web dashboard (optional)
             if not self.disable_dashboard:
-                await self._initialize_web_dashboard()
+                startup.add_step('dashboard', self._initialize_web_dashboard, after=('trading',), required=False)
             else:
                 self.logger.info("Web dashboard disabled by command line option")
             
-            # Phase 4: Initialize monitors (last, so they can use other components)
-            await self._initialize_monitors()
+            try:
+                await startup.run()
+            finally:
+                startup.log_report()
+            
+            if not self.monitors:
+                raise RuntimeError("No monitors were successfully initialized")
+            self.components_initialized['monitors'] = True
             
             self._log_initialization_summary()
             
@@ -147,24 +256,37 @@ class ProductionTradingSystem:
             self.logger.error(f"Component initialization failed: {e}")
             raise
 
+    async def _load_deferred_imports(self) -> None:
+        """Import the web3/NumPy-backed modules on a worker thread."""
+        def load() -> None:
+            for module in DEFERRED_IMPORTS:
+                importlib.import_module(module)
+        
+        await asyncio.to_thread(load)
+
     async def _initialize_analyzers(self) -> None:
         """Initialize Phase 2 analysis components."""
         try:
             self.logger.info("Initializing analysis components...")
             
+            from analyzers.contract_analyzer import ContractAnalyzer
+            from analyzers.social_analyzer import SocialAnalyzer
+            from analyzers.trading_scorer import TradingScorer
+            
             # Initialize Web3 for contract analysis
-            from web3 import Web3
-            w3 = Web3(Web3.HTTPProvider(settings.networks.ethereum_rpc_url))
+            w3 = create_web3(settings.networks.ethereum_rpc_url, 'ETHEREUM')
             
-            if not w3.is_connected():
+            if not await asyncio.to_thread(w3.is_connected):
                 raise ConnectionError("Failed to connect to Ethereum for contract analysis")
             
             # Initialize analyzers
             self.contract_analyzer = ContractAnalyzer(w3)
-            await self.contract_analyzer.initialize()
-            
             self.social_analyzer = SocialAnalyzer()
-            await self.social_analyzer.initialize()
+            self.social_analyzer.add_refinement_callback(self._handle_social_refinement)
+            await asyncio.gather(
+                self.contract_analyzer.initialize(),
+                self.social_analyzer.initialize()
+            )
             
             self.trading_scorer = TradingScorer()
             
@@ -180,6 +302,9 @@ class ProductionTradingSystem:
         try:
             self.logger.info("Initializing trading system...")
             
+            from trading.position_manager import PositionManager
+            from trading.execution_engine import ExecutionEngine
+            
             # Configure portfolio limits
             portfolio_limits = PortfolioLimits(
                 max_total_exposure_usd=5000.0,  # $5K max exposure
@@ -201,6 +326,21 @@ class ProductionTradingSystem:
             self.execution_engine = ExecutionEngine(self.risk_manager, self.position_manager)
             await self.execution_engine.initialize()
             
+            # Capacity only gates analysis when trades can actually be placed
+            self.pre_filter = OpportunityPreFilter(
+                self.risk_manager,
+                check_capacity=self.auto_trading_enabled
+            )
+            
+            # Watchlist price alerts, fed from the opportunity stream and per-block pair reserves
+            self.price_alert_engine = PriceAlertEngine()
+            self.reserve_poller = ReservePoller(self.price_alert_engine)
+            self.price_alert_engine.add_listener(self._broadcast_price_alerts_safe)
+            if self.auto_trading_enabled:
+                self.price_alert_engine.add_listener(
+                    AlertAutoBuyer(self.risk_manager, self.execution_engine)
+                )
+            
             self.components_initialized['trading_system'] = True
             self.logger.info("✅ Trading system initialized")
             self.logger.info(f"   Portfolio Limits: ${portfolio_limits.max_total_exposure_usd:,.0f} total exposure")
@@ -214,17 +354,15 @@ class ProductionTradingSystem:
 
     async def _initialize_web_dashboard(self) -> None:
         """Initialize web dashboard with proper integration."""
+        if self.dashboard_process:
+            await self._initialize_dashboard_process()
+            return
+            
         try:
             self.logger.info("Initializing production web dashboard...")
             
-            # Import dashboard using the working method
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "dashboard_server", 
-                "api/dashboard_server.py"
-            )
-            dashboard_module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(dashboard_module)
+            # FastAPI and the dashboard module load off the event loop
+            dashboard_module = await asyncio.to_thread(self._load_dashboard_module)
             
             # Get dashboard components
             self.dashboard_server = dashboard_module.dashboard_server
@@ -241,14 +379,19 @@ class ProductionTradingSystem:
             # Initialize dashboard
             await self.dashboard_server.initialize()
             
-            # Start server in background
-            self.web_server_task = asyncio.create_task(self._start_dashboard_server())
+            # Start server in background and wait until it is listening
+            import uvicorn
             
-            # Wait for startup
-            await asyncio.sleep(3)
+            server = uvicorn.Server(uvicorn.Config(
+                self.dashboard_app,
+                host="127.0.0.1",
+                port=8000,
+                log_level="warning",
+                access_log=False
+            ))
+            self.web_server_task = asyncio.create_task(self._run_dashboard_server(server))
             
-            # Check if server started successfully
-            if not self.web_server_task.done():
+            if await self._wait_for_dashboard_server(server):
                 self.components_initialized['web_dashboard'] = True
                 self.logger.info("✅ Production web dashboard initialized")
                 self.logger.info("   🌐 Dashboard: http://localhost:8000")
@@ -256,30 +399,72 @@ class ProductionTradingSystem:
                 self.logger.info("   💹 Live trading monitoring")
             else:
                 self.logger.warning("Dashboard server failed to start")
+                self.web_server_task.cancel()
                 self.web_server_task = None
                 
         except Exception as e:
             self.logger.warning(f"Dashboard initialization failed: {e}")
             self.logger.info("Continuing without dashboard - console mode only")
 
-    async def _start_dashboard_server(self):
-        """Start dashboard server in background."""
+    async def _initialize_dashboard_process(self) -> None:
+        """Publish dashboard events over a Unix socket and serve the dashboard from a child process."""
         try:
-            import uvicorn
+            self.logger.info(f"Starting dashboard process ({self.dashboard_workers} worker(s))...")
             
-            config = uvicorn.Config(
-                self.dashboard_app,  # Use the loaded app
-                host="127.0.0.1",
-                port=8000,
-                log_level="warning",
-                access_log=False
+            from api.dashboard_ipc import DashboardPublisher, launch_dashboard_process
+            
+            # Same interface as the in-process dashboard server, so the pipeline is unchanged
+            self.dashboard_server = DashboardPublisher()
+            if hasattr(self, 'execution_engine'):
+                self.dashboard_server.trading_executor = self.execution_engine
+            if hasattr(self, 'risk_manager'):
+                self.dashboard_server.risk_manager = self.risk_manager
+            if hasattr(self, 'position_manager'):
+                self.dashboard_server.position_manager = self.position_manager
+            
+            await self.dashboard_server.initialize()
+            self.dashboard_child = await launch_dashboard_process(
+                self.dashboard_server.socket_path,
+                workers=self.dashboard_workers
             )
             
-            server = uvicorn.Server(config)
-            await server.serve()
+            self.components_initialized['web_dashboard'] = True
+            self.logger.info("✅ Dashboard process started")
+            self.logger.info("   🌐 Dashboard: http://localhost:8000")
             
         except Exception as e:
-            self.logger.error(f"Dashboard server error: {e}")
+            self.logger.warning(f"Dashboard process failed to start: {e}")
+            self.logger.info("Continuing without dashboard - console mode only")
+            self.dashboard_server = None
+
+    @staticmethod
+    def _load_dashboard_module():
+        """Import the dashboard server module using the working method."""
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(
+            "dashboard_server", 
+            "api/dashboard_server.py"
+        )
+        dashboard_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(dashboard_module)
+        return dashboard_module
+
+    async def _wait_for_dashboard_server(self, server) -> bool:
+        """
+        Wait until uvicorn reports that it is listening.
+        
+        Args:
+            server: Uvicorn server being started by web_server_task
+            
+        Returns:
+            True once the server is listening, False if it exited or timed out first
+        """
+        deadline = time.monotonic() + DASHBOARD_STARTUP_TIMEOUT
+        while not server.started:
+            if self.web_server_task.done() or time.monotonic() > deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
 
     # Update the dashboard update methods to use the working integration
 
@@ -309,6 +494,18 @@ class ProductionTradingSystem:
             # Don't let dashboard broadcast errors break trading
             self.logger.debug(f"Dashboard broadcast failed (non-critical): {e}")
 
+    async def _broadcast_price_alerts_safe(self, alerts: List) -> None:
+        """Safely broadcast fired watchlist price alerts."""
+        try:
+            if (hasattr(self, 'dashboard_server') and 
+                self.dashboard_server and 
+                self.components_initialized.get('web_dashboard', False)):
+                
+                await self.dashboard_server.publish_price_alerts(alerts)
+                
+        except Exception as e:
+            self.logger.debug(f"Price alert broadcast failed (non-critical): {e}")
+
 
 
 
@@ -341,68 +538,81 @@ class ProductionTradingSystem:
 
 
 
-    async def _initialize_monitors(self) -> None:
-        """Initialize chain monitors with production callbacks."""
+    async def _initialize_http_monitors(self) -> None:
+        """Initialize and start the Solana monitors, which only need HTTP."""
+        self.logger.info("Initializing production monitors...")
+        
+        from monitors.solana_monitor import SolanaMonitor
+        from monitors.jupiter_solana_monitor import JupiterSolanaMonitor
+        
+        # Solana monitors
         try:
-            self.logger.info("Initializing production monitors...")
-            
-            # Ethereum monitor
-            try:
-                eth_monitor = NewTokenMonitor(check_interval=10.0)  # Slower for production
-                eth_monitor.add_callback(self._handle_ethereum_opportunity)
-                self.monitors.append(eth_monitor)
-                self.logger.info("✅ Ethereum monitor ready")
-            except Exception as e:
-                self.logger.warning(f"Ethereum monitor failed: {e}")
-            
-            # Base monitor
-            try:
-                base_monitor = BaseChainMonitor(check_interval=5.0)
-                base_monitor.add_callback(self._handle_base_opportunity)
-                self.monitors.append(base_monitor)
-                self.logger.info("✅ Base monitor ready")
-            except Exception as e:
-                self.logger.warning(f"Base monitor failed: {e}")
-            
-            # Solana monitors
-            try:
-                pump_monitor = SolanaMonitor(check_interval=10.0)  # Slower to avoid rate limits
-                pump_monitor.add_callback(self._handle_solana_pump_opportunity)
-                self.monitors.append(pump_monitor)
-                self.logger.info("✅ Solana Pump.fun monitor ready")
-            except Exception as e:
-                self.logger.warning(f"Solana Pump monitor failed: {e}")
-            
-            try:
-                jupiter_monitor = JupiterSolanaMonitor(check_interval=30.0)  # Even slower backup
-                jupiter_monitor.add_callback(self._handle_solana_jupiter_opportunity)
-                self.monitors.append(jupiter_monitor)
-                self.logger.info("✅ Solana Jupiter monitor ready")
-            except Exception as e:
-                self.logger.warning(f"Solana Jupiter monitor failed: {e}")
-            
-            if not self.monitors:
-                raise RuntimeError("No monitors were successfully initialized")
-            
-            self.components_initialized['monitors'] = True
-            self.logger.info(f"✅ {len(self.monitors)} monitors initialized for production")
-            
+            pump_monitor = SolanaMonitor(check_interval=10.0)  # Slower to avoid rate limits
+            pump_monitor.add_callback(self._handle_solana_pump_opportunity)
+            self._start_monitor(pump_monitor)
+            self.logger.info("✅ Solana Pump.fun monitor ready")
         except Exception as e:
-            self.logger.error(f"Failed to initialize monitors: {e}")
-            raise
+            self.logger.warning(f"Solana Pump monitor failed: {e}")
+        
+        try:
+            jupiter_monitor = JupiterSolanaMonitor(check_interval=30.0)  # Even slower backup
+            jupiter_monitor.add_callback(self._handle_solana_jupiter_opportunity)
+            self._start_monitor(jupiter_monitor)
+            self.logger.info("✅ Solana Jupiter monitor ready")
+        except Exception as e:
+            self.logger.warning(f"Solana Jupiter monitor failed: {e}")
+
+    async def _initialize_evm_monitors(self) -> None:
+        """Initialize and start the Ethereum and Base monitors once web3 is imported."""
+        from monitors.new_token_monitor import NewTokenMonitor
+        from monitors.base_chain_monitor import BaseChainMonitor
+        
+        # Ethereum monitor
+        try:
+            eth_monitor = NewTokenMonitor(check_interval=10.0)  # Slower for production
+            eth_monitor.add_callback(self._handle_ethereum_opportunity)
+            self._start_monitor(eth_monitor)
+            self.logger.info("✅ Ethereum monitor ready")
+        except Exception as e:
+            self.logger.warning(f"Ethereum monitor failed: {e}")
+        
+        # Base monitor
+        try:
+            base_monitor = BaseChainMonitor(check_interval=5.0)
+            base_monitor.add_callback(self._handle_base_opportunity)
+            self._start_monitor(base_monitor)
+            self.logger.info("✅ Base monitor ready")
+        except Exception as e:
+            self.logger.warning(f"Base monitor failed: {e}")
+
+    def _start_monitor(self, monitor) -> None:
+        """
+        Register a monitor and, outside replay, start it immediately.
+        
+        Args:
+            monitor: Monitor with its callbacks attached
+        """
+        self.monitors.append(monitor)
+        if self.event_replayer:
+            return
+        
+        self.monitor_tasks.append(asyncio.create_task(monitor.start()))
+        self.startup.watch(f"{monitor.name} connected", monitor.ready_event)
+        self.startup.watch(f"{monitor.name} scanning", monitor.scanning_event)
+        self.logger.info(f"Started monitor: {monitor.name}")
 
     async def _run_production_loop(self) -> None:
         """Run the main production trading loop."""
         try:
+            if self.event_replayer:
+                await self._run_replay()
+                return
+            
             self.logger.info("🎯 STARTING PRODUCTION TRADING LOOP")
             self.logger.info("Real-time monitoring across all chains with automated execution")
             
-            # Start all monitors
-            monitor_tasks = []
-            for monitor in self.monitors:
-                task = asyncio.create_task(monitor.start())
-                monitor_tasks.append(task)
-                self.logger.info(f"Started monitor: {monitor.name}")
+            # Monitors were started during startup as soon as each was created
+            monitor_tasks = list(self.monitor_tasks)
             
             # Start system monitoring tasks
             system_tasks = [
@@ -410,6 +620,10 @@ class ProductionTradingSystem:
                 asyncio.create_task(self._performance_reporter()),
                 asyncio.create_task(self._position_monitor())
             ]
+            if self.price_alert_engine:
+                system_tasks.append(asyncio.create_task(self.price_alert_engine.start()))
+            if self.reserve_poller:
+                system_tasks.append(asyncio.create_task(self.reserve_poller.start()))
             
             # Combine all tasks
             all_tasks = monitor_tasks + system_tasks
@@ -423,6 +637,42 @@ class ProductionTradingSystem:
             self.logger.error(f"Production loop error: {e}")
             raise
 
+    async def _run_replay(self) -> None:
+        """Feed recorded inputs through the monitors instead of polling live sources."""
+        monitors_by_name = {}
+        for monitor in self.monitors:
+            try:
+                await monitor._initialize()
+                monitors_by_name[monitor.name] = monitor
+            except Exception as e:
+                self.logger.warning(f"Replay: {monitor.name} monitor failed to initialize: {e}")
+        
+        async def dispatch(event: RecordedEvent) -> None:
+            monitor = monitors_by_name.get(event.source)
+            if monitor is None:
+                raise ValueError(f"no monitor named {event.source}")
+            await monitor.replay_input(event.key, event.data)
+        
+        self.logger.info(f"🎯 REPLAYING {len(self.event_replayer.inputs)} recorded inputs")
+        try:
+            stats = await self.event_replayer.run(dispatch)
+        finally:
+            for monitor in monitors_by_name.values():
+                await monitor._cleanup()
+        
+        self.logger.info("REPLAY COMPLETE")
+        self.logger.info(
+            f"Inputs: {stats['inputs_replayed']}/{stats['inputs_total']} "
+            f"({stats['inputs_failed']} failed) in {stats['replay_duration']:.2f}s "
+            f"(recorded over {stats['recorded_duration']:.0f}s)"
+        )
+        self.logger.info(f"Throughput: {stats['inputs_per_second']:,.1f} inputs/s")
+        self.logger.info(
+            f"Recorded responses: {stats['responses']['hits']} served, "
+            f"{stats['responses']['misses']} missing"
+        )
+        self._log_stage_stats()
+
     # Production opportunity handlers with full pipeline
     
     async def _handle_ethereum_opportunity(self, opportunity: TradingOpportunity) -> None:
@@ -488,16 +738,62 @@ class ProductionTradingSystem:
             chain: Chain identifier for logging
         """
         try:
+            # Monitors start before analysis is ready; early detections wait here
+            if not self.startup.is_ready('analyzers', 'trading'):
+                await self.startup.wait_ready('analyzers', 'trading')
+            self.startup.mark("first detection")
+            
             pipeline_start = datetime.now()
+            stage_start = time.perf_counter()
+            latencies = {
+                'queued': max(0.0, (pipeline_start - opportunity.detected_at).total_seconds() * 1000)
+            }
+            
+            # Watched tokens get a price tick whether or not they pass the pre-filter
+            if self.price_alert_engine:
+                self.price_alert_engine.submit([PriceTick.from_opportunity(opportunity)])
+            
+            # Fast path: reject on cheap signals before any RPC or API work
+            if self.pre_filter:
+                code_hash_pending = self.pre_filter.needs_code_hash(opportunity)
+                pre_filter_result = self.pre_filter.evaluate(opportunity, code_hash_pending=code_hash_pending)
+                
+                # One eth_getCode for survivors lets clones of recorded scams be rejected before analysis
+                if pre_filter_result.passed and code_hash_pending:
+                    await self._attach_code_hash(opportunity, chain)
+                    pre_filter_result = self.pre_filter.check_code_hash(opportunity)
+                
+                if not pre_filter_result.passed:
+                    self.logger.debug(
+                        f"PRE-FILTERED: {opportunity.token.symbol} on {chain} - {pre_filter_result.reason}"
+                    )
+                    latencies['total'] = (time.perf_counter() - stage_start) * 1000
+                    decision_log.record_opportunity(
+                        opportunity, chain, DECISION_FILTERED, pre_filter_result.reason, latencies=latencies
+                    )
+                    return
+            
+            # Stage 0: Prewarm the swap transaction while analysis runs
+            if self.execution_engine:
+                task = asyncio.create_task(self.execution_engine.prewarm_opportunity(opportunity))
+                self.background_tasks.add(task)
+                task.add_done_callback(self.background_tasks.discard)
             
             # Stage 1: Enhanced Analysis
             self.logger.info(f"🔍 ANALYZING: {opportunity.token.symbol} on {chain}")
             
+            analysis_start = time.perf_counter()
             await self._perform_enhanced_analysis(opportunity)
             self.system_stats['opportunities_analyzed'] += 1
+            risk_start = time.perf_counter()
+            latencies['analysis'] = (risk_start - analysis_start) * 1000
             
             # Stage 2: Risk Assessment
             risk_assessment = self.risk_manager.assess_opportunity(opportunity)
+            decision_start = time.perf_counter()
+            latencies['risk'] = (decision_start - risk_start) * 1000
+            risk_rejected = risk_assessment.risk_assessment == RiskAssessment.REJECTED
+            self.stage_stats['risk'].record(not risk_rejected, risk_assessment.rejection_reason)
             
             # Stage 3: Trading Decision
             recommendation = opportunity.metadata.get('recommendation', {})
@@ -509,7 +805,9 @@ class ProductionTradingSystem:
             
             # Stage 4: Execute Trade (if conditions met)
             if self.auto_trading_enabled and self._should_execute_trade(risk_assessment, recommendation):
+                self.stage_stats['decision'].record(True)
                 position = await self._execute_production_trade(opportunity, risk_assessment)
+                decision, reason = (DECISION_TRADE, None) if position else (DECISION_TRADE_FAILED, "Execution failed")
                 
                 if position:
                     self.system_stats['positions_opened'] += 1
@@ -520,15 +818,26 @@ class ProductionTradingSystem:
                         f"🎯 TRADE EXECUTED: {opportunity.token.symbol} - Position ID: {position.id}"
                     )
             else:
+                decision = DECISION_NO_TRADE
                 reason = self._get_no_trade_reason(risk_assessment, recommendation)
+                self.stage_stats['decision'].record(False, reason)
+                self.risk_manager.release_reservation(risk_assessment.reservation_id)
                 self.logger.info(f"📋 NO TRADE: {opportunity.token.symbol} - {reason}")
             
+            decision_end = time.perf_counter()
+            latencies['decision'] = (decision_end - decision_start) * 1000
+            latencies['total'] = (decision_end - stage_start) * 1000
+            decision_log.record_opportunity(
+                opportunity, chain, decision, reason,
+                risk_assessment=risk_assessment, latencies=latencies
+            )
+            
             # Stage 5: Update Dashboard (safely)
             await self._update_dashboard_safe(opportunity)
             
             # Performance tracking
             pipeline_time = (datetime.now() - pipeline_start).total_seconds()
-            self.logger.debug(f"Pipeline completed in {pipeline_time:.2f}s")
+            self.logger.debug("Pipeline completed in %.2fs", pipeline_time)
             
         except Exception as e:
             self.logger.error(f"Pipeline processing failed for {opportunity.token.symbol}: {e}")
@@ -558,6 +867,8 @@ class ProductionTradingSystem:
             # Contract analysis (for EVM chains)
             if 'SOLANA' not in opportunity.metadata.get('chain', ''):
                 opportunity.contract_analysis = await self.contract_analyzer.analyze_contract(opportunity)
+                if opportunity.contract_analysis.is_honeypot and self.pre_filter:
+                    self._record_scam(opportunity)
             else:
                 # Simplified analysis for Solana
                 from models.token import ContractAnalysis
@@ -589,6 +900,77 @@ class ProductionTradingSystem:
                 'warnings': ['Could not analyze token safely']
             }
 
+    def _get_chain_web3(self, chain: str) -> Optional['Web3']:
+        """
+        Get a Web3 connection for an EVM chain other than Ethereum, creating it on first use.
+        
+        Args:
+            chain: Chain name (e.g. BASE)
+            
+        Returns:
+            Web3 instance, or None if the chain is not configured
+        """
+        if chain not in self.chain_connections:
+            chain_type = ChainType.__members__.get(chain)
+            config = multichain_settings.chains.get(chain_type) if chain_type else None
+            self.chain_connections[chain] = create_web3(config.rpc_url, chain) if config else None
+        return self.chain_connections[chain]
+    
+    async def _attach_code_hash(self, opportunity: TradingOpportunity, chain: str) -> None:
+        """Store the token's code hash, read on its own chain, in metadata for the pre-filter's scam check."""
+        if opportunity.metadata.get('code_hash') or not self.contract_analyzer:
+            return
+        try:
+            # The contract analyzer's connection is Ethereum; other chains use their own RPC
+            w3 = None
+            if chain != 'ETHEREUM':
+                w3 = self._get_chain_web3(chain)
+                if w3 is None:
+                    return
+            code_hash = await self.contract_analyzer.trade_simulator.get_code_hash(opportunity.token.address, w3)
+            if code_hash:
+                opportunity.metadata['code_hash'] = code_hash
+        except Exception as e:
+            self.logger.debug(f"Code hash lookup failed for {opportunity.token.symbol}: {e}")
+
+    def _record_scam(self, opportunity: TradingOpportunity) -> None:
+        """Feed a detected scam back into the pre-filter so clones are rejected early."""
+        # The contract analyzer stores the code hash from its simulate() result in metadata
+        self.pre_filter.record_scam(opportunity, opportunity.metadata.get('code_hash'))
+
+    async def _handle_social_refinement(self, opportunity: TradingOpportunity, metrics) -> None:
+        """
+        Re-score an opportunity when late social results arrive and push it to the dashboard.
+        
+        Args:
+            opportunity: Opportunity that was already scored with partial social data
+            metrics: Refined social metrics including late sources
+        """
+        try:
+            if not opportunity.contract_analysis:
+                return
+                
+            opportunity.social_metrics = metrics
+            score = self.trading_scorer.score_opportunity(opportunity)
+            previous_action = opportunity.metadata.get('recommendation', {}).get('action')
+            recommendation = self.trading_scorer.generate_recommendation(opportunity)
+            
+            opportunity.metadata['recommendation'] = recommendation
+            opportunity.metadata['social_refined_at'] = datetime.now()
+            opportunity.confidence_score = score
+            
+            if recommendation.get('action') != previous_action:
+                self.logger.info(
+                    f"🔄 REFINED: {opportunity.token.symbol} - {previous_action} → {recommendation.get('action')}"
+                )
+            
+            if (self.dashboard_server and 
+                self.components_initialized.get('web_dashboard', False)):
+                await self.dashboard_server.update_opportunity(opportunity)
+                
+        except Exception as e:
+            self.logger.debug(f"Social refinement handling failed (non-critical): {e}")
+
     def _should_execute_trade(self, risk_assessment, recommendation: Dict) -> bool:
         """
         Determine if a trade should be executed based on risk and recommendation.
@@ -661,7 +1043,7 @@ class ProductionTradingSystem:
         self, 
         opportunity: TradingOpportunity, 
         risk_assessment
-    ) -> Optional[Position]:
+    ) -> Optional['Position']:
         """
         Execute a production trade with full error handling.
         
@@ -729,46 +1111,51 @@ class ProductionTradingSystem:
     ) -> None:
         """Log opportunity with production-level detail."""
         try:
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
+            
             recommendation = opportunity.metadata.get('recommendation', {})
             
-            self.logger.info("=" * 100)
-            self.logger.info(f"PRODUCTION OPPORTUNITY: {opportunity.token.symbol} on {chain}")
-            self.logger.info(f"Address: {opportunity.token.address}")
-            self.logger.info(f"Detected: {opportunity.detected_at.strftime('%H:%M:%S')}")
+            # One multi-line record instead of a record per line
+            lines = ["=" * 100]
+            lines.append(f"PRODUCTION OPPORTUNITY: {opportunity.token.symbol} on {chain}")
+            lines.append(f"Address: {opportunity.token.address}")
+            lines.append(f"Detected: {opportunity.detected_at.strftime('%H:%M:%S')}")
             
             # Risk Assessment
-            self.logger.info(f"RISK ASSESSMENT: {risk_assessment.risk_assessment.value.upper()}")
-            self.logger.info(f"Risk Score: {risk_assessment.risk_score:.3f}")
-            self.logger.info(f"Approved Amount: {risk_assessment.approved_amount}")
+            lines.append(f"RISK ASSESSMENT: {risk_assessment.risk_assessment.value.upper()}")
+            lines.append(f"Risk Score: {risk_assessment.risk_score:.3f}")
+            lines.append(f"Approved Amount: {risk_assessment.approved_amount}")
             
             # Analysis Results
             analysis = opportunity.contract_analysis
             social = opportunity.social_metrics
             
-            self.logger.info(f"Contract Risk: {analysis.risk_level.value.upper()}")
-            self.logger.info(f"Social Score: {social.social_score:.2f}")
-            self.logger.info(f"Liquidity: ${opportunity.liquidity.liquidity_usd:,.0f}")
+            lines.append(f"Contract Risk: {analysis.risk_level.value.upper()}")
+            lines.append(f"Social Score: {social.social_score:.2f}")
+            lines.append(f"Liquidity: ${opportunity.liquidity.liquidity_usd:,.0f}")
             
             # Trading Recommendation
             action = recommendation.get('action', 'UNKNOWN')
             confidence = recommendation.get('confidence', 'UNKNOWN')
             score = recommendation.get('score', 0.0)
             
-            self.logger.info(f"RECOMMENDATION: {action} ({confidence}, score: {score:.2f})")
+            lines.append(f"RECOMMENDATION: {action} ({confidence}, score: {score:.2f})")
             
             # Reasons
             reasons = risk_assessment.reasons[:3]  # Top 3 reasons
             if reasons:
-                self.logger.info(f"Key Factors: {', '.join(reasons)}")
+                lines.append(f"Key Factors: {', '.join(reasons)}")
             
             # Trading Decision
             will_trade = (
                 self.auto_trading_enabled and 
                 self._should_execute_trade(risk_assessment, recommendation)
             )
-            self.logger.info(f"TRADING DECISION: {'EXECUTE' if will_trade else 'SKIP'}")
+            lines.append(f"TRADING DECISION: {'EXECUTE' if will_trade else 'SKIP'}")
             
-            self.logger.info("=" * 100)
+            lines.append("=" * 100)
+            self.logger.info("\n".join(lines))
             
         except Exception as e:
             self.logger.error(f"Error logging opportunity: {e}")
@@ -822,6 +1209,12 @@ class ProductionTradingSystem:
                 self.logger.info(f"Win Rate: {portfolio_summary.get('win_rate_percentage', 0):.1f}%")
                 self.logger.info(f"Execution Success: {execution_metrics.get('success_rate_percentage', 0):.1f}%")
                 
+                cache_stats = analysis_cache.get_stats()
+                self.logger.info(
+                    f"Lookup Cache: {cache_stats['hit_rate']:.0%} hit rate, {cache_stats['entries']} entries"
+                )
+                self._log_stage_stats()
+                
                 # Update dashboard if available
                 if self.dashboard_server:
                     await self.dashboard_server.update_analysis_rate(int(analysis_rate))
@@ -829,6 +1222,20 @@ class ProductionTradingSystem:
         except Exception as e:
             self.logger.error(f"Performance reporter error: {e}")
 
+    def _log_stage_stats(self) -> None:
+        """Log pass/reject counts and top reject reasons per pipeline stage."""
+        stages = {'pre_filter': self.pre_filter.stats} if self.pre_filter else {}
+        stages.update(self.stage_stats)
+        
+        for name, stats in stages.items():
+            top_reasons = ", ".join(
+                f"{reason} ({count})" for reason, count in stats.reasons.most_common(3)
+            )
+            self.logger.info(
+                f"Stage {name}: {stats.passed}/{stats.evaluated} passed"
+                + (f" - top rejects: {top_reasons}" if top_reasons else "")
+            )
+
     async def _position_monitor(self) -> None:
         """Monitor positions for automated management."""
         try:
@@ -914,11 +1321,24 @@ class ProductionTradingSystem:
             # Stop position monitoring
             if self.position_manager:
                 await self.position_manager.stop_monitoring()
+            if self.execution_engine:
+                await self.execution_engine.stop_monitoring()
+            if self.price_alert_engine:
+                self.price_alert_engine.stop()
+            if self.reserve_poller:
+                self.reserve_poller.stop()
             
             # Cleanup monitors
             for monitor in self.monitors:
                 if hasattr(monitor, 'cleanup'):
                     await monitor.cleanup()
+            for task in self.monitor_tasks:
+                if not task.done():
+                    task.cancel()
+            self.startup.close()
+            
+            event_recorder.stop()
+            decision_log.stop()
             
             # Cancel web server
             if self.web_server_task:
@@ -928,6 +1348,16 @@ class ProductionTradingSystem:
                 except asyncio.CancelledError:
                     pass
             
+            # Stop the separate dashboard process
+            if self.dashboard_child and self.dashboard_child.returncode is None:
+                self.dashboard_child.terminate()
+                try:
+                    await asyncio.wait_for(self.dashboard_child.wait(), timeout=10)
+                except asyncio.TimeoutError:
+                    self.dashboard_child.kill()
+            if self.dashboard_process and self.dashboard_server:
+                await self.dashboard_server.close()
+            
             # Final performance report
             if self.start_time:
                 total_runtime = datetime.now() - self.start_time
@@ -937,6 +1367,7 @@ class ProductionTradingSystem:
                 self.logger.info(f"Opportunities Analyzed: {self.system_stats['opportunities_analyzed']}")
                 self.logger.info(f"Positions Opened: {self.system_stats['positions_opened']}")
                 self.logger.info(f"Trades Executed: {self.system_stats['trades_executed']}")
+                self._log_stage_stats()
                 
                 if self.position_manager:
                     portfolio = self.position_manager.get_portfolio_summary()
@@ -961,11 +1392,40 @@ async def main():
                        help='Run in demo mode (no real trades)')
     parser.add_argument('--no-dashboard', action='store_true',
                        help='Disable web dashboard (console only)')
+    parser.add_argument('--dashboard-process', action='store_true',
+                       help='Serve the dashboard from a separate process fed over a Unix socket')
+    parser.add_argument('--dashboard-workers', type=int, default=1,
+                       help='uvicorn workers for --dashboard-process (default 1)')
+    parser.add_argument('--record', metavar='FILE',
+                       help='Record all raw inputs to a compressed event file')
+    parser.add_argument('--replay', metavar='FILE',
+                       help='Replay a recorded event file against local stubs instead of live sources')
+    parser.add_argument('--replay-speed', type=float, default=0.0,
+                       help='Replay rate: 1.0 = real time, 0 = as fast as possible (default)')
+    parser.add_argument('--replay-concurrency', type=int, default=1,
+                       help='Recorded inputs processed at once during replay (1 = deterministic)')
+    parser.add_argument('--log-queue', action='store_true',
+                       help='Write logs from a background thread through a bounded queue')
+    parser.add_argument('--log-level', default=None,
+                       help='Root log level, e.g. INFO to skip DEBUG records entirely (default DEBUG)')
+    parser.add_argument('--decision-log', metavar='DIR', default=DEFAULT_DECISION_LOG_DIR,
+                       help=f'Directory for the structured decision log (default {DEFAULT_DECISION_LOG_DIR})')
+    parser.add_argument('--no-decision-log', action='store_true',
+                       help='Disable the structured decision log')
     
     args = parser.parse_args()
     
-    # Safety confirmation for auto-trading
-    if args.auto_trade and not args.demo_mode:
+    if args.log_level:
+        logger_manager.set_level(args.log_level)
+    if args.log_queue:
+        logger_manager.enable_queue_mode()
+    
+    if args.record and args.replay:
+        print("--record and --replay cannot be combined")
+        return
+    
+    # Safety confirmation for auto-trading (replay only talks to local stubs)
+    if args.auto_trade and not args.demo_mode and not args.replay:
         print("\n⚠️  WARNING: AUTO-TRADING ENABLED WITH REAL FUNDS ⚠️")
         print("This will automatically execute trades with real money.")
         print("Make sure you understand the risks and have proper funding limits set.")
@@ -978,7 +1438,14 @@ async def main():
     # Initialize and start system
     system = ProductionTradingSystem(
         auto_trading_enabled=args.auto_trade,
-        disable_dashboard=args.no_dashboard  # Add this parameter
+        disable_dashboard=args.no_dashboard,  # Add this parameter
+        record_path=args.record,
+        replay_path=args.replay,
+        replay_speed=args.replay_speed,
+        replay_concurrency=args.replay_concurrency,
+        dashboard_process=args.dashboard_process,
+        dashboard_workers=args.dashboard_workers,
+        decision_log_dir=None if args.no_decision_log else args.decision_log
     )
     
     try:
@@ -62,6 +62,8 @@ class ContractAnalysis:
     ownership_renounced: bool = False
     liquidity_locked: bool = False
     lock_duration: Optional[int] = None  # seconds
+    buy_tax: Optional[float] = None  # measured by trade simulation, 0-1
+    sell_tax: Optional[float] = None  # measured by trade simulation, 0-1
     risk_score: float = 0.0
     risk_level: RiskLevel = RiskLevel.MEDIUM
     analysis_notes: List[str] = field(default_factory=list)
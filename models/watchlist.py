@@ -1,17 +1,19 @@
 # models/watchlist.py
 """
 Watchlist management for tracking tokens marked for watching.
-Provides storage and retrieval of watchlist items with metadata.
+Provides storage and retrieval of watchlist items with metadata, backed by
+the journaled watchlist store.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 import json
 import os
 
 from models.token import TradingOpportunity, RiskLevel
+from models.watchlist_store import DEFAULT_USER, WatchlistStore, watchlist_key, watchlist_store
 from utils.logger import logger_manager
 
 
@@ -87,65 +89,94 @@ class WatchlistItem:
 class WatchlistManager:
     """
     Manages the watchlist for tokens marked for watching.
-    Provides storage, retrieval, and management of watchlist items.
+    Items are kept in the shared watchlist store; this manager adds the
+    WatchlistItem view and the one-time import of the legacy JSON file.
     """
     
-    def __init__(self, storage_file: str = "data/watchlist.json"):
-        """Initialize the watchlist manager."""
+    def __init__(
+        self,
+        storage_file: str = "data/watchlist.json",
+        store: Optional[WatchlistStore] = None,
+        user_id: str = DEFAULT_USER
+    ):
+        """
+        Initialize the watchlist manager.
+        
+        Args:
+            storage_file: Legacy JSON file imported into the store once
+            store: Watchlist store (the global store by default)
+            user_id: Store namespace this manager reads and writes
+        """
         self.storage_file = storage_file
+        self.store = store or watchlist_store
+        self.user_id = user_id
         self.logger = logger_manager.get_logger("WatchlistManager")
-        self.watchlist: Dict[str, WatchlistItem] = {}
-        self._ensure_storage_directory()
-        self._load_watchlist()
+        
+        # Parsed items keyed by record key; reused while the stored record is unchanged
+        self._parsed: Dict[str, Tuple[Dict[str, Any], WatchlistItem]] = {}
+        
+        # The legacy file is only a migration source; import it when the store first loads
+        self.store.add_listener(self._on_store_change)
+        if self.store.loaded:
+            self._import_legacy_file()
     
-    def _ensure_storage_directory(self) -> None:
-        """Ensure the storage directory exists."""
-        try:
-            directory = os.path.dirname(self.storage_file)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-                self.logger.info(f"Created storage directory: {directory}")
-        except Exception as e:
-            self.logger.error(f"Failed to create storage directory: {e}")
+    def _on_store_change(self, user: Optional[str], key: Optional[str], record: Optional[Dict[str, Any]]) -> None:
+        """Run the legacy import once the store has loaded."""
+        if user is None:
+            self._import_legacy_file()
     
-    def _load_watchlist(self) -> None:
-        """Load watchlist from storage file."""
+    def _import_legacy_file(self) -> None:
+        """Import the pre-store JSON watchlist once."""
+        marker = f"imported:{self.storage_file}"
         try:
-            if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                for item_data in data.get('watchlist', []):
-                    try:
-                        item = WatchlistItem.from_dict(item_data)
-                        key = f"{item.chain}:{item.token_address}"
-                        self.watchlist[key] = item
-                    except Exception as e:
-                        self.logger.error(f"Failed to load watchlist item: {e}")
-                        
-                self.logger.info(f"Loaded {len(self.watchlist)} watchlist items")
-            else:
-                self.logger.info("No existing watchlist file found")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to load watchlist: {e}")
-            self.watchlist = {}
-    
-    def _save_watchlist(self) -> None:
-        """Save watchlist to storage file."""
-        try:
-            data = {
-                'watchlist': [item.to_dict() for item in self.watchlist.values()],
-                'last_saved': datetime.now().isoformat()
-            }
+            if self.store.get_meta(marker) or not os.path.exists(self.storage_file):
+                return
             
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
-            self.logger.debug(f"Saved {len(self.watchlist)} watchlist items")
+            with open(self.storage_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            imported = 0
+            for item_data in data.get('watchlist', []):
+                try:
+                    item = WatchlistItem.from_dict(item_data)
+                    key = watchlist_key(item.chain, item.token_address)
+                    if self.store.get(self.user_id, key) is None:
+                        self.store.put(self.user_id, key, item.to_dict())
+                        imported += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to import watchlist item: {e}")
+            
+            self.store.set_meta(marker, datetime.now().isoformat())
+            self.store.compact()
+            self.logger.info(f"Imported {imported} watchlist items from {self.storage_file}")
             
         except Exception as e:
-            self.logger.error(f"Failed to save watchlist: {e}")
+            self.logger.error(f"Failed to import legacy watchlist: {e}")
+    
+    def _item(self, key: str, record: Dict[str, Any]) -> WatchlistItem:
+        """Parse a stored record, reusing the previous parse if it is unchanged."""
+        cached = self._parsed.get(key)
+        if cached is not None and cached[0] is record:
+            return cached[1]
+        item = WatchlistItem.from_dict(record)
+        self._parsed[key] = (record, item)
+        return item
+    
+    @property
+    def watchlist(self) -> Dict[str, WatchlistItem]:
+        """Current items keyed by chain:address."""
+        items = {}
+        for key, record in self.store.records.get(self.user_id, {}).items():
+            try:
+                items[key] = self._item(key, record)
+            except Exception as e:
+                self.logger.error(f"Failed to load watchlist item {key}: {e}")
+        return items
+    
+    def reload(self) -> None:
+        """Pick up changes made to the store by another process."""
+        self.store.refresh()
+        self._parsed = {}
     
     def add_to_watchlist(
         self, 
@@ -170,16 +201,23 @@ class WatchlistManager:
         """
         try:
             chain = opportunity.metadata.get('chain', 'unknown')
-            key = f"{chain}:{opportunity.token.address}"
+            key = watchlist_key(chain, opportunity.token.address)
             
             # Check if already in watchlist
-            if key in self.watchlist:
+            if self.store.get(self.user_id, key) is not None:
                 self.logger.warning(f"Token already in watchlist: {opportunity.token.symbol}")
                 return False
             
             # Get recommendation data
             recommendation = opportunity.metadata.get('recommendation', {})
             
+            # The other side of the pair, used to price the token from its reserves
+            liquidity = opportunity.liquidity
+            if str(liquidity.token0).lower() == opportunity.token.address.lower():
+                quote_token = liquidity.token1
+            else:
+                quote_token = liquidity.token0
+            
             # Create watchlist item
             item = WatchlistItem(
                 token_address=opportunity.token.address,
@@ -196,14 +234,15 @@ class WatchlistManager:
                 metadata={
                     'liquidity_usd': opportunity.liquidity.liquidity_usd,
                     'dex_name': opportunity.liquidity.dex_name,
+                    'pair_address': opportunity.liquidity.pair_address or None,
+                    'quote_token': quote_token or None,
                     'social_score': opportunity.social_metrics.social_score,
                     'confidence': recommendation.get('confidence'),
                     'action': recommendation.get('action')
                 }
             )
             
-            self.watchlist[key] = item
-            self._save_watchlist()
+            self.store.put(self.user_id, key, item.to_dict())
             
             self.logger.info(f"Added to watchlist: {opportunity.token.symbol} ({reason})")
             return True
@@ -224,16 +263,12 @@ class WatchlistManager:
             True if removed successfully, False otherwise
         """
         try:
-            key = f"{chain}:{token_address}"
+            key = watchlist_key(chain, token_address)
+            record = self.store.delete(self.user_id, key)
             
-            if key in self.watchlist:
-                item = self.watchlist[key]
-                item.status = WatchlistStatus.REMOVED
-                item.last_updated = datetime.now()
-                del self.watchlist[key]
-                
-                self._save_watchlist()
-                self.logger.info(f"Removed from watchlist: {item.token_symbol}")
+            if record is not None:
+                self._parsed.pop(key, None)
+                self.logger.info(f"Removed from watchlist: {record.get('token_symbol')}")
                 return True
             else:
                 self.logger.warning(f"Token not found in watchlist: {token_address}")
@@ -280,8 +315,9 @@ class WatchlistManager:
             Watchlist item if found, None otherwise
         """
         try:
-            key = f"{chain}:{token_address}"
-            return self.watchlist.get(key)
+            key = watchlist_key(chain, token_address)
+            record = self.store.get(self.user_id, key)
+            return self._item(key, record) if record is not None else None
             
         except Exception as e:
             self.logger.error(f"Failed to get watchlist item: {e}")
@@ -305,13 +341,14 @@ class WatchlistManager:
             True if updated successfully, False otherwise
         """
         try:
-            key = f"{chain}:{token_address}"
+            key = watchlist_key(chain, token_address)
+            record = self.store.get(self.user_id, key)
             
-            if key not in self.watchlist:
+            if record is None:
                 self.logger.warning(f"Watchlist item not found: {token_address}")
                 return False
             
-            item = self.watchlist[key]
+            item = WatchlistItem.from_dict(record)
             
             # Update allowed fields
             allowed_updates = [
@@ -325,7 +362,7 @@ class WatchlistManager:
                     setattr(item, field, value)
             
             item.last_updated = datetime.now()
-            self._save_watchlist()
+            self.store.put(self.user_id, key, item.to_dict())
             
             self.logger.info(f"Updated watchlist item: {item.token_symbol}")
             return True
@@ -337,22 +374,23 @@ class WatchlistManager:
     def get_stats(self) -> Dict[str, Any]:
         """Get watchlist statistics."""
         try:
-            total = len(self.watchlist)
+            records = self.store.items(self.user_id)
+            total = len(records)
             by_status = {}
             by_chain = {}
             by_risk = {}
             
-            for item in self.watchlist.values():
+            for record in records:
                 # Count by status
-                status = item.status.value
+                status = record.get('status', WatchlistStatus.WATCHING.value)
                 by_status[status] = by_status.get(status, 0) + 1
                 
                 # Count by chain
-                chain = item.chain
+                chain = record.get('chain')
                 by_chain[chain] = by_chain.get(chain, 0) + 1
                 
                 # Count by risk level
-                risk = item.risk_level
+                risk = record.get('risk_level')
                 by_risk[risk] = by_risk.get(risk, 0) + 1
             
             return {
@@ -360,6 +398,7 @@ class WatchlistManager:
                 'by_status': by_status,
                 'by_chain': by_chain,
                 'by_risk_level': by_risk,
+                'storage': self.store.get_stats(),
                 'last_updated': datetime.now().isoformat()
             }
             
@@ -369,4 +408,4 @@ class WatchlistManager:
 
 
 # Global watchlist manager instance
-watchlist_manager = WatchlistManager()
\ No newline at end of file
+watchlist_manager = WatchlistManager()
@@ -0,0 +1,463 @@
+# models/watchlist_store.py
+"""
+Watchlist storage engine shared by every watchlist interface.
+Records live in an in-memory hash index (user -> key -> record), so reads
+never touch disk. Each mutation appends one line to an operation journal;
+fsyncs are batched by count and time, and the journal is compacted into a
+snapshot once it grows well past the live data. Replaying the journal over
+any later snapshot gives the same state, so a crash between writing the
+snapshot and truncating the journal is harmless. The store has one writer;
+other processes sharing the files call refresh() to tail the journal.
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import logger_manager
+
+
+DEFAULT_USER = "default"
+
+
+def watchlist_key(chain: str, token_address: str) -> str:
+    """
+    Record key for a token.
+
+    Args:
+        chain: Chain name (case-insensitive)
+        token_address: Token address (kept as-is; Solana addresses are case-sensitive)
+
+    Returns:
+        Key of the form chain:address
+    """
+    return f"{str(chain).lower()}:{token_address}"
+
+
+class WatchlistStore:
+    """Journaled in-memory watchlist records for multiple users."""
+
+    def __init__(
+        self,
+        base_path: str = "data/watchlist",
+        fsync_interval: float = 1.0,
+        fsync_batch: int = 64,
+        compact_min_ops: int = 1000
+    ) -> None:
+        """
+        Initialize the store; the snapshot and journal are loaded on first use.
+
+        Args:
+            base_path: Path prefix for the .snapshot.json and .journal files
+            fsync_interval: Seconds an appended operation may stay unsynced
+            fsync_batch: Unsynced operations that force an fsync
+            compact_min_ops: Journal length below which compaction never runs
+        """
+        self.logger = logger_manager.get_logger("WatchlistStore")
+        self.snapshot_path = f"{base_path}.snapshot.json"
+        self.journal_path = f"{base_path}.journal"
+        self.fsync_interval = fsync_interval
+        self.fsync_batch = fsync_batch
+        self.compact_min_ops = compact_min_ops
+
+        self._records: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._by_address: Dict[str, Dict[str, str]] = {}
+        self._meta: Dict[str, Any] = {}
+        self.loaded = False
+
+        self.journal_ops = 0
+        self.unsynced = 0
+        self.writes = 0
+        self.fsyncs = 0
+        self.compactions = 0
+        self.last_fsync = time.monotonic()
+
+        self._journal = None
+        self._journal_offset = 0
+        self._torn_bytes = 0
+        self._snapshot_mtime: Optional[float] = None
+        self._sync_handle: Optional[asyncio.TimerHandle] = None
+        self.listeners: List[Callable[[Optional[str], Optional[str], Optional[Dict[str, Any]]], None]] = []
+        self._loading = False
+
+    # Loading
+
+    # Files are only opened on first use, so importing this module has no side effects
+    @property
+    def records(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Records by user, then by key."""
+        if not self.loaded:
+            self._load()
+        return self._records
+
+    @property
+    def by_address(self) -> Dict[str, Dict[str, str]]:
+        """Record keys by user, then by token address."""
+        if not self.loaded:
+            self._load()
+        return self._by_address
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        """Store-level flags."""
+        if not self.loaded:
+            self._load()
+        return self._meta
+
+    def _load(self) -> None:
+        """Load the snapshot, replay the journal and open it for appending."""
+        self.loaded = True
+        self._records = {}
+        self._by_address = {}
+        self._meta = {}
+        self.journal_ops = 0
+        self._journal_offset = 0
+        self._torn_bytes = 0
+        self._loading = True
+
+        try:
+            directory = os.path.dirname(self.snapshot_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    snapshot = json.load(f)
+                self._meta = snapshot.get('meta', {})
+                for user, records in snapshot.get('users', {}).items():
+                    for key, record in records.items():
+                        self._apply({"op": "put", "user": user, "key": key, "value": record})
+                self._snapshot_mtime = os.path.getmtime(self.snapshot_path)
+            else:
+                self._snapshot_mtime = None
+
+            self._replay_journal()
+
+        except Exception as e:
+            self.logger.error(f"Failed to load watchlist store: {e}")
+        finally:
+            self._loading = False
+
+        if self._journal is None:
+            self._journal = open(self.journal_path, 'ab')
+
+        self.logger.info(
+            f"Watchlist store loaded: {self.count()} records for {len(self.records)} user(s), "
+            f"{self.journal_ops} journal operations"
+        )
+        self._notify_listeners(None, None, None)
+
+    def _replay_journal(self) -> None:
+        """Apply complete journal lines after the current offset."""
+        if not os.path.exists(self.journal_path):
+            return
+
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self._journal_offset)
+            data = f.read()
+
+        consumed = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b'\n'):
+                break  # Partially written by a concurrent writer or a crash
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError) as e:
+                self.logger.warning(f"Skipping corrupt watchlist journal entry: {e}")
+            consumed += len(line)
+            self.journal_ops += 1
+
+        self._journal_offset += consumed
+        self._torn_bytes = len(data) - consumed
+
+    def refresh(self) -> None:
+        """Pick up operations appended (or a compaction done) by another process."""
+        if not self.loaded:
+            self._load()
+            return
+        try:
+            snapshot_mtime = os.path.getmtime(self.snapshot_path) if os.path.exists(self.snapshot_path) else None
+            journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+
+            if snapshot_mtime != self._snapshot_mtime or journal_size < self._journal_offset:
+                self._load()
+            elif journal_size > self._journal_offset:
+                self._replay_journal()
+
+        except Exception as e:
+            self.logger.error(f"Failed to refresh watchlist store: {e}")
+
+    # Change notification
+
+    def add_listener(
+        self,
+        callback: Callable[[Optional[str], Optional[str], Optional[Dict[str, Any]]], None]
+    ) -> None:
+        """
+        Register a callback for record changes.
+
+        Args:
+            callback: Called as (user, key, record) after a put, with record None
+                after a delete, key None after a user's records were cleared and
+                user None after the whole store was (re)loaded
+        """
+        self.listeners.append(callback)
+
+    def _notify_listeners(
+        self,
+        user: Optional[str],
+        key: Optional[str],
+        record: Optional[Dict[str, Any]]
+    ) -> None:
+        """Notify registered listeners of a change."""
+        if self._loading:
+            return  # A single reload notification follows
+        for callback in self.listeners:
+            try:
+                callback(user, key, record)
+            except Exception as e:
+                self.logger.error(f"Watchlist store listener failed: {e}")
+
+    # Mutations
+
+    def _apply(self, operation: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply one operation to the in-memory index.
+
+        Args:
+            operation: put, delete, clear or meta operation
+
+        Returns:
+            The record that was replaced or deleted, if any
+        """
+        op = operation["op"]
+
+        if op == "meta":
+            self.meta[operation["key"]] = operation.get("value")
+            return None
+
+        user = operation["user"]
+        records = self.records.setdefault(user, {})
+        addresses = self.by_address.setdefault(user, {})
+
+        if op == "put":
+            key = operation["key"]
+            record = operation["value"]
+            previous = records.pop(key, None)
+            if previous is not None and previous.get('token_address') != record.get('token_address'):
+                addresses.pop(previous.get('token_address'), None)
+            records[key] = record
+            if record.get('token_address'):
+                addresses[record['token_address']] = key
+            self._notify_listeners(user, key, record)
+            return previous
+
+        if op == "delete":
+            previous = records.pop(operation["key"], None)
+            if previous is not None:
+                addresses.pop(previous.get('token_address'), None)
+                self._notify_listeners(user, operation["key"], None)
+            return previous
+
+        if op == "clear":
+            records.clear()
+            addresses.clear()
+            self._notify_listeners(user, None, None)
+            return None
+
+        raise KeyError(f"Unknown watchlist operation: {op}")
+
+    def _append(self, operation: Dict[str, Any]) -> None:
+        """Journal an operation; one small write per mutation."""
+        line = (json.dumps(operation, separators=(',', ':'), default=str) + "\n").encode('utf-8')
+        if self._torn_bytes:
+            # Terminate a torn tail so replay skips it instead of merging it with this line
+            line = b"\n" + line
+            self._journal_offset += self._torn_bytes
+            self._torn_bytes = 0
+        self._journal.write(line)
+        self._journal.flush()
+        self._journal_offset += len(line)
+        self.journal_ops += 1
+        self.unsynced += 1
+        self.writes += 1
+
+        self._maybe_sync()
+        if self.journal_ops >= max(self.compact_min_ops, 2 * self.count()):
+            self.compact()
+
+    def put(self, user: str, key: str, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Insert or replace a record. Records are treated as immutable: put a new
+        dict rather than changing one returned by get().
+
+        Args:
+            user: User id
+            key: Record key (see watchlist_key)
+            record: JSON-serializable record
+
+        Returns:
+            The replaced record, if any
+        """
+        operation = {"op": "put", "user": user, "key": key, "value": record}
+        previous = self._apply(operation)
+        self._append(operation)
+        return previous
+
+    def delete(self, user: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Delete a record.
+
+        Args:
+            user: User id
+            key: Record key
+
+        Returns:
+            The deleted record, or None if it did not exist
+        """
+        if key not in self.records.get(user, {}):
+            return None
+        operation = {"op": "delete", "user": user, "key": key}
+        previous = self._apply(operation)
+        self._append(operation)
+        return previous
+
+    def clear(self, user: str) -> int:
+        """
+        Delete all of a user's records.
+
+        Args:
+            user: User id
+
+        Returns:
+            Number of records deleted
+        """
+        count = self.count(user)
+        if count:
+            operation = {"op": "clear", "user": user}
+            self._apply(operation)
+            self._append(operation)
+        return count
+
+    def set_meta(self, name: str, value: Any) -> None:
+        """Persist a store-level flag (e.g. that a legacy file was imported)."""
+        operation = {"op": "meta", "key": name, "value": value}
+        self._apply(operation)
+        self._append(operation)
+
+    # Durability
+
+    def _maybe_sync(self) -> None:
+        """fsync when the batch is full or the oldest unsynced write is due."""
+        if self.unsynced >= self.fsync_batch or time.monotonic() - self.last_fsync >= self.fsync_interval:
+            self.sync()
+            return
+
+        if self._sync_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._sync_handle = loop.call_later(self.fsync_interval, self.sync)
+
+    def sync(self) -> None:
+        """fsync the journal now."""
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        if not self.unsynced or self._journal is None:
+            return
+        try:
+            os.fsync(self._journal.fileno())
+            self.fsyncs += 1
+        except Exception as e:
+            self.logger.error(f"Failed to sync watchlist journal: {e}")
+        self.unsynced = 0
+        self.last_fsync = time.monotonic()
+
+    def compact(self) -> None:
+        """Write all live records to a new snapshot and truncate the journal."""
+        try:
+            snapshot = {
+                'version': 1,
+                'saved_at': time.time(),
+                'meta': self.meta,
+                'users': self.records
+            }
+            temp_path = f"{self.snapshot_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'), ensure_ascii=False, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+
+            self._journal.close()
+            self._journal = open(self.journal_path, 'wb')
+            os.fsync(self._journal.fileno())
+
+            self._snapshot_mtime = os.path.getmtime(self.snapshot_path)
+            self._journal_offset = 0
+            self._torn_bytes = 0
+            self.journal_ops = 0
+            self.unsynced = 0
+            self.compactions += 1
+            self.logger.debug(f"Compacted watchlist store: {self.count()} records")
+
+        except Exception as e:
+            self.logger.error(f"Failed to compact watchlist store: {e}")
+
+    def close(self) -> None:
+        """Sync and close the journal."""
+        self.sync()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    # Reads
+
+    def get(self, user: str, key: str) -> Optional[Dict[str, Any]]:
+        """Record by key, or None."""
+        return self.records.get(user, {}).get(key)
+
+    def find_key(self, user: str, token_address: str) -> Optional[str]:
+        """Key of the user's record for a token address on any chain."""
+        return self.by_address.get(user, {}).get(token_address)
+
+    def items(self, user: str) -> List[Dict[str, Any]]:
+        """A user's records, oldest first."""
+        return list(self.records.get(user, {}).values())
+
+    def oldest_key(self, user: str) -> Optional[str]:
+        """Key of the user's oldest record."""
+        return next(iter(self.records.get(user, {})), None)
+
+    def count(self, user: Optional[str] = None) -> int:
+        """Records of one user, or of all users."""
+        if user is not None:
+            return len(self.records.get(user, {}))
+        return sum(len(records) for records in self.records.values())
+
+    def get_meta(self, name: str) -> Any:
+        """Store-level flag set with set_meta."""
+        return self.meta.get(name)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size and I/O statistics."""
+        return {
+            'users': len(self.records),
+            'records': self.count(),
+            'journal_ops': self.journal_ops,
+            'journal_bytes': self._journal_offset,
+            'unsynced': self.unsynced,
+            'writes': self.writes,
+            'fsyncs': self.fsyncs,
+            'compactions': self.compactions
+        }
+
+
+# Global watchlist store instance
+watchlist_store = WatchlistStore()
+atexit.register(watchlist_store.sync)
@@ -5,13 +5,14 @@ Similar to Ethereum but optimized for Base chain characteristics.
 
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from web3 import Web3
 from web3.contract import Contract
 
 from models.token import TokenInfo, LiquidityInfo, TradingOpportunity, ContractAnalysis, SocialMetrics
 from monitors.base_monitor import BaseMonitor
 from config.chains import multichain_settings, ChainType
+from utils.replay_io import create_web3
 
 class BaseChainMonitor(BaseMonitor):
     """
@@ -19,6 +20,8 @@ class BaseChainMonitor(BaseMonitor):
     Uses same logic as Ethereum but with Base-specific configuration.
     """
     
+    replay_handlers = frozenset({'_process_pair_created_event'})
+    
     def __init__(self, check_interval: float = 2.0):  # Faster blocks on Base
         """Initialize the Base chain monitor."""
         super().__init__("BaseChain", check_interval)
@@ -54,15 +57,10 @@ class BaseChainMonitor(BaseMonitor):
     async def _initialize(self) -> None:
         """Initialize Web3 connection for Base chain."""
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.chain_config.rpc_url))
+            self.w3 = create_web3(self.chain_config.rpc_url, 'BASE')
             
-            if not self.w3.is_connected():
-                raise ConnectionError("Failed to connect to Base chain")
-                
-            # Verify we're on the right chain
-            chain_id = self.w3.eth.chain_id
-            if chain_id != self.chain_config.chain_id:
-                raise ValueError(f"Expected chain {self.chain_config.chain_id}, got {chain_id}")
+            # Blocking handshake runs in a worker thread
+            chain_id, current_block = await asyncio.to_thread(self._connect)
                 
             self.logger.info(f"Connected to {self.chain_config.name} (Chain ID: {chain_id})")
             
@@ -73,13 +71,29 @@ class BaseChainMonitor(BaseMonitor):
             )
             
             # Start from recent block
-            self.last_block_checked = self.w3.eth.block_number - 5
+            self.last_block_checked = current_block - 5
             self.logger.info(f"Starting from block {self.last_block_checked}")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Base chain: {e}")
             raise
             
+    def _connect(self) -> Tuple[int, int]:
+        """
+        Check the connection and chain ID (blocking).
+        
+        Returns:
+            Tuple of (chain ID, current block number)
+        """
+        if not self.w3.is_connected():
+            raise ConnectionError("Failed to connect to Base chain")
+            
+        # Verify we're on the right chain
+        chain_id = self.w3.eth.chain_id
+        if chain_id != self.chain_config.chain_id:
+            raise ValueError(f"Expected chain {self.chain_config.chain_id}, got {chain_id}")
+        return chain_id, self.w3.eth.block_number
+            
     async def _check(self) -> None:
         """Check for new token pairs on Base chain."""
         try:
@@ -88,7 +102,7 @@ class BaseChainMonitor(BaseMonitor):
             if current_block <= self.last_block_checked:
                 return
                 
-            self.logger.debug(f"Checking Base blocks {self.last_block_checked + 1} to {current_block}")
+            self.logger.debug("Checking Base blocks %s to %s", self.last_block_checked + 1, current_block)
             
             # Get PairCreated events
             events = await self._get_pair_created_events(
@@ -97,6 +111,7 @@ class BaseChainMonitor(BaseMonitor):
             )
             
             for event in events:
+                self._record_input('_process_pair_created_event', event)
                 await self._process_pair_created_event(event)
                 
             self.last_block_checked = current_block
@@ -126,7 +141,7 @@ class BaseChainMonitor(BaseMonitor):
             if not to_block_hex.startswith('0x'):
                 to_block_hex = '0x' + to_block_hex.lstrip('0x')
                 
-            self.logger.debug(f"Base chain query: blocks {from_block_hex} to {to_block_hex}")
+            self.logger.debug("Base chain query: blocks %s to %s", from_block_hex, to_block_hex)
             
             # Try the request with carefully formatted parameters
             filter_params = {
@@ -253,7 +268,7 @@ class BaseChainMonitor(BaseMonitor):
                 self.logger.debug(f"Trying Base RPC: {rpc_url}")
                 
                 # Create temporary Web3 instance with alternative RPC
-                temp_w3 = Web3(Web3.HTTPProvider(rpc_url))
+                temp_w3 = create_web3(rpc_url, 'BASE')
                 
                 if not temp_w3.is_connected():
                     continue
@@ -320,7 +335,7 @@ class BaseChainMonitor(BaseMonitor):
             self.processed_pairs.add(pair_address)
             
             self.logger.info(f"Processing new Base pair: {pair_address}")
-            self.logger.debug(f"Base Token0: {token0_address}, Token1: {token1_address}")
+            self.logger.debug("Base Token0: %s, Token1: %s", token0_address, token1_address)
             
             # Identify new token (exclude WETH and stablecoins)
             excluded_tokens = [self.chain_config.wrapped_native] + self.chain_config.stable_tokens
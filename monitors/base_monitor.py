@@ -11,12 +11,17 @@ from datetime import datetime
 from typing import Optional, Callable, Any
 import traceback
 
+from utils.event_recorder import event_recorder
+
 class BaseMonitor(ABC):
     """
     Abstract base class for all monitoring components.
     Provides common functionality like error handling, retry logic, and logging.
     """
     
+    # Processing methods that raw inputs are recorded against and replayed into
+    replay_handlers: frozenset = frozenset()
+    
     def __init__(self, name: str, check_interval: float = 1.0):
         """
         Initialize the base monitor.
@@ -34,6 +39,10 @@ class BaseMonitor(ABC):
         self.last_check: Optional[datetime] = None
         self.callbacks: list[Callable] = []
         
+        # Readiness signals: connected and initialized, first check completed
+        self.ready_event = asyncio.Event()
+        self.scanning_event = asyncio.Event()
+        
     def add_callback(self, callback: Callable) -> None:
         """Add a callback function to be called when opportunities are found."""
         self.callbacks.append(callback)
@@ -51,6 +60,7 @@ class BaseMonitor(ABC):
         
         try:
             await self._initialize()
+            self.ready_event.set()
             await self._run_monitoring_loop()
         except Exception as e:
             self.logger.error(f"Fatal error in {self.name} monitor: {e}")
@@ -76,6 +86,7 @@ class BaseMonitor(ABC):
                 
                 self.last_check = datetime.now()
                 self.error_count = 0  # Reset error count on successful check
+                self.scanning_event.set()
                 
                 # Calculate how long to sleep
                 elapsed = (datetime.now() - start_time).total_seconds()
@@ -121,6 +132,29 @@ class BaseMonitor(ABC):
             except Exception as e:
                 self.logger.error(f"Error in callback {callback.__name__}: {e}")
                 
+    def _record_input(self, handler: str, *args: Any) -> None:
+        """
+        Record a raw input just before it is handed to a processing method.
+        
+        Args:
+            handler: Name of the processing method (must be in replay_handlers)
+            *args: Arguments passed to the method
+        """
+        if event_recorder.enabled:
+            event_recorder.record_input(self.name, handler, list(args))
+            
+    async def replay_input(self, handler: str, args: list) -> None:
+        """
+        Feed a recorded input through the same processing method as live data.
+        
+        Args:
+            handler: Recorded processing method name
+            args: Recorded arguments
+        """
+        if handler not in self.replay_handlers:
+            raise ValueError(f"{self.name} monitor cannot replay '{handler}'")
+        await getattr(self, handler)(*args)
+        
     @abstractmethod
     async def _initialize(self) -> None:
         """Initialize the monitor. Override in subclasses."""
@@ -141,6 +175,7 @@ class BaseMonitor(ABC):
         return {
             'name': self.name,
             'is_running': self.is_running,
+            'ready': self.ready_event.is_set(),
             'error_count': self.error_count,
             'last_check': self.last_check.isoformat() if self.last_check else None,
             'check_interval': self.check_interval
@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional
 
 from models.token import LiquidityInfo, TradingOpportunity, ContractAnalysis, SocialMetrics
 from monitors.base_monitor import BaseMonitor
+from utils.replay_io import create_http_session
 
 class JupiterSolanaMonitor(BaseMonitor):
     """
@@ -19,6 +20,8 @@ class JupiterSolanaMonitor(BaseMonitor):
     Works around Pump.fun API overload issues.
     """
     
+    replay_handlers = frozenset({'_process_solana_token'})
+    
     def __init__(self, check_interval: float = 3.0):  # Slower to be respectful
         """Initialize the Jupiter-based Solana monitor."""
         super().__init__("JupiterSolana", check_interval)
@@ -30,6 +33,7 @@ class JupiterSolanaMonitor(BaseMonitor):
         self.jupiter_api = "https://quote-api.jup.ag/v6"
         self.solana_rpc = "https://api.mainnet-beta.solana.com"
         self.birdeye_api = "https://public-api.birdeye.so/defi"
+        self.token_list_url = "https://token.jup.ag/strict"
         
         # Well-known Solana tokens to filter against
         self.known_tokens = {
@@ -41,8 +45,7 @@ class JupiterSolanaMonitor(BaseMonitor):
     async def _initialize(self) -> None:
         """Initialize Jupiter connections."""
         try:
-            timeout = aiohttp.ClientTimeout(total=15)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_http_session(15)
             
             # Test Jupiter connection
             await self._test_jupiter_connection()
@@ -134,6 +137,7 @@ class JupiterSolanaMonitor(BaseMonitor):
                     self.logger.info(f"Found {len(new_tokens)} active Solana tokens via Birdeye")
                     
                 for token_data in new_tokens:
+                    self._record_input('_process_solana_token', token_data, "Birdeye")
                     await self._process_solana_token(token_data, "Birdeye")
                     
         except asyncio.TimeoutError:
@@ -156,7 +160,7 @@ class JupiterSolanaMonitor(BaseMonitor):
         """Monitor Jupiter for token list updates."""
         try:
             # Get Jupiter's strict token list (verified tokens)
-            url = "https://token.jup.ag/strict"
+            url = self.token_list_url
             
             async with self.session.get(url) as response:
                 if response.status != 200:
@@ -178,6 +182,7 @@ class JupiterSolanaMonitor(BaseMonitor):
                     self.logger.info(f"Found {len(new_tokens)} new verified tokens via Jupiter")
                     
                 for token_data in new_tokens:
+                    self._record_input('_process_solana_token', token_data, "Jupiter")
                     await self._process_solana_token(token_data, "Jupiter")
                     
         except Exception as e:
@@ -14,6 +14,7 @@ from web3.contract import Contract
 from models.token import TokenInfo, LiquidityInfo, TradingOpportunity, ContractAnalysis, SocialMetrics
 from monitors.base_monitor import BaseMonitor
 from config.settings import settings
+from utils.replay_io import create_web3, create_http_session
 
 class NewTokenMonitor(BaseMonitor):
     """
@@ -21,6 +22,8 @@ class NewTokenMonitor(BaseMonitor):
     Currently supports Uniswap V2 with plans for V3 and other DEXs.
     """
     
+    replay_handlers = frozenset({'_process_pair_created_event'})
+    
     def __init__(self, check_interval: float = 5.0):
         """Initialize the new token monitor."""
         super().__init__("NewToken", check_interval)
@@ -59,12 +62,10 @@ class NewTokenMonitor(BaseMonitor):
     async def _initialize(self) -> None:
         """Initialize Web3 connection and contracts."""
         try:
-            # Initialize Web3
-            self.w3 = Web3(Web3.HTTPProvider(settings.networks.ethereum_rpc_url))
+            # Initialize Web3; the blocking handshake runs in a worker thread
+            self.w3 = create_web3(settings.networks.ethereum_rpc_url, 'ETHEREUM')
+            current_block = await asyncio.to_thread(self._connect)
             
-            if not self.w3.is_connected():
-                raise ConnectionError("Failed to connect to Ethereum node")
-                
             self.logger.info("Connected to Ethereum node")
             
             # Initialize Uniswap Factory contract
@@ -74,17 +75,27 @@ class NewTokenMonitor(BaseMonitor):
             )
             
             # Initialize HTTP session
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_http_session(30)
             
-            # Get current block number
-            self.last_block_checked = self.w3.eth.block_number - 10  # Start 10 blocks back
+            # Start 10 blocks back
+            self.last_block_checked = current_block - 10
             self.logger.info(f"Starting from block {self.last_block_checked}")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize: {e}")
             raise
             
+    def _connect(self) -> int:
+        """
+        Check the node connection (blocking).
+        
+        Returns:
+            Current block number
+        """
+        if not self.w3.is_connected():
+            raise ConnectionError("Failed to connect to Ethereum node")
+        return self.w3.eth.block_number
+            
     async def _check(self) -> None:
         """Check for new token pairs created."""
         try:
@@ -93,7 +104,7 @@ class NewTokenMonitor(BaseMonitor):
             if current_block <= self.last_block_checked:
                 return
                 
-            self.logger.debug(f"Checking blocks {self.last_block_checked + 1} to {current_block}")
+            self.logger.debug("Checking blocks %s to %s", self.last_block_checked + 1, current_block)
             
             # Get PairCreated events from recent blocks
             events = await self._get_pair_created_events(
@@ -102,6 +113,7 @@ class NewTokenMonitor(BaseMonitor):
             )
             
             for event in events:
+                self._record_input('_process_pair_created_event', event)
                 await self._process_pair_created_event(event)
                 
             self.last_block_checked = current_block
@@ -137,7 +149,7 @@ class NewTokenMonitor(BaseMonitor):
                 'topics': [event_signature]
             }
             
-            self.logger.debug(f"Getting logs with params: fromBlock={from_block_hex}, toBlock={to_block_hex}")
+            self.logger.debug("Getting logs with params: fromBlock=%s, toBlock=%s", from_block_hex, to_block_hex)
             
             logs = self.w3.eth.get_logs(filter_params)
             
@@ -257,7 +269,7 @@ class NewTokenMonitor(BaseMonitor):
             self.processed_pairs.add(pair_address)
             
             self.logger.info(f"Processing new pair: {pair_address}")
-            self.logger.debug(f"Token0: {token0_address}, Token1: {token1_address}")
+            self.logger.debug("Token0: %s, Token1: %s", token0_address, token1_address)
             
             # FOR TESTING: Show ALL pairs, not just WETH pairs
             # Determine which token is the new one (not WETH/USDC/USDT)
@@ -340,7 +352,7 @@ class NewTokenMonitor(BaseMonitor):
                 total_supply=total_supply
             )
             
-            self.logger.debug(f"Token info: {symbol} ({name}) - {token_address}")
+            self.logger.debug("Token info: %s (%s) - %s", symbol, name, token_address)
             return token_info
             
         except Exception as e:
@@ -14,6 +14,7 @@ import base58
 from models.token import TokenInfo, LiquidityInfo, TradingOpportunity, ContractAnalysis, SocialMetrics
 from monitors.base_monitor import BaseMonitor
 from config.chains import multichain_settings
+from utils.replay_io import create_http_session
 
 class SolanaMonitor(BaseMonitor):
     """
@@ -21,6 +22,8 @@ class SolanaMonitor(BaseMonitor):
     Focuses on Pump.fun for new token detection and Raydium for DEX pairs.
     """
     
+    replay_handlers = frozenset({'_process_pump_fun_token'})
+    
     def __init__(self, check_interval: float = 1.0):  # Very fast for Solana
         """Initialize the Solana monitor."""
         super().__init__("Solana", check_interval)
@@ -34,8 +37,7 @@ class SolanaMonitor(BaseMonitor):
         """Initialize Solana connections."""
         try:
             # Initialize HTTP session
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            self.session = create_http_session(10)
             
             # Test connection to Pump.fun API
             await self._test_pump_fun_connection()
@@ -123,6 +125,7 @@ class SolanaMonitor(BaseMonitor):
                     self.logger.info(f"Found {len(new_tokens)} new Pump.fun tokens")
                     
                 for token_data in new_tokens:
+                    self._record_input('_process_pump_fun_token', token_data)
                     await self._process_pump_fun_token(token_data)
                     
         except asyncio.TimeoutError:
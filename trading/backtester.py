@@ -0,0 +1,556 @@
+"""
+Backtesting engine for entry scoring, position sizing and exit rules.
+Replays recorded launches with their Sync reserve histories, simulates
+constant-product slippage, gas and stop-loss/take-profit/max-hold exits, and
+runs parameter sweeps across a process pool.
+
+Usage:
+    python -m trading.backtester launches.jsonl.gz [--workers 8]
+"""
+
+from typing import Dict, List, Optional, Tuple, Any, Iterable
+from decimal import Decimal
+from dataclasses import dataclass, field, asdict, replace
+from datetime import timedelta
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import heapq
+import itertools
+import json
+import os
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from analyzers.trading_scorer import TradingScorer
+from models.token import RiskLevel
+from trading.portfolio_tracker import PerformanceMetrics
+from utils.logger import logger_manager
+
+
+# Scoring component order of LaunchRecord.components
+SCORE_COMPONENTS = ('contract_safety', 'social_sentiment', 'liquidity_quality', 'timing_factors')
+
+# Gas per swap in USD when a parameter set does not override it
+DEFAULT_GAS_COST_USD = {
+    'ETHEREUM': 15.0,
+    'BASE': 0.10,
+    'SOLANA': 0.01
+}
+
+
+@dataclass
+class LaunchRecord:
+    """
+    A recorded launch with its scoring inputs and reserve history.
+
+    Reserves come from the pair's Sync events: `sync_times` in epoch seconds,
+    `reserve_token` and `reserve_quote` in whole units, `quote_usd` the USD
+    price of the quote asset (WETH/SOL/stable) over the window.
+    """
+    token_address: str
+    symbol: str
+    chain: str
+    launch_time: float
+    risk_level: str
+    components: Dict[str, float]
+    sync_times: Any
+    reserve_token: Any
+    reserve_quote: Any
+    quote_usd: float = 1.0
+
+
+@dataclass
+class BacktestParams:
+    """One parameter set; defaults mirror the live system."""
+    name: str = "default"
+    scoring_weights: Dict[str, float] = field(default_factory=lambda: {
+        'contract_safety': 0.40,
+        'social_sentiment': 0.25,
+        'liquidity_quality': 0.20,
+        'timing_factors': 0.15
+    })
+    entry_actions: Tuple[str, ...] = ('STRONG_BUY',)
+    max_position_usd: float = 500.0
+    min_liquidity_ratio: float = 0.05
+    max_open_positions: int = 10
+    entry_delay_seconds: float = 12.0
+    stop_loss_pct: float = 0.15
+    take_profit_pct: float = 0.30
+    max_hold_hours: float = 24.0
+    swap_fee: float = 0.003
+    gas_cost_usd: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_GAS_COST_USD))
+
+
+@dataclass
+class SimulatedTrade:
+    """One simulated round trip."""
+    token_address: str
+    chain: str
+    entry_time: float
+    exit_time: float
+    cost_usd: float
+    proceeds_usd: float
+    gas_usd: float
+    exit_reason: str
+
+    @property
+    def pnl_usd(self) -> float:
+        """Realized P&L before gas."""
+        return self.proceeds_usd - self.cost_usd
+
+
+@dataclass
+class BacktestResult:
+    """Metrics and trades for one parameter set."""
+    params: BacktestParams
+    metrics: PerformanceMetrics
+    trades: List[SimulatedTrade]
+    launches_evaluated: int
+    elapsed_seconds: float
+
+
+def load_launches(path: str) -> List[LaunchRecord]:
+    """
+    Load launches from a gzip JSON-lines file.
+
+    Each line holds the LaunchRecord fields, with `sync` as a list of
+    [timestamp, reserve_token, reserve_quote] rows in time order.
+
+    Args:
+        path: Dataset file
+
+    Returns:
+        Launch records sorted by launch time, reserves as NumPy arrays
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy is required for backtesting")
+
+    launches = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            sync = np.asarray(item.get('sync') or [], dtype=np.float64).reshape(-1, 3)
+            launches.append(LaunchRecord(
+                token_address=item['token_address'],
+                symbol=item.get('symbol', ''),
+                chain=item.get('chain', 'ETHEREUM').upper(),
+                launch_time=float(item['launch_time']),
+                risk_level=item.get('risk_level', RiskLevel.MEDIUM.value),
+                components={name: float(item['components'].get(name, 0.0)) for name in SCORE_COMPONENTS},
+                sync_times=sync[:, 0],
+                reserve_token=sync[:, 1],
+                reserve_quote=sync[:, 2],
+                quote_usd=float(item.get('quote_usd', 1.0))
+            ))
+
+    launches.sort(key=lambda launch: launch.launch_time)
+    return launches
+
+
+def save_launches(path: str, launches: Iterable[LaunchRecord]) -> None:
+    """
+    Write launches in the format read by load_launches.
+
+    Args:
+        path: Output file
+        launches: Launch records
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with gzip.open(path, 'wt', encoding='utf-8') as f:
+        for launch in launches:
+            f.write(json.dumps({
+                'token_address': launch.token_address,
+                'symbol': launch.symbol,
+                'chain': launch.chain,
+                'launch_time': launch.launch_time,
+                'risk_level': launch.risk_level,
+                'components': launch.components,
+                'sync': [
+                    [float(t), float(r_token), float(r_quote)]
+                    for t, r_token, r_quote in zip(launch.sync_times, launch.reserve_token, launch.reserve_quote)
+                ],
+                'quote_usd': launch.quote_usd
+            }, separators=(',', ':')) + '\n')
+
+
+def parameter_grid(base: BacktestParams, **ranges: Iterable[Any]) -> List[BacktestParams]:
+    """
+    Build the cartesian product of parameter ranges.
+
+    Args:
+        base: Parameter set providing the values that are not swept
+        **ranges: Field name -> candidate values
+
+    Returns:
+        One BacktestParams per combination, named after its swept values
+    """
+    names = list(ranges)
+    grid = []
+    for values in itertools.product(*(ranges[name] for name in names)):
+        overrides = dict(zip(names, values))
+        label = ",".join(f"{name}={value}" for name, value in overrides.items()) or base.name
+        grid.append(replace(base, name=label, **overrides))
+    return grid
+
+
+def _amm_out(amount_in: Any, reserve_in: Any, reserve_out: Any, fee: float) -> Any:
+    """Constant-product output amount for a swap (works on scalars and arrays)."""
+    amount_in_after_fee = amount_in * (1.0 - fee)
+    return reserve_out * amount_in_after_fee / (reserve_in + amount_in_after_fee)
+
+
+def _chain_gas(params: BacktestParams, chain: str) -> float:
+    """Gas per swap for a chain label (SOLANA-PUMP uses the SOLANA entry)."""
+    family = 'SOLANA' if chain.startswith('SOLANA') else chain
+    return params.gas_cost_usd.get(chain, params.gas_cost_usd.get(family, 0.0))
+
+
+def simulate_launch(launch: LaunchRecord, params: BacktestParams, size_fraction: float) -> Optional[SimulatedTrade]:
+    """
+    Simulate one entry and exit against the launch's reserve history.
+
+    The buy is executed against the reserves in force after the entry delay.
+    Later reserves are shifted by the bought amounts, so the path reflects
+    our own price impact. Exits trigger on the spot price like PositionManager
+    and are filled with the AMM output at that reserve state.
+
+    Args:
+        launch: Launch record
+        params: Parameter set
+        size_fraction: Position size fraction from the recommendation tier
+
+    Returns:
+        Simulated trade, or None if no entry was possible
+    """
+    times = launch.sync_times
+    if len(times) == 0:
+        return None
+
+    entry_time = launch.launch_time + params.entry_delay_seconds
+    start = int(np.searchsorted(times, entry_time, side='right')) - 1
+    if start < 0:
+        start = 0
+    reserve_token = launch.reserve_token[start:]
+    reserve_quote = launch.reserve_quote[start:]
+    path_times = times[start:]
+    if reserve_token[0] <= 0 or reserve_quote[0] <= 0:
+        return None
+
+    # Size: tier fraction of the position cap, limited to a share of pool liquidity
+    liquidity_usd = 2.0 * reserve_quote[0] * launch.quote_usd
+    size_usd = min(params.max_position_usd * size_fraction, liquidity_usd * params.min_liquidity_ratio)
+    if size_usd <= 0:
+        return None
+
+    quote_in = size_usd / launch.quote_usd
+    tokens_out = _amm_out(quote_in, reserve_quote[0], reserve_token[0], params.swap_fee)
+    if tokens_out <= 0:
+        return None
+    entry_price = quote_in / tokens_out
+
+    # Pool after our buy, along the rest of the recorded path
+    pool_token = np.maximum(reserve_token - tokens_out, 1e-12)
+    pool_quote = reserve_quote + quote_in
+    spot = pool_quote / pool_token
+
+    stop_price = entry_price * (1.0 - params.stop_loss_pct)
+    target_price = entry_price * (1.0 + params.take_profit_pct)
+    deadline = max(entry_time, path_times[0]) + params.max_hold_hours * 3600.0
+
+    triggers = (
+        ('stop_loss', spot <= stop_price),
+        ('take_profit', spot >= target_price),
+        ('max_hold_time', path_times >= deadline)
+    )
+    exit_index = len(spot) - 1
+    exit_reason = 'end_of_data'
+    for reason, mask in triggers:
+        hits = np.flatnonzero(mask[1:])
+        if not hits.size:
+            continue
+        index = int(hits[0]) + 1
+        if index < exit_index or (index == exit_index and exit_reason == 'end_of_data'):
+            exit_index = index
+            exit_reason = reason
+
+    proceeds_quote = _amm_out(tokens_out, pool_token[exit_index], pool_quote[exit_index], params.swap_fee)
+    exit_time = float(path_times[exit_index])
+    if exit_reason == 'max_hold_time':
+        exit_time = max(exit_time, deadline)
+
+    return SimulatedTrade(
+        token_address=launch.token_address,
+        chain=launch.chain,
+        entry_time=max(entry_time, float(path_times[0])),
+        exit_time=exit_time,
+        cost_usd=size_usd,
+        proceeds_usd=float(proceeds_quote) * launch.quote_usd,
+        gas_usd=2.0 * _chain_gas(params, launch.chain),
+        exit_reason=exit_reason
+    )
+
+
+def build_metrics(trades: List[SimulatedTrade]) -> PerformanceMetrics:
+    """
+    Compute PerformanceMetrics for a list of trades, as PortfolioTracker would.
+
+    Args:
+        trades: Simulated trades
+
+    Returns:
+        Performance metrics
+    """
+    if not trades:
+        return PerformanceMetrics(
+            total_trades=0, winning_trades=0, losing_trades=0, win_rate=0.0,
+            average_win=Decimal('0'), average_loss=Decimal('0'),
+            largest_win=Decimal('0'), largest_loss=Decimal('0'),
+            total_pnl=Decimal('0'), total_fees=Decimal('0'), net_pnl=Decimal('0'),
+            sharpe_ratio=None, max_drawdown=Decimal('0'), current_drawdown=Decimal('0'),
+            average_hold_time=timedelta(0), profit_factor=0.0
+        )
+
+    ordered = sorted(trades, key=lambda trade: trade.exit_time)
+    pnl = np.array([trade.pnl_usd for trade in ordered])
+    gas = np.array([trade.gas_usd for trade in ordered])
+    cost = np.array([trade.cost_usd for trade in ordered])
+    hold = np.array([trade.exit_time - trade.entry_time for trade in ordered])
+
+    wins = pnl[pnl > 0]
+    losses = pnl[pnl < 0]
+
+    # Net equity curve and drawdown from its running peak
+    equity = np.cumsum(pnl - gas)
+    peak = np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:]
+    drawdown = peak - equity
+
+    # Sharpe over the last 365 per-trade returns, matching PortfolioTracker
+    returns = (pnl / cost)[-365:]
+    sharpe = None
+    if len(returns) >= 30:
+        std_return = float(np.std(returns, ddof=1))
+        if std_return > 0:
+            sharpe = (float(np.mean(returns)) - 0.05 / 365) / std_return
+
+    gross_losses = float(losses.sum())
+    return PerformanceMetrics(
+        total_trades=len(ordered),
+        winning_trades=int(wins.size),
+        losing_trades=len(ordered) - int(wins.size),
+        win_rate=wins.size / len(ordered) * 100,
+        average_win=Decimal(str(float(wins.mean()))) if wins.size else Decimal('0'),
+        average_loss=Decimal(str(float(losses.mean()))) if losses.size else Decimal('0'),
+        largest_win=Decimal(str(float(wins.max()))) if wins.size else Decimal('0'),
+        largest_loss=Decimal(str(float(losses.min()))) if losses.size else Decimal('0'),
+        total_pnl=Decimal(str(float(pnl.sum()))),
+        total_fees=Decimal(str(float(gas.sum()))),
+        net_pnl=Decimal(str(float(equity[-1]))),
+        sharpe_ratio=sharpe,
+        max_drawdown=Decimal(str(float(drawdown.max()))),
+        current_drawdown=Decimal(str(float(drawdown[-1]))),
+        average_hold_time=timedelta(seconds=float(hold.mean())),
+        profit_factor=abs(float(wins.sum()) / gross_losses) if gross_losses != 0 else 0
+    )
+
+
+def run_backtest(launches: List[LaunchRecord], params: BacktestParams) -> BacktestResult:
+    """
+    Run one parameter set over all launches.
+
+    Args:
+        launches: Launch records sorted by launch time
+        params: Parameter set
+
+    Returns:
+        Backtest result with PerformanceMetrics
+    """
+    start = time.perf_counter()
+
+    # Scores for every launch in one matrix product
+    weights = np.array([params.scoring_weights.get(name, 0.0) for name in SCORE_COMPONENTS])
+    components = np.array(
+        [[launch.components[name] for name in SCORE_COMPONENTS] for launch in launches]
+    ).reshape(-1, len(SCORE_COMPONENTS))
+    scores = components @ weights if len(launches) else np.zeros(0)
+
+    trades: List[SimulatedTrade] = []
+    open_exits: List[float] = []
+
+    for launch, score in zip(launches, scores):
+        try:
+            risk_level = RiskLevel(launch.risk_level)
+        except ValueError:
+            risk_level = RiskLevel.HIGH
+
+        action, _, size_fraction = TradingScorer._classify(float(score), risk_level)
+        if action not in params.entry_actions or size_fraction <= 0:
+            continue
+
+        entry_time = launch.launch_time + params.entry_delay_seconds
+        while open_exits and open_exits[0] <= entry_time:
+            heapq.heappop(open_exits)
+        if len(open_exits) >= params.max_open_positions:
+            continue
+
+        trade = simulate_launch(launch, params, size_fraction)
+        if trade:
+            trades.append(trade)
+            heapq.heappush(open_exits, trade.exit_time)
+
+    return BacktestResult(
+        params=params,
+        metrics=build_metrics(trades),
+        trades=trades,
+        launches_evaluated=len(launches),
+        elapsed_seconds=time.perf_counter() - start
+    )
+
+
+# Dataset loaded once per worker process by _init_worker
+_worker_launches: Optional[List[LaunchRecord]] = None
+
+
+def _init_worker(dataset_path: str) -> None:
+    """Load the dataset in a pool worker."""
+    global _worker_launches
+    _worker_launches = load_launches(dataset_path)
+
+
+def _run_in_worker(params: BacktestParams) -> BacktestResult:
+    """Run one parameter set in a pool worker; trades are dropped to keep results small."""
+    result = run_backtest(_worker_launches, params)
+    result.trades = []
+    return result
+
+
+class Backtester:
+    """
+    Runs parameter sweeps over a recorded launch dataset.
+    Each worker process loads the dataset once and evaluates whole parameter sets.
+    """
+
+    def __init__(self, dataset_path: str, workers: Optional[int] = None) -> None:
+        """
+        Initialize the backtester.
+
+        Args:
+            dataset_path: Launch dataset written by save_launches
+            workers: Worker processes (defaults to the CPU count)
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for backtesting")
+
+        self.logger = logger_manager.get_logger("Backtester")
+        self.dataset_path = dataset_path
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, params: BacktestParams) -> BacktestResult:
+        """
+        Run a single parameter set in this process, keeping the trade list.
+
+        Args:
+            params: Parameter set
+
+        Returns:
+            Backtest result
+        """
+        return run_backtest(load_launches(self.dataset_path), params)
+
+    def sweep(self, param_sets: List[BacktestParams]) -> List[BacktestResult]:
+        """
+        Evaluate parameter sets in parallel.
+
+        Args:
+            param_sets: Parameter sets to evaluate
+
+        Returns:
+            Results in the order of param_sets
+        """
+        start = time.perf_counter()
+        workers = min(self.workers, len(param_sets)) or 1
+
+        if workers == 1:
+            launches = load_launches(self.dataset_path)
+            results = [run_backtest(launches, params) for params in param_sets]
+            for result in results:
+                result.trades = []
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.dataset_path,)
+            ) as pool:
+                results = list(pool.map(_run_in_worker, param_sets))
+
+        self.logger.info(
+            f"Backtested {len(param_sets)} parameter sets on {workers} workers "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return results
+
+
+def result_to_dict(result: BacktestResult) -> Dict[str, Any]:
+    """Convert a backtest result to a JSON-serializable dictionary."""
+    metrics = asdict(result.metrics)
+    for key, value in metrics.items():
+        if isinstance(value, Decimal):
+            metrics[key] = float(value)
+        elif isinstance(value, timedelta):
+            metrics[key] = value.total_seconds()
+    return {
+        'params': asdict(result.params),
+        'metrics': metrics,
+        'launches_evaluated': result.launches_evaluated,
+        'elapsed_seconds': result.elapsed_seconds
+    }
+
+
+def main() -> None:
+    """Sweep stop-loss, take-profit and max hold over a dataset and print the results."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backtest exit rules and scoring over recorded launches")
+    parser.add_argument('dataset', help='Launch dataset (gzip JSON lines)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes')
+    parser.add_argument('--stop-loss', type=float, nargs='+', default=[0.10, 0.15, 0.25])
+    parser.add_argument('--take-profit', type=float, nargs='+', default=[0.20, 0.30, 0.50])
+    parser.add_argument('--max-hold-hours', type=float, nargs='+', default=[6.0, 24.0])
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    grid = parameter_grid(
+        BacktestParams(),
+        stop_loss_pct=args.stop_loss,
+        take_profit_pct=args.take_profit,
+        max_hold_hours=args.max_hold_hours
+    )
+    results = Backtester(args.dataset, workers=args.workers).sweep(grid)
+    results.sort(key=lambda result: result.metrics.net_pnl, reverse=True)
+
+    for result in results:
+        metrics = result.metrics
+        sharpe = f"{metrics.sharpe_ratio:.2f}" if metrics.sharpe_ratio is not None else "n/a"
+        print(
+            f"{result.params.name:<60} trades={metrics.total_trades:<5} "
+            f"win={metrics.win_rate:5.1f}% net=${float(metrics.net_pnl):>10,.2f} "
+            f"maxDD=${float(metrics.max_drawdown):>9,.2f} sharpe={sharpe}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump([result_to_dict(result) for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
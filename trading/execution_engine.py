@@ -8,6 +8,7 @@ from decimal import Decimal
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
+from collections import deque
 import asyncio
 import json
 from web3 import Web3
@@ -17,7 +18,12 @@ from models.token import TradingOpportunity
 from trading.risk_manager import RiskManager, PositionSizeResult
 from trading.position_manager import PositionManager, Position
 from trading.executor import TradeOrder, TradeType, TradeStatus, OrderType
+from trading.swap_templates import SwapTemplateCache, PreparedSwap
+from trading.gas_oracle import GasOracle, GasUrgency
+from config.chains import multichain_settings, ChainType
+from config.settings import settings
 from utils.logger import logger_manager
+from utils.replay_io import create_web3
 
 
 class ExecutionResult(Enum):
@@ -82,7 +88,16 @@ class ExecutionEngine:
         
         # Execution tracking
         self.pending_orders: Dict[str, TradeOrder] = {}
-        self.execution_history: List[ExecutionResult] = []
+        self.execution_history: deque = deque(maxlen=1000)  # Keep last 1000 executions
+        
+        # Pre-built swap transactions, prepared while analysis runs
+        self.swap_templates = SwapTemplateCache(recipient=settings.wallet_address)
+        if not settings.wallet_address:
+            self.logger.warning("WALLET_ADDRESS not set - swap templates use the zero address")
+        
+        # Per-chain gas oracles, refreshed once per new head
+        self.gas_oracles: Dict[str, GasOracle] = {}
+        self.gas_oracle_tasks: List[asyncio.Task] = []
         
         # Performance metrics
         self.total_executions = 0
@@ -115,6 +130,28 @@ class ExecutionEngine:
             self.logger.error(f"Failed to initialize execution engine: {e}")
             raise
     
+    async def prewarm_opportunity(self, opportunity: TradingOpportunity) -> None:
+        """
+        Prepare the swap transaction template for a freshly detected pair.
+        Runs before analysis finishes so an approved trade only patches and signs.
+        
+        Args:
+            opportunity: Newly detected trading opportunity
+        """
+        try:
+            chain = opportunity.metadata.get('chain', 'ETHEREUM').upper()
+            if chain not in self.web3_connections:
+                return
+            
+            await self.swap_templates.prewarm(
+                chain,
+                opportunity.token.address,
+                self.web3_connections.get(chain)
+            )
+            
+        except Exception as e:
+            self.logger.debug(f"Swap template prewarm failed for {opportunity.token.symbol}: {e}")
+    
     async def execute_buy_order(
         self, 
         opportunity: TradingOpportunity,
@@ -133,6 +170,7 @@ class ExecutionEngine:
         try:
             if risk_assessment.approved_amount <= 0:
                 self.logger.warning(f"Buy order rejected: {opportunity.token.symbol} - No approved amount")
+                self.risk_manager.release_reservation(risk_assessment.reservation_id)
                 return None
                 
             self.logger.info(f"Executing buy order: {opportunity.token.symbol}")
@@ -149,7 +187,8 @@ class ExecutionEngine:
                     opportunity=opportunity,
                     entry_price=execution_result.actual_price,
                     entry_amount=execution_result.amount_out,
-                    entry_tx_hash=execution_result.tx_hash
+                    entry_tx_hash=execution_result.tx_hash,
+                    reservation_id=risk_assessment.reservation_id
                 )
                 
                 self.logger.info(
@@ -162,10 +201,12 @@ class ExecutionEngine:
                 self.logger.error(
                     f"Buy order failed: {opportunity.token.symbol} - {execution_result.error_message}"
                 )
+                self.risk_manager.release_reservation(risk_assessment.reservation_id)
                 return None
                 
         except Exception as e:
             self.logger.error(f"Buy order execution failed for {opportunity.token.symbol}: {e}")
+            self.risk_manager.release_reservation(risk_assessment.reservation_id)
             return None
     
     async def execute_sell_order(self, position: Position) -> bool:
@@ -329,8 +370,6 @@ class ExecutionEngine:
             
             # Store execution history
             self.execution_history.append(result)
-            if len(self.execution_history) > 1000:  # Keep last 1000 executions
-                self.execution_history.pop(0)
             
             return result
             
@@ -360,17 +399,24 @@ class ExecutionEngine:
             ExecutionResult with execution details
         """
         try:
-            # This is a placeholder implementation
-            # In production, this would:
-            # 1. Get Web3 connection for chain
-            # 2. Get appropriate DEX router contract
-            # 3. Calculate swap parameters
-            # 4. Estimate gas
-            # 5. Send transaction
-            # 6. Monitor transaction confirmation
+            # Sending and confirmation are still simulated; order construction
+            # uses the prewarmed template so no RPC call sits on this path.
             
             self.logger.info(f"Executing EVM order: {order.id} on {order.chain}")
             
+            gas_limit = 150000
+            gas_price_gwei = self._get_gas_price_gwei(order.chain)
+            
+            if order.trade_type == TradeType.BUY:
+                prepared = await self._prepare_swap_transaction(order, opportunity)
+                if prepared:
+                    gas_limit = prepared.transaction['gas']
+                    if 'maxFeePerGas' in prepared.transaction:
+                        gas_price_gwei = prepared.transaction['maxFeePerGas'] / 1e9
+                    self.logger.debug(
+                        f"Swap transaction built in {prepared.build_time_ms:.3f}ms: {order.id}"
+                    )
+            
             # Simulate successful execution for testing
             await asyncio.sleep(2)  # Simulate network delay
             
@@ -388,8 +434,8 @@ class ExecutionEngine:
                 amount_in=order.amount,
                 amount_out=amount_out,
                 actual_price=actual_price,
-                gas_used=150000,
-                gas_price=20,
+                gas_used=gas_limit,
+                gas_price=gas_price_gwei,
                 slippage_actual=0.02
             )
             
@@ -400,6 +446,113 @@ class ExecutionEngine:
                 error_message=f"EVM execution failed: {str(e)}"
             )
     
+    async def _prepare_swap_transaction(
+        self, 
+        order: TradeOrder, 
+        opportunity: Optional[TradingOpportunity] = None
+    ) -> Optional[PreparedSwap]:
+        """
+        Build the buy transaction from the cached template, prewarming on a miss.
+        
+        Args:
+            order: Buy order to build
+            opportunity: Optional trading opportunity with pair reserves
+            
+        Returns:
+            PreparedSwap if a template could be used, None otherwise
+        """
+        try:
+            chain = order.chain.upper()
+            template = self.swap_templates.get_template(chain, order.token_address)
+            if not template:
+                template = await self.swap_templates.prewarm(
+                    chain, order.token_address, self.web3_connections.get(chain)
+                )
+            if not template:
+                return None
+            
+            amount_in_wei = int(order.amount * Decimal(10 ** 18))
+            amount_out_min = self._quote_min_amount_out(
+                opportunity, template.path[0], amount_in_wei, order.slippage
+            )
+            
+            return self.swap_templates.fire(template, amount_in_wei, amount_out_min)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to prepare swap transaction for {order.id}: {e}")
+            return None
+    
+    def _get_gas_price_gwei(self, chain: str) -> Optional[float]:
+        """
+        Get the oracle's current max fee for a chain without any RPC call.
+        
+        Args:
+            chain: Chain label
+            
+        Returns:
+            Max fee per gas in gwei, or None if the oracle has no data yet
+        """
+        oracle = self.gas_oracles.get(chain.upper())
+        suggestion = oracle.suggest(GasUrgency.HIGH) if oracle else None
+        return suggestion.max_fee_gwei if suggestion else None
+    
+    def _on_gas_update(self, oracle: GasOracle) -> None:
+        """
+        Push fresh oracle fees into the swap template cache.
+        
+        Args:
+            oracle: Gas oracle that just processed a new head
+        """
+        suggestion = oracle.suggest(GasUrgency.HIGH)
+        if suggestion:
+            self.swap_templates.update_fees(
+                oracle.chain,
+                suggestion.block_number,
+                suggestion.base_fee_per_gas,
+                suggestion.max_priority_fee_per_gas,
+                suggestion.max_fee_per_gas
+            )
+    
+    def _quote_min_amount_out(
+        self,
+        opportunity: Optional[TradingOpportunity],
+        wrapped_native: str,
+        amount_in_wei: int,
+        slippage: float
+    ) -> int:
+        """
+        Quote the minimum output from known pair reserves (Uniswap V2, 0.3% fee).
+        
+        Args:
+            opportunity: Trading opportunity with liquidity info
+            wrapped_native: Wrapped native token address of the chain
+            amount_in_wei: Native amount being spent
+            slippage: Allowed slippage fraction
+            
+        Returns:
+            Minimum amount out, or 0 when reserves are unknown
+        """
+        try:
+            if not opportunity or not opportunity.liquidity:
+                return 0
+            
+            liquidity = opportunity.liquidity
+            if liquidity.token0.lower() == wrapped_native.lower():
+                reserve_in, reserve_out = liquidity.reserve0, liquidity.reserve1
+            else:
+                reserve_in, reserve_out = liquidity.reserve1, liquidity.reserve0
+            
+            if not reserve_in or not reserve_out:
+                return 0
+            
+            amount_in_with_fee = amount_in_wei * 997
+            amount_out = (amount_in_with_fee * int(reserve_out)) // (int(reserve_in) * 1000 + amount_in_with_fee)
+            return int(amount_out * (1 - slippage))
+            
+        except Exception as e:
+            self.logger.debug(f"Reserve quote failed: {e}")
+            return 0
+    
     async def _execute_solana_order(
         self, 
         order: TradeOrder, 
@@ -457,9 +610,21 @@ class ExecutionEngine:
     async def _initialize_web3_connections(self) -> None:
         """Initialize Web3 connections for supported chains."""
         try:
-            # This would initialize actual Web3 connections
-            # Placeholder implementation
-            self.logger.info("Web3 connections initialized (placeholder)")
+            for chain_type, chain_config in multichain_settings.chains.items():
+                w3 = create_web3(chain_config.rpc_url, chain_type.name)
+                self.web3_connections[chain_type.name] = w3
+                
+                oracle = GasOracle(
+                    chain_type.name,
+                    w3,
+                    block_time=chain_config.block_time,
+                    max_gas_price_gwei=chain_config.max_gas_price
+                )
+                oracle.add_listener(self._on_gas_update)
+                self.gas_oracles[chain_type.name] = oracle
+                self.risk_manager.register_gas_oracle(chain_type.name, oracle)
+            
+            self.logger.info(f"Web3 connections initialized: {', '.join(self.web3_connections)}")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize Web3 connections: {e}")
@@ -481,12 +646,25 @@ class ExecutionEngine:
         try:
             self.monitoring_active = True
             # This would start actual transaction monitoring
+            self.gas_oracle_tasks = [
+                asyncio.create_task(oracle.start()) for oracle in self.gas_oracles.values()
+            ]
             self.logger.info("Transaction monitoring started")
             
         except Exception as e:
             self.logger.error(f"Failed to start monitoring: {e}")
             raise
     
+    async def stop_monitoring(self) -> None:
+        """Stop transaction monitoring and the gas oracles."""
+        self.monitoring_active = False
+        for oracle in self.gas_oracles.values():
+            oracle.stop()
+        for task in self.gas_oracle_tasks:
+            task.cancel()
+        await asyncio.gather(*self.gas_oracle_tasks, return_exceptions=True)
+        self.gas_oracle_tasks = []
+    
     def get_execution_metrics(self) -> Dict[str, Any]:
         """Get execution performance metrics."""
         try:
@@ -502,6 +680,10 @@ class ExecutionEngine:
                 'average_execution_time_seconds': round(self.average_execution_time, 2),
                 'total_gas_used': self.total_gas_used,
                 'pending_orders': len(self.pending_orders),
+                'swap_templates': self.swap_templates.get_stats(),
+                'gas_oracles': {
+                    chain: oracle.get_status() for chain, oracle in self.gas_oracles.items()
+                },
                 'recent_executions': [
                     {
                         'success': result.success,
@@ -509,7 +691,7 @@ class ExecutionEngine:
                         'gas_used': result.gas_used,
                         'error': result.error_message
                     }
-                    for result in self.execution_history[-10:]  # Last 10 executions
+                    for result in list(self.execution_history)[-10:]  # Last 10 executions
                 ]
             }
             
@@ -0,0 +1,285 @@
+"""
+Incremental exposure ledger for the risk manager.
+Keeps O(1) counters of open positions and USD exposure per chain, token and
+deployer, a rolling 24h P&L, and short-lived reservations so concurrent
+assessments cannot both take the last unit of a limit.
+"""
+
+from typing import Dict, Optional, Any
+from dataclasses import dataclass
+from collections import defaultdict, deque, OrderedDict
+import threading
+import time
+import uuid
+
+from utils.logger import logger_manager
+
+
+@dataclass
+class LedgerEntry:
+    """Exposure held by an open position or a pending reservation."""
+    entry_id: str
+    chain: str
+    token_address: str
+    deployer: Optional[str]
+    exposure_usd: float
+    reserved: bool
+    created_at: float
+    expires_at: Optional[float] = None
+
+
+class ExposureLedger:
+    """
+    Running totals of portfolio exposure, updated on every open, close and
+    reservation instead of being recomputed from the position book.
+
+    Callers that check limits and then reserve must hold `lock` across both
+    steps so the check-and-reserve is atomic.
+    """
+
+    def __init__(self, reservation_ttl: float = 120.0, pnl_window_seconds: float = 86400.0) -> None:
+        """
+        Initialize the ledger.
+
+        Args:
+            reservation_ttl: Seconds before an unused reservation is released
+            pnl_window_seconds: Length of the rolling P&L window
+        """
+        self.logger = logger_manager.get_logger("ExposureLedger")
+        self.reservation_ttl = reservation_ttl
+        self.pnl_window_seconds = pnl_window_seconds
+        self.lock = threading.RLock()
+
+        self.positions: Dict[str, LedgerEntry] = {}
+        # Reservations in creation order, so expiry only inspects the oldest
+        self.reservations: "OrderedDict[str, LedgerEntry]" = OrderedDict()
+
+        self.count_by_chain: Dict[str, int] = defaultdict(int)
+        self.exposure_total: float = 0.0
+        self.exposure_by_chain: Dict[str, float] = defaultdict(float)
+        self.exposure_by_token: Dict[str, float] = defaultdict(float)
+        self.exposure_by_deployer: Dict[str, float] = defaultdict(float)
+
+        self.pnl_events: deque = deque()
+        self.rolling_pnl: float = 0.0
+
+        self.stats = {
+            'reservations_made': 0,
+            'reservations_committed': 0,
+            'reservations_released': 0,
+            'reservations_expired': 0
+        }
+
+    @staticmethod
+    def _normalize(value: Optional[str]) -> Optional[str]:
+        """Normalize an address or label for use as a counter key."""
+        return value.lower() if value else None
+
+    def _apply(self, entry: LedgerEntry, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an entry from the running counters."""
+        exposure = entry.exposure_usd * sign
+        self.count_by_chain[entry.chain] += sign
+        self.exposure_total += exposure
+        self.exposure_by_chain[entry.chain] += exposure
+        self.exposure_by_token[entry.token_address] += exposure
+        if entry.deployer:
+            self.exposure_by_deployer[entry.deployer] += exposure
+
+        # Drop zeroed keys so the dicts do not grow with every token ever traded
+        if sign < 0:
+            if self.count_by_chain[entry.chain] <= 0:
+                del self.count_by_chain[entry.chain]
+                self.exposure_by_chain.pop(entry.chain, None)
+            if abs(self.exposure_by_token[entry.token_address]) < 1e-9:
+                del self.exposure_by_token[entry.token_address]
+            if entry.deployer and abs(self.exposure_by_deployer[entry.deployer]) < 1e-9:
+                del self.exposure_by_deployer[entry.deployer]
+            if not self.positions and not self.reservations:
+                self.exposure_total = 0.0  # Clear accumulated float error
+
+    def reserve(
+        self,
+        chain: str,
+        token_address: str,
+        exposure_usd: float,
+        deployer: Optional[str] = None
+    ) -> str:
+        """
+        Reserve exposure for a pending buy.
+
+        Args:
+            chain: Chain label
+            token_address: Token being bought
+            exposure_usd: Exposure to hold in USD
+            deployer: Optional deployer address
+
+        Returns:
+            Reservation ID to commit or release later
+        """
+        with self.lock:
+            now = time.monotonic()
+            entry = LedgerEntry(
+                entry_id=f"res_{uuid.uuid4().hex[:12]}",
+                chain=chain.upper(),
+                token_address=self._normalize(token_address) or '',
+                deployer=self._normalize(deployer),
+                exposure_usd=exposure_usd,
+                reserved=True,
+                created_at=now,
+                expires_at=now + self.reservation_ttl
+            )
+            self.reservations[entry.entry_id] = entry
+            self._apply(entry, 1)
+            self.stats['reservations_made'] += 1
+            return entry.entry_id
+
+    def commit(
+        self,
+        position_id: str,
+        chain: str,
+        token_address: str,
+        exposure_usd: float,
+        deployer: Optional[str] = None,
+        reservation_id: Optional[str] = None
+    ) -> None:
+        """
+        Record an opened position, converting its reservation if one exists.
+
+        Args:
+            position_id: Stable position ID
+            chain: Chain label
+            token_address: Token address
+            exposure_usd: Exposure in USD, used when there is no live reservation
+            deployer: Optional deployer address
+            reservation_id: Reservation made during assessment
+        """
+        with self.lock:
+            if position_id in self.positions:
+                return
+
+            reservation = self.reservations.pop(reservation_id, None) if reservation_id else None
+            if reservation:
+                # The reservation already counts toward the totals; just re-key it
+                reservation.entry_id = position_id
+                reservation.reserved = False
+                reservation.expires_at = None
+                self.positions[position_id] = reservation
+                self.stats['reservations_committed'] += 1
+                return
+
+            entry = LedgerEntry(
+                entry_id=position_id,
+                chain=chain.upper(),
+                token_address=self._normalize(token_address) or '',
+                deployer=self._normalize(deployer),
+                exposure_usd=exposure_usd,
+                reserved=False,
+                created_at=time.monotonic()
+            )
+            self.positions[position_id] = entry
+            self._apply(entry, 1)
+
+    def release(self, entry_id: Optional[str]) -> bool:
+        """
+        Release a reservation or close a position.
+
+        Args:
+            entry_id: Reservation ID or position ID
+
+        Returns:
+            True if an entry was released
+        """
+        if not entry_id:
+            return False
+
+        with self.lock:
+            entry = self.reservations.pop(entry_id, None)
+            if entry:
+                self.stats['reservations_released'] += 1
+            else:
+                entry = self.positions.pop(entry_id, None)
+            if not entry:
+                return False
+            self._apply(entry, -1)
+            return True
+
+    def expire_reservations(self) -> int:
+        """
+        Release reservations older than the TTL.
+
+        Returns:
+            Number of expired reservations
+        """
+        with self.lock:
+            now = time.monotonic()
+            expired = 0
+            while self.reservations:
+                entry = next(iter(self.reservations.values()))
+                if entry.expires_at is None or entry.expires_at > now:
+                    break
+                self.reservations.popitem(last=False)
+                self._apply(entry, -1)
+                expired += 1
+
+            if expired:
+                self.stats['reservations_expired'] += expired
+                self.logger.debug(f"Expired {expired} unused exposure reservations")
+            return expired
+
+    def record_pnl(self, pnl_usd: float) -> None:
+        """
+        Add a realized P&L event to the rolling window.
+
+        Args:
+            pnl_usd: Realized P&L (negative for a loss)
+        """
+        with self.lock:
+            self.pnl_events.append((time.time(), pnl_usd))
+            self.rolling_pnl += pnl_usd
+
+    def get_rolling_pnl(self) -> float:
+        """Get realized P&L over the rolling window, dropping events that aged out."""
+        with self.lock:
+            cutoff = time.time() - self.pnl_window_seconds
+            while self.pnl_events and self.pnl_events[0][0] < cutoff:
+                _, pnl = self.pnl_events.popleft()
+                self.rolling_pnl -= pnl
+            if not self.pnl_events:
+                self.rolling_pnl = 0.0  # Clear accumulated float error
+            return self.rolling_pnl
+
+    @property
+    def total_count(self) -> int:
+        """Open positions plus pending reservations."""
+        return len(self.positions) + len(self.reservations)
+
+    def get_chain_count(self, chain: str) -> int:
+        """Open positions plus pending reservations on a chain."""
+        return self.count_by_chain.get(chain.upper(), 0)
+
+    def get_chain_exposure(self, chain: str) -> float:
+        """USD exposure on a chain."""
+        return self.exposure_by_chain.get(chain.upper(), 0.0)
+
+    def get_token_exposure(self, token_address: str) -> float:
+        """USD exposure to a token."""
+        return self.exposure_by_token.get(self._normalize(token_address) or '', 0.0)
+
+    def get_deployer_exposure(self, deployer: Optional[str]) -> float:
+        """USD exposure to tokens from a deployer."""
+        if not deployer:
+            return 0.0
+        return self.exposure_by_deployer.get(self._normalize(deployer), 0.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ledger counters and reservation statistics."""
+        with self.lock:
+            return {
+                **self.stats,
+                'open_positions': len(self.positions),
+                'pending_reservations': len(self.reservations),
+                'exposure_usd': self.exposure_total,
+                'exposure_by_chain': dict(self.exposure_by_chain),
+                'positions_by_chain': dict(self.count_by_chain),
+                'rolling_pnl_usd': self.get_rolling_pnl()
+            }
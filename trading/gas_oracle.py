@@ -0,0 +1,256 @@
+"""
+Gas price oracle for EVM chains.
+Refreshes once per new head from eth_feeHistory and serves fee suggestions from memory.
+"""
+
+from typing import Dict, List, Optional, Any, Callable
+from dataclasses import dataclass
+from collections import deque
+from enum import Enum
+import asyncio
+import statistics
+import time
+
+from utils.logger import logger_manager
+
+
+class GasUrgency(Enum):
+    """How quickly a transaction needs to be included."""
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+
+
+# Reward percentiles requested from eth_feeHistory, one per urgency level
+FEE_HISTORY_PERCENTILES = [10, 50, 90]
+
+# Blocks of base fee growth (12.5% per full block) each urgency level tolerates
+URGENCY_BLOCK_HEADROOM = {
+    GasUrgency.LOW: 1,
+    GasUrgency.NORMAL: 3,
+    GasUrgency.HIGH: 6
+}
+
+DEFAULT_SWAP_GAS_LIMIT = 250000
+
+
+@dataclass
+class GasSuggestion:
+    """EIP-1559 fee suggestion in wei."""
+    max_fee_per_gas: int
+    max_priority_fee_per_gas: int
+    base_fee_per_gas: int
+    block_number: int
+
+    @property
+    def max_fee_gwei(self) -> float:
+        """Max fee per gas in gwei."""
+        return self.max_fee_per_gas / 1e9
+
+
+@dataclass
+class FeeSample:
+    """Fee data of a single block kept in the ring buffer."""
+    block_number: int
+    base_fee_per_gas: int
+    gas_used_ratio: float
+    priority_fees: List[int]
+
+
+class GasOracle:
+    """
+    Per-chain gas oracle backed by a ring buffer of recent fee history.
+    Suggestions are recomputed on each new head so suggest() is a dict lookup.
+    """
+
+    def __init__(
+        self,
+        chain: str,
+        w3,
+        block_time: float = 12.0,
+        history_blocks: int = 20,
+        max_gas_price_gwei: Optional[float] = None
+    ) -> None:
+        """
+        Initialize the gas oracle.
+
+        Args:
+            chain: Chain label such as 'ETHEREUM' or 'BASE'
+            w3: Web3 connection for the chain
+            block_time: Expected block time in seconds, used as the head poll interval
+            history_blocks: Number of blocks kept in the ring buffer
+            max_gas_price_gwei: Optional cap applied to suggested max fees
+        """
+        self.logger = logger_manager.get_logger("GasOracle")
+        self.chain = chain.upper()
+        self.w3 = w3
+        self.block_time = block_time
+        self.history_blocks = history_blocks
+        self.max_gas_price_wei = int(max_gas_price_gwei * 1e9) if max_gas_price_gwei else None
+
+        self.samples: deque = deque(maxlen=history_blocks)
+        self.next_base_fee: int = 0
+        self.head_block: int = 0
+        self.last_update: float = 0.0
+        self.suggestions: Dict[GasUrgency, GasSuggestion] = {}
+
+        self.listeners: List[Callable[['GasOracle'], None]] = []
+        self.is_running = False
+        self.updates = 0
+        self.errors = 0
+
+    def add_listener(self, callback: Callable[['GasOracle'], None]) -> None:
+        """
+        Register a callback invoked after every head update.
+
+        Args:
+            callback: Function receiving this oracle
+        """
+        self.listeners.append(callback)
+
+    async def start(self) -> None:
+        """Poll for new heads and refresh fee data once per block."""
+        self.is_running = True
+        self.logger.info(f"Gas oracle started for {self.chain}")
+
+        while self.is_running:
+            try:
+                block_number = await asyncio.to_thread(lambda: self.w3.eth.block_number)
+                if block_number > self.head_block:
+                    await self.refresh(block_number)
+            except Exception as e:
+                self.errors += 1
+                self.logger.debug(f"Gas oracle poll failed for {self.chain}: {e}")
+
+            await asyncio.sleep(self.block_time)
+
+    def stop(self) -> None:
+        """Stop the head polling loop."""
+        self.is_running = False
+
+    async def refresh(self, head_block: int) -> None:
+        """
+        Fetch fee history for blocks missing from the ring buffer.
+
+        Args:
+            head_block: Newest block number
+        """
+        missing = head_block - self.head_block if self.head_block else self.history_blocks
+        block_count = max(1, min(missing, self.history_blocks))
+
+        fee_history = await asyncio.to_thread(
+            self.w3.eth.fee_history, block_count, head_block, FEE_HISTORY_PERCENTILES
+        )
+        self.update_from_fee_history(fee_history)
+
+    def update_from_fee_history(self, fee_history: Dict[str, Any]) -> None:
+        """
+        Append an eth_feeHistory response to the ring buffer and recompute suggestions.
+
+        Args:
+            fee_history: Response with oldestBlock, baseFeePerGas, gasUsedRatio and reward
+        """
+        try:
+            oldest_block = int(fee_history['oldestBlock'])
+            base_fees = [int(fee) for fee in fee_history['baseFeePerGas']]
+            gas_used_ratios = list(fee_history.get('gasUsedRatio', []))
+            rewards = fee_history.get('reward') or [[0] * len(FEE_HISTORY_PERCENTILES)] * len(gas_used_ratios)
+
+            for offset, ratio in enumerate(gas_used_ratios):
+                block_number = oldest_block + offset
+                if block_number <= self.head_block:
+                    continue
+                self.samples.append(FeeSample(
+                    block_number=block_number,
+                    base_fee_per_gas=base_fees[offset],
+                    gas_used_ratio=float(ratio),
+                    priority_fees=[int(reward) for reward in rewards[offset]]
+                ))
+                self.head_block = block_number
+
+            # The final baseFeePerGas entry is the base fee of the next block
+            self.next_base_fee = base_fees[-1]
+            self.last_update = time.time()
+            self.updates += 1
+
+            self._recompute_suggestions()
+
+            for listener in self.listeners:
+                try:
+                    listener(self)
+                except Exception as e:
+                    self.logger.error(f"Gas oracle listener failed: {e}")
+
+        except Exception as e:
+            self.errors += 1
+            self.logger.error(f"Failed to process fee history for {self.chain}: {e}")
+
+    def _recompute_suggestions(self) -> None:
+        """Derive per-urgency suggestions from the ring buffer."""
+        if not self.samples:
+            return
+
+        for index, urgency in enumerate([GasUrgency.LOW, GasUrgency.NORMAL, GasUrgency.HIGH]):
+            priority_fee = int(statistics.median(
+                sample.priority_fees[index] for sample in self.samples
+                if len(sample.priority_fees) > index
+            ))
+            headroom = 1.125 ** URGENCY_BLOCK_HEADROOM[urgency]
+            max_fee = int(self.next_base_fee * headroom) + priority_fee
+
+            if self.max_gas_price_wei:
+                max_fee = min(max_fee, self.max_gas_price_wei)
+                priority_fee = min(priority_fee, max_fee)
+
+            self.suggestions[urgency] = GasSuggestion(
+                max_fee_per_gas=max_fee,
+                max_priority_fee_per_gas=priority_fee,
+                base_fee_per_gas=self.next_base_fee,
+                block_number=self.head_block
+            )
+
+    def suggest(self, urgency: GasUrgency = GasUrgency.NORMAL) -> Optional[GasSuggestion]:
+        """
+        Get the cached fee suggestion for an urgency level.
+
+        Args:
+            urgency: Required inclusion urgency
+
+        Returns:
+            GasSuggestion, or None before the first update
+        """
+        return self.suggestions.get(urgency)
+
+    def estimate_cost_native(
+        self,
+        gas_limit: int = DEFAULT_SWAP_GAS_LIMIT,
+        urgency: GasUrgency = GasUrgency.NORMAL
+    ) -> Optional[float]:
+        """
+        Estimate the worst-case transaction cost in native token units.
+
+        Args:
+            gas_limit: Gas limit of the transaction
+            urgency: Required inclusion urgency
+
+        Returns:
+            Cost in native units (ETH), or None if no data yet
+        """
+        suggestion = self.suggestions.get(urgency)
+        if not suggestion:
+            return None
+        return gas_limit * suggestion.max_fee_per_gas / 1e18
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get oracle status for monitoring."""
+        normal = self.suggestions.get(GasUrgency.NORMAL)
+        return {
+            'chain': self.chain,
+            'head_block': self.head_block,
+            'buffered_blocks': len(self.samples),
+            'next_base_fee_gwei': self.next_base_fee / 1e9,
+            'normal_max_fee_gwei': normal.max_fee_gwei if normal else None,
+            'seconds_since_update': time.time() - self.last_update if self.last_update else None,
+            'updates': self.updates,
+            'errors': self.errors
+        }
@@ -5,14 +5,17 @@ Provides detailed metrics, reporting, and risk analysis.
 
 from typing import Dict, List, Optional, Tuple, Any
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from collections import deque
 import json
 import csv
+import math
 from io import StringIO
 
 from trading.position_manager import Position, PositionExit, PositionStatus
 from trading.risk_manager import RiskManager
+from trading.trade_journal import TradeJournal
 from utils.logger import logger_manager
 
 
@@ -49,35 +52,132 @@ class ChainMetrics:
     worst_performer: Optional[str]
 
 
+class RollingStats:
+    """
+    Welford mean/variance over the most recent values, updated in O(1).
+    Values leaving the window are removed with the inverse Welford update.
+    """
+
+    def __init__(self, window: Optional[int] = None) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            window: Number of most recent values to keep (None for all)
+        """
+        self.values: deque = deque()
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value, dropping the oldest one if the window is full."""
+        if self.window is not None:
+            if len(self.values) >= self.window:
+                self._remove(self.values.popleft())
+            self.values.append(value)
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def _remove(self, value: float) -> None:
+        """Inverse Welford update for a value leaving the window."""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@dataclass
+class ChainAccumulator:
+    """Running per-chain aggregates."""
+    positions: int = 0
+    wins: int = 0
+    total_pnl: Decimal = Decimal('0')
+    best_exit: Optional[Tuple[Decimal, str]] = None
+    worst_exit: Optional[Tuple[Decimal, str]] = None
+    opened: int = 0
+    opened_size: Decimal = Decimal('0')
+
+
+@dataclass
+class RunningMetrics:
+    """Running totals updated on every closed position."""
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0  # Everything that is not a win, including break-even
+    negative_trades: int = 0
+    gross_wins: Decimal = Decimal('0')
+    gross_losses: Decimal = Decimal('0')
+    largest_win: Decimal = Decimal('0')
+    largest_loss: Decimal = Decimal('0')
+    total_pnl: Decimal = Decimal('0')
+    total_fees: Decimal = Decimal('0')
+
+    # Equity curve of cumulative net P&L with running peak
+    equity: Decimal = Decimal('0')
+    peak_equity: Decimal = Decimal('0')
+    max_drawdown: Decimal = Decimal('0')
+
+    # Hold-time aggregates (exits whose opening was tracked)
+    hold_seconds_total: float = 0.0
+    hold_count: int = 0
+
+    chains: Dict[str, ChainAccumulator] = field(default_factory=dict)
+
+
 class PortfolioTracker:
     """
     Advanced portfolio tracking and performance analytics system.
     Provides comprehensive metrics, reporting, and risk analysis.
     """
     
-    def __init__(self, risk_manager: RiskManager) -> None:
+    def __init__(
+        self,
+        risk_manager: RiskManager,
+        journal: Optional[TradeJournal] = None,
+        max_equity_points: int = 10000
+    ) -> None:
         """
         Initialize the portfolio tracker.
         
         Args:
             risk_manager: Risk management system for portfolio limits
+            journal: Optional persistent trade journal used for full-history queries
+            max_equity_points: Most recent equity curve points kept in memory
         """
         self.logger = logger_manager.get_logger("PortfolioTracker")
         self.risk_manager = risk_manager
+        self.journal = journal
         
         # Historical data storage
         self.position_history: List[Position] = []
+        self.positions_by_id: Dict[str, Position] = {}
         self.exit_history: List[PositionExit] = []
         self.daily_snapshots: List[Dict[str, Any]] = []
         
         # Performance tracking
         self.peak_portfolio_value = Decimal('0')
         self.portfolio_start_value = Decimal('0')
-        self.daily_returns: List[float] = []
+        # Recent points only; the journal holds the full history
+        self.equity_curve: deque = deque(maxlen=max_equity_points)
         
-        # Analytics cache
-        self.last_metrics_calculation: Optional[datetime] = None
-        self.cached_metrics: Optional[PerformanceMetrics] = None
+        # Incrementally maintained metrics, so reads do not depend on trade count
+        self.running = RunningMetrics()
+        self.trade_returns = RollingStats(window=365)
         
     def track_position_opened(self, position: Position) -> None:
         """
@@ -88,6 +188,11 @@ class PortfolioTracker:
         """
         try:
             self.position_history.append(position)
+            self.positions_by_id[position.id] = position
+            
+            chain_stats = self._get_chain_accumulator(self._get_chain(position.id))
+            chain_stats.opened += 1
+            chain_stats.opened_size += position.entry_amount
             
             # Update portfolio tracking
             current_value = self._calculate_current_portfolio_value()
@@ -108,12 +213,7 @@ class PortfolioTracker:
         """
         try:
             self.exit_history.append(position_exit)
-            
-            # Update daily returns
-            self._update_daily_returns(position_exit)
-            
-            # Clear cached metrics
-            self.cached_metrics = None
+            self._update_running_metrics(position_exit)
             
             self.logger.debug(f"Position exit tracked: {position_exit.position_id}")
             
@@ -125,90 +225,58 @@ class PortfolioTracker:
         Get comprehensive performance metrics.
         
         Args:
-            recalculate: Force recalculation even if cached
+            recalculate: Kept for compatibility; metrics are always current
             
         Returns:
             PerformanceMetrics with current portfolio performance
         """
         try:
-            # Return cached metrics if recent and not forced
-            if (not recalculate and 
-                self.cached_metrics and 
-                self.last_metrics_calculation and
-                (datetime.now() - self.last_metrics_calculation).total_seconds() < 300):  # 5 minutes
-                return self.cached_metrics
-            
-            # Calculate fresh metrics
-            metrics = self._calculate_performance_metrics()
-            
-            # Cache results
-            self.cached_metrics = metrics
-            self.last_metrics_calculation = datetime.now()
-            
-            return metrics
+            return self._calculate_performance_metrics()
             
         except Exception as e:
             self.logger.error(f"Failed to get performance metrics: {e}")
             return self._get_default_metrics()
     
     def _calculate_performance_metrics(self) -> PerformanceMetrics:
-        """Calculate comprehensive performance metrics."""
+        """Build performance metrics from the running totals in O(1)."""
         try:
-            if not self.exit_history:
+            running = self.running
+            if running.total_trades == 0:
                 return self._get_default_metrics()
             
-            # Basic trade statistics
-            total_trades = len(self.exit_history)
-            winning_trades = len([exit for exit in self.exit_history if exit.realized_pnl > 0])
-            losing_trades = total_trades - winning_trades
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
-            
-            # P&L calculations
-            all_pnl = [exit.realized_pnl for exit in self.exit_history]
-            winning_pnl = [pnl for pnl in all_pnl if pnl > 0]
-            losing_pnl = [pnl for pnl in all_pnl if pnl < 0]
-            
-            total_pnl = sum(all_pnl)
-            total_fees = sum([exit.gas_fees for exit in self.exit_history])
-            net_pnl = total_pnl - total_fees
+            win_rate = running.winning_trades / running.total_trades * 100
             
             # Win/Loss statistics
-            average_win = sum(winning_pnl) / len(winning_pnl) if winning_pnl else Decimal('0')
-            average_loss = sum(losing_pnl) / len(losing_pnl) if losing_pnl else Decimal('0')
-            largest_win = max(winning_pnl) if winning_pnl else Decimal('0')
-            largest_loss = min(losing_pnl) if losing_pnl else Decimal('0')
+            average_win = (
+                running.gross_wins / running.winning_trades if running.winning_trades else Decimal('0')
+            )
+            average_loss = (
+                running.gross_losses / running.negative_trades if running.negative_trades else Decimal('0')
+            )
             
             # Risk metrics
             profit_factor = (
-                abs(sum(winning_pnl) / sum(losing_pnl)) 
-                if losing_pnl and sum(losing_pnl) != 0 else 0
+                abs(float(running.gross_wins / running.gross_losses))
+                if running.gross_losses != 0 else 0
             )
-            
-            # Drawdown calculations
             max_drawdown, current_drawdown = self._calculate_drawdown()
             
-            # Time metrics
-            average_hold_time = self._calculate_average_hold_time()
-            
-            # Sharpe ratio (simplified)
-            sharpe_ratio = self._calculate_sharpe_ratio()
-            
             return PerformanceMetrics(
-                total_trades=total_trades,
-                winning_trades=winning_trades,
-                losing_trades=losing_trades,
+                total_trades=running.total_trades,
+                winning_trades=running.winning_trades,
+                losing_trades=running.losing_trades,
                 win_rate=win_rate,
                 average_win=average_win,
                 average_loss=average_loss,
-                largest_win=largest_win,
-                largest_loss=largest_loss,
-                total_pnl=total_pnl,
-                total_fees=total_fees,
-                net_pnl=net_pnl,
-                sharpe_ratio=sharpe_ratio,
+                largest_win=running.largest_win,
+                largest_loss=running.largest_loss,
+                total_pnl=running.total_pnl,
+                total_fees=running.total_fees,
+                net_pnl=running.total_pnl - running.total_fees,
+                sharpe_ratio=self._calculate_sharpe_ratio(),
                 max_drawdown=max_drawdown,
                 current_drawdown=current_drawdown,
-                average_hold_time=average_hold_time,
+                average_hold_time=self._calculate_average_hold_time(),
                 profit_factor=profit_factor
             )
             
@@ -216,50 +284,97 @@ class PortfolioTracker:
             self.logger.error(f"Performance metrics calculation failed: {e}")
             return self._get_default_metrics()
     
+    def _update_running_metrics(self, position_exit: PositionExit) -> None:
+        """
+        Fold one closed position into the running metrics.
+        
+        Args:
+            position_exit: Position exit details
+        """
+        running = self.running
+        pnl = position_exit.realized_pnl
+        
+        running.total_trades += 1
+        running.total_pnl += pnl
+        running.total_fees += position_exit.gas_fees
+        
+        if pnl > 0:
+            running.winning_trades += 1
+            running.gross_wins += pnl
+            running.largest_win = max(running.largest_win, pnl)
+        else:
+            running.losing_trades += 1
+            if pnl < 0:
+                running.negative_trades += 1
+                running.gross_losses += pnl
+                running.largest_loss = min(running.largest_loss, pnl)
+        
+        # Equity curve of net P&L and drawdown from its running peak
+        running.equity += pnl - position_exit.gas_fees
+        running.peak_equity = max(running.peak_equity, running.equity)
+        running.max_drawdown = max(running.max_drawdown, running.peak_equity - running.equity)
+        self.equity_curve.append((position_exit.exit_time, running.equity))
+        
+        # Per-trade returns for the Sharpe ratio
+        self.trade_returns.add(float(position_exit.realized_pnl_percentage) / 100)
+        
+        # Hold time, when the opening was tracked
+        position = self._get_position_by_id(position_exit.position_id)
+        if position:
+            running.hold_seconds_total += (position_exit.exit_time - position.entry_time).total_seconds()
+            running.hold_count += 1
+        
+        # Per-chain aggregates
+        chain_stats = self._get_chain_accumulator(self._get_chain(position_exit.position_id))
+        chain_stats.positions += 1
+        chain_stats.total_pnl += pnl
+        if pnl > 0:
+            chain_stats.wins += 1
+        if chain_stats.best_exit is None or pnl > chain_stats.best_exit[0]:
+            chain_stats.best_exit = (pnl, position_exit.position_id)
+        if chain_stats.worst_exit is None or pnl < chain_stats.worst_exit[0]:
+            chain_stats.worst_exit = (pnl, position_exit.position_id)
+    
+    def _get_chain_accumulator(self, chain: str) -> ChainAccumulator:
+        """Get or create the running aggregates for a chain."""
+        if chain not in self.running.chains:
+            self.running.chains[chain] = ChainAccumulator()
+        return self.running.chains[chain]
+    
+    def _journal_available(self) -> bool:
+        """Whether full-history queries can be answered from the trade journal."""
+        return bool(self.journal and self.journal.enabled and self.journal.row_count() > 0)
+    
     def get_chain_performance(self) -> List[ChainMetrics]:
         """Get performance metrics broken down by blockchain."""
         try:
-            chain_data = {}
-            
-            # Group exits by chain
-            for exit in self.exit_history:
-                # Get chain from position (simplified lookup)
-                chain = self._get_chain_from_position_id(exit.position_id)
-                
-                if chain not in chain_data:
-                    chain_data[chain] = {
-                        'exits': [],
-                        'positions': 0,
-                        'total_pnl': Decimal('0'),
-                        'wins': 0
-                    }
-                
-                chain_data[chain]['exits'].append(exit)
-                chain_data[chain]['positions'] += 1
-                chain_data[chain]['total_pnl'] += exit.realized_pnl
-                if exit.realized_pnl > 0:
-                    chain_data[chain]['wins'] += 1
+            if self._journal_available():
+                return [
+                    ChainMetrics(
+                        chain=row['chain'],
+                        positions=row['positions'],
+                        total_pnl=Decimal(str(row['total_pnl'])),
+                        win_rate=row['win_rate'],
+                        average_position_size=Decimal(str(row['average_position_size'])),
+                        best_performer=row['best_performer'],
+                        worst_performer=row['worst_performer']
+                    )
+                    for row in self.journal.chain_performance()
+                ]
             
-            # Create metrics for each chain
             chain_metrics = []
-            for chain, data in chain_data.items():
-                win_rate = (data['wins'] / data['positions'] * 100) if data['positions'] > 0 else 0
-                
-                # Find best and worst performers
-                exits = data['exits']
-                best_exit = max(exits, key=lambda x: x.realized_pnl) if exits else None
-                worst_exit = min(exits, key=lambda x: x.realized_pnl) if exits else None
-                
-                avg_position_size = self._calculate_average_position_size_for_chain(chain)
+            for chain, data in self.running.chains.items():
+                if data.positions == 0:
+                    continue
                 
                 chain_metrics.append(ChainMetrics(
                     chain=chain,
-                    positions=data['positions'],
-                    total_pnl=data['total_pnl'],
-                    win_rate=win_rate,
-                    average_position_size=avg_position_size,
-                    best_performer=self._get_token_from_position_id(best_exit.position_id) if best_exit else None,
-                    worst_performer=self._get_token_from_position_id(worst_exit.position_id) if worst_exit else None
+                    positions=data.positions,
+                    total_pnl=data.total_pnl,
+                    win_rate=data.wins / data.positions * 100,
+                    average_position_size=self._calculate_average_position_size_for_chain(chain),
+                    best_performer=self._get_token_symbol(data.best_exit[1]) if data.best_exit else None,
+                    worst_performer=self._get_token_symbol(data.worst_exit[1]) if data.worst_exit else None
                 ))
             
             return sorted(chain_metrics, key=lambda x: x.total_pnl, reverse=True)
@@ -381,10 +496,39 @@ class PortfolioTracker:
             self.logger.error(f"JSON report generation failed: {e}")
             return json.dumps({'error': str(e)})
     
+    def get_daily_pnl(self, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get realized P&L per day from the trade journal.
+        
+        Args:
+            days: Optional number of most recent days
+            
+        Returns:
+            List of per-day P&L dictionaries (empty without a journal)
+        """
+        return self.journal.daily_pnl(days) if self.journal else []
+    
+    def get_token_stats(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-token trade statistics from the trade journal.
+        
+        Args:
+            limit: Optional number of tokens, by total P&L
+            
+        Returns:
+            List of per-token dictionaries (empty without a journal)
+        """
+        return self.journal.token_stats(limit) if self.journal else []
+    
     def _generate_csv_report(self) -> str:
         """Generate CSV report of all trades."""
         try:
             output = StringIO()
+            
+            if self._journal_available():
+                self.journal.export_csv(output)
+                return output.getvalue()
+            
             writer = csv.writer(output)
             
             # Header
@@ -403,8 +547,8 @@ class PortfolioTracker:
                 
                 writer.writerow([
                     exit.position_id,
-                    self._get_token_from_position_id(exit.position_id),
-                    self._get_chain_from_position_id(exit.position_id),
+                    self._get_token_symbol(exit.position_id),
+                    self._get_chain(exit.position_id),
                     position.entry_time.isoformat() if position else '',
                     exit.exit_time.isoformat(),
                     str(exit.exit_amount),
@@ -429,70 +573,28 @@ class PortfolioTracker:
         return Decimal('1000')  # Placeholder
     
     def _calculate_drawdown(self) -> Tuple[Decimal, Decimal]:
-        """Calculate maximum and current drawdown."""
-        # Simplified implementation
-        return Decimal('0'), Decimal('0')
+        """Get maximum and current drawdown of the net P&L equity curve."""
+        return self.running.max_drawdown, self.running.peak_equity - self.running.equity
     
     def _calculate_average_hold_time(self) -> timedelta:
-        """Calculate average position hold time."""
-        if not self.exit_history:
+        """Get average hold time of closed positions whose opening was tracked."""
+        if self.running.hold_count == 0:
             return timedelta(0)
-        
-        try:
-            total_seconds = 0
-            valid_exits = 0
-            
-            for exit in self.exit_history:
-                position = self._get_position_by_id(exit.position_id)
-                if position:
-                    hold_time = exit.exit_time - position.entry_time
-                    total_seconds += hold_time.total_seconds()
-                    valid_exits += 1
-            
-            if valid_exits > 0:
-                return timedelta(seconds=total_seconds / valid_exits)
-            
-        except Exception as e:
-            self.logger.error(f"Average hold time calculation failed: {e}")
-        
-        return timedelta(0)
+        return timedelta(seconds=self.running.hold_seconds_total / self.running.hold_count)
     
     def _calculate_sharpe_ratio(self) -> Optional[float]:
-        """Calculate Sharpe ratio."""
-        if len(self.daily_returns) < 30:  # Need at least 30 days
+        """Calculate Sharpe ratio over the last 365 trade returns."""
+        if self.trade_returns.count < 30:  # Need at least 30 returns
             return None
         
-        try:
-            import statistics
-            
-            avg_return = statistics.mean(self.daily_returns)
-            std_return = statistics.stdev(self.daily_returns)
-            
-            if std_return == 0:
-                return None
-            
-            # Assume 5% risk-free rate annually
-            risk_free_rate = 0.05 / 365  # Daily risk-free rate
-            
-            return (avg_return - risk_free_rate) / std_return
-            
-        except Exception as e:
-            self.logger.error(f"Sharpe ratio calculation failed: {e}")
+        std_return = self.trade_returns.stdev
+        if std_return == 0:
             return None
-    
-    def _update_daily_returns(self, position_exit: PositionExit) -> None:
-        """Update daily returns tracking."""
-        try:
-            # Simplified daily return calculation
-            return_pct = float(position_exit.realized_pnl_percentage) / 100
-            self.daily_returns.append(return_pct)
-            
-            # Keep only last 365 days
-            if len(self.daily_returns) > 365:
-                self.daily_returns.pop(0)
-                
-        except Exception as e:
-            self.logger.error(f"Daily returns update failed: {e}")
+        
+        # Assume 5% risk-free rate annually
+        risk_free_rate = 0.05 / 365  # Daily risk-free rate
+        
+        return (self.trade_returns.mean - risk_free_rate) / std_return
     
     def _get_default_metrics(self) -> PerformanceMetrics:
         """Get default metrics when calculation fails."""
@@ -526,23 +628,31 @@ class PortfolioTracker:
         else:
             return 'ETHEREUM'
     
+    def _get_chain(self, position_id: str) -> str:
+        """Get the chain of a tracked position, falling back to parsing the ID."""
+        position = self.positions_by_id.get(position_id)
+        if position and position.chain:
+            return position.chain
+        return self._get_chain_from_position_id(position_id)
+    
+    def _get_token_symbol(self, position_id: str) -> str:
+        """Get the token symbol of a tracked position, falling back to parsing the ID."""
+        position = self.positions_by_id.get(position_id)
+        if position:
+            return position.token_symbol
+        return self._get_token_from_position_id(position_id)
+    
     def _get_token_from_position_id(self, position_id: str) -> str:
         """Extract token symbol from position ID."""
         return position_id.split('_')[0] if '_' in position_id else 'UNKNOWN'
     
     def _get_position_by_id(self, position_id: str) -> Optional[Position]:
         """Get position by ID from history."""
-        for position in self.position_history:
-            if position.id == position_id:
-                return position
-        return None
+        return self.positions_by_id.get(position_id)
     
     def _calculate_average_position_size_for_chain(self, chain: str) -> Decimal:
         """Calculate average position size for a specific chain."""
-        chain_positions = [pos for pos in self.position_history if self._get_chain_from_position_id(pos.id) == chain]
-        
-        if not chain_positions:
+        chain_stats = self.running.chains.get(chain)
+        if not chain_stats or chain_stats.opened == 0:
             return Decimal('0')
-        
-        total_size = sum(pos.entry_amount for pos in chain_positions)
-        return total_size / len(chain_positions)
\ No newline at end of file
+        return chain_stats.opened_size / chain_stats.opened
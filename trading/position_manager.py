@@ -3,16 +3,18 @@ Position management system for tracking active trades and portfolio state.
 Handles position lifecycle, P&L calculation, and automated exit strategies.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from decimal import Decimal, ROUND_HALF_UP
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
 import json
+import uuid
 
 from models.token import TradingOpportunity
 from trading.risk_manager import RiskManager, PositionSizeResult
+from trading.trade_journal import trade_journal
 from utils.logger import logger_manager
 
 
@@ -189,6 +191,9 @@ class PositionManager:
         self.active_positions: Dict[str, Position] = {}
         self.closed_positions: List[PositionExit] = []
         
+        # Persistent history of closed trades
+        self.journal = trade_journal
+        
         # Performance tracking
         self.total_realized_pnl = Decimal('0')
         self.total_fees_paid = Decimal('0')
@@ -199,6 +204,26 @@ class PositionManager:
         self.price_update_task: Optional[asyncio.Task] = None
         self.monitoring_active = False
         
+        # Notified whenever positions or P&L change
+        self.listeners: List[Callable[['PositionManager'], None]] = []
+        
+    def add_listener(self, callback: Callable[['PositionManager'], None]) -> None:
+        """
+        Register a callback invoked after positions or P&L change.
+        
+        Args:
+            callback: Function receiving this position manager
+        """
+        self.listeners.append(callback)
+        
+    def _notify_listeners(self) -> None:
+        """Tell listeners that portfolio state changed."""
+        for listener in self.listeners:
+            try:
+                listener(self)
+            except Exception as e:
+                self.logger.error(f"Position listener failed: {e}")
+        
     async def initialize(self) -> None:
         """Initialize the position manager and start monitoring."""
         try:
@@ -218,7 +243,8 @@ class PositionManager:
         opportunity: TradingOpportunity,
         entry_price: Decimal,
         entry_amount: Decimal,
-        entry_tx_hash: Optional[str] = None
+        entry_tx_hash: Optional[str] = None,
+        reservation_id: Optional[str] = None
     ) -> Optional[Position]:
         """
         Open a new trading position.
@@ -228,13 +254,16 @@ class PositionManager:
             entry_price: Price at which position was entered
             entry_amount: Amount of tokens purchased
             entry_tx_hash: Transaction hash of entry trade
+            reservation_id: Exposure reservation from the risk assessment
             
         Returns:
             Position object if successful, None otherwise
         """
         try:
             # Generate unique position ID
-            position_id = f"{opportunity.token.symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            position_id = (
+                f"{opportunity.token.symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            )
             
             # Get risk parameters from opportunity metadata
             recommendation = opportunity.metadata.get('recommendation', {})
@@ -273,7 +302,15 @@ class PositionManager:
             self.position_count += 1
             
             # Update risk manager
-            self.risk_manager.add_position(opportunity.token.symbol, entry_amount)
+            self.risk_manager.add_position(
+                position_id,
+                entry_amount,
+                chain=position.chain,
+                token_address=position.token_address,
+                deployer=opportunity.metadata.get('deployer') or opportunity.metadata.get('creator'),
+                reservation_id=reservation_id
+            )
+            self._notify_listeners()
             
             self.logger.info(
                 f"Position opened: {position.token_symbol} - "
@@ -345,11 +382,13 @@ class PositionManager:
                 
             # Update risk manager P&L
             self.risk_manager.update_daily_pnl(float(realized_pnl))
-            self.risk_manager.remove_position(position.token_symbol)
+            self.risk_manager.remove_position(position_id)
             
             # Move to closed positions
             self.closed_positions.append(position_exit)
+            self.journal.record_exit(position, position_exit)
             del self.active_positions[position_id]
+            self._notify_listeners()
             
             self.logger.info(
                 f"Position closed: {position.token_symbol} - "
@@ -390,6 +429,8 @@ class PositionManager:
                 except Exception as e:
                     self.logger.error(f"Error updating position {position_id}: {e}")
                     continue
+            
+            self._notify_listeners()
                     
         except Exception as e:
             self.logger.error(f"Position price update failed: {e}")
@@ -466,6 +507,8 @@ class PositionManager:
                     await self.price_update_task
                 except asyncio.CancelledError:
                     pass
+            
+            self.journal.flush()
                     
             self.logger.info("Position monitoring stopped")
             
@@ -0,0 +1,812 @@
+"""
+Price alert engine for watchlist items.
+Target prices, stop losses, percentage moves and liquidity drops are kept as
+sorted threshold ladders per token, so evaluating a price tick is a dict
+lookup plus a bisection over that token's thresholds. Ticks are evaluated in
+batches (one per block or polling cycle) and an alert fires when the price
+crosses a threshold, not on every tick beyond it; the first tick for a token
+only sets the starting point. Ticks come from the
+opportunity stream and, for EVM chains, from a poller that reads every watched
+pair's reserves once per block in a single Multicall3 call.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from bisect import bisect_left, bisect_right
+import asyncio
+import time
+
+from models.token import (
+    TradingOpportunity, TokenInfo, LiquidityInfo, ContractAnalysis, SocialMetrics, RiskLevel
+)
+from models.watchlist_store import WatchlistStore, watchlist_key, watchlist_store
+from config.chains import ChainConfig, ChainType, multichain_settings
+from trading.risk_manager import RiskManager, RiskAssessment
+from utils.abi_encoding import (
+    SELECTOR_DECIMALS, SELECTOR_GET_RESERVES, decode_try_aggregate, decode_uint,
+    encode_get_pair, encode_try_aggregate
+)
+from utils.logger import logger_manager
+from utils.replay_io import create_web3
+
+
+class AlertKind(Enum):
+    """Condition that fired an alert."""
+    TARGET_PRICE = "target_price"
+    STOP_LOSS = "stop_loss"
+    MOVE_UP = "move_up"
+    MOVE_DOWN = "move_down"
+    LIQUIDITY_DROP = "liquidity_drop"
+
+
+# Moves from the reference price that alert for every watched token
+DEFAULT_MOVE_PCTS = (0.25, 0.5, 1.0)
+
+# Fraction of the liquidity seen when the token was added that may disappear before alerting
+DEFAULT_LIQUIDITY_DROP_PCT = 0.5
+
+# Multicall3 is deployed at the same address on every supported EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Assumed USD price of the native token when valuing pairs quoted in it
+DEFAULT_NATIVE_USD = 3000.0
+
+
+def is_evm_chain(chain: Optional[str]) -> bool:
+    """Whether a chain name (e.g. ETHEREUM, BASE, SOLANA-PUMP) refers to an EVM chain."""
+    return 'SOLANA' not in str(chain or '').upper()
+
+
+@dataclass
+class PriceTick:
+    """Latest price and/or liquidity observation for one token."""
+    chain: str
+    token_address: str
+    price: Optional[float] = None
+    liquidity_usd: Optional[float] = None
+    block_number: Optional[int] = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def key(self) -> str:
+        """Watchlist key of the token."""
+        return watchlist_key(self.chain, self.token_address)
+
+    @classmethod
+    def from_opportunity(cls, opportunity: TradingOpportunity) -> 'PriceTick':
+        """
+        Build a tick from a freshly detected opportunity.
+
+        Args:
+            opportunity: Opportunity carrying price and liquidity data
+
+        Returns:
+            Price tick for the opportunity's token
+        """
+        price = opportunity.entry_price or opportunity.metadata.get('price_usd')
+        return cls(
+            chain=opportunity.metadata.get('chain', 'unknown'),
+            token_address=opportunity.token.address,
+            price=float(price) if price else None,
+            liquidity_usd=opportunity.liquidity.liquidity_usd,
+            block_number=opportunity.liquidity.block_number
+        )
+
+
+@dataclass
+class AlertRule:
+    """One threshold of one watchlist item."""
+    user_id: str
+    key: str
+    kind: AlertKind
+    threshold: float
+    token_symbol: str
+    auto_buy: bool = False
+
+
+@dataclass
+class PriceAlert:
+    """A threshold crossing."""
+    rule: AlertRule
+    tick: PriceTick
+    value: float
+    previous: Optional[float]
+    fired_at: datetime = field(default_factory=datetime.now)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert alert to dictionary for broadcasting."""
+        return {
+            'user_id': self.rule.user_id,
+            'key': self.rule.key,
+            'token_symbol': self.rule.token_symbol,
+            'token_address': self.tick.token_address,
+            'chain': self.tick.chain,
+            'kind': self.rule.kind.value,
+            'threshold': self.rule.threshold,
+            'value': self.value,
+            'previous': self.previous,
+            'block_number': self.tick.block_number,
+            'fired_at': self.fired_at.isoformat()
+        }
+
+
+class ThresholdLadder:
+    """Thresholds kept sorted, with the rules they belong to in the same order."""
+
+    def __init__(self) -> None:
+        """Initialize an empty ladder."""
+        self.values: List[float] = []
+        self.rules: List[AlertRule] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def add(self, rule: AlertRule) -> None:
+        """Insert a rule at its threshold."""
+        index = bisect_right(self.values, rule.threshold)
+        self.values.insert(index, rule.threshold)
+        self.rules.insert(index, rule)
+
+    def crossed_up(self, previous: Optional[float], current: float) -> List[AlertRule]:
+        """Rules with previous < threshold <= current (all <= current without a previous value)."""
+        low = 0 if previous is None else bisect_right(self.values, previous)
+        high = bisect_right(self.values, current)
+        return self.rules[low:high] if low < high else []
+
+    def crossed_down(self, previous: Optional[float], current: float) -> List[AlertRule]:
+        """Rules with current <= threshold < previous (all >= current without a previous value)."""
+        low = bisect_left(self.values, current)
+        high = len(self.values) if previous is None else bisect_left(self.values, previous)
+        return self.rules[low:high] if low < high else []
+
+
+class TokenAlerts:
+    """Thresholds of one token across every watchlist holding it."""
+
+    def __init__(self, key: str) -> None:
+        """
+        Initialize the token's alert state.
+
+        Args:
+            key: Watchlist key (chain:address)
+        """
+        self.key = key
+        self.records: Dict[str, Dict[str, Any]] = {}
+        self.above = ThresholdLadder()
+        self.below = ThresholdLadder()
+        self.liquidity_below = ThresholdLadder()
+
+        self.last_price: Optional[float] = None
+        self.last_liquidity: Optional[float] = None
+
+        # Observed values used when an item has no price/liquidity from when it was added
+        self.observed_price: Optional[float] = None
+        self.observed_liquidity: Optional[float] = None
+        self.awaiting_observation = False
+
+    def rule_count(self) -> int:
+        """Number of thresholds for this token."""
+        return len(self.above) + len(self.below) + len(self.liquidity_below)
+
+    def rebuild(self, move_pcts: Iterable[float], liquidity_drop_pct: float) -> None:
+        """
+        Recompute the threshold ladders from the watchlist records.
+
+        Args:
+            move_pcts: Percentage moves from the reference price to alert on
+            liquidity_drop_pct: Fraction of reference liquidity whose loss alerts
+        """
+        self.above = ThresholdLadder()
+        self.below = ThresholdLadder()
+        self.liquidity_below = ThresholdLadder()
+        self.awaiting_observation = False
+
+        for user_id, record in self.records.items():
+            if record.get('status', 'watching') != 'watching':
+                continue
+
+            metadata = record.get('metadata') or {}
+            symbol = record.get('token_symbol') or 'UNKNOWN'
+            auto_buy = bool(metadata.get('auto_buy'))
+
+            def rule(kind: AlertKind, threshold: float) -> AlertRule:
+                return AlertRule(user_id, self.key, kind, threshold, symbol, auto_buy)
+
+            if record.get('target_price'):
+                self.above.add(rule(AlertKind.TARGET_PRICE, float(record['target_price'])))
+            if record.get('stop_loss'):
+                self.below.add(rule(AlertKind.STOP_LOSS, float(record['stop_loss'])))
+
+            reference_price = record.get('price_when_added') or self.observed_price
+            if reference_price:
+                for pct in move_pcts:
+                    self.above.add(rule(AlertKind.MOVE_UP, float(reference_price) * (1 + pct)))
+                    if pct < 1:
+                        self.below.add(rule(AlertKind.MOVE_DOWN, float(reference_price) * (1 - pct)))
+            else:
+                self.awaiting_observation = True
+
+            reference_liquidity = metadata.get('liquidity_usd') or self.observed_liquidity
+            if reference_liquidity and liquidity_drop_pct > 0:
+                self.liquidity_below.add(
+                    rule(AlertKind.LIQUIDITY_DROP, float(reference_liquidity) * (1 - liquidity_drop_pct))
+                )
+            elif not reference_liquidity:
+                self.awaiting_observation = True
+
+
+class PriceAlertEngine:
+    """
+    Evaluates batches of price ticks against the thresholds of all watchlist items.
+    The index follows the watchlist store through its change listener.
+    """
+
+    def __init__(
+        self,
+        store: Optional[WatchlistStore] = None,
+        move_pcts: Iterable[float] = DEFAULT_MOVE_PCTS,
+        liquidity_drop_pct: float = DEFAULT_LIQUIDITY_DROP_PCT,
+        batch_interval: float = 1.0
+    ) -> None:
+        """
+        Initialize the alert engine.
+
+        Args:
+            store: Watchlist store to index (the global store by default)
+            move_pcts: Percentage moves from the reference price to alert on
+            liquidity_drop_pct: Fraction of reference liquidity whose loss alerts
+            batch_interval: Seconds between evaluations of submitted ticks
+        """
+        self.logger = logger_manager.get_logger("PriceAlertEngine")
+        self.store = store or watchlist_store
+        self.move_pcts = tuple(move_pcts)
+        self.liquidity_drop_pct = liquidity_drop_pct
+        self.batch_interval = batch_interval
+
+        self.tokens: Dict[str, TokenAlerts] = {}
+        self.pending: List[PriceTick] = []
+
+        self.listeners: List[Callable[[List[PriceAlert]], Any]] = []
+        self.is_running = False
+
+        self.batches = 0
+        self.ticks_evaluated = 0
+        self.alerts_fired = 0
+        self.last_batch_ms = 0.0
+
+        self.store.add_listener(self._on_watchlist_change)
+        self._rebuild_all()
+
+    def add_listener(self, callback: Callable[[List[PriceAlert]], Any]) -> None:
+        """
+        Register a callback for fired alerts.
+
+        Args:
+            callback: Function (sync or async) receiving each batch's alerts
+        """
+        self.listeners.append(callback)
+
+    def _rebuild_all(self) -> None:
+        """Index every record in the store."""
+        self.tokens = {}
+        for user_id, records in self.store.records.items():
+            for key, record in records.items():
+                self._index(user_id, key, record)
+        self.logger.info(
+            f"Price alerts indexed: {len(self.tokens)} tokens, "
+            f"{sum(token.rule_count() for token in self.tokens.values())} thresholds"
+        )
+
+    def _index(self, user_id: str, key: str, record: Optional[Dict[str, Any]]) -> None:
+        """Add, replace or (record None) remove one item's thresholds."""
+        token = self.tokens.get(key)
+        if record is None:
+            if token is None:
+                return
+            token.records.pop(user_id, None)
+            if not token.records:
+                del self.tokens[key]
+                return
+        else:
+            if token is None:
+                token = self.tokens[key] = TokenAlerts(key)
+            token.records[user_id] = record
+        token.rebuild(self.move_pcts, self.liquidity_drop_pct)
+
+    def _on_watchlist_change(
+        self,
+        user_id: Optional[str],
+        key: Optional[str],
+        record: Optional[Dict[str, Any]]
+    ) -> None:
+        """Keep the index in step with the watchlist store."""
+        if user_id is None:
+            self._rebuild_all()
+        elif key is None:
+            for token_key in [k for k, token in self.tokens.items() if user_id in token.records]:
+                self._index(user_id, token_key, None)
+        else:
+            self._index(user_id, key, record)
+
+    def submit(self, ticks: Iterable[PriceTick]) -> None:
+        """
+        Queue ticks for the next batch. Ticks for unwatched tokens are dropped here.
+
+        Args:
+            ticks: Price observations
+        """
+        self.pending.extend(tick for tick in ticks if tick.key in self.tokens)
+
+    def evaluate(self, ticks: Iterable[PriceTick]) -> List[PriceAlert]:
+        """
+        Evaluate a batch of ticks in order.
+
+        Args:
+            ticks: Price observations
+
+        Returns:
+            Alerts for every threshold crossed
+        """
+        alerts: List[PriceAlert] = []
+        evaluated = 0
+
+        for tick in ticks:
+            token = self.tokens.get(tick.key)
+            if token is None:
+                continue
+            evaluated += 1
+
+            # Items without a price or liquidity from when they were added use the first one seen
+            if token.awaiting_observation and (
+                (token.observed_price is None and tick.price) or
+                (token.observed_liquidity is None and tick.liquidity_usd)
+            ):
+                token.observed_price = token.observed_price or tick.price
+                token.observed_liquidity = token.observed_liquidity or tick.liquidity_usd
+                token.rebuild(self.move_pcts, self.liquidity_drop_pct)
+
+            # The first tick after a (re)start only seeds the last value: thresholds it is
+            # already beyond were crossed before, and firing them again would repeat alerts
+            if tick.price is not None:
+                previous = token.last_price
+                if previous is not None:
+                    for rule in token.above.crossed_up(previous, tick.price):
+                        alerts.append(PriceAlert(rule, tick, tick.price, previous))
+                    for rule in token.below.crossed_down(previous, tick.price):
+                        alerts.append(PriceAlert(rule, tick, tick.price, previous))
+                token.last_price = tick.price
+
+            if tick.liquidity_usd is not None:
+                previous = token.last_liquidity
+                if previous is not None:
+                    for rule in token.liquidity_below.crossed_down(previous, tick.liquidity_usd):
+                        alerts.append(PriceAlert(rule, tick, tick.liquidity_usd, previous))
+                token.last_liquidity = tick.liquidity_usd
+
+        self.ticks_evaluated += evaluated
+        self.alerts_fired += len(alerts)
+        return alerts
+
+    async def process_batch(self, ticks: Optional[Iterable[PriceTick]] = None) -> List[PriceAlert]:
+        """
+        Evaluate a batch (the queued ticks by default) and notify listeners.
+
+        Args:
+            ticks: Ticks to evaluate instead of the queued ones
+
+        Returns:
+            Fired alerts
+        """
+        if ticks is None:
+            ticks, self.pending = self.pending, []
+
+        started = time.perf_counter()
+        alerts = self.evaluate(ticks)
+        self.last_batch_ms = (time.perf_counter() - started) * 1000
+        self.batches += 1
+
+        if alerts:
+            self.logger.info(f"{len(alerts)} price alert(s) fired")
+            for callback in self.listeners:
+                try:
+                    result = callback(alerts)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception as e:
+                    self.logger.error(f"Price alert listener failed: {e}")
+
+        return alerts
+
+    async def start(self) -> None:
+        """Evaluate queued ticks once per batch interval until stopped."""
+        self.is_running = True
+        self.logger.info("Price alert engine started")
+
+        while self.is_running:
+            try:
+                if self.pending:
+                    await self.process_batch()
+            except Exception as e:
+                self.logger.error(f"Price alert batch failed: {e}")
+
+            await asyncio.sleep(self.batch_interval)
+
+    def stop(self) -> None:
+        """Stop the evaluation loop."""
+        self.is_running = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get engine statistics."""
+        return {
+            'tokens': len(self.tokens),
+            'thresholds': sum(token.rule_count() for token in self.tokens.values()),
+            'pending_ticks': len(self.pending),
+            'batches': self.batches,
+            'ticks_evaluated': self.ticks_evaluated,
+            'alerts_fired': self.alerts_fired,
+            'last_batch_ms': round(self.last_batch_ms, 3),
+            'running': self.is_running
+        }
+
+
+@dataclass
+class WatchedPair:
+    """Pool a watched token is priced from."""
+    key: str
+    token_address: str
+    pair_address: str
+    quote_address: str
+
+    @property
+    def token_is_token0(self) -> bool:
+        """Uniswap V2 pairs order their tokens by address."""
+        return int(self.token_address, 16) < int(self.quote_address, 16)
+
+
+class ReservePoller:
+    """
+    Feeds the alert engine from chain state. On each EVM chain with watched
+    tokens it waits for a new block, then reads the reserves of every watched
+    pair with one Multicall3 tryAggregate call and submits the resulting ticks.
+    Pairs missing from the watchlist metadata are looked up on the chain's DEX
+    factory, and token decimals are fetched, in the same call the first time a
+    token is seen.
+    """
+
+    def __init__(
+        self,
+        engine: PriceAlertEngine,
+        chains: Optional[Dict[ChainType, ChainConfig]] = None,
+        native_usd: float = DEFAULT_NATIVE_USD,
+        batch_size: int = 500
+    ) -> None:
+        """
+        Initialize the reserve poller.
+
+        Args:
+            engine: Alert engine whose watched tokens are polled and which receives the ticks
+            chains: EVM chain configurations (the multi-chain settings by default)
+            native_usd: USD price of the native token, used to value pairs quoted in it
+            batch_size: Maximum calls per Multicall3 request
+        """
+        self.logger = logger_manager.get_logger("ReservePoller")
+        self.engine = engine
+        self.chains = chains or multichain_settings.chains
+        self.native_usd = native_usd
+        self.batch_size = batch_size
+
+        # Resolved pools by watchlist key; None when the token has no pool on the chain's DEX
+        self.pairs: Dict[str, Optional[WatchedPair]] = {}
+        self.decimals: Dict[str, int] = {}
+        self.last_block: Dict[ChainType, int] = {}
+        self.is_running = False
+
+        self.blocks_polled = 0
+        self.ticks_submitted = 0
+        self.poll_failures = 0
+
+    def _pair_from_metadata(self, key: str, config: ChainConfig) -> Optional[WatchedPair]:
+        """Build the token's pool from any watchlist record carrying its pair address."""
+        token = self.engine.tokens.get(key)
+        if token is None:
+            return None
+        for record in token.records.values():
+            metadata = record.get('metadata') or {}
+            if metadata.get('pair_address'):
+                return WatchedPair(
+                    key=key,
+                    token_address=key.split(':', 1)[1],
+                    pair_address=metadata['pair_address'],
+                    quote_address=metadata.get('quote_token') or config.wrapped_native
+                )
+        return None
+
+    def _quote_usd(self, quote_address: str, config: ChainConfig) -> Optional[float]:
+        """USD value of one quote token, if the quote is the native or a stable token."""
+        if quote_address.lower() == config.wrapped_native.lower():
+            return self.native_usd
+        if quote_address.lower() in (stable.lower() for stable in config.stable_tokens):
+            return 1.0
+        return None
+
+    async def _eth_call(self, w3, data: bytes, block_number: int) -> bytes:
+        """Run one eth_call against the Multicall3 contract at a block."""
+        response = await asyncio.to_thread(
+            w3.provider.make_request,
+            "eth_call",
+            [{'to': MULTICALL3_ADDRESS, 'data': '0x' + data.hex()}, hex(block_number)]
+        )
+        error = response.get('error')
+        if error:
+            raise RuntimeError(error.get('message', str(error)))
+        return bytes.fromhex(response['result'][2:])
+
+    async def _multicall(self, w3, calls: List[Any], block_number: int) -> List[Any]:
+        """Run (target, calldata) calls through tryAggregate, splitting very large batches."""
+        chunks = [calls[i:i + self.batch_size] for i in range(0, len(calls), self.batch_size)]
+        outputs = await asyncio.gather(
+            *(self._eth_call(w3, encode_try_aggregate(chunk), block_number) for chunk in chunks)
+        )
+        return [result for output in outputs for result in decode_try_aggregate(output)]
+
+    async def poll_block(
+        self,
+        w3,
+        chain: ChainType,
+        config: ChainConfig,
+        block_number: int
+    ) -> List[PriceTick]:
+        """
+        Read the reserves of every watched pool on a chain at a block.
+
+        Args:
+            w3: Web3 connection to the chain
+            chain: Chain being polled
+            config: Chain configuration
+            block_number: Block to read the reserves at
+
+        Returns:
+            One tick per priced pool
+        """
+        prefix = f"{chain.value}:"
+        keys = [key for key in self.engine.tokens if key.startswith(prefix)]
+        for key in [key for key in self.pairs if key.startswith(prefix) and key not in self.engine.tokens]:
+            del self.pairs[key]
+
+        calls: List[Any] = []
+        handlers: List[Any] = []
+        for key in keys:
+            if key not in self.pairs:
+                pair = self._pair_from_metadata(key, config)
+                if pair is None:
+                    calls.append((config.dex_factory, encode_get_pair(key.split(':', 1)[1], config.wrapped_native)))
+                    handlers.append(('pair', key))
+                    continue
+                self.pairs[key] = pair
+
+            pair = self.pairs[key]
+            if pair is None:
+                continue
+            for address in (pair.token_address, pair.quote_address):
+                if address.lower() not in self.decimals:
+                    calls.append((address, SELECTOR_DECIMALS))
+                    handlers.append(('decimals', address.lower()))
+            calls.append((pair.pair_address, SELECTOR_GET_RESERVES))
+            handlers.append(('reserves', pair))
+
+        if not calls:
+            return []
+
+        results = await self._multicall(w3, calls, block_number)
+
+        reserves = []
+        for (kind, subject), (success, data) in zip(handlers, results):
+            if kind == 'pair':
+                address = data[12:32] if success and len(data) >= 32 else bytes(20)
+                if any(address):
+                    self.pairs[subject] = WatchedPair(
+                        key=subject,
+                        token_address=subject.split(':', 1)[1],
+                        pair_address='0x' + address.hex(),
+                        quote_address=config.wrapped_native
+                    )
+                else:
+                    self.pairs[subject] = None
+                    self.logger.debug(f"No {config.name} pool found for watched token {subject}")
+            elif kind == 'decimals':
+                self.decimals[subject] = decode_uint(data) if success and len(data) >= 32 else 18
+            elif success and len(data) >= 64:
+                reserves.append((subject, decode_uint(data, 0), decode_uint(data, 1)))
+
+        ticks = []
+        for pair, reserve0, reserve1 in reserves:
+            token_reserve, quote_reserve = (reserve0, reserve1) if pair.token_is_token0 else (reserve1, reserve0)
+            quote_usd = self._quote_usd(pair.quote_address, config)
+            if not token_reserve or quote_usd is None:
+                continue
+
+            token_amount = token_reserve / 10 ** self.decimals.get(pair.token_address.lower(), 18)
+            quote_amount = quote_reserve / 10 ** self.decimals.get(pair.quote_address.lower(), 18)
+            ticks.append(PriceTick(
+                chain=chain.name,
+                token_address=pair.token_address,
+                price=quote_amount / token_amount * quote_usd,
+                liquidity_usd=2 * quote_amount * quote_usd,
+                block_number=block_number
+            ))
+
+        return ticks
+
+    async def _poll_chain(self, chain: ChainType, config: ChainConfig) -> None:
+        """Poll one chain for new blocks while any of its tokens are watched."""
+        w3 = create_web3(config.rpc_url, chain.name)
+        prefix = f"{chain.value}:"
+
+        while self.is_running:
+            try:
+                if any(key.startswith(prefix) for key in self.engine.tokens):
+                    response = await asyncio.to_thread(w3.provider.make_request, "eth_blockNumber", [])
+                    block_number = int(response['result'], 16)
+                    if block_number > self.last_block.get(chain, 0):
+                        self.last_block[chain] = block_number
+                        ticks = await self.poll_block(w3, chain, config, block_number)
+                        self.blocks_polled += 1
+                        if ticks:
+                            self.engine.submit(ticks)
+                            self.ticks_submitted += len(ticks)
+            except Exception as e:
+                self.poll_failures += 1
+                self.logger.error(f"{config.name} reserve poll failed: {e}")
+
+            # Check twice per block so each new block is picked up promptly
+            await asyncio.sleep(config.block_time / 2)
+
+    async def start(self) -> None:
+        """Poll every configured EVM chain until stopped."""
+        self.is_running = True
+        self.logger.info(f"Reserve poller started for {', '.join(config.name for config in self.chains.values())}")
+        await asyncio.gather(*(self._poll_chain(chain, config) for chain, config in self.chains.items()))
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self.is_running = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get poller statistics."""
+        return {
+            'pairs': sum(1 for pair in self.pairs.values() if pair is not None),
+            'blocks_polled': self.blocks_polled,
+            'ticks_submitted': self.ticks_submitted,
+            'poll_failures': self.poll_failures,
+            'last_block': {chain.name: block for chain, block in self.last_block.items()},
+            'running': self.is_running
+        }
+
+
+class AlertAutoBuyer:
+    """
+    Alert listener that buys watched tokens through the normal risk and
+    execution path when selected alerts fire.
+    """
+
+    def __init__(
+        self,
+        risk_manager: RiskManager,
+        execution_engine,
+        store: Optional[WatchlistStore] = None,
+        kinds: Iterable[AlertKind] = (AlertKind.TARGET_PRICE,),
+        opt_in_only: bool = True
+    ) -> None:
+        """
+        Initialize the auto-buyer.
+
+        Args:
+            risk_manager: Risk manager sizing and approving the buy
+            execution_engine: Execution engine placing the order
+            store: Watchlist store holding the alerted items
+            kinds: Alert kinds that trigger a buy
+            opt_in_only: Only buy items whose metadata sets auto_buy
+        """
+        self.logger = logger_manager.get_logger("AlertAutoBuyer")
+        self.risk_manager = risk_manager
+        self.execution_engine = execution_engine
+        self.store = store or watchlist_store
+        self.kinds = set(kinds)
+        self.opt_in_only = opt_in_only
+
+        # Tokens already bought, so repeated crossings do not stack positions; the buy is
+        # also stored in the watchlist record so it survives a restart
+        self.bought: Set[str] = set()
+
+    def _build_opportunity(self, alert: PriceAlert, record: Dict[str, Any]) -> TradingOpportunity:
+        """Rebuild an opportunity from a watchlist record and the alerting tick."""
+        metadata = record.get('metadata') or {}
+        try:
+            risk_level = RiskLevel(record.get('risk_level'))
+        except ValueError:
+            risk_level = RiskLevel.MEDIUM
+
+        opportunity = TradingOpportunity(
+            token=TokenInfo(
+                address=record['token_address'],
+                symbol=record.get('token_symbol'),
+                name=record.get('token_name')
+            ),
+            liquidity=LiquidityInfo(
+                pair_address="",
+                dex_name=metadata.get('dex_name') or "Unknown",
+                token0=record['token_address'],
+                token1="",
+                reserve0=0.0,
+                reserve1=0.0,
+                liquidity_usd=float(alert.tick.liquidity_usd or metadata.get('liquidity_usd') or 0.0),
+                created_at=datetime.now(),
+                block_number=alert.tick.block_number or 0
+            ),
+            contract_analysis=ContractAnalysis(risk_level=risk_level),
+            social_metrics=SocialMetrics(social_score=metadata.get('social_score') or 0.0),
+            entry_price=alert.tick.price
+        )
+        opportunity.metadata.update({
+            'chain': record.get('chain'),
+            'source': 'watchlist_alert',
+            'alert_kind': alert.rule.kind.value,
+            'recommendation': {
+                'action': metadata.get('action') or 'BUY',
+                'confidence': metadata.get('confidence') or 'MEDIUM',
+                'score': record.get('score', 0.0)
+            }
+        })
+        return opportunity
+
+    def _mark_bought(self, rule: AlertRule, record: Dict[str, Any]) -> None:
+        """Record the buy in the watchlist item's metadata."""
+        try:
+            metadata = dict(record.get('metadata') or {})
+            metadata['auto_bought_at'] = datetime.now().isoformat()
+            metadata['auto_buy_alert'] = rule.kind.value
+            self.store.put(rule.user_id, rule.key, {**record, 'metadata': metadata})
+        except Exception as e:
+            self.logger.error(f"Failed to record alert buy for {rule.token_symbol}: {e}")
+
+    async def __call__(self, alerts: List[PriceAlert]) -> None:
+        """Buy the tokens of qualifying alerts."""
+        for alert in alerts:
+            rule = alert.rule
+            if rule.kind not in self.kinds or rule.key in self.bought:
+                continue
+            if self.opt_in_only and not rule.auto_buy:
+                continue
+            if not is_evm_chain(alert.tick.chain):
+                # Buys go through the EVM execution engine; TokenInfo rejects Solana addresses
+                self.logger.debug(f"Alert buy skipped for {rule.token_symbol}: {alert.tick.chain} is not an EVM chain")
+                continue
+
+            record = self.store.get(rule.user_id, rule.key)
+            if record is None:
+                continue
+            if (record.get('metadata') or {}).get('auto_bought_at'):
+                self.bought.add(rule.key)
+                continue
+
+            try:
+                opportunity = self._build_opportunity(alert, record)
+                assessment = self.risk_manager.assess_opportunity(opportunity)
+                if assessment.risk_assessment == RiskAssessment.REJECTED:
+                    self.risk_manager.release_reservation(assessment.reservation_id)
+                    self.logger.info(f"Alert buy rejected for {rule.token_symbol}: {assessment.reasons}")
+                    continue
+
+                self.bought.add(rule.key)
+                position = await self.execution_engine.execute_buy_order(opportunity, assessment)
+                if position is None:
+                    self.bought.discard(rule.key)
+                else:
+                    self._mark_bought(rule, record)
+                    self.logger.info(f"Alert buy executed for {rule.token_symbol} ({rule.kind.value})")
+
+            except Exception as e:
+                self.bought.discard(rule.key)
+                self.logger.error(f"Alert buy failed for {rule.token_symbol}: {e}")
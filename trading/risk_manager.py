@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 from models.token import TradingOpportunity, RiskLevel
+from trading.exposure_ledger import ExposureLedger
+from trading.gas_oracle import GasOracle, GasUrgency, DEFAULT_SWAP_GAS_LIMIT
 from utils.logger import logger_manager
 
 
@@ -31,6 +33,14 @@ class PositionSizeResult:
     max_loss_usd: float
     recommended_stop_loss: float
     recommended_take_profit: float
+    reservation_id: Optional[str] = None  # Exposure held for this trade until opened or released
+
+    @property
+    def rejection_reason(self) -> Optional[str]:
+        """Reason that rejected the trade; checks append it after the sizing notes."""
+        if self.risk_assessment != RiskAssessment.REJECTED or not self.reasons:
+            return None
+        return self.reasons[-1]
 
 
 @dataclass
@@ -42,6 +52,14 @@ class PortfolioLimits:
     max_positions_per_chain: int = 5
     max_total_positions: int = 15
     min_liquidity_ratio: float = 0.1  # 10% of liquidity
+    max_gas_cost_ratio: float = 0.1  # Round-trip gas at most 10% of position
+    max_exposure_per_chain_usd: Optional[float] = None
+    max_exposure_per_token_usd: Optional[float] = None
+    max_exposure_per_deployer_usd: Optional[float] = None
+
+
+# Simplified native-to-USD conversion used for exposure accounting
+USD_PER_NATIVE_UNIT = 100.0
 
 
 class RiskManager:
@@ -60,11 +78,12 @@ class RiskManager:
         self.logger = logger_manager.get_logger("RiskManager")
         self.limits = portfolio_limits or PortfolioLimits()
         
-        # Track current positions and daily performance
-        self.current_positions: Dict[str, Decimal] = {}
-        self.daily_pnl: float = 0.0
+        # Open positions, reservations and rolling 24h P&L
+        self.ledger = ExposureLedger()
         self.position_history: List[Dict] = []
-        self.last_reset_date = datetime.now().date()
+        
+        # Gas oracles by chain for gas-cost checks
+        self.gas_oracles: Dict[str, GasOracle] = {}
         
         # Risk assessment weights
         self.risk_weights = {
@@ -87,8 +106,8 @@ class RiskManager:
         try:
             self.logger.debug(f"Assessing risk for {opportunity.token.symbol}")
             
-            # Reset daily tracking if needed
-            self._reset_daily_tracking_if_needed()
+            # Drop reservations for trades that were never placed
+            self.ledger.expire_reservations()
             
             # Calculate individual risk components
             contract_risk = self._assess_contract_risk(opportunity)
@@ -410,30 +429,45 @@ class RiskManager:
                     recommended_take_profit=position_result.recommended_take_profit
                 )
             
-            # Check position count limits
             chain = opportunity.metadata.get('chain', 'ETHEREUM')
-            chain_positions = len([pos for pos in self.current_positions.keys() if chain in pos])
-            
-            if chain_positions >= self.limits.max_positions_per_chain:
-                reasons.append(f"Chain position limit reached ({chain_positions})")
-                approved_amount = Decimal('0')
+            token_address = opportunity.token.address
+            deployer = opportunity.metadata.get('deployer') or opportunity.metadata.get('creator')
+            reservation_id = None
+            
+            # Limit checks and the reservation happen under one lock so that
+            # concurrent assessments cannot both fit under the same limit
+            with self.ledger.lock:
+                chain_positions = self.ledger.get_chain_count(chain)
+                if chain_positions >= self.limits.max_positions_per_chain:
+                    reasons.append(f"Chain position limit reached ({chain_positions})")
+                    approved_amount = Decimal('0')
+                    
+                if self.ledger.total_count >= self.limits.max_total_positions:
+                    reasons.append(f"Total position limit reached ({self.ledger.total_count})")
+                    approved_amount = Decimal('0')
+                    
+                # Check exposure limits (simplified USD conversion)
+                if approved_amount > 0:
+                    approved_amount, exposure_reason = self._fit_exposure_limits(
+                        chain, token_address, deployer, approved_amount
+                    )
+                    if exposure_reason:
+                        reasons.append(exposure_reason)
                 
-            if len(self.current_positions) >= self.limits.max_total_positions:
-                reasons.append(f"Total position limit reached ({len(self.current_positions)})")
-                approved_amount = Decimal('0')
+                # Check gas cost against position size (buy and sell)
+                if approved_amount > 0:
+                    gas_reason = self._check_gas_cost(chain, approved_amount)
+                    if gas_reason:
+                        reasons.append(gas_reason)
+                        approved_amount = Decimal('0')
                 
-            # Check total exposure (simplified)
-            current_exposure_usd = sum([float(pos) * 100 for pos in self.current_positions.values()])
-            new_exposure_usd = float(approved_amount) * 100  # Simplified USD conversion
-            
-            if current_exposure_usd + new_exposure_usd > self.limits.max_total_exposure_usd:
-                max_additional = self.limits.max_total_exposure_usd - current_exposure_usd
-                if max_additional <= 0:
-                    approved_amount = Decimal('0')
-                    reasons.append("Total exposure limit reached")
-                else:
-                    approved_amount = Decimal(str(max_additional / 100))
-                    reasons.append("Position size limited by total exposure")
+                if approved_amount > 0:
+                    reservation_id = self.ledger.reserve(
+                        chain,
+                        token_address,
+                        float(approved_amount) * USD_PER_NATIVE_UNIT,
+                        deployer
+                    )
             
             # Update assessment based on constraints
             if approved_amount == Decimal('0') and position_result.risk_assessment != RiskAssessment.REJECTED:
@@ -448,13 +482,111 @@ class RiskManager:
                 reasons=reasons,
                 max_loss_usd=position_result.max_loss_usd,
                 recommended_stop_loss=position_result.recommended_stop_loss,
-                recommended_take_profit=position_result.recommended_take_profit
+                recommended_take_profit=position_result.recommended_take_profit,
+                reservation_id=reservation_id
             )
             
         except Exception as e:
             self.logger.error(f"Portfolio constraint application failed: {e}")
             return self._create_rejection_result("Portfolio constraint check failed")
 
+    def _fit_exposure_limits(
+        self,
+        chain: str,
+        token_address: str,
+        deployer: Optional[str],
+        amount: Decimal
+    ) -> Tuple[Decimal, Optional[str]]:
+        """
+        Shrink a position to the tightest of the total, chain, token and deployer exposure limits.
+        
+        Args:
+            chain: Chain label
+            token_address: Token address
+            deployer: Optional deployer address
+            amount: Requested position size in native units
+            
+        Returns:
+            Tuple of (allowed amount, reason if the amount was reduced or rejected)
+        """
+        headrooms = [('Total', self.limits.max_total_exposure_usd - self.ledger.exposure_total)]
+        if self.limits.max_exposure_per_chain_usd is not None:
+            headrooms.append(('Chain', self.limits.max_exposure_per_chain_usd - self.ledger.get_chain_exposure(chain)))
+        if self.limits.max_exposure_per_token_usd is not None:
+            headrooms.append(('Token', self.limits.max_exposure_per_token_usd - self.ledger.get_token_exposure(token_address)))
+        if self.limits.max_exposure_per_deployer_usd is not None and deployer:
+            headrooms.append(('Deployer', self.limits.max_exposure_per_deployer_usd - self.ledger.get_deployer_exposure(deployer)))
+        
+        limit_name, max_additional = min(headrooms, key=lambda item: item[1])
+        new_exposure_usd = float(amount) * USD_PER_NATIVE_UNIT
+        
+        if new_exposure_usd <= max_additional:
+            return amount, None
+        if max_additional <= 0:
+            return Decimal('0'), f"{limit_name} exposure limit reached"
+        return Decimal(str(max_additional / USD_PER_NATIVE_UNIT)), f"Position size limited by {limit_name.lower()} exposure"
+
+    def check_capacity(self, chain: str) -> Optional[str]:
+        """
+        Cheap check whether any new position could be approved on a chain.
+        
+        Args:
+            chain: Chain label
+            
+        Returns:
+            Reason no position can be opened, or None if capacity remains
+        """
+        self.ledger.expire_reservations()
+        
+        if self.daily_pnl < -self.limits.max_daily_loss_usd:
+            return "daily loss limit reached"
+        if self.ledger.total_count >= self.limits.max_total_positions:
+            return "total position limit reached"
+        if self.ledger.get_chain_count(chain) >= self.limits.max_positions_per_chain:
+            return "chain position limit reached"
+        if self.ledger.exposure_total >= self.limits.max_total_exposure_usd:
+            return "total exposure limit reached"
+        
+        return None
+
+    def register_gas_oracle(self, chain: str, oracle: GasOracle) -> None:
+        """
+        Register a gas oracle used to check gas cost for a chain.
+        
+        Args:
+            chain: Chain label such as 'ETHEREUM' or 'BASE'
+            oracle: Gas oracle for the chain
+        """
+        self.gas_oracles[chain.upper()] = oracle
+
+    def _check_gas_cost(self, chain: str, amount: Decimal) -> Optional[str]:
+        """
+        Check whether round-trip gas cost is too large relative to the position.
+        
+        Args:
+            chain: Chain label
+            amount: Position size in native units
+            
+        Returns:
+            Rejection reason, or None if gas cost is acceptable or unknown
+        """
+        oracle = self.gas_oracles.get(chain.upper())
+        if not oracle:
+            return None
+            
+        swap_cost = oracle.estimate_cost_native(DEFAULT_SWAP_GAS_LIMIT, GasUrgency.HIGH)
+        if swap_cost is None:
+            return None
+            
+        round_trip_cost = swap_cost * 2
+        max_cost = float(amount) * self.limits.max_gas_cost_ratio
+        if round_trip_cost > max_cost:
+            return (
+                f"Gas cost too high ({round_trip_cost:.5f} vs "
+                f"{self.limits.max_gas_cost_ratio:.0%} of {float(amount):.4f})"
+            )
+        return None
+
     def _create_rejection_result(self, reason: str) -> PositionSizeResult:
         """
         Create a rejection result with the given reason.
@@ -475,13 +607,10 @@ class RiskManager:
             recommended_take_profit=0.30
         )
 
-    def _reset_daily_tracking_if_needed(self) -> None:
-        """Reset daily tracking if we've moved to a new day."""
-        current_date = datetime.now().date()
-        if current_date > self.last_reset_date:
-            self.daily_pnl = 0.0
-            self.last_reset_date = current_date
-            self.logger.info("Daily P&L tracking reset for new day")
+    @property
+    def daily_pnl(self) -> float:
+        """Realized P&L over the last 24 hours."""
+        return self.ledger.get_rolling_pnl()
 
     def update_daily_pnl(self, pnl_change: float) -> None:
         """
@@ -490,30 +619,58 @@ class RiskManager:
         Args:
             pnl_change: Change in P&L (positive for profit, negative for loss)
         """
-        self.daily_pnl += pnl_change
+        self.ledger.record_pnl(pnl_change)
         self.logger.debug(f"Daily P&L updated: ${self.daily_pnl:.2f}")
 
-    def add_position(self, token_symbol: str, amount: Decimal) -> None:
+    def add_position(
+        self,
+        position_id: str,
+        amount: Decimal,
+        chain: str = 'ETHEREUM',
+        token_address: str = '',
+        deployer: Optional[str] = None,
+        reservation_id: Optional[str] = None
+    ) -> None:
         """
         Add a new position to tracking.
         
         Args:
-            token_symbol: Symbol of the token
+            position_id: Stable position ID
             amount: Position size
+            chain: Chain label
+            token_address: Token address
+            deployer: Optional deployer address
+            reservation_id: Reservation made when the trade was assessed
         """
-        self.current_positions[token_symbol] = amount
-        self.logger.info(f"Position added: {token_symbol} - {amount}")
+        self.ledger.commit(
+            position_id,
+            chain,
+            token_address,
+            float(amount) * USD_PER_NATIVE_UNIT,
+            deployer,
+            reservation_id
+        )
+        self.logger.info(f"Position added: {position_id} - {amount}")
 
-    def remove_position(self, token_symbol: str) -> None:
+    def remove_position(self, position_id: str) -> None:
         """
         Remove a position from tracking.
         
         Args:
-            token_symbol: Symbol of the token to remove
+            position_id: ID of the position to remove
         """
-        if token_symbol in self.current_positions:
-            del self.current_positions[token_symbol]
-            self.logger.info(f"Position removed: {token_symbol}")
+        if self.ledger.release(position_id):
+            self.logger.info(f"Position removed: {position_id}")
+
+    def release_reservation(self, reservation_id: Optional[str]) -> None:
+        """
+        Return exposure reserved for a trade that was not placed.
+        
+        Args:
+            reservation_id: Reservation ID from PositionSizeResult
+        """
+        if self.ledger.release(reservation_id):
+            self.logger.debug(f"Exposure reservation released: {reservation_id}")
 
     def get_portfolio_status(self) -> Dict:
         """
@@ -523,35 +680,20 @@ class RiskManager:
             Dictionary containing portfolio status information
         """
         try:
-            current_exposure = sum([float(pos) * 100 for pos in self.current_positions.values()])
+            current_exposure = self.ledger.exposure_total
             
             return {
-                'total_positions': len(self.current_positions),
+                'total_positions': len(self.ledger.positions),
+                'pending_reservations': len(self.ledger.reservations),
                 'current_exposure_usd': current_exposure,
                 'max_exposure_usd': self.limits.max_total_exposure_usd,
                 'exposure_utilization': current_exposure / self.limits.max_total_exposure_usd,
                 'daily_pnl': self.daily_pnl,
                 'daily_loss_limit': self.limits.max_daily_loss_usd,
-                'positions_by_chain': self._get_positions_by_chain(),
+                'positions_by_chain': dict(self.ledger.count_by_chain),
+                'exposure_by_chain': dict(self.ledger.exposure_by_chain),
                 'available_capacity': self.limits.max_total_exposure_usd - current_exposure
             }
         except Exception as e:
             self.logger.error(f"Failed to get portfolio status: {e}")
             return {}
-
-    def _get_positions_by_chain(self) -> Dict[str, int]:
-        """Get count of positions by chain."""
-        chain_counts = {}
-        for token_symbol in self.current_positions.keys():
-            # Extract chain from token symbol or position metadata
-            # This is simplified - in practice you'd have better chain tracking
-            if 'SOL' in token_symbol:
-                chain = 'SOLANA'
-            elif 'BASE' in token_symbol:
-                chain = 'BASE'
-            else:
-                chain = 'ETHEREUM'
-                
-            chain_counts[chain] = chain_counts.get(chain, 0) + 1
-            
-        return chain_counts
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""
+Pre-built swap transaction templates for fast order construction.
+Prepares router calldata, gas estimates and fee data as soon as a pair is
+detected so that firing an approved trade only patches amount and deadline.
+"""
+
+from typing import Dict, List, Optional, Tuple, Any, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+import asyncio
+import time
+
+from config.chains import multichain_settings, ChainType, ChainConfig
+from trading.gas_oracle import DEFAULT_SWAP_GAS_LIMIT
+from utils.abi_encoding import encode_uint, encode_swap_exact_eth_for_tokens
+from utils.logger import logger_manager
+
+
+# Byte offsets of the patchable words inside the encoded calldata
+AMOUNT_OUT_MIN_OFFSET = 4
+DEADLINE_OFFSET = 4 + 32 * 3
+
+GAS_LIMIT_BUFFER = 1.2
+
+
+@dataclass
+class FeeSnapshot:
+    """Most recent fee data seen for a chain."""
+    block_number: int
+    base_fee_wei: int
+    priority_fee_wei: int
+    max_fee_wei: Optional[int] = None
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def max_fee_per_gas(self) -> int:
+        """EIP-1559 max fee, defaulting to allowing the base fee to double."""
+        if self.max_fee_wei is not None:
+            return self.max_fee_wei
+        return self.base_fee_wei * 2 + self.priority_fee_wei
+
+
+@dataclass
+class SwapTemplate:
+    """Unsigned swap transaction with patchable amount and deadline."""
+    chain: str
+    chain_id: int
+    router: str
+    token_address: str
+    path: Tuple[str, ...]
+    calldata: bytes
+    gas_limit: int
+    created_at: datetime = field(default_factory=datetime.now)
+
+    def build_calldata(self, amount_out_min: int, deadline: int) -> bytes:
+        """
+        Patch amountOutMin and deadline into the pre-encoded calldata.
+
+        Args:
+            amount_out_min: Minimum tokens to receive
+            deadline: Unix timestamp deadline
+
+        Returns:
+            Calldata ready to be placed in a transaction
+        """
+        data = bytearray(self.calldata)
+        data[AMOUNT_OUT_MIN_OFFSET:AMOUNT_OUT_MIN_OFFSET + 32] = encode_uint(amount_out_min)
+        data[DEADLINE_OFFSET:DEADLINE_OFFSET + 32] = encode_uint(deadline)
+        return bytes(data)
+
+
+@dataclass
+class PreparedSwap:
+    """Transaction produced from a template at fire time."""
+    template: SwapTemplate
+    transaction: Dict[str, Any]
+    signed_transaction: Optional[bytes] = None
+    build_time_ms: float = 0.0
+
+
+class SwapTemplateCache:
+    """
+    Cache of pre-built swap templates, gas estimates and fee snapshots.
+    Templates are keyed by chain and token address; gas estimates by router and path.
+    """
+
+    def __init__(
+        self,
+        recipient: Optional[str] = None,
+        signer: Optional[Callable[[Dict[str, Any]], bytes]] = None,
+        max_templates: int = 500
+    ) -> None:
+        """
+        Initialize the template cache.
+
+        Args:
+            recipient: Wallet address that receives swapped tokens
+            signer: Optional callable signing a transaction dict into raw bytes
+            max_templates: Maximum number of templates kept in memory
+        """
+        self.logger = logger_manager.get_logger("SwapTemplateCache")
+        self.recipient = recipient or "0x" + "00" * 20
+        self.signer = signer
+        self.max_templates = max_templates
+
+        self.templates: Dict[Tuple[str, str], SwapTemplate] = {}
+        self.gas_estimates: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self.fee_snapshots: Dict[str, FeeSnapshot] = {}
+        self.nonces: Dict[str, int] = {}
+
+        self.stats = {
+            'templates_built': 0,
+            'template_hits': 0,
+            'template_misses': 0,
+            'gas_estimates_cached': 0
+        }
+
+    @staticmethod
+    def get_chain_config(chain: str) -> Optional[ChainConfig]:
+        """
+        Resolve the EVM chain configuration for a chain label.
+
+        Args:
+            chain: Chain label such as 'ETHEREUM' or 'BASE'
+
+        Returns:
+            ChainConfig if the chain is a supported EVM chain, None otherwise
+        """
+        try:
+            chain_type = ChainType(chain.lower())
+        except ValueError:
+            return None
+        return multichain_settings.chains.get(chain_type)
+
+    async def prewarm(self, chain: str, token_address: str, w3=None) -> Optional[SwapTemplate]:
+        """
+        Build and cache a swap template for a newly detected token.
+
+        Args:
+            chain: Chain label of the pair
+            token_address: Token being bought
+            w3: Optional Web3 connection used to estimate gas
+
+        Returns:
+            Cached SwapTemplate, or None if the chain is not an EVM chain
+        """
+        try:
+            key = (chain.upper(), token_address.lower())
+            if key in self.templates:
+                return self.templates[key]
+
+            chain_config = self.get_chain_config(chain)
+            if not chain_config:
+                return None
+
+            path = (chain_config.wrapped_native, token_address)
+            calldata = encode_swap_exact_eth_for_tokens(0, list(path), self.recipient, 0)
+            gas_limit = await self._get_gas_estimate(chain_config, path, calldata, w3)
+
+            template = SwapTemplate(
+                chain=chain.upper(),
+                chain_id=chain_config.chain_id,
+                router=chain_config.dex_router,
+                token_address=token_address,
+                path=path,
+                calldata=calldata,
+                gas_limit=gas_limit
+            )
+
+            if len(self.templates) >= self.max_templates:
+                # Dicts keep insertion order, so the first key is the oldest template
+                self.templates.pop(next(iter(self.templates)))
+            self.templates[key] = template
+            self.stats['templates_built'] += 1
+
+            self.logger.debug(f"Prewarmed swap template: {token_address} on {chain} (gas {gas_limit})")
+            return template
+
+        except Exception as e:
+            self.logger.error(f"Failed to prewarm swap template for {token_address}: {e}")
+            return None
+
+    async def _get_gas_estimate(
+        self,
+        chain_config: ChainConfig,
+        path: Tuple[str, ...],
+        calldata: bytes,
+        w3=None
+    ) -> int:
+        """
+        Get a cached gas estimate for a router/path, estimating once if needed.
+
+        Args:
+            chain_config: Chain configuration
+            path: Swap path
+            calldata: Template calldata used for estimation
+            w3: Optional Web3 connection
+
+        Returns:
+            Gas limit to use for the swap
+        """
+        key = (chain_config.dex_router.lower(), tuple(hop.lower() for hop in path))
+        if key in self.gas_estimates:
+            return self.gas_estimates[key]
+
+        gas_limit = DEFAULT_SWAP_GAS_LIMIT
+        if w3 is not None:
+            try:
+                estimate = await asyncio.to_thread(
+                    w3.eth.estimate_gas,
+                    {
+                        'from': self.recipient,
+                        'to': chain_config.dex_router,
+                        'data': '0x' + calldata.hex(),
+                        'value': 10 ** 15
+                    }
+                )
+                gas_limit = int(estimate * GAS_LIMIT_BUFFER)
+            except Exception as e:
+                # New pairs frequently fail estimation before liquidity settles
+                self.logger.debug(f"Gas estimation failed, using default: {e}")
+
+        self.gas_estimates[key] = gas_limit
+        self.stats['gas_estimates_cached'] += 1
+        return gas_limit
+
+    def update_fees(
+        self,
+        chain: str,
+        block_number: int,
+        base_fee_wei: int,
+        priority_fee_wei: int,
+        max_fee_wei: Optional[int] = None
+    ) -> None:
+        """
+        Record the latest fee data for a chain, called once per new head.
+
+        Args:
+            chain: Chain label
+            block_number: Head block number
+            base_fee_wei: Base fee of the head block
+            priority_fee_wei: Suggested priority fee
+            max_fee_wei: Optional suggested max fee per gas
+        """
+        current = self.fee_snapshots.get(chain.upper())
+        if current and current.block_number > block_number:
+            return
+        self.fee_snapshots[chain.upper()] = FeeSnapshot(
+            block_number=block_number,
+            base_fee_wei=base_fee_wei,
+            priority_fee_wei=priority_fee_wei,
+            max_fee_wei=max_fee_wei
+        )
+
+    def set_nonce(self, chain: str, nonce: int) -> None:
+        """Seed the locally tracked nonce for a chain."""
+        self.nonces[chain.upper()] = nonce
+
+    def get_template(self, chain: str, token_address: str) -> Optional[SwapTemplate]:
+        """Get a cached template without building one."""
+        template = self.templates.get((chain.upper(), token_address.lower()))
+        if template:
+            self.stats['template_hits'] += 1
+        else:
+            self.stats['template_misses'] += 1
+        return template
+
+    def fire(
+        self,
+        template: SwapTemplate,
+        amount_in_wei: int,
+        amount_out_min: int,
+        deadline_seconds: int = 120
+    ) -> PreparedSwap:
+        """
+        Build the final transaction from a template without any RPC calls.
+
+        Args:
+            template: Prewarmed swap template
+            amount_in_wei: Native amount to spend
+            amount_out_min: Minimum tokens to receive
+            deadline_seconds: Seconds from now until the swap expires
+
+        Returns:
+            PreparedSwap with the transaction and, if a signer is set, the raw signed bytes
+        """
+        start = time.perf_counter()
+
+        calldata = template.build_calldata(amount_out_min, int(time.time()) + deadline_seconds)
+        transaction: Dict[str, Any] = {
+            'chainId': template.chain_id,
+            'to': template.router,
+            'from': self.recipient,
+            'value': amount_in_wei,
+            'data': '0x' + calldata.hex(),
+            'gas': template.gas_limit
+        }
+
+        fees = self.fee_snapshots.get(template.chain)
+        if fees:
+            transaction['maxFeePerGas'] = fees.max_fee_per_gas
+            transaction['maxPriorityFeePerGas'] = fees.priority_fee_wei
+
+        if template.chain in self.nonces:
+            transaction['nonce'] = self.nonces[template.chain]
+            self.nonces[template.chain] += 1
+
+        signed = self.signer(transaction) if self.signer else None
+
+        return PreparedSwap(
+            template=template,
+            transaction=transaction,
+            signed_transaction=signed,
+            build_time_ms=(time.perf_counter() - start) * 1000
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get template cache statistics."""
+        return {
+            **self.stats,
+            'cached_templates': len(self.templates),
+            'fee_snapshots': {
+                chain: {
+                    'block_number': snapshot.block_number,
+                    'base_fee_gwei': snapshot.base_fee_wei / 1e9,
+                    'priority_fee_gwei': snapshot.priority_fee_wei / 1e9
+                }
+                for chain, snapshot in self.fee_snapshots.items()
+            }
+        }
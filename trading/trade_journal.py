@@ -0,0 +1,525 @@
+"""
+Persistent columnar trade journal.
+Closed trades are buffered in memory and flushed as immutable segments with
+one NumPy array file per column. Segments are memory-mapped on read, so
+analytics queries run as vector operations over only the columns they need.
+"""
+
+from typing import Dict, List, Optional, Any, TextIO, Tuple
+from datetime import datetime, timezone
+import csv
+import json
+import os
+import shutil
+import threading
+import time
+
+from utils.logger import logger_manager
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Column name -> NumPy dtype string. Strings are fixed-width bytes.
+JOURNAL_COLUMNS: Dict[str, str] = {
+    'position_id': 'S64',
+    'token_symbol': 'S24',
+    'token_address': 'S48',
+    'chain': 'S16',
+    'exit_reason': 'S24',
+    'entry_time': 'f8',
+    'exit_time': 'f8',
+    'entry_amount': 'f8',
+    'entry_price': 'f8',
+    'exit_price': 'f8',
+    'realized_pnl': 'f8',
+    'realized_pnl_percentage': 'f8',
+    'gas_fees': 'f8'
+}
+
+SEGMENT_PREFIX = "segment_"
+# Written inside a compacted segment; lists the segments it replaces
+COMPACTION_MANIFEST = "replaces.json"
+
+
+class TradeJournal:
+    """
+    Append-only journal of closed trades stored as columnar segments.
+    Requires NumPy; without it the journal is disabled and appends are ignored.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_rows: int = 50000,
+        flush_interval: float = 60.0,
+        compact_threshold: int = 32
+    ) -> None:
+        """
+        Initialize the journal.
+
+        Args:
+            directory: Directory holding the segment directories
+            segment_rows: Buffered rows that trigger a flush
+            flush_interval: Seconds after which a non-empty buffer is flushed on the next append
+            compact_threshold: Number of small segments that triggers compaction on load
+        """
+        self.logger = logger_manager.get_logger("TradeJournal")
+        self.directory = directory
+        self.segment_rows = segment_rows
+        self.flush_interval = flush_interval
+        self.compact_threshold = compact_threshold
+        self.enabled = NUMPY_AVAILABLE
+
+        self.lock = threading.RLock()
+        self.buffer: List[Tuple[Any, ...]] = []
+        self.last_flush = time.monotonic()
+        self.segments: Dict[int, Dict[str, Any]] = {}
+        self.next_segment = 0
+        self.loaded = False
+
+        if not self.enabled:
+            self.logger.warning("NumPy not installed - trade journal disabled")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record_exit(self, position, position_exit) -> None:
+        """
+        Append a closed trade.
+
+        Args:
+            position: Position that was closed
+            position_exit: Exit details of the position
+        """
+        if not self.enabled:
+            return
+
+        try:
+            row = (
+                position.id,
+                position.token_symbol or '',
+                position.token_address or '',
+                position.chain or '',
+                position_exit.exit_reason.value,
+                position.entry_time.timestamp(),
+                position_exit.exit_time.timestamp(),
+                float(position.entry_amount),
+                float(position.entry_price),
+                float(position_exit.exit_price),
+                float(position_exit.realized_pnl),
+                float(position_exit.realized_pnl_percentage),
+                float(position_exit.gas_fees)
+            )
+
+            with self.lock:
+                self.buffer.append(row)
+                if (len(self.buffer) >= self.segment_rows or
+                        time.monotonic() - self.last_flush >= self.flush_interval):
+                    self.flush()
+
+        except Exception as e:
+            self.logger.error(f"Failed to journal exit {position_exit.position_id}: {e}")
+
+    def flush(self) -> None:
+        """Write buffered rows as a new segment."""
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.last_flush = time.monotonic()
+            if not self.buffer:
+                return
+
+            try:
+                self.load()
+                columns = self._rows_to_columns(self.buffer)
+                self._write_segment(columns)
+                self.buffer = []
+            except Exception as e:
+                self.logger.error(f"Failed to flush trade journal: {e}")
+
+    def _rows_to_columns(self, rows: List[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """Convert buffered row tuples into typed column arrays."""
+        transposed = list(zip(*rows)) if rows else [()] * len(JOURNAL_COLUMNS)
+        columns = {}
+        for (name, dtype), values in zip(JOURNAL_COLUMNS.items(), transposed):
+            if dtype.startswith('S'):
+                values = [str(value).encode('utf-8')[:int(dtype[1:])] for value in values]
+            columns[name] = np.array(values, dtype=dtype)
+        return columns
+
+    def _write_segment(self, columns: Dict[str, Any], replaces: Optional[List[int]] = None) -> int:
+        """
+        Write columns as a segment directory, atomically.
+
+        Args:
+            columns: Column arrays of equal length
+            replaces: Segments merged into this one, recorded in its compaction manifest
+
+        Returns:
+            Segment number
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        number = self.next_segment
+        self.next_segment += 1
+
+        final_path = self._segment_path(number)
+        temp_path = f"{final_path}.tmp"
+        shutil.rmtree(temp_path, ignore_errors=True)
+        os.makedirs(temp_path)
+
+        for name, values in columns.items():
+            np.save(os.path.join(temp_path, f"{name}.npy"), values)
+        if replaces:
+            with open(os.path.join(temp_path, COMPACTION_MANIFEST), 'w') as f:
+                json.dump({'replaces': replaces}, f)
+        os.replace(temp_path, final_path)
+
+        self.segments[number] = self._open_segment(final_path)
+        self.logger.debug(f"Trade journal segment {number} written ({len(columns['position_id'])} rows)")
+        return number
+
+    # ------------------------------------------------------------------
+    # Segment management
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, number: int) -> str:
+        """Get the directory path of a segment."""
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:08d}")
+
+    def _open_segment(self, path: str) -> Dict[str, Any]:
+        """Memory-map every column file of a segment."""
+        return {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r')
+            for name in JOURNAL_COLUMNS
+        }
+
+    def load(self) -> None:
+        """Open existing segments once, compacting many small segments first."""
+        if self.loaded or not self.enabled:
+            return
+        self.loaded = True
+
+        try:
+            if not os.path.isdir(self.directory):
+                return
+
+            for entry in sorted(os.listdir(self.directory)):
+                path = os.path.join(self.directory, entry)
+                if entry.endswith('.tmp'):
+                    shutil.rmtree(path, ignore_errors=True)  # Interrupted write
+                    continue
+                if not entry.startswith(SEGMENT_PREFIX):
+                    continue
+                try:
+                    number = int(entry[len(SEGMENT_PREFIX):])
+                    self.segments[number] = self._open_segment(path)
+                    self.next_segment = max(self.next_segment, number + 1)
+                except Exception as e:
+                    self.logger.error(f"Skipping unreadable journal segment {entry}: {e}")
+
+            self._finish_compactions()
+
+            small = [n for n, seg in self.segments.items() if len(seg['position_id']) < self.segment_rows]
+            if len(small) >= self.compact_threshold:
+                self.compact()
+
+            self.logger.info(f"Trade journal loaded: {self.row_count()} trades in {len(self.segments)} segments")
+
+        except Exception as e:
+            self.logger.error(f"Failed to load trade journal: {e}")
+
+    def _finish_compactions(self) -> None:
+        """Drop segments that a compacted segment replaced but a crash left behind."""
+        replaced = set()
+        for number in list(self.segments):
+            manifest_path = os.path.join(self._segment_path(number), COMPACTION_MANIFEST)
+            if not os.path.exists(manifest_path):
+                continue
+            try:
+                with open(manifest_path, 'r') as f:
+                    replaced.update(json.load(f)['replaces'])
+            except Exception as e:
+                self.logger.error(f"Unreadable compaction manifest in segment {number}: {e}")
+
+        leftovers = sorted(replaced & set(self.segments))
+        for number in leftovers:
+            self.segments.pop(number)
+            shutil.rmtree(self._segment_path(number), ignore_errors=True)
+        if leftovers:
+            self.logger.warning(f"Removed {len(leftovers)} journal segments left by an interrupted compaction")
+
+    def compact(self) -> None:
+        """Merge all segments smaller than segment_rows into one segment."""
+        with self.lock:
+            small = sorted(n for n, seg in self.segments.items() if len(seg['position_id']) < self.segment_rows)
+            if len(small) < 2:
+                return
+
+            merged = {
+                name: np.concatenate([self.segments[n][name] for n in small])
+                for name in JOURNAL_COLUMNS
+            }
+            # The manifest makes the merge safe to crash after: load() drops any leftovers
+            self._write_segment(merged, replaces=small)
+
+            for number in small:
+                self.segments.pop(number)
+                shutil.rmtree(self._segment_path(number), ignore_errors=True)
+
+            self.logger.info(f"Compacted {len(small)} trade journal segments")
+
+    def row_count(self) -> int:
+        """Total journaled trades, including unflushed ones and segments from earlier runs."""
+        with self.lock:
+            self.load()
+            return sum(len(seg['position_id']) for seg in self.segments.values()) + len(self.buffer)
+
+    def _column(self, name: str) -> Any:
+        """
+        Get one column across all segments and the unflushed buffer.
+
+        Args:
+            name: Column name
+
+        Returns:
+            1-D array of the column's values
+        """
+        with self.lock:
+            self.load()
+            parts = [self.segments[n][name] for n in sorted(self.segments)]
+            if self.buffer:
+                parts.append(self._rows_to_columns(self.buffer)[name])
+
+        if not parts:
+            return np.array([], dtype=JOURNAL_COLUMNS[name])
+        return np.concatenate(parts) if len(parts) > 1 else np.asarray(parts[0])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        """Decode a fixed-width bytes value."""
+        return value.decode('utf-8', errors='replace') if isinstance(value, bytes) else str(value)
+
+    def _group_extremes(self, inverse: Any, values: Any, groups: int) -> Tuple[Any, Any]:
+        """
+        Find row indexes of the minimum and maximum value within each group.
+
+        Args:
+            inverse: Group index of every row
+            values: Values to compare
+            groups: Number of groups
+
+        Returns:
+            Tuple of (argmin per group, argmax per group)
+        """
+        order = np.lexsort((values, inverse))
+        boundaries = np.searchsorted(inverse[order], np.arange(groups))
+        ends = np.append(boundaries[1:], len(order)) - 1
+        return order[boundaries], order[ends]
+
+    def chain_performance(self) -> List[Dict[str, Any]]:
+        """
+        Per-chain trade count, P&L, win rate, average size and best/worst token.
+
+        Returns:
+            List of per-chain dictionaries sorted by total P&L descending
+        """
+        if not self.enabled or self.row_count() == 0:
+            return []
+
+        try:
+            chains, inverse = np.unique(self._column('chain'), return_inverse=True)
+            pnl = self._column('realized_pnl')
+            size = self._column('entry_amount')
+            symbols = self._column('token_symbol')
+
+            counts = np.bincount(inverse, minlength=len(chains))
+            totals = np.bincount(inverse, weights=pnl, minlength=len(chains))
+            wins = np.bincount(inverse, weights=(pnl > 0), minlength=len(chains))
+            sizes = np.bincount(inverse, weights=size, minlength=len(chains))
+            worst, best = self._group_extremes(inverse, pnl, len(chains))
+
+            results = [
+                {
+                    'chain': self._decode(chains[i]),
+                    'positions': int(counts[i]),
+                    'total_pnl': float(totals[i]),
+                    'win_rate': float(wins[i] / counts[i] * 100),
+                    'average_position_size': float(sizes[i] / counts[i]),
+                    'best_performer': self._decode(symbols[best[i]]),
+                    'worst_performer': self._decode(symbols[worst[i]])
+                }
+                for i in range(len(chains))
+            ]
+            return sorted(results, key=lambda item: item['total_pnl'], reverse=True)
+
+        except Exception as e:
+            self.logger.error(f"Chain performance query failed: {e}")
+            return []
+
+    def daily_pnl(self, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Realized P&L per UTC day of exit.
+
+        Args:
+            days: Optional number of most recent days to return
+
+        Returns:
+            List of {'date', 'trades', 'pnl', 'fees', 'wins'} in date order
+        """
+        if not self.enabled or self.row_count() == 0:
+            return []
+
+        try:
+            day_index = np.floor(self._column('exit_time') / 86400).astype(np.int64)
+            unique_days, inverse = np.unique(day_index, return_inverse=True)
+            pnl = self._column('realized_pnl')
+
+            counts = np.bincount(inverse, minlength=len(unique_days))
+            totals = np.bincount(inverse, weights=pnl, minlength=len(unique_days))
+            fees = np.bincount(inverse, weights=self._column('gas_fees'), minlength=len(unique_days))
+            wins = np.bincount(inverse, weights=(pnl > 0), minlength=len(unique_days))
+
+            start = len(unique_days) - days if days else 0
+            return [
+                {
+                    'date': datetime.fromtimestamp(int(unique_days[i]) * 86400, tz=timezone.utc).date().isoformat(),
+                    'trades': int(counts[i]),
+                    'pnl': float(totals[i]),
+                    'fees': float(fees[i]),
+                    'wins': int(wins[i])
+                }
+                for i in range(max(0, start), len(unique_days))
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Daily P&L query failed: {e}")
+            return []
+
+    def token_stats(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Per-token trade statistics.
+
+        Args:
+            limit: Optional number of tokens to return, by total P&L descending
+
+        Returns:
+            List of per-token dictionaries
+        """
+        if not self.enabled or self.row_count() == 0:
+            return []
+
+        try:
+            addresses, first_index, inverse = np.unique(
+                self._column('token_address'), return_index=True, return_inverse=True
+            )
+            pnl = self._column('realized_pnl')
+            pnl_pct = self._column('realized_pnl_percentage')
+            exit_time = self._column('exit_time')
+            symbols = self._column('token_symbol')
+            chains = self._column('chain')
+
+            groups = len(addresses)
+            counts = np.bincount(inverse, minlength=groups)
+            totals = np.bincount(inverse, weights=pnl, minlength=groups)
+            pct_totals = np.bincount(inverse, weights=pnl_pct, minlength=groups)
+            wins = np.bincount(inverse, weights=(pnl > 0), minlength=groups)
+            last_exit = np.full(groups, -np.inf)
+            np.maximum.at(last_exit, inverse, exit_time)
+
+            order = np.argsort(-totals)
+            if limit:
+                order = order[:limit]
+
+            return [
+                {
+                    'token_address': self._decode(addresses[i]),
+                    'token_symbol': self._decode(symbols[first_index[i]]),
+                    'chain': self._decode(chains[first_index[i]]),
+                    'trades': int(counts[i]),
+                    'wins': int(wins[i]),
+                    'total_pnl': float(totals[i]),
+                    'average_pnl_percentage': float(pct_totals[i] / counts[i]),
+                    'last_exit': datetime.fromtimestamp(float(last_exit[i])).isoformat()
+                }
+                for i in order
+            ]
+
+        except Exception as e:
+            self.logger.error(f"Token stats query failed: {e}")
+            return []
+
+    def export_csv(self, output: TextIO) -> int:
+        """
+        Write every journaled trade as CSV, one segment at a time.
+
+        Args:
+            output: Text stream to write to
+
+        Returns:
+            Number of rows written
+        """
+        writer = csv.writer(output)
+        writer.writerow([
+            'Position ID', 'Token', 'Chain', 'Entry Time', 'Exit Time',
+            'Entry Amount', 'Exit Price', 'Realized P&L', 'P&L %',
+            'Hold Time (Hours)', 'Exit Reason'
+        ])
+
+        if not self.enabled:
+            return 0
+
+        with self.lock:
+            self.load()
+            parts = [self.segments[n] for n in sorted(self.segments)]
+            if self.buffer:
+                parts.append(self._rows_to_columns(self.buffer))
+
+        written = 0
+        for part in parts:
+            hold_hours = (part['exit_time'] - part['entry_time']) / 3600
+            for row in zip(
+                part['position_id'].tolist(), part['token_symbol'].tolist(), part['chain'].tolist(),
+                part['entry_time'].tolist(), part['exit_time'].tolist(), part['entry_amount'].tolist(),
+                part['exit_price'].tolist(), part['realized_pnl'].tolist(),
+                part['realized_pnl_percentage'].tolist(), hold_hours.tolist(), part['exit_reason'].tolist()
+            ):
+                writer.writerow([
+                    self._decode(row[0]),
+                    self._decode(row[1]),
+                    self._decode(row[2]),
+                    datetime.fromtimestamp(row[3]).isoformat(),
+                    datetime.fromtimestamp(row[4]).isoformat(),
+                    row[5],
+                    row[6],
+                    row[7],
+                    f"{row[8]:.2f}%",
+                    f"{row[9]:.2f}",
+                    self._decode(row[10])
+                ])
+                written += 1
+
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal size statistics."""
+        return {
+            'enabled': self.enabled,
+            'rows': self.row_count() if self.enabled else 0,
+            'segments': len(self.segments),
+            'buffered_rows': len(self.buffer)
+        }
+
+
+# Shared trade journal
+trade_journal = TradeJournal(os.path.join("data", "trade_journal"))
@@ -0,0 +1,191 @@
+# utils/abi_encoding.py
+"""
+Minimal ABI encoding helpers for hand-built router and ERC20 calldata.
+Avoids building full contract objects on latency-sensitive paths.
+"""
+
+from typing import List, Tuple
+
+
+# Function selectors
+SELECTOR_BALANCE_OF = bytes.fromhex("70a08231")             # balanceOf(address)
+SELECTOR_APPROVE = bytes.fromhex("095ea7b3")                # approve(address,uint256)
+SELECTOR_GET_AMOUNTS_OUT = bytes.fromhex("d06ca61f")        # getAmountsOut(uint256,address[])
+SELECTOR_SWAP_EXACT_ETH_FOR_TOKENS = bytes.fromhex("7ff36ab5")
+SELECTOR_SWAP_EXACT_ETH_FOR_TOKENS_FOT = bytes.fromhex("b6f9de95")
+SELECTOR_SWAP_EXACT_TOKENS_FOR_TOKENS_FOT = bytes.fromhex("5c11d795")
+SELECTOR_DECIMALS = bytes.fromhex("313ce567")               # decimals()
+SELECTOR_GET_RESERVES = bytes.fromhex("0902f1ac")           # getReserves()
+SELECTOR_GET_PAIR = bytes.fromhex("e6a43905")               # getPair(address,address)
+SELECTOR_TRY_AGGREGATE = bytes.fromhex("bce38bd7")          # tryAggregate(bool,(address,bytes)[])
+
+MAX_UINT256 = 2 ** 256 - 1
+
+
+def encode_uint(value: int) -> bytes:
+    """Encode an unsigned integer as a 32-byte ABI word."""
+    return int(value).to_bytes(32, "big")
+
+
+def encode_address(address: str) -> bytes:
+    """Encode a hex address as a left-padded 32-byte ABI word."""
+    return bytes(12) + bytes.fromhex(address[2:] if address.startswith("0x") else address)
+
+
+def encode_address_array(addresses: List[str]) -> bytes:
+    """Encode the tail of a dynamic address[] argument."""
+    return encode_uint(len(addresses)) + b"".join(encode_address(a) for a in addresses)
+
+
+def decode_uint(data: bytes, index: int = 0) -> int:
+    """
+    Decode the uint256 word at a given index of ABI return data.
+
+    Args:
+        data: Raw return data
+        index: Word index
+
+    Returns:
+        Decoded integer
+    """
+    return int.from_bytes(data[index * 32:(index + 1) * 32], "big")
+
+
+def decode_uint_array_last(data: bytes) -> int:
+    """
+    Decode the last element of a returned uint256[] (e.g. getAmountsOut).
+
+    Args:
+        data: Raw return data of a function returning uint256[]
+
+    Returns:
+        Last element of the array
+    """
+    offset = decode_uint(data, 0) // 32
+    length = decode_uint(data, offset)
+    return decode_uint(data, offset + length)
+
+
+def encode_bytes(data: bytes) -> bytes:
+    """Encode the tail of a dynamic bytes argument (length plus zero-padded data)."""
+    return encode_uint(len(data)) + data + bytes(-len(data) % 32)
+
+
+def encode_balance_of(owner: str) -> bytes:
+    """Encode balanceOf(owner)."""
+    return SELECTOR_BALANCE_OF + encode_address(owner)
+
+
+def encode_approve(spender: str, amount: int = MAX_UINT256) -> bytes:
+    """Encode approve(spender, amount)."""
+    return SELECTOR_APPROVE + encode_address(spender) + encode_uint(amount)
+
+
+def encode_get_amounts_out(amount_in: int, path: List[str]) -> bytes:
+    """Encode getAmountsOut(amountIn, path)."""
+    return SELECTOR_GET_AMOUNTS_OUT + encode_uint(amount_in) + encode_uint(0x40) + encode_address_array(path)
+
+
+def encode_get_pair(token_a: str, token_b: str) -> bytes:
+    """Encode getPair(tokenA, tokenB)."""
+    return SELECTOR_GET_PAIR + encode_address(token_a) + encode_address(token_b)
+
+
+def encode_try_aggregate(calls: List[Tuple[str, bytes]], require_success: bool = False) -> bytes:
+    """
+    Encode Multicall3 tryAggregate(requireSuccess, calls).
+
+    Args:
+        calls: (target address, calldata) pairs
+        require_success: Whether one failing call reverts the whole batch
+
+    Returns:
+        Calldata for the Multicall3 contract
+    """
+    # Each (address, bytes) tuple is dynamic, so the array starts with per-element offsets
+    tails = [encode_address(target) + encode_uint(0x40) + encode_bytes(data) for target, data in calls]
+    offsets = []
+    position = 32 * len(tails)
+    for tail in tails:
+        offsets.append(encode_uint(position))
+        position += len(tail)
+    return (
+        SELECTOR_TRY_AGGREGATE
+        + encode_uint(int(require_success))
+        + encode_uint(0x40)  # offset of the dynamic calls array
+        + encode_uint(len(tails))
+        + b"".join(offsets)
+        + b"".join(tails)
+    )
+
+
+def decode_try_aggregate(data: bytes) -> List[Tuple[bool, bytes]]:
+    """
+    Decode the (success, returnData)[] returned by Multicall3 tryAggregate.
+
+    Args:
+        data: Raw return data
+
+    Returns:
+        Per-call (success, return data) pairs, in call order
+    """
+    array = decode_uint(data, 0)
+    length = decode_uint(data[array:], 0)
+    elements = data[array + 32:]
+
+    results = []
+    for index in range(length):
+        element = elements[decode_uint(elements, index):]
+        returned = element[decode_uint(element, 1):]
+        results.append((bool(decode_uint(element, 0)), returned[32:32 + decode_uint(returned, 0)]))
+    return results
+
+
+def encode_swap_exact_eth_for_tokens(
+    amount_out_min: int,
+    path: List[str],
+    recipient: str,
+    deadline: int,
+    fee_on_transfer: bool = False
+) -> bytes:
+    """
+    Encode swapExactETHForTokens or its SupportingFeeOnTransferTokens variant.
+
+    Args:
+        amount_out_min: Minimum tokens to receive
+        path: Swap path starting with the wrapped native token
+        recipient: Address receiving the tokens
+        deadline: Unix timestamp after which the swap reverts
+        fee_on_transfer: Use the fee-on-transfer supporting variant
+
+    Returns:
+        Encoded calldata bytes
+    """
+    selector = SELECTOR_SWAP_EXACT_ETH_FOR_TOKENS_FOT if fee_on_transfer else SELECTOR_SWAP_EXACT_ETH_FOR_TOKENS
+    return (
+        selector
+        + encode_uint(amount_out_min)
+        + encode_uint(0x80)  # offset of the dynamic path array
+        + encode_address(recipient)
+        + encode_uint(deadline)
+        + encode_address_array(path)
+    )
+
+
+def encode_swap_exact_tokens_for_tokens_fot(
+    amount_in: int,
+    amount_out_min: int,
+    path: List[str],
+    recipient: str,
+    deadline: int
+) -> bytes:
+    """Encode swapExactTokensForTokensSupportingFeeOnTransferTokens."""
+    return (
+        SELECTOR_SWAP_EXACT_TOKENS_FOR_TOKENS_FOT
+        + encode_uint(amount_in)
+        + encode_uint(amount_out_min)
+        + encode_uint(0xa0)  # offset of the dynamic path array
+        + encode_address(recipient)
+        + encode_uint(deadline)
+        + encode_address_array(path)
+    )
@@ -0,0 +1,293 @@
+# utils/async_cache.py
+"""
+Shared async TTL cache for external analyzer lookups.
+Provides per-source TTLs, negative caching, single-flight request coalescing,
+LRU eviction, hit/miss statistics and optional on-disk persistence.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from utils.logger import logger_manager
+
+
+@dataclass
+class CacheEntry:
+    """Cached value with its expiry time (wall clock, so it survives restarts)."""
+    value: Any
+    expires_at: float
+    negative: bool = False
+
+
+class AsyncTTLCache:
+    """
+    Size-bounded LRU cache for async lookups keyed by (source, key).
+    Concurrent lookups of the same missing key share a single fetch.
+    """
+
+    def __init__(
+        self,
+        source_ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 300.0,
+        negative_ttl: float = 60.0,
+        max_entries: int = 10000,
+        persist_path: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            source_ttls: TTL in seconds per source name
+            default_ttl: TTL for sources without an explicit entry
+            negative_ttl: TTL for failed or empty lookups
+            max_entries: Maximum number of cached entries before LRU eviction
+            persist_path: Optional JSON file used to persist entries across restarts
+        """
+        self.logger = logger_manager.get_logger("AsyncTTLCache")
+        self.source_ttls = dict(source_ttls or {})
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+
+        self.entries: "OrderedDict[Tuple[str, str], CacheEntry]" = OrderedDict()
+        self.inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.loaded = False
+
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _source_stats(self, source: str) -> Dict[str, int]:
+        """Get the stats counters for a source."""
+        if source not in self.stats:
+            self.stats[source] = {
+                'hits': 0,
+                'negative_hits': 0,
+                'misses': 0,
+                'coalesced': 0,
+                'errors': 0,
+                'evictions': 0
+            }
+        return self.stats[source]
+
+    @staticmethod
+    def _cache_key(source: str, key: str) -> Tuple[str, str]:
+        """Build the entry key; only EVM hex addresses are case-insensitive (Solana mints are not)."""
+        if key[:2] in ('0x', '0X'):
+            key = key.lower()
+        return source, key
+
+    def get_ttl(self, source: str) -> float:
+        """Get the positive TTL for a source."""
+        return self.source_ttls.get(source, self.default_ttl)
+
+    def get(self, source: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached value without fetching.
+
+        Args:
+            source: Source name
+            key: Lookup key within the source
+
+        Returns:
+            Tuple of (found, value); value is None for negative entries
+        """
+        cache_key = self._cache_key(source, key)
+        entry = self.entries.get(cache_key)
+        if entry is None:
+            return False, None
+
+        if entry.expires_at <= time.time():
+            del self.entries[cache_key]
+            return False, None
+
+        self.entries.move_to_end(cache_key)
+        return True, entry.value
+
+    def set(self, source: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value. None is stored as a negative entry with the negative TTL.
+
+        Args:
+            source: Source name
+            key: Lookup key within the source
+            value: Value to cache
+            ttl: Optional TTL override in seconds
+        """
+        negative = value is None
+        if ttl is None:
+            ttl = self.negative_ttl if negative else self.get_ttl(source)
+
+        cache_key = self._cache_key(source, key)
+        self.entries[cache_key] = CacheEntry(value=value, expires_at=time.time() + ttl, negative=negative)
+        self.entries.move_to_end(cache_key)
+
+        while len(self.entries) > self.max_entries:
+            (evicted_source, _), _ = self.entries.popitem(last=False)
+            self._source_stats(evicted_source)['evictions'] += 1
+
+    async def get_or_fetch(
+        self,
+        source: str,
+        key: str,
+        fetcher: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Return a cached value or fetch it once, sharing the fetch with concurrent callers.
+
+        A fetcher returning None or raising is cached negatively, so a failing
+        service is not hammered on every analysis.
+
+        Args:
+            source: Source name, selects the TTL
+            key: Lookup key within the source (e.g. token address)
+            fetcher: Coroutine factory performing the remote lookup
+            ttl: Optional TTL override for a successful result
+
+        Returns:
+            Fetched or cached value, or None if the lookup failed
+        """
+        stats = self._source_stats(source)
+        cache_key = self._cache_key(source, key)
+
+        found, value = self.get(source, key)
+        if found:
+            if value is None:
+                stats['negative_hits'] += 1
+            else:
+                stats['hits'] += 1
+            return value
+
+        pending = self.inflight.get(cache_key)
+        if pending is not None:
+            stats['coalesced'] += 1
+            return await asyncio.shield(pending)
+
+        stats['misses'] += 1
+        # The fetch runs as its own task so cancelling the caller that started it
+        # does not cancel the callers sharing the result
+        task = asyncio.ensure_future(self._fetch(source, key, cache_key, fetcher, ttl))
+        self.inflight[cache_key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        source: str,
+        key: str,
+        cache_key: Tuple[str, str],
+        fetcher: Callable[[], Awaitable[Any]],
+        ttl: Optional[float]
+    ) -> Any:
+        """Run a shared fetch and cache its result, negatively on failure."""
+        try:
+            value = await fetcher()
+        except Exception as e:
+            self._source_stats(source)['errors'] += 1
+            self.logger.debug(f"Cache fetch failed for {source}:{key}: {e}")
+            value = None
+        finally:
+            self.inflight.pop(cache_key, None)
+
+        self.set(source, key, value, ttl if value is not None else None)
+        return value
+
+    def invalidate(self, source: str, key: str) -> None:
+        """Drop a cached entry so the next lookup fetches again."""
+        self.entries.pop(self._cache_key(source, key), None)
+
+    def load(self) -> None:
+        """Load unexpired entries from the persistence file, once."""
+        if self.loaded or not self.persist_path:
+            return
+        self.loaded = True
+
+        try:
+            if not os.path.exists(self.persist_path):
+                return
+
+            with open(self.persist_path, 'r') as f:
+                data = json.load(f)
+
+            now = time.time()
+            for item in data.get('entries', []):
+                if item['expires_at'] > now:
+                    self.entries[(item['source'], item['key'])] = CacheEntry(
+                        value=item['value'],
+                        expires_at=item['expires_at'],
+                        negative=item.get('negative', False)
+                    )
+
+            self.logger.info(f"Loaded {len(self.entries)} cached lookups from {self.persist_path}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to load cache from {self.persist_path}: {e}")
+
+    def save(self) -> None:
+        """Write unexpired, JSON-serializable entries to the persistence file."""
+        if not self.persist_path:
+            return
+
+        try:
+            now = time.time()
+            items = []
+            for (source, key), entry in self.entries.items():
+                if entry.expires_at <= now:
+                    continue
+                try:
+                    json.dumps(entry.value)
+                except (TypeError, ValueError):
+                    continue
+                items.append({
+                    'source': source,
+                    'key': key,
+                    'value': entry.value,
+                    'expires_at': entry.expires_at,
+                    'negative': entry.negative
+                })
+
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{self.persist_path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({'saved_at': now, 'entries': items}, f)
+            os.replace(temp_path, self.persist_path)
+
+        except Exception as e:
+            self.logger.error(f"Failed to save cache to {self.persist_path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics per source."""
+        totals = {'hits': 0, 'negative_hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'evictions': 0}
+        for source_stats in self.stats.values():
+            for name, count in source_stats.items():
+                totals[name] += count
+
+        lookups = totals['hits'] + totals['negative_hits'] + totals['misses'] + totals['coalesced']
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hit_rate': (totals['hits'] + totals['negative_hits'] + totals['coalesced']) / lookups if lookups else 0.0,
+            'totals': totals,
+            'sources': {source: dict(counts) for source, counts in self.stats.items()}
+        }
+
+
+# Shared cache for analyzer lookups against external services
+analysis_cache = AsyncTTLCache(
+    source_ttls={
+        'honeypot_api': 600.0,
+        'token_sniffer': 1800.0,
+        'twitter': 120.0,
+        'telegram': 300.0,
+        'reddit': 300.0,
+        'influencer': 300.0
+    },
+    persist_path=os.path.join("data", "analysis_cache.json")
+)
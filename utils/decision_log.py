@@ -0,0 +1,812 @@
+# utils/decision_log.py
+"""
+Structured decision log.
+Every opportunity that reaches a decision gets one compact, schema-versioned
+record: detection and decision times, extracted features, component scores,
+risk result, recommendation, decision and stage latencies. Records are
+appended to length-prefixed binary segment files; each sealed segment gets a
+sidecar index by time and token, so queries only decode the records they
+return.
+
+Segment layout:
+    header  magic "DXDL", schema version, codec, created_at   (>4sHHd)
+    frame   payload length, CRC32 of payload                  (>II)
+    payload msgpack (or JSON) list of values in RECORD_FIELDS order
+
+Fields are only ever appended to RECORD_FIELDS; readers pad records from
+older schema versions with None.
+
+Usage:
+    python -m utils.decision_log query --since 2h --token 0xabc...
+    python -m utils.decision_log query --since 2025-01-01T10:00 --until 2025-01-01T11:00 --decision trade
+    python -m utils.decision_log stats --since 1d
+"""
+
+import argparse
+import bisect
+import glob
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+from utils.logger import logger_manager
+
+
+DECISION_LOG_MAGIC = b"DXDL"
+DECISION_LOG_VERSION = 1
+
+SEGMENT_HEADER = struct.Struct('>4sHHd')
+FRAME_HEADER = struct.Struct('>II')
+CODEC_JSON = 0
+CODEC_MSGPACK = 1
+
+SEGMENT_PREFIX = "decisions_"
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+DEFAULT_LOG_DIR = "data/decisions"
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+MAX_RECORD_BYTES = 1024 * 1024
+
+# One sparse time-index entry per this many records
+TIME_INDEX_EVERY = 128
+
+# Decision outcomes
+DECISION_TRADE = "trade"
+DECISION_TRADE_FAILED = "trade_failed"
+DECISION_NO_TRADE = "no_trade"
+DECISION_FILTERED = "filtered"
+DECISION_ANALYZED = "analyzed"
+
+# Record layout, schema version 1; append only
+RECORD_FIELDS = (
+    'ts',
+    'detected_at',
+    'chain',
+    'token',
+    'symbol',
+    'source',
+    'features',
+    'scores',
+    'risk',
+    'action',
+    'confidence',
+    'score',
+    'decision',
+    'reason',
+    'latencies'
+)
+TS_FIELD = RECORD_FIELDS.index('ts')
+TOKEN_FIELD = RECORD_FIELDS.index('token')
+DECISION_FIELD = RECORD_FIELDS.index('decision')
+
+
+def _encode(codec: int, values: List[Any]) -> bytes:
+    """Encode a record payload."""
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(values, use_bin_type=True, default=str)
+    return json.dumps(values, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _decode(codec: int, payload: bytes) -> List[Any]:
+    """Decode a record payload."""
+    if codec == CODEC_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("Segment is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(payload, raw=False)
+    return json.loads(payload)
+
+
+def _to_record(values: List[Any]) -> Dict[str, Any]:
+    """Map positional values to field names, padding fields added after the record was written."""
+    record = dict(zip(RECORD_FIELDS, values))
+    for name in RECORD_FIELDS[len(values):]:
+        record[name] = None
+    return record
+
+
+def _index_path(segment_path: str) -> str:
+    """Sidecar index path of a segment."""
+    return segment_path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+
+
+def list_segments(log_dir: str) -> List[str]:
+    """Segment files in a log directory, oldest first."""
+    return sorted(glob.glob(os.path.join(log_dir, f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")))
+
+
+class SegmentIndex:
+    """
+    Time and token index of one segment.
+    Built incrementally while writing and stored as a JSON sidecar when the
+    segment is sealed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.count = 0
+        self.min_ts: Optional[float] = None
+        self.max_ts: Optional[float] = None
+        self.tokens: Dict[str, List[int]] = defaultdict(list)
+        self.time_ts: List[float] = []
+        self.time_offsets: List[int] = []
+
+    def add(self, ts: float, token: Optional[str], offset: int) -> None:
+        """
+        Index one record.
+
+        Args:
+            ts: Record timestamp
+            token: Token address
+            offset: Byte offset of the record frame in the segment
+        """
+        if self.count % TIME_INDEX_EVERY == 0:
+            self.time_ts.append(ts)
+            self.time_offsets.append(offset)
+        self.count += 1
+        self.min_ts = ts if self.min_ts is None else min(self.min_ts, ts)
+        self.max_ts = ts if self.max_ts is None else max(self.max_ts, ts)
+        if token:
+            self.tokens[token.lower()].append(offset)
+
+    def overlaps(self, since: Optional[float], until: Optional[float]) -> bool:
+        """Whether the segment may hold records in [since, until]."""
+        if self.count == 0:
+            return False
+        if since is not None and self.max_ts < since:
+            return False
+        if until is not None and self.min_ts > until:
+            return False
+        return True
+
+    def start_offset(self, since: Optional[float]) -> Optional[int]:
+        """Offset to start a time scan from, or None for the first record."""
+        if since is None or not self.time_ts:
+            return None
+        position = bisect.bisect_right(self.time_ts, since) - 1
+        return self.time_offsets[position] if position >= 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index for the sidecar file."""
+        return {
+            'version': DECISION_LOG_VERSION,
+            'count': self.count,
+            'min_ts': self.min_ts,
+            'max_ts': self.max_ts,
+            'tokens': dict(self.tokens),
+            'time': [self.time_ts, self.time_offsets]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SegmentIndex':
+        """Load an index from its sidecar representation."""
+        index = cls()
+        index.count = data.get('count', 0)
+        index.min_ts = data.get('min_ts')
+        index.max_ts = data.get('max_ts')
+        index.tokens = defaultdict(list, data.get('tokens', {}))
+        index.time_ts, index.time_offsets = data.get('time', [[], []])
+        return index
+
+
+class SegmentReader:
+    """Reads records from one segment file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a segment and read its header.
+
+        Args:
+            path: Segment file path
+
+        Raises:
+            ValueError: If the file is not a decision log segment or is newer than this reader
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(SEGMENT_HEADER.size)
+        if len(header) < SEGMENT_HEADER.size:
+            raise ValueError(f"{path} has no segment header")
+        magic, self.version, self.codec, self.created_at = SEGMENT_HEADER.unpack(header)
+        if magic != DECISION_LOG_MAGIC:
+            raise ValueError(f"{path} is not a decision log segment")
+        if self.version > DECISION_LOG_VERSION:
+            raise ValueError(f"Unsupported decision log version {self.version} in {path}")
+
+    def frames(self, start: Optional[int] = None) -> Iterator[Tuple[int, List[Any]]]:
+        """
+        Iterate decoded records in file order.
+
+        Stops at the first incomplete or corrupt frame (a torn tail).
+
+        Args:
+            start: Byte offset of the first frame to read
+
+        Returns:
+            Iterator of (offset, values)
+        """
+        with open(self.path, 'rb') as f:
+            offset = start if start is not None else SEGMENT_HEADER.size
+            f.seek(offset)
+            while True:
+                header = f.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    return
+                length, crc = FRAME_HEADER.unpack(header)
+                if length > MAX_RECORD_BYTES:
+                    return
+                payload = f.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    return
+                yield offset, _decode(self.codec, payload)
+                offset += FRAME_HEADER.size + length
+
+    def read_at(self, offsets: List[int]) -> Iterator[Tuple[int, List[Any]]]:
+        """
+        Decode the records at the given frame offsets.
+
+        Args:
+            offsets: Frame offsets from the token index
+
+        Returns:
+            Iterator of (offset, values)
+        """
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                header = f.read(FRAME_HEADER.size)
+                if len(header) < FRAME_HEADER.size:
+                    return
+                length, crc = FRAME_HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    return
+                yield offset, _decode(self.codec, payload)
+
+    def build_index(self) -> Tuple[SegmentIndex, int]:
+        """
+        Index the segment by scanning it.
+
+        Returns:
+            Tuple of (index, end offset of the last complete frame)
+        """
+        index = SegmentIndex()
+        last_offset = None
+        for offset, values in self.frames():
+            index.add(values[TS_FIELD], values[TOKEN_FIELD], offset)
+            last_offset = offset
+
+        end = SEGMENT_HEADER.size
+        if last_offset is not None:
+            with open(self.path, 'rb') as f:
+                f.seek(last_offset)
+                length, _ = FRAME_HEADER.unpack(f.read(FRAME_HEADER.size))
+            end = last_offset + FRAME_HEADER.size + length
+        return index, end
+
+    def load_index(self) -> SegmentIndex:
+        """Load the sidecar index, scanning the segment if it is not sealed."""
+        try:
+            with open(_index_path(self.path), 'r', encoding='utf-8') as f:
+                return SegmentIndex.from_dict(json.load(f))
+        except (OSError, ValueError):
+            return self.build_index()[0]
+
+
+class DecisionLog:
+    """
+    Append-only writer for decision records.
+    Logging is off until start() is called. Records are encoded on the
+    calling thread and written in batches; segments roll at a size limit
+    and are sealed with their index on roll and on stop.
+    """
+
+    def __init__(
+        self,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        flush_every: int = 64,
+        flush_interval: float = 1.0
+    ) -> None:
+        """
+        Initialize the decision log.
+
+        Args:
+            segment_bytes: Size at which the active segment is sealed and a new one started
+            flush_every: Buffered records that trigger a write
+            flush_interval: Seconds after which buffered records are written on the next append
+        """
+        self.logger = logger_manager.get_logger("DecisionLog")
+        self.segment_bytes = segment_bytes
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.codec = CODEC_MSGPACK if MSGPACK_AVAILABLE else CODEC_JSON
+        self.enabled = False
+        self.log_dir: Optional[str] = None
+
+        self._file = None
+        self._segment_path: Optional[str] = None
+        self._segment_seq = 0
+        self._offset = 0
+        self._index = SegmentIndex()
+        self._buffer: List[bytes] = []
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.stats = {
+            'records': 0,
+            'bytes': 0,
+            'segments_sealed': 0,
+            'encode_errors': 0,
+            'recovered_bytes': 0
+        }
+
+    def start(self, log_dir: str = DEFAULT_LOG_DIR) -> None:
+        """
+        Seal any segment left open by a previous run and open a new one.
+
+        Args:
+            log_dir: Directory holding the segment files
+        """
+        if self.enabled:
+            self.stop()
+
+        os.makedirs(log_dir, exist_ok=True)
+        self.log_dir = log_dir
+
+        segments = list_segments(log_dir)
+        for path in segments:
+            if not os.path.exists(_index_path(path)):
+                self._recover_segment(path)
+        if segments:
+            name = os.path.basename(segments[-1])
+            self._segment_seq = int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+        self._open_segment()
+        self.enabled = True
+        self.logger.info(f"Decision log writing to {log_dir}")
+
+    def _recover_segment(self, path: str) -> None:
+        """Truncate a torn tail from an unsealed segment and write its index."""
+        try:
+            reader = SegmentReader(path)
+            index, end = reader.build_index()
+            size = os.path.getsize(path)
+            if size > end:
+                with open(path, 'r+b') as f:
+                    f.truncate(end)
+                self.stats['recovered_bytes'] += size - end
+                self.logger.warning(f"Truncated {size - end} torn bytes from {path}")
+            self._write_index(path, index)
+        except Exception as e:
+            self.logger.error(f"Could not recover decision segment {path}: {e}")
+
+    def _open_segment(self) -> None:
+        """Start a new segment file."""
+        self._segment_seq += 1
+        self._segment_path = os.path.join(
+            self.log_dir, f"{SEGMENT_PREFIX}{self._segment_seq:06d}{SEGMENT_SUFFIX}"
+        )
+        self._file = open(self._segment_path, 'wb')
+        self._file.write(SEGMENT_HEADER.pack(DECISION_LOG_MAGIC, DECISION_LOG_VERSION, self.codec, time.time()))
+        # Flushed now so queries reading the live segment before its first records see the header
+        self._file.flush()
+        self._offset = SEGMENT_HEADER.size
+        self._index = SegmentIndex()
+        self._last_flush = time.monotonic()
+
+    def _seal_segment(self) -> None:
+        """Write out the active segment and its index; caller holds the lock."""
+        if not self._file:
+            return
+        self._write_buffer()
+        self._file.close()
+        self._file = None
+        self._write_index(self._segment_path, self._index)
+        self.stats['segments_sealed'] += 1
+
+    @staticmethod
+    def _write_index(segment_path: str, index: SegmentIndex) -> None:
+        """Write a segment's sidecar index atomically."""
+        path = _index_path(segment_path)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index.to_dict(), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def record(self, values: List[Any]) -> None:
+        """
+        Append one record.
+
+        Args:
+            values: Field values in RECORD_FIELDS order
+        """
+        if not self.enabled:
+            return
+
+        try:
+            payload = _encode(self.codec, values)
+        except Exception as e:
+            self.stats['encode_errors'] += 1
+            self.logger.debug(f"Could not encode decision record: {e}")
+            return
+        if len(payload) > MAX_RECORD_BYTES:
+            self.stats['encode_errors'] += 1
+            return
+
+        frame = FRAME_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            if not self._file:
+                return
+            self._index.add(values[TS_FIELD], values[TOKEN_FIELD], self._offset)
+            self._buffer.append(frame)
+            self._offset += len(frame)
+            self.stats['records'] += 1
+            self.stats['bytes'] += len(frame)
+            self.counts[values[DECISION_FIELD]] += 1
+
+            if (len(self._buffer) >= self.flush_every
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._write_buffer()
+            if self._offset >= self.segment_bytes:
+                self._seal_segment()
+                self._open_segment()
+
+    def record_opportunity(
+        self,
+        opportunity: Any,
+        chain: str,
+        decision: str,
+        reason: Optional[str] = None,
+        risk_assessment: Any = None,
+        latencies: Optional[Dict[str, float]] = None
+    ) -> None:
+        """
+        Append the record of one opportunity and what was decided about it.
+
+        Args:
+            opportunity: Analyzed (or pre-filtered) TradingOpportunity
+            chain: Chain label used by the pipeline
+            decision: One of the DECISION_* outcomes
+            reason: Why the opportunity was not traded, if it was not
+            risk_assessment: PositionSizeResult from the risk manager, if assessed
+            latencies: Stage latencies in milliseconds
+        """
+        if not self.enabled:
+            return
+
+        try:
+            token = opportunity.token
+            metadata = opportunity.metadata
+            recommendation = metadata.get('recommendation') or {}
+            scores = metadata.get('score_components')
+
+            risk = None
+            if risk_assessment is not None:
+                risk = {
+                    'result': risk_assessment.risk_assessment.value,
+                    'score': round(risk_assessment.risk_score, 4),
+                    'approved': float(risk_assessment.approved_amount),
+                    'reasons': risk_assessment.reasons[:5]
+                }
+
+            self.record([
+                round(time.time(), 6),
+                opportunity.detected_at.timestamp(),
+                chain,
+                token.address,
+                token.symbol,
+                metadata.get('solana_source') or opportunity.liquidity.dex_name,
+                self._features(opportunity),
+                {name: round(value, 4) for name, value in scores.items()} if scores else None,
+                risk,
+                recommendation.get('action'),
+                recommendation.get('confidence'),
+                round(opportunity.confidence_score or 0.0, 4),
+                decision,
+                reason,
+                {name: round(value, 3) for name, value in (latencies or {}).items()}
+            ])
+        except Exception as e:
+            self.stats['encode_errors'] += 1
+            self.logger.debug(f"Could not build decision record: {e}")
+
+    @staticmethod
+    def _features(opportunity: Any) -> Dict[str, Any]:
+        """Scoring and risk inputs of an opportunity."""
+        liquidity = opportunity.liquidity
+        analysis = opportunity.contract_analysis
+        social = opportunity.social_metrics
+        return {
+            'liquidity_usd': liquidity.liquidity_usd,
+            'dex': liquidity.dex_name,
+            'pair': liquidity.pair_address,
+            'block': liquidity.block_number,
+            'honeypot': analysis.is_honeypot,
+            'mintable': analysis.is_mintable,
+            'pausable': analysis.is_pausable,
+            'blacklist': analysis.has_blacklist,
+            'renounced': analysis.ownership_renounced,
+            'locked': analysis.liquidity_locked,
+            'buy_tax': analysis.buy_tax,
+            'sell_tax': analysis.sell_tax,
+            'contract_risk': analysis.risk_score,
+            'risk_level': analysis.risk_level.value,
+            'social_score': social.social_score,
+            'sentiment': social.sentiment_score
+        }
+
+    def _write_buffer(self) -> None:
+        """Write buffered frames; caller holds the lock."""
+        if self._file and self._buffer:
+            self._file.write(b''.join(self._buffer))
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Write buffered records to the active segment."""
+        with self._lock:
+            self._write_buffer()
+
+    def stop(self) -> None:
+        """Flush, seal the active segment and stop logging."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.enabled = False
+            self._seal_segment()
+
+        self.logger.info(f"Decision log stopped: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get decision log statistics."""
+        return {
+            'enabled': self.enabled,
+            'log_dir': self.log_dir,
+            'segment': self._segment_path,
+            'codec': 'msgpack' if self.codec == CODEC_MSGPACK else 'json',
+            'buffered': len(self._buffer),
+            'decisions': dict(self.counts),
+            **self.stats
+        }
+
+
+def query_decisions(
+    log_dir: str = DEFAULT_LOG_DIR,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    token: Optional[str] = None,
+    chain: Optional[str] = None,
+    action: Optional[str] = None,
+    decision: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Read matching decision records in time order.
+
+    Segments outside the time range are skipped using their index; token
+    queries read only the indexed records and time queries start at the
+    nearest sparse index entry.
+
+    Args:
+        log_dir: Directory holding the segment files
+        since: Earliest record timestamp (Unix seconds)
+        until: Latest record timestamp (Unix seconds)
+        token: Token address (case-insensitive)
+        chain: Chain label (case-insensitive)
+        action: Recommendation action, e.g. BUY
+        decision: Decision outcome, e.g. no_trade
+        limit: Maximum records to return
+
+    Returns:
+        Iterator of records as dictionaries
+    """
+    logger = logger_manager.get_logger("DecisionLog")
+    token = token.lower() if token else None
+    chain = chain.upper() if chain else None
+    action = action.upper() if action else None
+    returned = 0
+
+    for path in list_segments(log_dir):
+        try:
+            reader = SegmentReader(path)
+            index = reader.load_index()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping decision segment {path}: {e}")
+            continue
+        if not index.overlaps(since, until):
+            continue
+
+        if token:
+            frames = reader.read_at(index.tokens.get(token, []))
+        else:
+            frames = reader.frames(index.start_offset(since))
+
+        for _, values in frames:
+            record = _to_record(values)
+            ts = record['ts']
+            if since is not None and ts < since:
+                continue
+            if until is not None and ts > until:
+                if token:
+                    continue
+                break
+            if token and (record['token'] or '').lower() != token:
+                continue
+            if chain and (record['chain'] or '').upper() != chain:
+                continue
+            if action and record['action'] != action:
+                continue
+            if decision and record['decision'] != decision:
+                continue
+
+            yield record
+            returned += 1
+            if limit is not None and returned >= limit:
+                return
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a CLI time argument.
+
+    Args:
+        value: Relative age such as 30s, 15m, 2h or 1d, an ISO timestamp or Unix seconds
+
+    Returns:
+        Unix timestamp, or None if no value was given
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if not value:
+        return None
+    units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+    if value[-1] in units and value[:-1].replace('.', '', 1).isdigit():
+        return time.time() - float(value[:-1]) * units[value[-1]]
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def summarize(records: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Aggregate counts and latency percentiles over records.
+
+    Args:
+        records: Records from query_decisions
+
+    Returns:
+        Dictionary of totals, breakdowns and per-stage latency percentiles (ms)
+    """
+    total = 0
+    by_decision: Dict[str, int] = defaultdict(int)
+    by_action: Dict[str, int] = defaultdict(int)
+    by_chain: Dict[str, int] = defaultdict(int)
+    by_reason: Dict[str, int] = defaultdict(int)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    first_ts = last_ts = None
+
+    for record in records:
+        total += 1
+        by_decision[record['decision']] += 1
+        by_action[record['action']] += 1
+        by_chain[record['chain']] += 1
+        if record['reason']:
+            by_reason[record['reason']] += 1
+        for stage, value in (record['latencies'] or {}).items():
+            latencies[stage].append(value)
+        first_ts = record['ts'] if first_ts is None else min(first_ts, record['ts'])
+        last_ts = record['ts'] if last_ts is None else max(last_ts, record['ts'])
+
+    latency_stats = {}
+    for stage, values in latencies.items():
+        values.sort()
+        latency_stats[stage] = {
+            'p50': _percentile(values, 0.5),
+            'p95': _percentile(values, 0.95),
+            'p99': _percentile(values, 0.99),
+            'max': values[-1]
+        }
+
+    return {
+        'records': total,
+        'first': datetime.fromtimestamp(first_ts).isoformat() if first_ts else None,
+        'last': datetime.fromtimestamp(last_ts).isoformat() if last_ts else None,
+        'by_decision': dict(by_decision),
+        'by_action': dict(by_action),
+        'by_chain': dict(by_chain),
+        'top_reasons': dict(sorted(by_reason.items(), key=lambda item: -item[1])[:10]),
+        'latency_ms': latency_stats
+    }
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """One-line human-readable form of a record."""
+    when = datetime.fromtimestamp(record['ts']).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    total = (record['latencies'] or {}).get('total')
+    line = (
+        f"{when}  {record['chain'] or '-':15} {record['symbol'] or '?':12} {record['token']}  "
+        f"{record['action'] or '-':10} {record['confidence'] or '-':6} {record['score'] or 0.0:.3f}  "
+        f"{record['decision']}"
+    )
+    if total is not None:
+        line += f"  {total:.0f}ms"
+    if record['reason']:
+        line += f"  ({record['reason']})"
+    return line
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Query the structured decision log")
+    parser.add_argument('--dir', default=DEFAULT_LOG_DIR, help='Decision log directory')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('query', 'Print matching records'), ('stats', 'Summarize matching records')):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument('--since', help='Start time: age (30m, 2h, 1d), ISO timestamp or Unix seconds')
+        sub.add_argument('--until', help='End time, same formats as --since')
+        sub.add_argument('--token', help='Token address')
+        sub.add_argument('--chain', help='Chain label, e.g. BASE')
+        sub.add_argument('--action', help='Recommendation action, e.g. BUY')
+        sub.add_argument('--decision', help='Decision outcome, e.g. no_trade')
+        sub.add_argument('--json', action='store_true', help='Print JSON instead of text')
+    subparsers.choices['query'].add_argument('--limit', type=int, default=100, help='Maximum records to print')
+
+    args = parser.parse_args()
+
+    try:
+        since = parse_time(args.since)
+        until = parse_time(args.until)
+    except ValueError as e:
+        parser.error(f"Invalid time: {e}")
+
+    records = query_decisions(
+        args.dir,
+        since=since,
+        until=until,
+        token=args.token,
+        chain=args.chain,
+        action=args.action,
+        decision=args.decision,
+        limit=getattr(args, 'limit', None)
+    )
+
+    if args.command == 'stats':
+        print(json.dumps(summarize(records), indent=2, default=str))
+        return
+
+    for record in records:
+        if args.json:
+            print(json.dumps(record, default=str))
+        else:
+            print(format_record(record))
+
+
+# Global decision log instance
+decision_log = DecisionLog()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+# utils/event_recorder.py
+"""
+Record-and-replay of raw pipeline inputs.
+The recorder writes every monitor input, RPC response and HTTP payload to a
+gzip-compressed JSON-lines event file; the replayer reads it back, serves the
+recorded responses to local stubs and re-drives the monitor inputs in order.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import logger_manager
+
+
+EVENT_FILE_FORMAT = "dex-sniper-events"
+EVENT_FILE_VERSION = 1
+
+# Event kinds
+INPUT_EVENT = "input"
+RPC_EVENT = "rpc"
+HTTP_EVENT = "http"
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Convert web3/aiohttp values to plain JSON types.
+
+    Args:
+        value: Value to convert
+
+    Returns:
+        JSON-serializable equivalent (bytes become 0x-prefixed hex)
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return '0x' + bytes(value).hex()
+    if isinstance(value, dict) or hasattr(value, 'items'):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def make_key(*parts: Any) -> str:
+    """Build a stable lookup key for a request from its method and arguments."""
+    return json.dumps(to_jsonable(parts), sort_keys=True, separators=(',', ':'))
+
+
+@dataclass
+class RecordedEvent:
+    """One entry of an event file."""
+    t: float
+    kind: str
+    source: str
+    key: str
+    data: Any
+
+
+class EventRecorder:
+    """
+    Append-only writer for pipeline inputs.
+    Recording is off until start() is called, so the hooks in monitors and
+    providers cost a single attribute check in normal operation.
+    """
+
+    def __init__(self, flush_every: int = 500) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            flush_every: Number of buffered events before writing to disk
+        """
+        self.logger = logger_manager.get_logger("EventRecorder")
+        self.flush_every = flush_every
+        self.enabled = False
+        self.path: Optional[str] = None
+        self.started_at = 0.0
+
+        self._file = None
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def start(self, path: str) -> None:
+        """
+        Open an event file and start recording.
+
+        Args:
+            path: Output file (gzip-compressed JSON lines)
+        """
+        if self.enabled:
+            self.stop()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.started_at = time.time()
+        self.counts.clear()
+        self._file = gzip.open(path, 'wt', encoding='utf-8', compresslevel=6)
+        self._file.write(json.dumps({
+            'format': EVENT_FILE_FORMAT,
+            'version': EVENT_FILE_VERSION,
+            'started_at': self.started_at
+        }) + '\n')
+        self.enabled = True
+        self.logger.info(f"Recording pipeline inputs to {path}")
+
+    def record(self, kind: str, source: str, data: Any, key: str = '') -> None:
+        """
+        Append one event.
+
+        Args:
+            kind: Event kind (input, rpc or http)
+            source: Monitor name or endpoint label
+            data: Payload or response
+            key: Request key used to match responses during replay
+        """
+        if not self.enabled:
+            return
+
+        try:
+            line = json.dumps({
+                't': round(time.time() - self.started_at, 6),
+                'kind': kind,
+                'src': source,
+                'key': key,
+                'data': to_jsonable(data)
+            }, separators=(',', ':'))
+        except Exception as e:
+            self.logger.debug(f"Could not serialize {kind} event from {source}: {e}")
+            return
+
+        with self._lock:
+            self._buffer.append(line)
+            self.counts[kind] += 1
+            if len(self._buffer) >= self.flush_every:
+                self._write_buffer()
+
+    def record_input(self, source: str, handler: str, args: List[Any]) -> None:
+        """
+        Record a monitor input as the processing method and its arguments.
+
+        Args:
+            source: Monitor name
+            handler: Name of the monitor method that consumes the input
+            args: Positional arguments passed to the method
+        """
+        self.record(INPUT_EVENT, source, args, key=handler)
+
+    def _write_buffer(self) -> None:
+        """Write buffered lines; caller holds the lock."""
+        if self._file and self._buffer:
+            self._file.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+
+    def flush(self) -> None:
+        """Write buffered events to the file."""
+        with self._lock:
+            self._write_buffer()
+            if self._file:
+                self._file.flush()
+
+    def stop(self) -> None:
+        """Flush and close the event file."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.enabled = False
+            self._write_buffer()
+            if self._file:
+                self._file.close()
+                self._file = None
+
+        self.logger.info(f"Recording stopped: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recording statistics."""
+        return {
+            'enabled': self.enabled,
+            'path': self.path,
+            'events': dict(self.counts),
+            'duration_seconds': time.time() - self.started_at if self.started_at else 0.0
+        }
+
+
+def read_events(path: str) -> Iterator[RecordedEvent]:
+    """
+    Read events from a recorded file in order.
+
+    Args:
+        path: Event file written by EventRecorder
+
+    Returns:
+        Iterator of recorded events
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if header.get('format') != EVENT_FILE_FORMAT:
+            raise ValueError(f"{path} is not a recorded event file")
+        if header.get('version', 0) > EVENT_FILE_VERSION:
+            raise ValueError(f"Unsupported event file version {header.get('version')}")
+
+        for line in f:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            yield RecordedEvent(
+                t=item['t'],
+                kind=item['kind'],
+                source=item['src'],
+                key=item.get('key', ''),
+                data=item.get('data')
+            )
+
+
+class ResponseStore:
+    """
+    Recorded RPC/HTTP responses keyed by (source, request key).
+    Repeated requests get the recorded responses in order; once a key is
+    exhausted its last response is repeated, so polling loops keep working.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self.responses: Dict[Tuple[str, str], Deque[Any]] = defaultdict(deque)
+        self.last: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, source: str, key: str, data: Any) -> None:
+        """Add a recorded response."""
+        self.responses[(source, key)].append(data)
+
+    def next(self, source: str, key: str) -> Tuple[bool, Any]:
+        """
+        Get the next recorded response for a request.
+
+        Args:
+            source: Endpoint label
+            key: Request key
+
+        Returns:
+            Tuple of (found, response)
+        """
+        lookup = (source, key)
+        with self._lock:
+            queue = self.responses.get(lookup)
+            if queue:
+                data = queue.popleft()
+                self.last[lookup] = data
+                self.hits += 1
+                return True, data
+            if lookup in self.last:
+                self.hits += 1
+                return True, self.last[lookup]
+            self.misses += 1
+            return False, None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics."""
+        return {
+            'keys': len(self.responses),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+class EventReplayer:
+    """
+    Re-drives recorded monitor inputs, either paced by the recorded
+    timestamps or as fast as the pipeline can consume them.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0, concurrency: int = 1) -> None:
+        """
+        Initialize the replayer.
+
+        Args:
+            path: Event file to replay
+            speed: Playback rate relative to recording (1.0 = real time, 0 = as fast as possible)
+            concurrency: Inputs processed at once (1 keeps replay deterministic)
+        """
+        self.logger = logger_manager.get_logger("EventReplayer")
+        self.path = path
+        self.speed = speed
+        self.concurrency = max(1, concurrency)
+
+        self.store = ResponseStore()
+        self.inputs: List[RecordedEvent] = []
+        self.loaded = False
+
+        self.stats = {
+            'inputs_replayed': 0,
+            'inputs_failed': 0,
+            'recorded_duration': 0.0,
+            'replay_duration': 0.0
+        }
+
+    def load(self) -> None:
+        """Load the event file, splitting inputs from recorded responses."""
+        if self.loaded:
+            return
+
+        responses = 0
+        for event in read_events(self.path):
+            if event.kind == INPUT_EVENT:
+                self.inputs.append(event)
+            else:
+                self.store.add(event.source, event.key, event.data)
+                responses += 1
+            self.stats['recorded_duration'] = event.t
+
+        self.loaded = True
+        self.logger.info(
+            f"Loaded {len(self.inputs)} inputs and {responses} recorded responses from {self.path}"
+        )
+
+    async def run(self, dispatch: Callable[[RecordedEvent], Awaitable[None]]) -> Dict[str, Any]:
+        """
+        Replay every recorded input through a dispatcher.
+
+        Args:
+            dispatch: Coroutine that feeds one input to its monitor
+
+        Returns:
+            Replay statistics
+        """
+        self.load()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = set()
+
+        async def replay_one(event: RecordedEvent) -> None:
+            try:
+                await dispatch(event)
+                self.stats['inputs_replayed'] += 1
+            except Exception as e:
+                self.stats['inputs_failed'] += 1
+                self.logger.error(f"Replay of {event.source}.{event.key} failed: {e}")
+            finally:
+                semaphore.release()
+
+        start = time.perf_counter()
+        for event in self.inputs:
+            if self.speed > 0:
+                delay = event.t / self.speed - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await semaphore.acquire()
+            task = asyncio.create_task(replay_one(event))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending)
+
+        self.stats['replay_duration'] = time.perf_counter() - start
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get replay statistics, including throughput."""
+        duration = self.stats['replay_duration']
+        return {
+            **self.stats,
+            'inputs_total': len(self.inputs),
+            'inputs_per_second': self.stats['inputs_replayed'] / duration if duration else 0.0,
+            'responses': self.store.get_stats()
+        }
+
+
+# Global recorder used by monitors and recording providers
+event_recorder = EventRecorder()
@@ -2,13 +2,24 @@
 """
 Centralized logging configuration for the DEX sniping system.
 Provides structured logging with different levels and formatters.
+In queue mode, callers only enqueue records; formatting, console and file
+writes and rotation happen on a listener thread, and records are dropped
+(and counted) rather than blocking when the queue is full.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Environment switches read when the global manager is created
+LOG_QUEUE_ENV = "DEX_LOG_QUEUE"
+LOG_LEVEL_ENV = "DEX_LOG_LEVEL"
+
+DEFAULT_QUEUE_SIZE = 10000
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output."""
@@ -23,17 +34,123 @@ class ColoredFormatter(logging.Formatter):
     }
     
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        record.levelname = f"{log_color}{record.levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        # Colour a copy of the level name only; file handlers format the same record
+        levelname = record.levelname
+        log_color = self.COLORS.get(levelname, self.COLORS['RESET'])
+        record.levelname = f"{log_color}{levelname}{self.COLORS['RESET']}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller.
+    Below WARNING, records are dropped once the queue is nearly full so the
+    remaining slots stay free for warnings and errors. Dropped records are
+    counted per level and reported by a summary record once there is room.
+    """
+    
+    def __init__(self, log_queue: queue.SimpleQueue, capacity: int, reserve_fraction: float = 0.1):
+        """
+        Initialize the handler.
+        
+        Args:
+            log_queue: Queue read by the listener thread
+            capacity: Records allowed in the queue at once
+            reserve_fraction: Share of the capacity kept for WARNING and above
+        """
+        super().__init__(log_queue)
+        self.capacity = capacity
+        self.reserve = int(self.capacity * reserve_fraction)
+        self.enqueued = 0
+        self.max_depth = 0
+        self.dropped: Dict[str, int] = {}
+        self.unreported: Dict[str, int] = {}
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments and render any traceback now, while they
+        are still valid; everything else is formatted by the listener. The
+        record is changed in place: the root handler is the last to see it.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def _drop(self, record: logging.LogRecord) -> None:
+        """Count a record that did not fit."""
+        self.dropped[record.levelname] = self.dropped.get(record.levelname, 0) + 1
+        self.unreported[record.levelname] = self.unreported.get(record.levelname, 0) + 1
+    
+    def _report_drops(self) -> None:
+        """Enqueue a summary of records dropped since the last summary."""
+        counts = ', '.join(f"{level}: {count}" for level, count in self.unreported.items())
+        summary = logging.LogRecord(
+            name="LoggerManager",
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Log queue full, dropped {sum(self.unreported.values())} records ({counts})",
+            args=None,
+            exc_info=None,
+            func="emit"
+        )
+        self.queue.put_nowait(summary)
+        self.unreported = {}
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, or drop it if the queue is full."""
+        try:
+            depth = self.queue.qsize()
+            limit = self.capacity if record.levelno >= logging.WARNING else self.capacity - self.reserve
+            if depth >= limit:
+                self._drop(record)
+                return
+            
+            if self.unreported:
+                self._report_drops()
+            self.enqueue(self.prepare(record))
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, depth + 1)
+            
+        except Exception:
+            self.handleError(record)
 
 class LoggerManager:
     """Manages logging configuration for different components."""
     
-    def __init__(self, log_dir: str = "logs"):
+    def __init__(
+        self,
+        log_dir: str = "logs",
+        queue_mode: Optional[bool] = None,
+        level: Optional[str] = None
+    ):
+        """
+        Initialize logging.
+        
+        Args:
+            log_dir: Directory for log files
+            queue_mode: Hand records to a listener thread (defaults to DEX_LOG_QUEUE)
+            level: Root log level name (defaults to DEX_LOG_LEVEL, else DEBUG)
+        """
         self.log_dir = log_dir
+        self.handlers: List[logging.Handler] = []
+        self.queue_handler: Optional[BoundedQueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self._atexit_registered = False
+        
         self._ensure_log_directory()
         self._setup_root_logger()
+        self.set_level(level or os.getenv(LOG_LEVEL_ENV) or "DEBUG")
+        
+        if queue_mode is None:
+            queue_mode = os.getenv(LOG_QUEUE_ENV, "").lower() in ("1", "true", "yes", "on")
+        if queue_mode:
+            self.enable_queue_mode()
         
     def _ensure_log_directory(self) -> None:
         """Create log directory if it doesn't exist."""
@@ -91,6 +208,71 @@ class LoggerManager:
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
         root_logger.addHandler(error_handler)
+        
+        self.handlers = [console_handler, file_handler, error_handler]
+
+    def set_level(self, level: str) -> None:
+        """
+        Set the root log level. Records below it are discarded before any
+        formatting, which is what makes isEnabledFor guards worthwhile.
+        
+        Args:
+            level: Level name such as 'DEBUG' or 'INFO'
+        """
+        logging.getLogger().setLevel(getattr(logging, str(level).upper(), logging.DEBUG))
+
+    def enable_queue_mode(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        """
+        Move the console and file handlers behind a bounded queue and a listener thread.
+        
+        Args:
+            queue_size: Records buffered before low-priority records are dropped
+        """
+        if self.listener is not None:
+            return
+        
+        # SimpleQueue avoids the condition-variable overhead of Queue; the handler enforces the bound
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_handler = BoundedQueueHandler(log_queue, queue_size)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, *self.handlers, respect_handler_level=True
+        )
+        
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+        root_logger.addHandler(self.queue_handler)
+        self.listener.start()
+        
+        if not self._atexit_registered:
+            atexit.register(self.disable_queue_mode)
+            self._atexit_registered = True
+
+    def disable_queue_mode(self) -> None:
+        """Drain the queue and write records directly again."""
+        if self.listener is None:
+            return
+        
+        self.listener.stop()
+        self.listener = None
+        
+        root_logger = logging.getLogger()
+        root_logger.handlers.clear()
+        for handler in self.handlers:
+            root_logger.addHandler(handler)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get logging pipeline statistics."""
+        if self.queue_handler is None or self.listener is None:
+            return {'mode': 'direct'}
+        
+        return {
+            'mode': 'queue',
+            'queue_depth': self.queue_handler.queue.qsize(),
+            'queue_capacity': self.queue_handler.capacity,
+            'max_depth': self.queue_handler.max_depth,
+            'enqueued': self.queue_handler.enqueued,
+            'dropped': dict(self.queue_handler.dropped)
+        }
 
 
 
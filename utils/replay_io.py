@@ -0,0 +1,192 @@
+# utils/replay_io.py
+"""
+Web3 and HTTP factories used by monitors, analyzers and the execution engine.
+Normally they return the real clients; while recording they wrap them so every
+response is written to the event recorder, and during replay they return local
+stubs answering from a ResponseStore.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import aiohttp
+
+from utils.event_recorder import event_recorder, make_key, ResponseStore, HTTP_EVENT
+
+if TYPE_CHECKING:
+    from web3 import Web3
+
+
+# Set by enable_replay(); None means live mode
+replay_store: Optional[ResponseStore] = None
+
+
+def enable_replay(store: ResponseStore) -> None:
+    """
+    Route all clients created through this module to recorded responses.
+
+    Args:
+        store: Responses loaded from an event file
+    """
+    global replay_store
+    replay_store = store
+
+
+def is_replaying() -> bool:
+    """Whether clients are being served from a recording."""
+    return replay_store is not None
+
+
+def create_web3(rpc_url: str, label: str) -> 'Web3':
+    """
+    Create a Web3 client for an RPC endpoint.
+    web3 is imported on the first call rather than with this module, since
+    importing it takes over a second and HTTP-only monitors never need it.
+
+    Args:
+        rpc_url: RPC URL used in live mode
+        label: Stable endpoint name (e.g. chain name) used to match recorded responses
+
+    Returns:
+        Web3 instance backed by the live, recording or replay provider
+    """
+    from web3 import Web3
+    from utils.replay_web3 import RecordingHTTPProvider, ReplayProvider
+
+    if replay_store is not None:
+        return Web3(ReplayProvider(replay_store, label))
+    if event_recorder.enabled:
+        return Web3(RecordingHTTPProvider(rpc_url, label))
+    return Web3(Web3.HTTPProvider(rpc_url))
+
+
+def _http_key(method: str, url: str, params: Optional[Dict[str, Any]]) -> str:
+    """Build the request key for an HTTP call."""
+    return make_key(method, url, params or {})
+
+
+class ReplayResponse:
+    """Minimal stand-in for aiohttp.ClientResponse."""
+
+    def __init__(self, url: str, status: int, body: Any) -> None:
+        self.url = url
+        self.status = status
+        self._body = body
+
+    async def json(self, **kwargs: Any) -> Any:
+        return self._body
+
+    async def text(self, **kwargs: Any) -> str:
+        return self._body if isinstance(self._body, str) else str(self._body)
+
+    async def __aenter__(self) -> "ReplayResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class ReplayHTTPSession:
+    """Local HTTP stub with the subset of the aiohttp.ClientSession API the monitors use."""
+
+    def __init__(self, store: ResponseStore) -> None:
+        self.store = store
+        self.closed = False
+
+    def _respond(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> ReplayResponse:
+        found, recorded = self.store.next(HTTP_EVENT, _http_key(method, url, params))
+        if not found:
+            return ReplayResponse(url, 404, None)
+        return ReplayResponse(url, recorded.get('status', 200), recorded.get('body'))
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> ReplayResponse:
+        return self._respond('GET', url, params)
+
+    def post(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> ReplayResponse:
+        return self._respond('POST', url, params)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _RecordingResponse:
+    """Proxy around a live response that records the decoded body."""
+
+    def __init__(self, response: aiohttp.ClientResponse, key: str) -> None:
+        self._response = response
+        self._key = key
+        self.recorded = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def _record(self, body: Any) -> None:
+        self.recorded = True
+        event_recorder.record(HTTP_EVENT, HTTP_EVENT, {'status': self._response.status, 'body': body}, key=self._key)
+
+    async def json(self, **kwargs: Any) -> Any:
+        body = await self._response.json(**kwargs)
+        self._record(body)
+        return body
+
+    async def text(self, **kwargs: Any) -> str:
+        body = await self._response.text(**kwargs)
+        self._record(body)
+        return body
+
+
+class _RecordingRequest:
+    """Async context manager returned by RecordingHTTPSession.get/post."""
+
+    def __init__(self, request_cm: Any, key: str) -> None:
+        self._request_cm = request_cm
+        self._key = key
+        self._proxy: Optional[_RecordingResponse] = None
+
+    async def __aenter__(self) -> _RecordingResponse:
+        response = await self._request_cm.__aenter__()
+        self._proxy = _RecordingResponse(response, self._key)
+        return self._proxy
+
+    async def __aexit__(self, *exc_info: Any) -> Any:
+        # Non-200 responses are usually not decoded; keep their status for replay
+        if self._proxy and not self._proxy.recorded:
+            self._proxy._record(None)
+        return await self._request_cm.__aexit__(*exc_info)
+
+
+class RecordingHTTPSession:
+    """aiohttp session wrapper that records every response body."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> _RecordingRequest:
+        return _RecordingRequest(self._session.get(url, params=params, **kwargs), _http_key('GET', url, params))
+
+    def post(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> _RecordingRequest:
+        return _RecordingRequest(self._session.post(url, params=params, **kwargs), _http_key('POST', url, params))
+
+    async def close(self) -> None:
+        await self._session.close()
+
+
+def create_http_session(timeout_seconds: float):
+    """
+    Create an HTTP session for external APIs.
+
+    Args:
+        timeout_seconds: Total request timeout in live mode
+
+    Returns:
+        aiohttp.ClientSession, or a recording/replay wrapper with the same get/post/close API
+    """
+    if replay_store is not None:
+        return ReplayHTTPSession(replay_store)
+
+    session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout_seconds))
+    if event_recorder.enabled:
+        return RecordingHTTPSession(session)
+    return session
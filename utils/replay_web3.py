@@ -0,0 +1,67 @@
+# utils/replay_web3.py
+"""
+JSON-RPC providers behind create_web3 for recording and replay.
+Kept apart from utils.replay_io so that importing the HTTP factories does
+not import web3.
+"""
+
+import itertools
+from typing import Any
+
+from web3.providers import BaseProvider, HTTPProvider
+
+from utils.event_recorder import event_recorder, make_key, ResponseStore, RPC_EVENT
+
+
+class RecordingHTTPProvider(HTTPProvider):
+    """HTTPProvider that records every JSON-RPC response under an endpoint label."""
+
+    def __init__(self, endpoint_uri: str, label: str, **kwargs: Any) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            endpoint_uri: RPC URL
+            label: Name stored in the event file instead of the URL (which may contain an API key)
+        """
+        super().__init__(endpoint_uri, **kwargs)
+        self.label = label
+
+    def make_request(self, method, params):
+        """Send the request and record its response."""
+        response = super().make_request(method, params)
+        event_recorder.record(RPC_EVENT, self.label, response, key=make_key(method, params))
+        return response
+
+
+class ReplayProvider(BaseProvider):
+    """Local JSON-RPC stub answering from recorded responses."""
+
+    def __init__(self, store: ResponseStore, label: str) -> None:
+        """
+        Initialize the stub.
+
+        Args:
+            store: Recorded responses
+            label: Endpoint label the responses were recorded under
+        """
+        super().__init__()
+        self.store = store
+        self.label = label
+        self.request_ids = itertools.count(1)
+
+    def make_request(self, method, params):
+        """Return the recorded response, or a JSON-RPC error if none was recorded."""
+        found, response = self.store.next(self.label, make_key(method, params))
+        request_id = next(self.request_ids)
+        if not found:
+            return {
+                'jsonrpc': '2.0',
+                'id': request_id,
+                'error': {'code': -32000, 'message': f"no recorded response for {method}"}
+            }
+        return {**response, 'id': request_id}
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """The stub is always reachable."""
+        return True
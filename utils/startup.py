@@ -0,0 +1,251 @@
+# utils/startup.py
+"""
+Startup orchestration.
+Components register as named steps along with the steps they depend on.
+Every step whose dependencies are ready runs concurrently, and each step has
+a completion event that other code waits on instead of sleeping. Milestones
+such as "monitor scanning" are timestamped as they happen, so startup can be
+reported as a timing breakdown measured from process start.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.logger import logger_manager
+
+
+# Reference point for startup timings; entry points import this module first
+PROCESS_START = time.perf_counter()
+
+# Step states
+STEP_PENDING = "pending"
+STEP_RUNNING = "running"
+STEP_READY = "ready"
+STEP_FAILED = "failed"
+STEP_SKIPPED = "skipped"
+
+
+class StartupError(RuntimeError):
+    """Raised when a required startup step did not become ready."""
+
+
+@dataclass
+class StartupStep:
+    """One unit of startup work and its outcome."""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    after: Tuple[str, ...] = ()
+    required: bool = True
+    timeout: Optional[float] = None
+    state: str = STEP_PENDING
+    started_at: Optional[float] = None  # seconds since process start
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the step ran for, once finished."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class StartupOrchestrator:
+    """
+    Runs startup steps concurrently in dependency order.
+    Steps must be added after the steps they depend on, so the graph cannot
+    contain cycles. A failed step marks its dependents as skipped; run()
+    raises StartupError if any required step did not become ready.
+    """
+
+    def __init__(self, started_at: float = PROCESS_START) -> None:
+        """
+        Initialize the orchestrator.
+
+        Args:
+            started_at: perf_counter() value that timings are measured from
+        """
+        self.logger = logger_manager.get_logger("Startup")
+        self.started_at = started_at
+        self.steps: Dict[str, StartupStep] = {}
+        self.milestones: Dict[str, float] = {}
+        self._watchers: List[asyncio.Task] = []
+
+    def elapsed(self) -> float:
+        """Seconds since process start."""
+        return time.perf_counter() - self.started_at
+
+    def add_step(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        after: Tuple[str, ...] = (),
+        required: bool = True,
+        timeout: Optional[float] = None
+    ) -> StartupStep:
+        """
+        Register a startup step.
+
+        Args:
+            name: Step name used for dependencies, readiness checks and the report
+            func: Coroutine function doing the work
+            after: Steps that must be ready before this one starts
+            required: Whether failure of this step fails startup
+            timeout: Seconds after which the step is treated as failed
+
+        Returns:
+            The registered step
+
+        Raises:
+            ValueError: If the name is taken or a dependency is not registered yet
+        """
+        if name in self.steps:
+            raise ValueError(f"Startup step {name} already registered")
+        unknown = [dependency for dependency in after if dependency not in self.steps]
+        if unknown:
+            raise ValueError(f"Startup step {name} depends on unknown steps: {', '.join(unknown)}")
+
+        step = StartupStep(name=name, func=func, after=tuple(after), required=required, timeout=timeout)
+        self.steps[name] = step
+        return step
+
+    async def _run_step(self, step: StartupStep) -> None:
+        """Wait for a step's dependencies, then run it and record the outcome."""
+        try:
+            for dependency in step.after:
+                await self.steps[dependency].done.wait()
+                if self.steps[dependency].state != STEP_READY:
+                    step.state = STEP_SKIPPED
+                    step.error = f"{dependency} not ready"
+                    return
+
+            step.state = STEP_RUNNING
+            step.started_at = self.elapsed()
+            try:
+                if step.timeout:
+                    await asyncio.wait_for(step.func(), step.timeout)
+                else:
+                    await step.func()
+                step.state = STEP_READY
+            except asyncio.TimeoutError:
+                step.state = STEP_FAILED
+                step.error = f"timed out after {step.timeout:g}s"
+            except Exception as e:
+                step.state = STEP_FAILED
+                step.error = str(e) or type(e).__name__
+
+            if step.state == STEP_FAILED:
+                log = self.logger.error if step.required else self.logger.warning
+                log(f"Startup step {step.name} failed: {step.error}")
+        finally:
+            step.finished_at = self.elapsed()
+            step.done.set()
+
+    async def run(self) -> None:
+        """
+        Run all registered steps and wait for them to finish.
+
+        Raises:
+            StartupError: If a required step failed or was skipped
+        """
+        await asyncio.gather(*(self._run_step(step) for step in self.steps.values()))
+
+        failed = [step.name for step in self.steps.values() if step.required and step.state != STEP_READY]
+        if failed:
+            raise StartupError(f"Required startup steps not ready: {', '.join(failed)}")
+
+    def is_ready(self, *names: str) -> bool:
+        """Whether all named steps finished successfully."""
+        return all(name in self.steps and self.steps[name].state == STEP_READY for name in names)
+
+    async def wait_ready(self, *names: str) -> None:
+        """
+        Wait until the named steps have finished.
+
+        Args:
+            *names: Step names
+
+        Raises:
+            StartupError: If any of the steps failed or was skipped
+        """
+        for name in names:
+            step = self.steps[name]
+            await step.done.wait()
+            if step.state != STEP_READY:
+                raise StartupError(f"Startup step {name} is {step.state}: {step.error}")
+
+    def mark(self, name: str) -> float:
+        """
+        Record a milestone the first time it is reached.
+
+        Args:
+            name: Milestone name, e.g. "BaseChain scanning"
+
+        Returns:
+            Seconds since process start at which the milestone was first reached
+        """
+        if name not in self.milestones:
+            self.milestones[name] = self.elapsed()
+            self.logger.info(f"{name} at +{self.milestones[name]:.3f}s")
+        return self.milestones[name]
+
+    def watch(self, name: str, event: asyncio.Event) -> None:
+        """
+        Record a milestone when an event is set.
+
+        Args:
+            name: Milestone name
+            event: Event signalling the milestone
+        """
+        async def wait_and_mark() -> None:
+            await event.wait()
+            self.mark(name)
+
+        self._watchers.append(asyncio.create_task(wait_and_mark()))
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get the startup timing breakdown."""
+        finished = [step.finished_at for step in self.steps.values() if step.finished_at is not None]
+        return {
+            'total_seconds': max(finished) if finished else None,
+            'steps': {
+                step.name: {
+                    'state': step.state,
+                    'started_at': step.started_at,
+                    'finished_at': step.finished_at,
+                    'duration': step.duration,
+                    'after': list(step.after),
+                    'error': step.error
+                }
+                for step in self.steps.values()
+            },
+            'milestones': dict(sorted(self.milestones.items(), key=lambda item: item[1]))
+        }
+
+    def log_report(self) -> None:
+        """Log the startup timing breakdown."""
+        report = self.get_report()
+        self.logger.info(f"STARTUP TIMING (from process start, total {report['total_seconds'] or 0.0:.3f}s)")
+        for name, step in report['steps'].items():
+            if step['started_at'] is None:
+                self.logger.info(f"  {name:12} {step['state']:8} ({step['error']})")
+                continue
+            line = (
+                f"  {name:12} {step['state']:8} "
+                f"+{step['started_at']:.3f}s → +{step['finished_at']:.3f}s ({step['duration']:.3f}s)"
+            )
+            if step['error']:
+                line += f" - {step['error']}"
+            self.logger.info(line)
+        for name, at in report['milestones'].items():
+            self.logger.info(f"  {name} at +{at:.3f}s")
+
+    def close(self) -> None:
+        """Stop waiting for milestones that were not reached."""
+        for task in self._watchers:
+            if not task.done():
+                task.cancel()
+        self._watchers.clear()